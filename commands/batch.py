@@ -0,0 +1,256 @@
+"""
+Creación de proyectos en lote para Genesis CLI
+
+DOCTRINA DEL ECOSISTEMA:
+- NO implementa lógica de generación
+- NO coordina agentes directamente
+- SÍ valida entrada del usuario
+- SÍ muestra progreso y estado elegante
+- Solo usa genesis-core como interfaz
+"""
+
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from rich.console import Console
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.table import Table
+
+from genesis_cli.directory_probe import directory_probe_scope, probe_directories
+from genesis_cli.exceptions import ConfigurationError, ValidationError
+from genesis_cli.utils import format_duration
+from genesis_cli.validators import validate_project_config
+
+console = Console()
+
+# Características por defecto en modo no interactivo (igual que `genesis init`)
+DEFAULT_FEATURES = ["authentication", "database", "api", "frontend", "docker", "cicd"]
+DEFAULT_DESCRIPTION = "Aplicación generada con Genesis Engine"
+
+@dataclass
+class BatchResult:
+    """
+    Resultado de crear un proyecto del lote
+    
+    DOCTRINA: Mostramos estado de manera elegante
+    """
+    name: str
+    success: bool
+    duration: float
+    project_path: Optional[str] = None
+    generated_files: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+def load_manifest(path: Path) -> Dict[str, Any]:
+    """
+    Leer manifiesto de proyectos (YAML o JSON)
+    
+    El manifiesto puede ser una lista de proyectos o un objeto con
+    `projects` y, opcionalmente, `defaults` comunes a todos ellos.
+    """
+    if not path.exists():
+        raise ConfigurationError(f"No se encontró el manifiesto: {path}", config_key="manifest")
+    
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError as e:
+        raise ConfigurationError(f"No se pudo leer el manifiesto: {e}", config_key="manifest")
+    
+    try:
+        if path.suffix.lower() in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise ConfigurationError(
+                    "Los manifiestos YAML requieren PyYAML: pip install 'genesis-cli[batch]' "
+                    "(o usa un manifiesto .json)",
+                    config_key="manifest"
+                )
+            data = yaml.safe_load(text)
+        else:
+            data = json.loads(text)
+    except ConfigurationError:
+        raise
+    except Exception as e:
+        raise ConfigurationError(f"Manifiesto inválido: {e}", config_key="manifest")
+    
+    if isinstance(data, list):
+        data = {"projects": data}
+    
+    if not isinstance(data, dict) or not isinstance(data.get("projects"), list):
+        raise ConfigurationError("El manifiesto debe contener una lista 'projects'", config_key="manifest")
+    
+    return data
+
+def build_project_configs(manifest: Dict[str, Any], defaults: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Combinar cada entrada del manifiesto con los valores por defecto
+    
+    Prioridad: entrada del proyecto > `defaults` del manifiesto > opciones de la CLI
+    """
+    base = {**defaults, **(manifest.get("defaults") or {})}
+    configs = []
+    
+    for index, entry in enumerate(manifest["projects"], 1):
+        if isinstance(entry, str):
+            entry = {"name": entry}
+        if not isinstance(entry, dict):
+            raise ConfigurationError(f"Entrada {index} del manifiesto inválida", config_key="projects")
+        
+        config = {**base, **entry}
+        # `output` es el alias corto aceptado en manifiestos
+        if "output" in config:
+            config["output_path"] = config.pop("output")
+        config["output_path"] = str(Path(config.get("output_path") or ".").resolve())
+        config.setdefault("description", DEFAULT_DESCRIPTION)
+        config.setdefault("features", list(DEFAULT_FEATURES))
+        config["interactive"] = False
+        configs.append(config)
+    
+    return configs
+
+def validate_batch(configs: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+    """
+    Validar todas las entradas antes de generar nada
+    
+    Returns:
+        Dict[str, List[str]]: Errores por proyecto (vacío si todo es válido)
+    """
+    errors: Dict[str, List[str]] = {}
+    seen = set()
+    
+    with directory_probe_scope():
+        # Sondear todos los directorios en paralelo antes de validar: cada
+        # directorio de salida (compartido por muchos proyectos) una sola vez
+        targets = [config for config in configs if config.get("name") and config.get("output_path")]
+        probe_directories({config["output_path"] for config in targets}, free=True)
+        probe_directories([Path(config["output_path"]) / config["name"] for config in targets], empty=True)
+        
+        for index, config in enumerate(configs, 1):
+            label = config.get("name") or f"#{index}"
+            result = validate_project_config(config)
+            entry_errors = list(result.errors)
+            if not config.get("name"):
+                entry_errors.append("Falta el nombre del proyecto")
+            
+            target = (config.get("output_path"), config.get("name"))
+            if target in seen:
+                entry_errors.append("Proyecto duplicado en el manifiesto")
+            seen.add(target)
+            
+            if entry_errors:
+                errors[label] = entry_errors
+    
+    return errors
+
+async def run_batch(configs: List[Dict[str, Any]],
+                    create_project: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+                    jobs: int = 4) -> List[BatchResult]:
+    """
+    Crear los proyectos del lote con concurrencia acotada
+    
+    DOCTRINA: Solo usamos genesis-core como interfaz (a través de `create_project`)
+    
+    Args:
+        configs: Configuraciones ya validadas
+        create_project: Corrutina que crea un proyecto y devuelve el dict de resultado
+        jobs: Máximo de proyectos generándose a la vez
+    """
+    import asyncio
+    
+    semaphore = asyncio.Semaphore(max(1, jobs))
+    
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[bold]{task.description}"),
+        TextColumn("{task.fields[status]}"),
+        TimeElapsedColumn(),
+        console=console,
+    ) as progress:
+        # Una fila por entrada: el mismo nombre puede repetirse con otro output_path
+        rows = [
+            progress.add_task(config["name"], total=1, start=False, status="[dim]en cola[/dim]")
+            for config in configs
+        ]
+        
+        async def _run_one(index: int, config: Dict[str, Any]) -> BatchResult:
+            task_id = rows[index]
+            async with semaphore:
+                progress.update(task_id, status="[cyan]generando...[/cyan]")
+                progress.start_task(task_id)
+                start = time.monotonic()
+                try:
+                    result = await create_project(config)
+                except Exception as e:
+                    result = {"success": False, "error": str(e)}
+                duration = time.monotonic() - start
+            
+            if result.get("success"):
+                progress.update(task_id, completed=1, status="[green]✅ listo[/green]")
+                return BatchResult(
+                    name=config["name"],
+                    success=True,
+                    duration=duration,
+                    project_path=result.get("project_path"),
+                    generated_files=result.get("generated_files") or [],
+                )
+            
+            progress.update(task_id, completed=1, status="[red]❌ error[/red]")
+            return BatchResult(
+                name=config["name"],
+                success=False,
+                duration=duration,
+                error=result.get("error", "Error desconocido"),
+            )
+        
+        return list(await asyncio.gather(*(_run_one(index, config) for index, config in enumerate(configs))))
+
+def show_batch_summary(results: List[BatchResult], elapsed: float) -> None:
+    """
+    Mostrar resumen del lote
+    
+    DOCTRINA: Mostramos estado de manera elegante
+    """
+    table = Table(title="📦 Resumen de creación en lote")
+    table.add_column("Proyecto", style="cyan")
+    table.add_column("Estado")
+    table.add_column("Duración", justify="right")
+    table.add_column("Detalle", style="dim")
+    
+    for result in results:
+        if result.success:
+            table.add_row(
+                result.name,
+                "[green]✅ OK[/green]",
+                format_duration(result.duration),
+                f"{len(result.generated_files)} archivos",
+            )
+        else:
+            table.add_row(
+                result.name,
+                "[red]❌ Error[/red]",
+                format_duration(result.duration),
+                result.error or "",
+            )
+    
+    console.print(table)
+    
+    succeeded = sum(1 for result in results if result.success)
+    failed = len(results) - succeeded
+    style = "green" if failed == 0 else "yellow" if succeeded else "red"
+    console.print(
+        f"[bold {style}]{succeeded} creados, {failed} con errores "
+        f"en {format_duration(elapsed)}[/bold {style}]"
+    )
+
+def format_batch_errors(errors: Dict[str, List[str]]) -> ValidationError:
+    """Construir error de validación para todo el manifiesto"""
+    messages = [f"{name}: {message}" for name, entry_errors in errors.items() for message in entry_errors]
+    return ValidationError(
+        f"{len(errors)} proyecto(s) del manifiesto no son válidos",
+        field="manifest",
+        errors=messages
+    )
@@ -10,12 +10,15 @@ DOCTRINA DEL ECOSISTEMA:
 """
 
 import sys
-import subprocess
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 from rich.table import Table
 from genesis_cli import __version__
+from genesis_cli.config import get_dependency_cache_ttl
+from genesis_cli.probes import DEFAULT_PROBES, DEFAULT_PROBE_BUDGET, ProbeCache, run_probes
+from genesis_cli.tracing import PHASE_DEPENDENCIES, traced
+from genesis_cli.validators import TemplateValidator
 
 console = Console()
 
@@ -41,12 +44,17 @@ def show_banner():
         subtitle="[dim]Powered by AI Agents[/dim]"
     ))
 
-def check_dependencies() -> bool:
+@traced(PHASE_DEPENDENCIES)
+def check_dependencies(timeout: float = DEFAULT_PROBE_BUDGET, refresh: bool = False) -> bool:
     """
     Verificar dependencias básicas del sistema
     
     DOCTRINA: Validamos entrada del usuario y mostramos estado
     
+    Args:
+        timeout: Presupuesto global en segundos para todas las verificaciones
+        refresh: Ignorar resultados en caché y volver a verificar
+    
     Returns:
         bool: True si todas las dependencias están disponibles
     """
@@ -57,27 +65,18 @@ def check_dependencies() -> bool:
     if sys.version_info < (3, 8):
         missing.append("Python >= 3.8")
     
-    # Verificar herramientas básicas
-    def _check_tool(cmd: list, name: str, required: bool = True) -> bool:
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
-            return result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
-    
-    # Dependencias críticas
-    if not _check_tool(["node", "--version"], "Node.js"):
-        missing.append("Node.js")
-    
-    if not _check_tool(["git", "--version"], "Git"):
-        missing.append("Git")
-    
-    # Dependencias opcionales
-    if not _check_tool(["docker", "--version"], "Docker", required=False):
-        warnings.append("Docker (recomendado para despliegue)")
+    # Verificar herramientas básicas (en paralelo, un proceso por herramienta,
+    # reutilizando resultados en caché mientras los binarios no cambien)
+    cache = ProbeCache(ttl=get_dependency_cache_ttl())
+    results = run_probes(DEFAULT_PROBES, timeout=timeout, cache=cache, refresh=refresh)
     
-    if not _check_tool(["npm", "--version"], "npm", required=False):
-        warnings.append("npm (recomendado para proyectos frontend)")
+    for probe in DEFAULT_PROBES:
+        if results[probe.name].installed:
+            continue
+        if probe.required:
+            missing.append(probe.name)
+        else:
+            warnings.append(f"{probe.name} ({probe.notes})" if probe.notes else probe.name)
     
     # Crear tabla de diagnóstico
     table = Table(title="🔍 Verificación de Dependencias")
@@ -91,24 +90,12 @@ def check_dependencies() -> bool:
     table.add_row("Python", python_status, f"v{python_version}")
     
     # Mostrar otras dependencias
-    dependencies = [
-        ("Node.js", ["node", "--version"]),
-        ("Git", ["git", "--version"]),
-        ("Docker", ["docker", "--version"]),
-        ("npm", ["npm", "--version"])
-    ]
-    
-    for name, cmd in dependencies:
-        if _check_tool(cmd, name, required=False):
-            try:
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
-                version = result.stdout.strip()
-                table.add_row(name, "✅ OK", version)
-            except:
-                table.add_row(name, "✅ OK", "Instalado")
+    for name, result in results.items():
+        if result.installed:
+            table.add_row(name, "✅ OK", result.version or "Instalado")
         else:
-            status = "❌ Faltante" if name in ["Node.js", "Git"] else "⚠️ Opcional"
-            table.add_row(name, status, "No encontrado")
+            status = "❌ Faltante" if result.required else "⚠️ Opcional"
+            table.add_row(name, status, result.error or "No encontrado")
     
     console.print(table)
     
@@ -154,10 +141,7 @@ def validate_project_config(config: dict) -> list:
     
     # Validar template
     template = config.get("template", "")
-    valid_templates = [
-        "saas-basic", "api-only", "frontend-only", "microservices",
-        "e-commerce", "blog", "ai-ready", "minimal"
-    ]
+    valid_templates = list(TemplateValidator.templates())
     
     if template and template not in valid_templates:
         errors.append(f"Template inválido: {template}. Válidos: {', '.join(valid_templates)}")
@@ -0,0 +1,299 @@
+"""
+Verificación de archivos generados para Genesis CLI
+
+Compara los `generated_files` de genesis.json con el directorio de trabajo y
+detecta archivos faltantes, modificados a mano y no registrados. Los hashes
+se calculan en paralelo y se reutilizan entre ejecuciones mientras el tamaño
+y la mtime del archivo no cambien.
+
+DOCTRINA DEL ECOSISTEMA:
+- NO implementa lógica de generación
+- NO coordina agentes directamente
+- SÍ valida el estado del proyecto
+- SÍ muestra progreso y estado elegante
+- Solo usa genesis-core como interfaz
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from rich.console import Console
+from rich.table import Table
+
+from genesis_cli.disk_usage import compile_excludes
+from genesis_cli.project_manifest import GENERATION_KEY, MANIFEST_FILE, hash_file
+
+console = Console()
+
+HASH_CACHE_FILE = Path.home() / ".genesis-cli" / "hash-cache.json"
+
+# Cambiar al modificar el formato de las entradas
+HASH_CACHE_FORMAT = 1
+
+# Proyectos distintos que conserva la caché (los menos usados se descartan)
+MAX_CACHED_PROJECTS = 16
+
+# Archivos modificados hace menos de esto no se cachean: otra escritura
+# dentro del mismo tick de mtime pasaría desapercibida
+RACY_WINDOW_NS = 2 * 1_000_000_000
+
+# Entradas que nunca se consideran archivos no registrados
+DEFAULT_EXCLUDES = (
+    MANIFEST_FILE,
+    ".git",
+    ".genesis-staging-*",
+    "node_modules",
+    "__pycache__",
+    "*.pyc",
+    ".venv",
+    "venv",
+    ".DS_Store",
+)
+
+# Filas mostradas por categoría en el informe
+MAX_REPORTED_FILES = 20
+
+@dataclass
+class VerifyReport:
+    """
+    Resultado de comparar genesis.json con el disco
+    
+    DOCTRINA: Mostramos estado de manera elegante
+    """
+    tracked: int = 0
+    missing: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    untracked: List[str] = field(default_factory=list)
+    unverified: List[str] = field(default_factory=list)  # sin hash registrado en genesis.json
+    hashed: int = 0
+    cached: int = 0
+    
+    @property
+    def clean(self) -> bool:
+        return not (self.missing or self.modified or self.untracked)
+
+class HashCache:
+    """
+    Caché de hashes por proyecto en ~/.genesis-cli/hash-cache.json
+    
+    Cada archivo guarda [tamaño, mtime_ns, sha256]; el hash solo se reutiliza
+    si el tamaño y la mtime coinciden.
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def __init__(self, cache_file: Optional[Path] = None):
+        self.cache_file = cache_file or HASH_CACHE_FILE
+        self._data: Optional[Dict[str, Any]] = None
+    
+    def _load(self) -> Dict[str, Any]:
+        if self._data is None:
+            try:
+                with open(self.cache_file, "r") as f:
+                    data = json.load(f)
+                if not isinstance(data, dict) or data.get("format") != HASH_CACHE_FORMAT:
+                    raise ValueError("formato de caché desconocido")
+                self._data = data
+            except (OSError, ValueError):
+                self._data = {"format": HASH_CACHE_FORMAT, "projects": {}}
+        return self._data
+    
+    def entries(self, root: Path) -> Dict[str, List[Any]]:
+        return self._load()["projects"].get(str(root), {}).get("files", {})
+    
+    def update(self, root: Path, entries: Dict[str, List[Any]]):
+        """Reemplazar las entradas de un proyecto y guardar de forma atómica"""
+        projects = self._load()["projects"]
+        projects[str(root)] = {"files": entries, "last_used": time.time()}
+        for stale in sorted(projects, key=lambda k: projects[k].get("last_used", 0))[:-MAX_CACHED_PROJECTS]:
+            del projects[stale]
+        
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, "w") as f:
+                # json.dumps usa el codificador en C; json.dump a un archivo no
+                f.write(json.dumps(self._data, separators=(",", ":")))
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            # Sin caché solo se pierde velocidad
+            pass
+
+def _relative(path: str, root: Path) -> Optional[str]:
+    """Ruta de `generated_files` relativa a la raíz (None si queda fuera)"""
+    if not os.path.isabs(path) and "\\" not in path and "./" not in path and "//" not in path:
+        return path or None
+    candidate = Path(path)
+    if candidate.is_absolute():
+        try:
+            candidate = candidate.relative_to(root)
+        except ValueError:
+            return None
+    relative_path = candidate.as_posix()
+    return None if relative_path == "." else relative_path
+
+def scan_files(root: Path, exclude: Iterable[str] = DEFAULT_EXCLUDES) -> Dict[str, Tuple[int, int]]:
+    """
+    Archivos del directorio de trabajo con su tamaño y mtime
+    
+    Returns:
+        Dict[str, Tuple[int, int]]: {ruta relativa: (tamaño, mtime_ns)}
+    """
+    excluded = compile_excludes(exclude)
+    files: Dict[str, Tuple[int, int]] = {}
+    stack = [""]
+    while stack:
+        relative_dir = stack.pop()
+        prefix = f"{relative_dir}/" if relative_dir else ""
+        try:
+            with os.scandir(root / relative_dir if relative_dir else root) as entries:
+                for entry in entries:
+                    relative_path = prefix + entry.name
+                    if excluded is not None and excluded(entry.name, relative_path):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(relative_path)
+                        elif entry.is_file():
+                            stat = entry.stat()
+                            files[relative_path] = (stat.st_size, stat.st_mtime_ns)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return files
+
+def verify_project(root: Path, exclude: Iterable[str] = (), jobs: Optional[int] = None,
+                   cache: Optional[HashCache] = None, untracked: bool = True) -> VerifyReport:
+    """
+    Comparar los archivos registrados en genesis.json con el disco
+    
+    Args:
+        root: Raíz del proyecto (donde está genesis.json)
+        exclude: Globs adicionales que no cuentan como archivos no registrados
+        jobs: Hilos para hashear (por defecto según CPUs)
+        cache: Caché de hashes por tamaño y mtime
+        untracked: Buscar archivos no registrados en genesis.json
+    """
+    root = Path(root).resolve()
+    with open(root / MANIFEST_FILE, "r") as f:
+        manifest = json.load(f)
+    
+    recorded = (manifest.get(GENERATION_KEY) or {}).get("files") or {}
+    tracked = {}
+    for path in manifest.get("generated_files") or []:
+        relative_path = _relative(str(path), root)
+        if relative_path:
+            tracked[relative_path] = (recorded.get(relative_path) or {}).get("sha256")
+    for relative_path, entry in recorded.items():
+        tracked.setdefault(relative_path, (entry or {}).get("sha256"))
+    
+    report = VerifyReport(tracked=len(tracked))
+    on_disk = scan_files(root, list(DEFAULT_EXCLUDES) + list(exclude)) if untracked else {}
+    
+    # Archivos a comprobar: (ruta, tamaño, mtime_ns, hash esperado)
+    pending = []
+    for relative_path, expected in tracked.items():
+        stat = on_disk.get(relative_path)
+        if stat is None:
+            # Puede estar en un directorio excluido del recorrido
+            try:
+                result = os.stat(root / relative_path)
+                stat = (result.st_size, result.st_mtime_ns)
+            except OSError:
+                report.missing.append(relative_path)
+                continue
+        if expected is None:
+            report.unverified.append(relative_path)
+            continue
+        pending.append((relative_path, stat[0], stat[1], expected))
+    
+    if untracked:
+        report.untracked = sorted(set(on_disk) - set(tracked))
+    
+    previous = cache.entries(root) if cache is not None else {}
+    fresh: Dict[str, List[Any]] = {}
+    racy_after = time.time_ns() - RACY_WINDOW_NS
+    to_hash = []
+    for relative_path, size, mtime_ns, expected in pending:
+        cached = previous.get(relative_path)
+        if cached is not None and cached[0] == size and cached[1] == mtime_ns:
+            report.cached += 1
+            fresh[relative_path] = cached
+            if cached[2] != expected:
+                report.modified.append(relative_path)
+        else:
+            to_hash.append((relative_path, size, mtime_ns, expected))
+    
+    if to_hash:
+        workers = jobs or min(32, (os.cpu_count() or 1) + 4)
+        paths = [root / relative_path for relative_path, _, _, _ in to_hash]
+        if workers == 1 or len(paths) == 1:
+            digests = list(map(hash_file, paths))
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                digests = list(pool.map(hash_file, paths, chunksize=64))
+        
+        for (relative_path, size, mtime_ns, expected), digest in zip(to_hash, digests):
+            report.hashed += 1
+            if digest is None:
+                report.missing.append(relative_path)
+                continue
+            if mtime_ns < racy_after:
+                fresh[relative_path] = [size, mtime_ns, digest]
+            if digest != expected:
+                report.modified.append(relative_path)
+    
+    if cache is not None and fresh != previous:
+        cache.update(root, fresh)
+    
+    report.missing.sort()
+    report.modified.sort()
+    report.unverified.sort()
+    return report
+
+def show_verify_report(report: VerifyReport, elapsed: float) -> None:
+    """
+    Mostrar el resultado de la verificación
+    
+    DOCTRINA: Mostramos estado de manera elegante
+    """
+    from genesis_cli.utils import format_duration
+    
+    table = Table(title="🔍 Verificación de archivos generados")
+    table.add_column("Estado", style="cyan")
+    table.add_column("Archivos", justify="right")
+    table.add_row("Registrados", str(report.tracked))
+    table.add_row("[red]Faltantes[/red]", str(len(report.missing)))
+    table.add_row("[yellow]Modificados[/yellow]", str(len(report.modified)))
+    table.add_row("[blue]No registrados[/blue]", str(len(report.untracked)))
+    if report.unverified:
+        table.add_row("[dim]Sin hash registrado[/dim]", str(len(report.unverified)))
+    console.print(table)
+    
+    for title, style, files in (
+        ("❌ Faltantes", "red", report.missing),
+        ("✏️ Modificados", "yellow", report.modified),
+        ("➕ No registrados", "blue", report.untracked),
+    ):
+        if not files:
+            continue
+        console.print(f"\n[bold {style}]{title}:[/bold {style}]")
+        for file_path in files[:MAX_REPORTED_FILES]:
+            console.print(f"  • {file_path}", markup=False)
+        if len(files) > MAX_REPORTED_FILES:
+            console.print(f"  [dim]... y {len(files) - MAX_REPORTED_FILES} más[/dim]")
+    
+    console.print(
+        f"\n[dim]{report.hashed} hasheados, {report.cached} desde caché "
+        f"en {format_duration(elapsed)}[/dim]"
+    )
+    if report.clean:
+        console.print("[green]✅ Los archivos generados coinciden con genesis.json[/green]")
+    else:
+        console.print("[yellow]⚠️ El proyecto difiere de genesis.json[/yellow]")
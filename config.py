@@ -1,6 +1,20 @@
 """
 Configuración específica para Genesis CLI
 
+La configuración se resuelve una vez por proceso en capas, de menor a mayor
+prioridad: valores por defecto, ~/.genesis-cli/config.json, el
+.genesis-cli.toml más cercano subiendo desde el directorio actual, variables
+de entorno y opciones de la línea de comandos. El resultado es un CLIConfig inmutable. Los archivos ya
+interpretados se guardan en ~/.genesis-cli/config.cache junto con su mtime,
+tamaño e inodo, de modo que las ejecuciones siguientes solo hacen un stat
+por archivo mientras no cambien.
+
+config.json se escribe de forma atómica (archivo temporal, fsync y rename)
+y con un bloqueo consultivo sobre config.json.lock, de modo que varios
+procesos pueden actualizarlo a la vez sin perder cambios ni dejar lecturas
+a medias: cada actualización relee el archivo dentro del bloqueo y combina
+sus cambios con lo que ya estaba guardado.
+
 DOCTRINA DEL ECOSISTEMA:
 - NO implementa lógica de generación
 - NO coordina agentes directamente
@@ -9,10 +23,24 @@ DOCTRINA DEL ECOSISTEMA:
 - Solo configuración de interfaz de usuario
 """
 
+import json
+import marshal
 import os
+import stat
+import tempfile
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, field
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, fields
+
+from genesis_cli.project_discovery import RACY_WINDOW, discover_project
+from genesis_cli.tracing import PHASE_CONFIG, traced
+
+try:
+    import fcntl
+except ImportError:  # Windows: sin bloqueo consultivo, solo escritura atómica
+    fcntl = None
 
 # Configuración por defecto para la CLI
 DEFAULT_CONFIG = {
@@ -27,7 +55,11 @@ DEFAULT_CONFIG = {
         "interactive_mode": True,
         "auto_confirm": False,
         "verbose_output": False,
-        "skip_dependency_check": False
+        "skip_dependency_check": False,
+        "dependency_cache_ttl": 86400,
+        "daemon_idle_timeout": 900,
+        "result_cache_max_mb": 512,
+        "template_catalog_ttl": 86400
     },
     "templates": {
         "default_template": "saas-basic",
@@ -41,11 +73,34 @@ DEFAULT_CONFIG = {
     }
 }
 
-@dataclass
+# Archivos ya interpretados: cambiar CONFIG_CACHE_FORMAT al modificar el formato
+CONFIG_CACHE_FILE = "config.cache"
+CONFIG_CACHE_FORMAT = 1
+CONFIG_CACHE_ENTRIES = 32
+
+# Variables de entorno que fijan un valor: variable → (campo, valor)
+ENV_FLAGS = {
+    "GENESIS_CLI_NO_BANNER": ("show_banner", False),
+    "GENESIS_CLI_NO_INTERACTIVE": ("interactive_mode", False),
+    "GENESIS_CLI_VERBOSE": ("verbose_output", True),
+    "GENESIS_CLI_DEBUG": ("debug_mode", True),
+    "GENESIS_CLI_SKIP_DEPS": ("skip_dependency_check", True),
+}
+
+# Variables de entorno que toman su valor: variable → campo
+ENV_VALUES = {
+    "GENESIS_CLI_DEFAULT_TEMPLATE": "default_template",
+    "GENESIS_CLI_LOG_FORMAT": "log_format",
+}
+
+@dataclass(frozen=True)
 class CLIConfig:
     """
     Configuración específica para Genesis CLI
     
+    Es inmutable: para cambiar un valor se crea otra con
+    `dataclasses.replace` o se usa `update_config`.
+    
     DOCTRINA: Solo configuración de interfaz de usuario
     """
     
@@ -61,6 +116,10 @@ class CLIConfig:
     auto_confirm: bool = False
     verbose_output: bool = False
     skip_dependency_check: bool = False
+    dependency_cache_ttl: int = 86400  # segundos; 0 desactiva la caché
+    daemon_idle_timeout: int = 900  # segundos sin solicitudes antes de cerrar el daemon
+    result_cache_max_mb: int = 512  # tamaño máximo de la caché de resultados
+    template_catalog_ttl: int = 86400  # segundos; 0 consulta genesis-core siempre
     
     # Configuración de templates
     default_template: str = "saas-basic"
@@ -75,20 +134,15 @@ class CLIConfig:
     # Configuración de desarrollo
     debug_mode: bool = False
     log_level: str = "INFO"
+    log_format: str = "text"  # "text" o "jsonl" (un objeto JSON por línea)
+    log_max_mb: int = 10  # tamaño al que rota el archivo de log
+    log_retention_mb: int = 100  # tamaño máximo de ~/.genesis-cli/logs; 0 sin límite
+    log_retention_days: int = 7  # antigüedad máxima de los segmentos rotados; 0 sin límite
     
     @classmethod
     def from_dict(cls, config_dict: Dict[str, Any]) -> 'CLIConfig':
-        """Crear configuración desde diccionario"""
-        # Aplanar configuración anidada
-        flattened = {}
-        for section, values in config_dict.items():
-            if isinstance(values, dict):
-                for key, value in values.items():
-                    flattened[key] = value
-            else:
-                flattened[section] = values
-        
-        return cls(**flattened)
+        """Crear configuración desde diccionario (se ignoran claves desconocidas)"""
+        return cls(**_flatten(config_dict))
     
     def to_dict(self) -> Dict[str, Any]:
         """Convertir configuración a diccionario"""
@@ -104,7 +158,11 @@ class CLIConfig:
                 "interactive_mode": self.interactive_mode,
                 "auto_confirm": self.auto_confirm,
                 "verbose_output": self.verbose_output,
-                "skip_dependency_check": self.skip_dependency_check
+                "skip_dependency_check": self.skip_dependency_check,
+                "dependency_cache_ttl": self.dependency_cache_ttl,
+                "daemon_idle_timeout": self.daemon_idle_timeout,
+                "result_cache_max_mb": self.result_cache_max_mb,
+                "template_catalog_ttl": self.template_catalog_ttl
             },
             "templates": {
                 "default_template": self.default_template,
@@ -118,10 +176,128 @@ class CLIConfig:
             },
             "debug": {
                 "debug_mode": self.debug_mode,
-                "log_level": self.log_level
+                "log_level": self.log_level,
+                "log_format": self.log_format,
+                "log_max_mb": self.log_max_mb,
+                "log_retention_mb": self.log_retention_mb,
+                "log_retention_days": self.log_retention_days
             }
         }
 
+CONFIG_FIELDS = frozenset(f.name for f in fields(CLIConfig))
+
+def _flatten(config_dict: Any) -> Dict[str, Any]:
+    """Aplanar secciones ({"ui": {"theme": ...}} → {"theme": ...}) conservando solo campos conocidos"""
+    if not isinstance(config_dict, dict):
+        return {}
+    
+    flattened = {}
+    for section, values in config_dict.items():
+        if isinstance(values, dict):
+            flattened.update((key, value) for key, value in values.items() if key in CONFIG_FIELDS)
+        elif section in CONFIG_FIELDS:
+            flattened[section] = values
+    return flattened
+
+def _default_values() -> Dict[str, Any]:
+    """Capa de valores por defecto (copia nueva: DEFAULT_CONFIG nunca se modifica)"""
+    return {**{f.name: f.default for f in fields(CLIConfig)}, **_flatten(DEFAULT_CONFIG)}
+
+def env_overrides() -> Dict[str, Any]:
+    """Valores fijados por variables de entorno GENESIS_CLI_*"""
+    values = {}
+    for variable, (key, value) in ENV_FLAGS.items():
+        if os.getenv(variable):
+            values[key] = value
+    for variable, key in ENV_VALUES.items():
+        value = os.getenv(variable)
+        if value:
+            values[key] = value
+    return values
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    """mtime, tamaño e inodo; None si el archivo no existe"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+def _parse_config_file(path: Path) -> Dict[str, Any]:
+    """Valores de un config.json o .genesis-cli.toml; vacío si no se puede interpretar"""
+    try:
+        if path.suffix == ".toml":
+            try:
+                import tomllib
+            except ImportError:
+                import tomli as tomllib
+            with open(path, "rb") as f:
+                return _flatten(tomllib.load(f))
+        
+        with open(path, "r") as f:
+            return _flatten(json.load(f))
+    except (ImportError, OSError, ValueError):
+        return {}
+
+@contextmanager
+def _locked(lock_file: Path) -> Iterator[None]:
+    """Bloqueo exclusivo entre procesos sobre `lock_file`"""
+    lock_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_file, "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+def _atomic_write(path: Path, payload: bytes, durable: bool = False):
+    """
+    Reemplazar `path` de una vez: los lectores ven el archivo anterior o el nuevo
+    
+    Con `durable=True` se hace fsync del archivo y del directorio para que un
+    corte de luz no deje el archivo vacío.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        try:
+            os.chmod(tmp_name, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    
+    if durable and hasattr(os, "O_DIRECTORY"):
+        try:
+            dir_fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except OSError:
+            pass
+
+def _read_json_file(path: Path) -> Dict[str, Any]:
+    """Contenido de un config.json, vacío si falta o no es un objeto JSON"""
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
 class CLIConfigManager:
     """
     Gestor de configuración para Genesis CLI
@@ -132,69 +308,84 @@ class CLIConfigManager:
     def __init__(self):
         self.config_dir = Path.home() / ".genesis-cli"
         self.config_file = self.config_dir / "config.json"
+        self.project_file: Optional[Path] = None  # None: el PROJECT_CONFIG_FILE más cercano
         self._config: Optional[CLIConfig] = None
+        self._overrides: Dict[str, Any] = {}
+    
+    @property
+    def cache_file(self) -> Path:
+        return self.config_dir / CONFIG_CACHE_FILE
+    
+    @property
+    def lock_file(self) -> Path:
+        return self.config_file.with_name(f"{self.config_file.name}.lock")
     
     def load_config(self) -> CLIConfig:
-        """Cargar configuración desde archivo"""
-        if self._config is not None:
-            return self._config
-        
-        if self.config_file.exists():
-            try:
-                import json
-                with open(self.config_file, 'r') as f:
-                    config_dict = json.load(f)
-                
-                # Merge con configuración por defecto
-                merged_config = DEFAULT_CONFIG.copy()
-                self._merge_config(merged_config, config_dict)
-                
-                self._config = CLIConfig.from_dict(merged_config)
-                return self._config
-            
-            except (json.JSONDecodeError, IOError):
-                # Si hay error, usar configuración por defecto
-                pass
-        
-        # Usar configuración por defecto
-        self._config = CLIConfig.from_dict(DEFAULT_CONFIG)
+        """Configuración resuelta (se calcula una vez por proceso)"""
+        if self._config is None:
+            self._config = self._resolve()
         return self._config
     
+    def reload_config(self) -> CLIConfig:
+        """Volver a resolver: solo se interpretan los archivos que cambiaron"""
+        self._config = None
+        return self.load_config()
+    
+    def set_overrides(self, **values):
+        """Fijar valores de opciones de la línea de comandos (capa de mayor prioridad)"""
+        self._overrides = {key: value for key, value in values.items() if key in CONFIG_FIELDS}
+        self._config = None
+    
     def save_config(self, config: CLIConfig):
-        """Guardar configuración en archivo"""
-        self.config_dir.mkdir(parents=True, exist_ok=True)
-        
+        """Guardar configuración en archivo (reemplaza la guardada)"""
+        data = config.to_dict()
         try:
-            import json
-            with open(self.config_file, 'w') as f:
-                json.dump(config.to_dict(), f, indent=2)
-            
-            self._config = config
-            
-        except IOError:
+            with _locked(self.lock_file):
+                _atomic_write(self.config_file, json.dumps(data, indent=2).encode(), durable=True)
+        except OSError:
             # Si no se puede guardar, continuar con configuración en memoria
             pass
+        
+        self._config = self._resolve(user=_flatten(data))
     
-    def update_config(self, **kwargs):
-        """Actualizar configuración específica"""
-        config = self.load_config()
+    def read_saved_config(self) -> CLIConfig:
+        """Configuración guardada en config.json sobre los valores por defecto (sin otras capas)"""
+        return CLIConfig(**{**_default_values(), **_flatten(_read_json_file(self.config_file))})
+    
+    def compare_and_swap(self, expected: Dict[str, Any], **changes) -> bool:
+        """
+        Aplicar `changes` solo si los valores guardados siguen siendo `expected`
         
-        # Actualizar campos específicos
-        for key, value in kwargs.items():
-            if hasattr(config, key):
-                setattr(config, key, value)
+        La comprobación y la escritura ocurren dentro del bloqueo, así que
+        entre procesos concurrentes solo uno gana; el resto recibe False y
+        puede releer con `read_saved_config` y reintentar. Las claves que no
+        se cambian se conservan tal como estaban en el archivo, incluidas las
+        que esta versión de la CLI no conoce.
         
-        self.save_config(config)
+        Returns:
+            bool: True si se aplicaron los cambios
+        """
+        changes = {key: value for key, value in changes.items() if key in CONFIG_FIELDS}
+        try:
+            with _locked(self.lock_file):
+                return self._swap(expected, changes, write=True)
+        except OSError:
+            # Si no se puede guardar, continuar con configuración en memoria
+            return self._swap(expected, changes, write=False)
+    
+    def update_config(self, **kwargs):
+        """Actualizar configuración específica"""
+        # Solo se parte del archivo del usuario: los valores del proyecto,
+        # del entorno o de la línea de comandos no se guardan
+        self.compare_and_swap({}, **kwargs)
     
     def reset_config(self):
         """Resetear configuración a valores por defecto"""
-        self._config = CLIConfig.from_dict(DEFAULT_CONFIG)
-        self.save_config(self._config)
+        self.save_config(CLIConfig.from_dict(DEFAULT_CONFIG))
     
     def get_config_value(self, key: str, default: Any = None) -> Any:
         """Obtener valor específico de configuración"""
-        config = self.load_config()
-        return getattr(config, key, default)
+        return vars(self.load_config()).get(key, default)
     
     def _merge_config(self, base: Dict[str, Any], update: Dict[str, Any]):
         """Merge recursivo de configuraciones"""
@@ -203,6 +394,83 @@ class CLIConfigManager:
                 self._merge_config(base[key], value)
             else:
                 base[key] = value
+    
+    def _swap(self, expected: Dict[str, Any], changes: Dict[str, Any], write: bool) -> bool:
+        saved = _read_json_file(self.config_file)
+        current = vars(CLIConfig(**{**_default_values(), **_flatten(saved)}))
+        if any(current.get(key) != value for key, value in expected.items()):
+            return False
+        
+        self._merge_config(saved, CLIConfig(**{**current, **changes}).to_dict())
+        if write:
+            _atomic_write(self.config_file, json.dumps(saved, indent=2).encode(), durable=True)
+        self._config = self._resolve(user=_flatten(saved))
+        return True
+    
+    @traced(PHASE_CONFIG)
+    def _resolve(self, user: Optional[Dict[str, Any]] = None) -> CLIConfig:
+        layers = self._file_layers()
+        if user is not None:
+            layers[0] = user
+        
+        values = _default_values()
+        for layer in layers:
+            values.update(layer)
+        values.update(env_overrides())
+        values.update(self._overrides)
+        return CLIConfig(**values)
+    
+    def _config_files(self) -> List[Path]:
+        project_file = self.project_file or discover_project().config_file
+        return [self.config_file, project_file] if project_file is not None else [self.config_file]
+    
+    def _file_layers(self) -> List[Dict[str, Any]]:
+        """Valores de cada archivo, reutilizando los ya interpretados si no cambiaron"""
+        entries = self._read_cache()
+        layers = []
+        changed = False
+        for path in self._config_files():
+            signature = _file_signature(path)
+            if signature is None:
+                layers.append({})
+                continue
+            
+            cached = entries.get(str(path))
+            if cached is not None and tuple(cached[0]) == signature:
+                layers.append(dict(cached[1]))
+                continue
+            
+            values = _parse_config_file(path)
+            layers.append(dict(values))
+            entries.pop(str(path), None)
+            # Un archivo recién escrito puede volver a cambiar sin que cambie su
+            # firma (reloj de grano grueso, inodo reutilizado): no se recuerda
+            if time.time_ns() - signature[0] > RACY_WINDOW * 1e9:
+                entries[str(path)] = (signature, values)
+            changed = True
+        
+        if changed:
+            self._write_cache(entries)
+        return layers
+    
+    def _read_cache(self) -> Dict[str, Any]:
+        try:
+            with open(self.cache_file, "rb") as f:
+                data = marshal.load(f)
+            if data.get("format") != CONFIG_CACHE_FORMAT:
+                return {}
+            return dict(data["entries"])
+        except (OSError, EOFError, ValueError, TypeError, KeyError, AttributeError):
+            return {}
+    
+    def _write_cache(self, entries: Dict[str, Any]):
+        # Se conservan los archivos usados más recientemente (un proyecto por directorio)
+        recent = dict(list(entries.items())[-CONFIG_CACHE_ENTRIES:])
+        try:
+            _atomic_write(self.cache_file, marshal.dumps({"format": CONFIG_CACHE_FORMAT, "entries": recent}))
+        except (OSError, ValueError):
+            # Sin caché, la próxima ejecución vuelve a interpretar los archivos
+            pass
 
 # Instancia global del gestor de configuración
 config_manager = CLIConfigManager()
@@ -215,6 +483,10 @@ def update_config(**kwargs):
     """Actualizar configuración"""
     config_manager.update_config(**kwargs)
 
+def compare_and_swap(expected: Dict[str, Any], **changes) -> bool:
+    """Actualizar configuración si los valores guardados siguen siendo `expected`"""
+    return config_manager.compare_and_swap(expected, **changes)
+
 def reset_config():
     """Resetear configuración"""
     config_manager.reset_config()
@@ -244,6 +516,22 @@ def should_skip_dependency_check() -> bool:
     """Verificar si debe omitir verificación de dependencias"""
     return config_manager.get_config_value("skip_dependency_check", False)
 
+def get_dependency_cache_ttl() -> int:
+    """Obtener vigencia (segundos) de la caché de dependencias"""
+    return config_manager.get_config_value("dependency_cache_ttl", 86400)
+
+def get_daemon_idle_timeout() -> int:
+    """Obtener tiempo de inactividad (segundos) antes de cerrar el daemon"""
+    return config_manager.get_config_value("daemon_idle_timeout", 900)
+
+def get_result_cache_max_mb() -> int:
+    """Obtener tamaño máximo (MB) de la caché de resultados de generación"""
+    return config_manager.get_config_value("result_cache_max_mb", 512)
+
+def get_template_catalog_ttl() -> int:
+    """Obtener vigencia (segundos) del catálogo de templates guardado"""
+    return config_manager.get_config_value("template_catalog_ttl", 86400)
+
 def get_default_output_dir() -> str:
     """Obtener directorio de salida por defecto"""
     return config_manager.get_config_value("default_output_dir", ".")
@@ -260,29 +548,27 @@ def get_log_level() -> str:
     """Obtener nivel de log"""
     return config_manager.get_config_value("log_level", "INFO")
 
+def get_log_format() -> str:
+    """Obtener formato del archivo de log ("text" o "jsonl")"""
+    return config_manager.get_config_value("log_format", "text")
+
+def get_log_max_mb() -> int:
+    """Obtener tamaño (MB) al que rota el archivo de log"""
+    return config_manager.get_config_value("log_max_mb", 10)
+
+def get_log_retention_mb() -> int:
+    """Obtener tamaño total máximo (MB) del directorio de logs"""
+    return config_manager.get_config_value("log_retention_mb", 100)
+
+def get_log_retention_days() -> int:
+    """Obtener antigüedad máxima (días) de los logs rotados"""
+    return config_manager.get_config_value("log_retention_days", 7)
+
 # Configuración específica por entorno
-def load_env_config():
-    """Cargar configuración desde variables de entorno"""
-    config = get_config()
-    
-    # Variables de entorno específicas para Genesis CLI
-    if os.getenv("GENESIS_CLI_NO_BANNER"):
-        config.show_banner = False
-    
-    if os.getenv("GENESIS_CLI_NO_INTERACTIVE"):
-        config.interactive_mode = False
-    
-    if os.getenv("GENESIS_CLI_VERBOSE"):
-        config.verbose_output = True
-    
-    if os.getenv("GENESIS_CLI_DEBUG"):
-        config.debug_mode = True
-    
-    if os.getenv("GENESIS_CLI_SKIP_DEPS"):
-        config.skip_dependency_check = True
-    
-    default_template = os.getenv("GENESIS_CLI_DEFAULT_TEMPLATE")
-    if default_template:
-        config.default_template = default_template
-    
-    return config
\ No newline at end of file
+def load_env_config() -> CLIConfig:
+    """Volver a resolver la configuración con las variables de entorno actuales"""
+    return config_manager.reload_config()
+
+def set_cli_overrides(**values):
+    """Aplicar opciones de la línea de comandos sobre el resto de capas"""
+    config_manager.set_overrides(**values)
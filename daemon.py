@@ -0,0 +1,377 @@
+"""
+Daemon opcional de Genesis CLI
+
+Mantiene un proceso en segundo plano con genesis-core ya importado, su
+configuración inicializada, un único CoreOrchestrator y un único event loop.
+Los comandos `init`, `generate` y `deploy` le reenvían sus solicitudes a
+través de un socket Unix en ~/.genesis-cli/; si el daemon no está activo,
+la CLI ejecuta la solicitud en su propio proceso como siempre.
+
+DOCTRINA DEL ECOSISTEMA:
+- NO implementa lógica de generación
+- NO coordina agentes directamente
+- SÍ reduce el coste de arranque de la interfaz de usuario
+- Solo usa genesis-core como interfaz
+"""
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from genesis_cli import __version__
+
+DAEMON_DIR = Path.home() / ".genesis-cli"
+SOCKET_PATH = DAEMON_DIR / "daemon.sock"
+LOG_FILE = DAEMON_DIR / "logs" / "daemon.log"
+
+# Segundos sin solicitudes antes de que el daemon se detenga solo
+DEFAULT_IDLE_TIMEOUT = 900
+
+# Comandos que el daemon sabe ejecutar
+FORWARDED_COMMANDS = ("init", "generate", "deploy")
+
+# Segundos esperando la respuesta de una solicitud ya entregada al daemon
+REQUEST_TIMEOUT = 600.0
+
+# Respuesta de _send cuando el daemon recibió el mensaje pero no contestó
+NO_REPLY = "no_reply"
+
+# Segundos que se espera a que un daemon detenido libere su socket
+STOP_TIMEOUT = 10.0
+
+def is_supported() -> bool:
+    """Verificar si la plataforma soporta sockets Unix"""
+    return hasattr(socket, "AF_UNIX")
+
+def daemon_version() -> str:
+    """
+    Versión usada en el handshake cliente/daemon
+    
+    Incluye la versión de genesis-core: actualizar cualquiera de los dos
+    paquetes invalida un daemon que sigue ejecutando el código anterior.
+    """
+    from genesis_cli.result_cache import get_core_version
+    
+    return f"{__version__}+core.{get_core_version()}"
+
+# Cliente: usado por cada invocación de `genesis`
+
+def _send(message: Dict[str, Any], socket_path: Path = SOCKET_PATH,
+          timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """
+    Enviar un mensaje al daemon y devolver su respuesta
+    
+    Returns:
+        None si el mensaje no llegó al daemon; {"ok": False, "error": NO_REPLY}
+        si llegó pero no hubo respuesta válida a tiempo
+    """
+    if not is_supported() or not socket_path.exists():
+        return None
+    
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(socket_path))
+            sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+        except ConnectionRefusedError:
+            # Socket huérfano de un daemon que terminó sin limpiar
+            try:
+                socket_path.unlink()
+            except OSError:
+                pass
+            return None
+        except OSError:
+            return None
+        
+        # A partir de aquí el daemon tiene el mensaje: puede estar ejecutándolo
+        chunks = []
+        try:
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        except OSError:
+            return {"ok": False, "error": NO_REPLY}
+    
+    try:
+        return json.loads(b"".join(chunks).decode("utf-8"))
+    except ValueError:
+        return {"ok": False, "error": NO_REPLY}
+
+def get_daemon_info(socket_path: Path = SOCKET_PATH) -> Optional[Dict[str, Any]]:
+    """Obtener estado del daemon en ejecución (None si no hay daemon)"""
+    response = _send({"op": "hello", "version": daemon_version()}, socket_path, timeout=2.0)
+    return response if response and response.get("ok") else None
+
+def forward_request(command: str, config: Dict[str, Any],
+                    socket_path: Path = SOCKET_PATH,
+                    timeout: float = REQUEST_TIMEOUT) -> Optional[Dict[str, Any]]:
+    """
+    Reenviar una solicitud al daemon
+    
+    Returns:
+        El resultado del comando, o None si debe ejecutarse en proceso
+        (daemon inactivo, desactivado con GENESIS_CLI_NO_DAEMON, de otra
+        versión u ocupado con otra solicitud). Si el daemon recibió la
+        solicitud pero no responde en `timeout` segundos se devuelve un
+        error: ejecutarla también en proceso la repetiría.
+    """
+    if os.getenv("GENESIS_CLI_NO_DAEMON") or command not in FORWARDED_COMMANDS:
+        return None
+    
+    response = _send({
+        "op": "run",
+        "version": daemon_version(),
+        "command": command,
+        "config": config,
+        "cwd": os.getcwd(),
+    }, socket_path, timeout=timeout)
+    
+    if response is None or response.get("error") == "busy":
+        # Sin daemon, o el daemon la rechazó sin ejecutarla
+        return None
+    
+    if response.get("error") == NO_REPLY:
+        return {"success": False,
+                "error": "El daemon no respondió; la solicitud puede seguir en ejecución"}
+    
+    if response.get("error") == "version_mismatch":
+        # Daemon de una versión anterior: reemplazarlo para la próxima vez,
+        # solo cuando el anterior ya terminó y liberó el socket
+        if stop_daemon(socket_path):
+            start_daemon(wait=False, socket_path=socket_path)
+        return None
+    
+    if not response.get("ok"):
+        return {"success": False, "error": response.get("error", "Error desconocido en el daemon")}
+    
+    return response.get("result")
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # Existe pero es de otro usuario
+        return True
+    return True
+
+def stop_daemon(socket_path: Path = SOCKET_PATH, wait_timeout: float = STOP_TIMEOUT) -> bool:
+    """
+    Solicitar al daemon que se detenga y esperar a que termine
+    
+    El daemon borra su socket al salir: lanzar otro antes haría que el
+    anterior borrara el socket del nuevo.
+    
+    Returns:
+        bool: True si había un daemon y ya terminó
+    """
+    response = _send({"op": "shutdown"}, socket_path, timeout=5.0)
+    if not (response and response.get("ok")):
+        return False
+    
+    pid = response.get("pid")
+    deadline = time.monotonic() + wait_timeout
+    while time.monotonic() < deadline:
+        if not socket_path.exists() or (pid is not None and not _pid_alive(pid)):
+            return True
+        time.sleep(0.05)
+    return False
+
+def start_daemon(idle_timeout: int = DEFAULT_IDLE_TIMEOUT, wait: bool = True,
+                 socket_path: Path = SOCKET_PATH, wait_timeout: float = 30.0) -> bool:
+    """
+    Lanzar el daemon en segundo plano
+    
+    Returns:
+        bool: True si el daemon quedó escuchando (o si no se esperó)
+    """
+    if not is_supported():
+        return False
+    
+    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(LOG_FILE, "ab") as log:
+        subprocess.Popen(
+            [sys.executable, "-m", "genesis_cli.daemon",
+             "--idle-timeout", str(idle_timeout), "--socket", str(socket_path)],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,
+        )
+    
+    if not wait:
+        return True
+    
+    deadline = time.monotonic() + wait_timeout
+    while time.monotonic() < deadline:
+        if get_daemon_info(socket_path) is not None:
+            return True
+        time.sleep(0.1)
+    return False
+
+# Servidor: proceso de larga duración lanzado con `genesis daemon start`
+
+class GenesisDaemon:
+    """
+    Servidor del daemon
+    
+    Atiende una solicitud por conexión (una línea JSON de ida y una de vuelta).
+    Las solicitudes se ejecutan de una en una porque dependen del directorio
+    de trabajo del cliente, que es global al proceso; mientras hay una en
+    curso las demás se rechazan con `busy` para que el cliente las ejecute
+    en su propio proceso en lugar de esperar en cola.
+    
+    DOCTRINA: Solo usa genesis-core como interfaz
+    """
+    
+    def __init__(self, socket_path: Path = SOCKET_PATH, idle_timeout: int = DEFAULT_IDLE_TIMEOUT):
+        self.socket_path = socket_path
+        self.idle_timeout = idle_timeout
+        self.version = daemon_version()
+        self.started_at = time.time()
+        self.last_activity = time.monotonic()
+        self.requests_served = 0
+        self.orchestrator = None
+        self._cli = None
+        self._lock = None
+        self._stop = None
+    
+    def _load(self):
+        """Importar genesis-core e inicializar el orquestador compartido"""
+        from genesis_cli import main as cli
+        
+        cli._ensure_core()
+        self._cli = cli
+        self.orchestrator = cli.CoreOrchestrator()
+    
+    async def _execute(self, command: str, config: Dict[str, Any]) -> Dict[str, Any]:
+        cli = self._cli
+        if command == "init":
+            return await cli._create_project_async(config, orchestrator=self.orchestrator)
+        if command == "generate":
+            return await cli._generate_async(config, orchestrator=self.orchestrator)
+        if command == "deploy":
+            return await cli._deploy_async(config, orchestrator=self.orchestrator)
+        return {"success": False, "error": f"Comando no soportado por el daemon: {command}"}
+    
+    async def _dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        op = request.get("op")
+        
+        if op == "hello":
+            return {
+                "ok": True,
+                "version": self.version,
+                "pid": os.getpid(),
+                "started_at": self.started_at,
+                "requests_served": self.requests_served,
+                "idle_timeout": self.idle_timeout,
+            }
+        
+        if op == "shutdown":
+            self._stop.set()
+            return {"ok": True, "pid": os.getpid()}
+        
+        if op == "run":
+            if request.get("version") != self.version:
+                return {"ok": False, "error": "version_mismatch", "version": self.version}
+            
+            if self._lock.locked():
+                return {"ok": False, "error": "busy"}
+            
+            async with self._lock:
+                previous_cwd = os.getcwd()
+                try:
+                    os.chdir(request.get("cwd") or previous_cwd)
+                    result = await self._execute(request.get("command", ""), request.get("config") or {})
+                finally:
+                    os.chdir(previous_cwd)
+                    self.requests_served += 1
+            return {"ok": True, "result": result}
+        
+        return {"ok": False, "error": f"Operación desconocida: {op}"}
+    
+    async def _handle(self, reader, writer):
+        self.last_activity = time.monotonic()
+        try:
+            line = await reader.readline()
+            try:
+                request = json.loads(line.decode("utf-8"))
+                response = await self._dispatch(request)
+            except ValueError:
+                response = {"ok": False, "error": "Solicitud inválida"}
+            except Exception as e:
+                response = {"ok": False, "error": str(e)}
+            
+            writer.write(json.dumps(response, default=str).encode("utf-8") + b"\n")
+            await writer.drain()
+        finally:
+            self.last_activity = time.monotonic()
+            writer.close()
+    
+    async def _watch_idle(self):
+        import asyncio
+        
+        while not self._stop.is_set():
+            await asyncio.sleep(min(self.idle_timeout, 30))
+            idle = time.monotonic() - self.last_activity
+            if not self._lock.locked() and idle >= self.idle_timeout:
+                self._stop.set()
+    
+    async def serve(self):
+        """Escuchar solicitudes hasta recibir shutdown o superar el tiempo inactivo"""
+        import asyncio
+        
+        self._lock = asyncio.Lock()
+        self._stop = asyncio.Event()
+        self._load()
+        
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+        
+        server = await asyncio.start_unix_server(self._handle, path=str(self.socket_path))
+        os.chmod(self.socket_path, 0o600)
+        bound_inode = os.stat(self.socket_path).st_ino
+        watcher = asyncio.ensure_future(self._watch_idle())
+        
+        try:
+            await self._stop.wait()
+        finally:
+            watcher.cancel()
+            server.close()
+            await server.wait_closed()
+            try:
+                # Solo si sigue siendo nuestro socket: otro daemon pudo ocupar la ruta
+                if os.stat(self.socket_path).st_ino == bound_inode:
+                    self.socket_path.unlink()
+            except OSError:
+                pass
+
+def run_daemon(socket_path: Path = SOCKET_PATH, idle_timeout: int = DEFAULT_IDLE_TIMEOUT):
+    """Ejecutar el daemon en primer plano"""
+    import asyncio
+    
+    os.umask(0o077)
+    asyncio.run(GenesisDaemon(socket_path, idle_timeout).serve())
+
+def main(argv: Optional[list] = None):
+    """Entry point de `python -m genesis_cli.daemon`"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(prog="genesis-daemon")
+    parser.add_argument("--idle-timeout", type=int, default=DEFAULT_IDLE_TIMEOUT)
+    parser.add_argument("--socket", type=Path, default=SOCKET_PATH)
+    args = parser.parse_args(argv)
+    
+    run_daemon(args.socket, args.idle_timeout)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Sondeo de directorios para Genesis CLI
+
+Reúne en una sola pasada lo que los validadores necesitan saber de un
+directorio: si existe, si es un directorio, si se puede escribir, si está
+vacío y el espacio libre. Usa un `os.stat`, `os.access` en lugar de crear y
+borrar un archivo de prueba, y `os.scandir` detenido en la primera entrada
+en lugar de listar el directorio. Dentro de `directory_probe_scope()` cada
+ruta se sondea una sola vez, y `probe_directories` sondea muchas rutas en
+paralelo (manifiestos de `init --manifest`).
+
+DOCTRINA DEL ECOSISTEMA:
+- NO implementa lógica de generación
+- NO coordina agentes directamente
+- SÍ valida entrada del usuario
+- Solo herramientas para interfaz de usuario
+"""
+
+import os
+import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Union
+
+# Hilos para sondear rutas en paralelo (las esperas son de E/S)
+DEFAULT_PROBE_WORKERS = 8
+
+@dataclass(frozen=True)
+class DirectoryProbe:
+    """
+    Hechos de una ruta en el momento del sondeo
+    
+    `empty` y `free_bytes` son None si no se pidieron o no aplican (la ruta
+    no existe o no es un directorio). `error` recoge un fallo distinto de
+    "no existe" (por ejemplo, sin permiso para leer el directorio).
+    
+    DOCTRINA: Validamos entrada del usuario
+    """
+    path: str
+    exists: bool
+    is_dir: bool = False
+    writable: bool = False
+    empty: Optional[bool] = None
+    free_bytes: Optional[int] = None
+    error: Optional[str] = None
+    
+    def covers(self, empty: bool, free: bool) -> bool:
+        """Si ya responde a lo que se pide"""
+        if not self.is_dir or self.error:
+            return True
+        return (not empty or self.empty is not None) and (not free or self.free_bytes is not None)
+
+_scope: "ContextVar[Optional[Dict[str, DirectoryProbe]]]" = ContextVar("directory_probe_scope", default=None)
+
+@contextmanager
+def directory_probe_scope() -> Iterator[Dict[str, DirectoryProbe]]:
+    """
+    Reutilizar los sondeos durante un comando
+    
+    Fuera de un ámbito cada llamada vuelve a sondear; los ámbitos anidados
+    comparten la caché del exterior.
+    """
+    cache = _scope.get()
+    if cache is not None:
+        yield cache
+        return
+    
+    token = _scope.set({})
+    try:
+        yield _scope.get()
+    finally:
+        _scope.reset(token)
+
+def _probe(path: str, empty: bool, free: bool) -> DirectoryProbe:
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return DirectoryProbe(path, exists=False)
+    except OSError as e:
+        return DirectoryProbe(path, exists=False, error=str(e))
+    
+    if not stat.S_ISDIR(st.st_mode):
+        return DirectoryProbe(path, exists=True)
+    
+    probe = DirectoryProbe(path, exists=True, is_dir=True, writable=os.access(path, os.W_OK))
+    
+    if empty:
+        try:
+            with os.scandir(path) as entries:
+                probe = replace(probe, empty=next(entries, None) is None)
+        except OSError as e:
+            return replace(probe, error=str(e))
+    
+    if free:
+        try:
+            probe = replace(probe, free_bytes=shutil.disk_usage(path).free)
+        except OSError:
+            # El espacio libre es informativo: si no se puede obtener, se omite
+            pass
+    
+    return probe
+
+def probe_directory(path: Union[str, Path], empty: bool = False, free: bool = False) -> DirectoryProbe:
+    """
+    Sondear una ruta
+    
+    Args:
+        path: Ruta a sondear
+        empty: Comprobar si el directorio está vacío
+        free: Obtener el espacio libre del sistema de archivos
+    """
+    key = os.path.abspath(os.fspath(path))
+    cache = _scope.get()
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None and cached.covers(empty, free):
+            return cached
+        if cached is not None:
+            empty = empty or cached.empty is not None
+            free = free or cached.free_bytes is not None
+    
+    probe = _probe(key, empty, free)
+    if cache is not None:
+        cache[key] = probe
+    return probe
+
+def probe_directories(paths: Iterable[Union[str, Path]], empty: bool = False, free: bool = False,
+                      workers: int = DEFAULT_PROBE_WORKERS) -> Dict[str, DirectoryProbe]:
+    """
+    Sondear muchas rutas en paralelo
+    
+    Dentro de un ámbito, los resultados quedan en su caché para que las
+    validaciones posteriores no vuelvan al sistema de archivos.
+    
+    Returns:
+        Dict[str, DirectoryProbe]: Sondeo por ruta absoluta
+    """
+    keys = list(dict.fromkeys(os.path.abspath(os.fspath(path)) for path in paths))
+    cache = _scope.get()
+    results: Dict[str, DirectoryProbe] = {}
+    pending = []
+    for key in keys:
+        cached = cache.get(key) if cache is not None else None
+        if cached is not None and cached.covers(empty, free):
+            results[key] = cached
+        else:
+            pending.append(key)
+    
+    if len(pending) > 1 and workers > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(pending))) as executor:
+            probes = list(executor.map(lambda key: _probe(key, empty, free), pending))
+    else:
+        probes = [_probe(key, empty, free) for key in pending]
+    
+    for key, probe in zip(pending, probes):
+        results[key] = probe
+        if cache is not None:
+            cache[key] = probe
+    
+    return {key: results[key] for key in keys}
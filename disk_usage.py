@@ -0,0 +1,272 @@
+"""
+Uso de disco del proyecto para Genesis CLI
+
+Calcula el tamaño de un árbol de directorios con `os.scandir`, reutilizando
+el `stat` de cada DirEntry y repartiendo los subdirectorios de primer nivel
+entre un pool de hilos. Una caché por directorio, indexada por su mtime,
+permite que las ejecuciones repetidas no vuelvan a listar los directorios
+que no cambiaron.
+
+La mtime de un directorio cambia al crear, borrar o renombrar entradas, no al
+modificar el contenido de un archivo existente: un archivo reescrito en el
+mismo sitio conserva el tamaño cacheado hasta que su directorio cambie.
+
+DOCTRINA DEL ECOSISTEMA:
+- NO implementa lógica de generación
+- NO coordina agentes directamente
+- SÍ proporciona utilities de UX/UI
+- Solo usa genesis-core como interfaz
+"""
+
+import fnmatch
+import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+DISK_CACHE_FILE = Path.home() / ".genesis-cli" / "disk-cache.json"
+
+# Cambiar al modificar el formato de las entradas
+DISK_CACHE_FORMAT = 1
+
+# Raíces distintas que conserva la caché (las menos usadas se descartan)
+MAX_CACHED_ROOTS = 16
+
+# Directorios modificados hace menos de esto no se cachean: otra escritura
+# dentro del mismo tick de mtime pasaría desapercibida
+RACY_WINDOW_NS = 2 * 1_000_000_000
+
+# Nombre de la fila de archivos que están directamente en la raíz
+ROOT_FILES = "."
+
+@dataclass
+class DiskUsage:
+    """
+    Resultado del cálculo de uso de disco
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    total: int = 0
+    files: int = 0
+    directories: Dict[str, int] = field(default_factory=dict)  # totales por directorio de primer nivel
+    root_files: int = 0  # bytes de los archivos de la raíz
+    cached_dirs: int = 0
+    scanned_dirs: int = 0
+
+def compile_excludes(patterns: Iterable[str]):
+    """
+    Compilar los globs de exclusión en una sola expresión regular
+    
+    Cada patrón se compara con el nombre de la entrada y con su ruta relativa
+    a la raíz (separada por "/").
+    
+    Returns:
+        Función (nombre, ruta relativa) -> bool, o None si no hay patrones
+    """
+    patterns = [pattern.strip().rstrip("/") for pattern in patterns if pattern and pattern.strip()]
+    if not patterns:
+        return None
+    
+    regex = re.compile("|".join(f"(?:{fnmatch.translate(pattern)})" for pattern in patterns))
+    match = regex.match
+    return lambda name, relative_path: match(name) is not None or match(relative_path) is not None
+
+class DiskUsageCache:
+    """
+    Caché de tamaños por directorio en ~/.genesis-cli/disk-cache.json
+    
+    Para cada directorio guarda su mtime, los bytes y el número de sus
+    archivos propios (sin subdirectorios) y los nombres de sus
+    subdirectorios. Las entradas se separan por raíz y por globs de exclusión.
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def __init__(self, cache_file: Optional[Path] = None):
+        self.cache_file = cache_file or DISK_CACHE_FILE
+        self._data: Optional[Dict[str, Any]] = None
+    
+    def _load(self) -> Dict[str, Any]:
+        if self._data is None:
+            try:
+                with open(self.cache_file, "r") as f:
+                    data = json.load(f)
+                if not isinstance(data, dict) or data.get("format") != DISK_CACHE_FORMAT:
+                    raise ValueError("formato de caché desconocido")
+                self._data = data
+            except (OSError, ValueError):
+                self._data = {"format": DISK_CACHE_FORMAT, "roots": {}}
+        return self._data
+    
+    @staticmethod
+    def root_key(root: Path, excludes: Iterable[str]) -> str:
+        return json.dumps([str(root), sorted(excludes)])
+    
+    def entries(self, key: str) -> Dict[str, List[Any]]:
+        """Entradas guardadas para una raíz: {ruta relativa: [mtime_ns, bytes, archivos, subdirectorios]}"""
+        return self._load()["roots"].get(key, {}).get("dirs", {})
+    
+    def update(self, key: str, entries: Dict[str, List[Any]]):
+        """Reemplazar las entradas de una raíz y guardar de forma atómica"""
+        roots = self._load()["roots"]
+        roots[key] = {"dirs": entries, "last_used": time.time()}
+        for stale in sorted(roots, key=lambda k: roots[k].get("last_used", 0))[:-MAX_CACHED_ROOTS]:
+            del roots[stale]
+        
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, "w") as f:
+                # json.dumps usa el codificador en C; json.dump a un archivo no
+                f.write(json.dumps(self._data, separators=(",", ":")))
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            # Sin caché solo se pierde velocidad
+            pass
+    
+    def clear(self):
+        """Eliminar la caché de uso de disco"""
+        self._data = None
+        try:
+            self.cache_file.unlink()
+        except OSError:
+            pass
+
+class _Scanner:
+    """Recorrido de un árbol con os.scandir; cada hilo trabaja con su propio subárbol"""
+    
+    def __init__(self, root: Path, excluded, previous: Dict[str, List[Any]], now_ns: int):
+        self.root = root
+        self.excluded = excluded
+        self.previous = previous
+        self.fresh: Dict[str, List[Any]] = {}
+        self.racy_after = now_ns - RACY_WINDOW_NS
+    
+    def scan_dir(self, relative_path: str, mtime_ns: int) -> Tuple[int, int, List[Tuple[str, Optional[int]]], bool]:
+        """
+        Bytes y archivos propios de un directorio y sus subdirectorios
+        
+        Returns:
+            (bytes, archivos, [(subdirectorio, mtime_ns o None)], desde caché)
+        """
+        cached = self.previous.get(relative_path)
+        if cached is not None and cached[0] == mtime_ns:
+            self.fresh[relative_path] = cached
+            return cached[1], cached[2], [(name, None) for name in cached[3]], True
+        
+        size = files = 0
+        subdirs = []
+        excluded = self.excluded
+        prefix = f"{relative_path}/" if relative_path else ""
+        try:
+            with os.scandir(self.root / relative_path if relative_path else self.root) as entries:
+                for entry in entries:
+                    if excluded is not None and excluded(entry.name, prefix + entry.name):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append((entry.name, entry.stat(follow_symlinks=False).st_mtime_ns))
+                        elif not entry.is_symlink() or not entry.is_dir():
+                            size += entry.stat().st_size
+                            files += 1
+                    except OSError:
+                        # Enlaces rotos o archivos sin permiso
+                        continue
+        except OSError:
+            return 0, 0, [], False
+        
+        if mtime_ns < self.racy_after:
+            self.fresh[relative_path] = [mtime_ns, size, files, [name for name, _ in subdirs]]
+        return size, files, subdirs, False
+    
+    def walk(self, relative_path: str, mtime_ns: int) -> Tuple[int, int, int, int]:
+        """
+        Totales de un subárbol completo
+        
+        Returns:
+            (bytes, archivos, directorios desde caché, directorios listados)
+        """
+        total = files = cached_dirs = scanned_dirs = 0
+        stack = [(relative_path, mtime_ns)]
+        while stack:
+            current, current_mtime = stack.pop()
+            size, count, subdirs, cached = self.scan_dir(current, current_mtime)
+            total += size
+            files += count
+            if cached:
+                cached_dirs += 1
+            else:
+                scanned_dirs += 1
+            
+            for name, child_mtime in subdirs:
+                child = f"{current}/{name}" if current else name
+                if child_mtime is None:
+                    try:
+                        child_mtime = os.stat(self.root / child, follow_symlinks=False).st_mtime_ns
+                    except OSError:
+                        continue
+                stack.append((child, child_mtime))
+        return total, files, cached_dirs, scanned_dirs
+
+def scan_disk_usage(root: Path, exclude: Iterable[str] = (), workers: Optional[int] = None,
+                    cache: Optional[DiskUsageCache] = None) -> DiskUsage:
+    """
+    Calcular el uso de disco de `root` con totales por directorio de primer nivel
+    
+    Args:
+        root: Directorio a recorrer
+        exclude: Globs de archivos o directorios a ignorar (nombre o ruta relativa)
+        workers: Hilos para recorrer los subdirectorios (por defecto según CPUs)
+        cache: Caché por directorio; sin ella se listan todos los directorios
+    """
+    root = Path(root).resolve()
+    exclude = list(exclude)
+    usage = DiskUsage()
+    
+    key = DiskUsageCache.root_key(root, exclude) if cache is not None else None
+    previous = cache.entries(key) if cache is not None else {}
+    scanner = _Scanner(root, compile_excludes(exclude), previous, time.time_ns())
+    
+    try:
+        root_mtime = os.stat(root).st_mtime_ns
+    except OSError:
+        return usage
+    
+    size, files, subdirs, cached = scanner.scan_dir("", root_mtime)
+    usage.root_files = usage.total = size
+    usage.files = files
+    usage.cached_dirs, usage.scanned_dirs = (1, 0) if cached else (0, 1)
+    
+    def _walk_top(subdir: Tuple[str, Optional[int]]) -> Tuple[str, Tuple[int, int, int, int]]:
+        name, mtime_ns = subdir
+        if mtime_ns is None:
+            try:
+                mtime_ns = os.stat(root / name, follow_symlinks=False).st_mtime_ns
+            except OSError:
+                return name, (0, 0, 0, 0)
+        return name, scanner.walk(name, mtime_ns)
+    
+    if subdirs:
+        workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        if workers == 1 or len(subdirs) == 1:
+            results = map(_walk_top, subdirs)
+        else:
+            with ThreadPoolExecutor(max_workers=min(workers, len(subdirs))) as pool:
+                results = list(pool.map(_walk_top, subdirs))
+        
+        for name, (size, files, cached_dirs, scanned_dirs) in results:
+            usage.directories[name] = size
+            usage.total += size
+            usage.files += files
+            usage.cached_dirs += cached_dirs
+            usage.scanned_dirs += scanned_dirs
+    
+    if cache is not None and scanner.fresh != previous:
+        # Solo se conservan los directorios vistos en este recorrido
+        cache.update(key, scanner.fresh)
+    
+    return usage
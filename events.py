@@ -0,0 +1,136 @@
+"""
+Eventos de progreso de generación para Genesis CLI
+
+Normaliza los eventos que emite genesis-core durante la generación de un
+proyecto (fase iniciada, archivo escrito, agente terminado) y adapta la
+llamada al orquestador según lo que este soporte: un iterador asíncrono de
+eventos, un callback de progreso o, si no soporta ninguno, la llamada simple.
+
+DOCTRINA DEL ECOSISTEMA:
+- NO implementa lógica de generación
+- NO coordina agentes directamente
+- SÍ muestra progreso y estado
+- Solo usa genesis-core como interfaz
+"""
+
+import inspect
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+# Tipos de evento
+PHASE_STARTED = "phase_started"
+FILE_WRITTEN = "file_written"
+AGENT_FINISHED = "agent_finished"
+COMPLETED = "completed"
+
+EVENT_TYPES = (PHASE_STARTED, FILE_WRITTEN, AGENT_FINISHED, COMPLETED)
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """
+    Evento de progreso de la generación
+    
+    `name` es la fase o el agente según el tipo; `total` es el número de
+    fases esperadas en `phase_started` y de archivos en `file_written`.
+    `result` solo viaja en el evento `completed` de un iterador.
+    
+    DOCTRINA: Mostramos progreso y estado elegante
+    """
+    type: str
+    name: Optional[str] = None
+    path: Optional[str] = None
+    total: Optional[int] = None
+    message: Optional[str] = None
+    result: Any = None
+    
+    @classmethod
+    def from_raw(cls, raw: Any) -> "ProgressEvent":
+        """Crear evento desde un dict u objeto emitido por genesis-core"""
+        if isinstance(raw, cls):
+            return raw
+        
+        if isinstance(raw, dict):
+            get = raw.get
+        else:
+            def get(key, default=None):
+                return getattr(raw, key, default)
+        
+        event_type = str(get("type") or get("event") or "").lower().replace("-", "_").replace(".", "_")
+        total = get("total")
+        return cls(
+            type=event_type,
+            name=get("name") or get("phase") or get("agent"),
+            path=get("path") or get("file"),
+            total=int(total) if total is not None else None,
+            message=get("message"),
+            result=get("result"),
+        )
+
+EventCallback = Callable[[ProgressEvent], None]
+
+def _class_attribute(obj: Any, name: str) -> Any:
+    """
+    Buscar el método en la clase y no en la instancia
+    
+    Así los dobles de prueba (Mock) que solo definen atributos de instancia
+    se tratan como orquestadores sin soporte de eventos.
+    """
+    return inspect.getattr_static(type(obj), name, None)
+
+def supports_event_stream(orchestrator: Any) -> bool:
+    """Verificar si el orquestador expone `stream_project_generation`"""
+    method = _class_attribute(orchestrator, "stream_project_generation")
+    return inspect.isasyncgenfunction(method) or inspect.isfunction(method)
+
+def supports_progress_callback(orchestrator: Any) -> bool:
+    """Verificar si `execute_project_generation` acepta `progress_callback`"""
+    method = _class_attribute(orchestrator, "execute_project_generation")
+    if not callable(method):
+        return False
+    
+    try:
+        parameters = inspect.signature(method).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    
+    return any(
+        parameter.name == "progress_callback" or parameter.kind is inspect.Parameter.VAR_KEYWORD
+        for parameter in parameters
+    )
+
+async def execute_with_progress(orchestrator: Any, request: Any,
+                                on_event: Optional[EventCallback] = None) -> Any:
+    """
+    Ejecutar la generación del proyecto emitiendo eventos de progreso
+    
+    Args:
+        orchestrator: CoreOrchestrator de genesis-core
+        request: ProjectGenerationRequest
+        on_event: Callback que recibe cada ProgressEvent (opcional)
+    
+    Returns:
+        El resultado de genesis-core, igual que `execute_project_generation`
+    """
+    if on_event is None:
+        return await orchestrator.execute_project_generation(request)
+    
+    if supports_event_stream(orchestrator):
+        result = None
+        async for raw in orchestrator.stream_project_generation(request):
+            event = ProgressEvent.from_raw(raw)
+            if event.type == COMPLETED:
+                result = event.result
+            else:
+                on_event(event)
+        
+        if result is None:
+            raise RuntimeError("La generación terminó sin devolver un resultado")
+        return result
+    
+    if supports_progress_callback(orchestrator):
+        return await orchestrator.execute_project_generation(
+            request,
+            progress_callback=lambda raw: on_event(ProgressEvent.from_raw(raw))
+        )
+    
+    return await orchestrator.execute_project_generation(request)
@@ -0,0 +1,180 @@
+"""
+Grafo de dependencias entre características para Genesis CLI
+
+Compila el catálogo de características (las de FeatureValidator o las que
+informe genesis-core) en máscaras de bits: cada característica ocupa un bit
+en orden topológico (dependencias primero) y guarda la máscara de su cierre
+transitivo. Resolver un conjunto de características se reduce a unas pocas
+operaciones OR, y el orden que necesita el orquestador es el orden de los
+bits.
+
+DOCTRINA DEL ECOSISTEMA:
+- NO implementa lógica de generación
+- NO coordina agentes directamente
+- SÍ valida entrada del usuario
+- Solo usa genesis-core como interfaz
+"""
+
+from dataclasses import dataclass
+from itertools import compress
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
+
+_BIT_SELECTORS = bytes.maketrans(b"01", b"\x00\x01")
+
+@dataclass(frozen=True)
+class FeatureGraph:
+    """
+    Catálogo de características compilado
+    
+    `features` está en orden topológico: el bit `i` corresponde a
+    `features[i]` y ninguna característica depende de otra con un bit mayor,
+    salvo dentro de un ciclo.
+    
+    DOCTRINA: Validamos entrada del usuario
+    """
+    features: Tuple[str, ...]
+    index: Dict[str, int]
+    closures: Tuple[int, ...]  # máscara del cierre transitivo de cada bit (incluido él mismo)
+    cycles: Tuple[Tuple[str, ...], ...]
+    cycle_mask: int  # bits de las características que forman parte de algún ciclo
+    missing: Dict[str, Tuple[str, ...]]  # dependencias que no están en el catálogo
+    
+    @classmethod
+    def compile(cls, catalog: Mapping[str, Mapping[str, Any]]) -> "FeatureGraph":
+        """
+        Compilar el catálogo {característica: {'dependencies': [...]}}
+        
+        Los ciclos se detectan con el algoritmo de Tarjan (iterativo), que
+        entrega cada componente después de todas sus dependencias: ese es
+        directamente el orden topológico.
+        """
+        edges: Dict[str, List[str]] = {}
+        missing: Dict[str, Tuple[str, ...]] = {}
+        for feature, info in catalog.items():
+            dependencies = list((info or {}).get("dependencies") or [])
+            edges[feature] = [dep for dep in dependencies if dep in catalog]
+            unknown = tuple(dep for dep in dependencies if dep not in catalog)
+            if unknown:
+                missing[feature] = unknown
+        
+        components = _strongly_connected(edges)
+        
+        features: List[str] = []
+        for component in components:
+            features.extend(component)
+        index = {feature: position for position, feature in enumerate(features)}
+        
+        closures = [0] * len(features)
+        cycles = []
+        cycle_mask = 0
+        for component in components:
+            mask = 0
+            for feature in component:
+                mask |= 1 << index[feature]
+                for dep in edges[feature]:
+                    if dep not in component:
+                        mask |= closures[index[dep]]
+            
+            is_cycle = len(component) > 1 or component[0] in edges[component[0]]
+            if is_cycle:
+                cycles.append(tuple(component))
+                for feature in component:
+                    cycle_mask |= 1 << index[feature]
+            
+            for feature in component:
+                closures[index[feature]] = mask
+        
+        return cls(tuple(features), index, tuple(closures), tuple(cycles), cycle_mask, missing)
+    
+    def mask(self, features: Iterable[str]) -> int:
+        """Máscara del cierre transitivo de `features` (las desconocidas se ignoran)"""
+        index = self.index
+        closures = self.closures
+        mask = 0
+        for feature in features:
+            position = index.get(feature)
+            if position is not None:
+                mask |= closures[position]
+        return mask
+    
+    def names(self, mask: int) -> List[str]:
+        """Características de una máscara, en orden topológico"""
+        # bin() da los bits del más alto al más bajo: invertidos y traducidos a
+        # bytes 0/1 sirven de selector para compress sin iterar bit a bit
+        selectors = bin(mask)[:1:-1].encode("ascii").translate(_BIT_SELECTORS)
+        return list(compress(self.features, selectors))
+    
+    def resolve(self, features: Iterable[str]) -> List[str]:
+        """
+        Características más todas sus dependencias, dependencias primero
+        
+        Las características que no están en el catálogo se conservan al
+        final, en el orden recibido.
+        """
+        features = list(features)
+        index = self.index
+        unknown = [feature for feature in dict.fromkeys(features) if feature not in index]
+        return self.names(self.mask(features)) + unknown
+    
+    def cycles_in(self, features: Iterable[str]) -> List[Tuple[str, ...]]:
+        """Ciclos alcanzables desde `features`"""
+        mask = self.mask(features)
+        if not mask & self.cycle_mask:
+            return []
+        index = self.index
+        return [cycle for cycle in self.cycles if mask >> index[cycle[0]] & 1]
+
+def _strongly_connected(edges: Mapping[str, List[str]]) -> List[List[str]]:
+    """
+    Componentes fuertemente conexas en orden de dependencias primero
+    
+    Tarjan iterativo: el orden de recorrido sigue el del catálogo para que
+    el resultado sea determinista.
+    """
+    counter = 0
+    order: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    stack: List[str] = []
+    on_stack = set()
+    components: List[List[str]] = []
+    
+    for root in edges:
+        if root in order:
+            continue
+        
+        work = [(root, 0)]
+        while work:
+            node, child_index = work.pop()
+            if child_index == 0:
+                order[node] = lowlink[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack.add(node)
+            
+            children = edges[node]
+            while child_index < len(children):
+                child = children[child_index]
+                child_index += 1
+                if child not in order:
+                    # Procesar el hijo y volver a este nodo después
+                    work.append((node, child_index))
+                    work.append((child, 0))
+                    break
+                if child in on_stack:
+                    lowlink[node] = min(lowlink[node], order[child])
+            else:
+                if lowlink[node] == order[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component[::-1])
+                
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+    
+    return components
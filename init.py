@@ -21,32 +21,49 @@ __email__ = "team@genesis.dev"
 
 # Configuración de logging
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
-# Importaciones principales con manejo de errores
-try:
-    # Solo importamos genesis-core, nunca MCPturbo directamente
-    from genesis_core.orchestrator.core_orchestrator import CoreOrchestrator
-    from genesis_core.project_manager import ProjectManager
-except Exception as e:  # pragma: no cover - graceful fallback if deps fail
-    logger.error(f"Failed to import genesis-core dependencies: {e}", exc_info=True)
-    CoreOrchestrator = None
-    ProjectManager = None
-
-# Importaciones CLI específicas
-try:
-    from .commands.utils import show_banner, check_dependencies
-    from .ui.console import genesis_console
-    from .utils import get_terminal_size, is_interactive_terminal
-except Exception as e:  # pragma: no cover - graceful fallback
-    logger.error(f"Failed to import CLI utilities: {e}", exc_info=True)
-    show_banner = None
-    check_dependencies = None
-    genesis_console = None
-    get_terminal_size = None
-    is_interactive_terminal = None
+# Comando en curso, para los registros JSONL del log. Vive aquí y no en
+# genesis_cli.logging para que registrarlo no cargue el log en cada ejecución
+current_command = {"name": None, "started": time.time()}
+
+def start_command(name):
+    """Registrar el comando en curso: nombre y origen de elapsed_ms"""
+    current_command["name"] = name
+    current_command["started"] = time.time()
+
+# Importaciones bajo demanda (PEP 562): importar el paquete no debe cargar
+# genesis-core ni Rich, para que el arranque de la CLI sea inmediato.
+# DOCTRINA: Solo importamos genesis-core, nunca MCPturbo directamente
+_LAZY_EXPORTS = {
+    "CoreOrchestrator": ("genesis_core.orchestrator.core_orchestrator", "CoreOrchestrator"),
+    "ProjectManager": ("genesis_core.project_manager", "ProjectManager"),
+    "show_banner": (".commands.utils", "show_banner"),
+    "check_dependencies": (".commands.utils", "check_dependencies"),
+    "genesis_console": (".ui.console", "genesis_console"),
+    "get_terminal_size": (".utils", "get_terminal_size"),
+    "is_interactive_terminal": (".utils", "is_interactive_terminal"),
+}
+
+def __getattr__(name):
+    """Resolver exportaciones pesadas solo cuando se usan"""
+    target = _LAZY_EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    module_name, attribute = target
+    try:
+        from importlib import import_module
+        value = getattr(import_module(module_name, __name__), attribute)
+    except Exception as e:  # pragma: no cover - graceful fallback if deps fail
+        logger.error(f"Failed to import {module_name}.{attribute}: {e}", exc_info=True)
+        value = None
+    
+    globals()[name] = value
+    return value
 
 __all__ = [
     "CoreOrchestrator",
@@ -56,6 +73,7 @@ __all__ = [
     "genesis_console",
     "get_terminal_size",
     "is_interactive_terminal",
+    "start_command",
     "__version__",
     "__author__",
     "__email__"
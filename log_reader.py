@@ -0,0 +1,494 @@
+"""
+Lectura de los logs de Genesis CLI
+
+Lee ~/.genesis-cli/logs sin cargar archivos enteros en memoria:
+
+- Las últimas N líneas se leen desde el final del archivo, en bloques hacia
+  atrás, y solo se pasa a los segmentos anteriores si faltan líneas.
+- El seguimiento (--follow) espera cambios con inotify en Linux y, si no está
+  disponible, consultando el archivo a intervalos; detecta la rotación por
+  el inodo y continúa en el archivo nuevo.
+- Las búsquedas por fecha usan un índice disperso guardado en
+  ~/.genesis-cli/log-index.json: cada INDEX_STRIDE bytes se apunta el
+  desplazamiento y la hora máxima vista antes de él. Los archivos (o tramos)
+  cuyos registros son todos anteriores a --since se saltan sin leerlos; el
+  archivo activo solo se indexa desde donde se quedó la vez anterior.
+
+Entiende los dos formatos del archivo de log: texto (FILE_LOG_FORMAT) y
+JSON Lines. Las líneas sin hora (trazas) pertenecen al registro anterior.
+
+DOCTRINA DEL ECOSISTEMA:
+- NO implementa lógica de generación
+- NO coordina agentes directamente
+- SÍ muestra los logs de la CLI
+- Solo herramientas para interfaz de usuario
+"""
+
+import bisect
+import gzip
+import json
+import os
+import re
+import select
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, IO, Iterator, List, Optional, Pattern, Tuple
+
+from genesis_cli.logging import LOG_FILE_NAME, is_log_segment
+
+LOG_INDEX_FILE = Path.home() / ".genesis-cli" / "log-index.json"
+
+# Cambiar al modificar el formato del índice
+LOG_INDEX_FORMAT = 1
+
+# Bytes entre dos puntos del índice
+INDEX_STRIDE = 256 * 1024
+
+# Tamaño de los bloques leídos hacia atrás desde el final
+READ_BLOCK_SIZE = 64 * 1024
+
+# Espera entre consultas al seguir un archivo sin inotify (segundos)
+FOLLOW_POLL_INTERVAL = 0.25
+
+# Espera máxima con inotify antes de volver a mirar el archivo (segundos)
+FOLLOW_WAKEUP_INTERVAL = 1.0
+
+# Niveles en orden de gravedad (--level muestra ese nivel y los superiores)
+LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+_DURATION = re.compile(r"^(\d+(?:\.\d+)?)\s*([smhdw])$")
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 7 * 86400}
+
+@dataclass
+class LogEntry:
+    """
+    Un registro del log: su primera línea y las que la continúan
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    timestamp: Optional[float]
+    level: Optional[str]
+    lines: List[str] = field(default_factory=list)
+    
+    @property
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+def parse_header(line: str) -> Optional[Tuple[float, str]]:
+    """Hora (epoch) y nivel si `line` empieza un registro; None si es una continuación"""
+    if line.startswith("{"):
+        try:
+            entry = json.loads(line)
+            return datetime.fromisoformat(entry["ts"]).timestamp(), entry.get("level", "")
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return None
+    
+    # "2026-10-17 10:15:00,123 - genesis-cli - INFO - mensaje"
+    if len(line) < 23 or line[4] != "-" or line[10] != " " or line[19] != ",":
+        return None
+    try:
+        timestamp = _text_minute(line[:16]) + int(line[17:19]) + int(line[20:23]) / 1000
+    except ValueError:
+        return None
+    parts = line.split(" - ", 3)
+    return timestamp, parts[2] if len(parts) > 2 else ""
+
+@lru_cache(maxsize=4096)
+def _text_minute(prefix: str) -> float:
+    # strptime es lento: una vez por minuto (los cambios de hora son de horas enteras)
+    return datetime.strptime(prefix, "%Y-%m-%d %H:%M").timestamp()
+
+def parse_since(value: str, now: Optional[float] = None) -> float:
+    """
+    Convertir --since en una hora (epoch)
+    
+    Acepta una antigüedad (30s, 15m, 2h, 1d, 1w) o una fecha ISO
+    (2026-10-17, 2026-10-17 10:00, 2026-10-17T10:00:00).
+    
+    Raises:
+        ValueError: Si el valor no tiene ninguno de esos formatos
+    """
+    value = value.strip()
+    match = _DURATION.match(value)
+    if match:
+        seconds = float(match.group(1)) * _DURATION_UNITS[match.group(2)]
+        return (time.time() if now is None else now) - seconds
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        raise ValueError(f"'{value}' no es una fecha (2026-10-17 10:00) ni una antigüedad (30m, 2h, 1d)")
+
+def log_files(log_dir: Path) -> List[Path]:
+    """Segmentos rotados del más antiguo al más nuevo y, al final, el archivo activo"""
+    try:
+        names = os.listdir(log_dir)
+    except OSError:
+        return []
+    
+    # El nombre lleva la fecha de rotación: el orden alfabético es el cronológico
+    files = [Path(log_dir) / name for name in sorted(names) if is_log_segment(name)]
+    if LOG_FILE_NAME in names:
+        files.append(Path(log_dir) / LOG_FILE_NAME)
+    return files
+
+def _open_text(path: Path) -> IO[str]:
+    if path.name.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", errors="replace")
+    return open(path, "r", encoding="utf-8", errors="replace")
+
+def tail_lines(path: Path, count: int, block_size: int = READ_BLOCK_SIZE) -> List[str]:
+    """
+    Últimas `count` líneas de un archivo de texto, leyendo bloques desde el final
+    
+    Un segmento comprimido no admite lectura hacia atrás: se recorre
+    guardando solo las últimas `count` líneas.
+    """
+    if count <= 0:
+        return []
+    if path.name.endswith(".gz"):
+        with _open_text(path) as f:
+            return [line.rstrip("\n") for line in deque(f, maxlen=count)]
+    
+    with open(path, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        data = b""
+        # Hace falta un salto de línea más que líneas pedidas (el del final)
+        while position > 0 and data.count(b"\n") <= count:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + data
+    
+    lines = data.decode("utf-8", errors="replace").splitlines()
+    return lines[-count:]
+
+def read_last_lines(log_dir: Path, count: int) -> List[str]:
+    """Últimas `count` líneas del log, pasando a segmentos anteriores si hace falta"""
+    lines: List[str] = []
+    for path in reversed(log_files(log_dir)):
+        if len(lines) >= count:
+            break
+        try:
+            lines = tail_lines(path, count - len(lines)) + lines
+        except OSError:
+            continue
+    return lines
+
+def _scan(f: IO[bytes], offset: int) -> Iterator[Tuple[int, bytes]]:
+    """(desplazamiento, línea) desde `offset`; la última puede no estar completa"""
+    f.seek(offset)
+    for raw in f:
+        yield offset, raw
+        offset += len(raw)
+
+class LogIndex:
+    """
+    Índice disperso hora → desplazamiento de cada archivo de log
+    
+    Cada punto (máximo, desplazamiento) indica que ningún registro anterior a
+    `desplazamiento` es posterior a `máximo`, aunque varios procesos escriban
+    el archivo con horas ligeramente desordenadas. Los segmentos comprimidos
+    solo guardan su hora máxima: no se puede saltar dentro de ellos sin
+    descomprimir, pero sí saltárselos enteros.
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def __init__(self, index_file: Optional[Path] = None, stride: int = INDEX_STRIDE):
+        self.index_file = index_file or LOG_INDEX_FILE
+        self.stride = stride
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty = False
+    
+    def lookup(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Entrada del índice de `path`, actualizada si el archivo cambió"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        
+        key = str(path)
+        entries = self._load()
+        entry = entries.get(key)
+        compressed = path.name.endswith(".gz")
+        
+        if compressed:
+            # Un segmento no cambia: vale mientras coincidan inodo, tamaño y mtime
+            signature = [st.st_ino, st.st_size, st.st_mtime_ns]
+            if entry is None or entry["signature"] != signature:
+                entry = {"signature": signature, "max": None, "points": [], "indexed": 0}
+                with _open_text(path) as f:
+                    for line in f:
+                        header = parse_header(line)
+                        if header is not None and (entry["max"] is None or header[0] > entry["max"]):
+                            entry["max"] = header[0]
+                entries[key] = entry
+                self._dirty = True
+            return entry
+        
+        # El archivo activo solo crece: se indexa desde donde se quedó
+        if entry is None or entry["signature"] != [st.st_ino] or st.st_size < entry["indexed"]:
+            entry = {"signature": [st.st_ino], "max": None, "points": [], "indexed": 0}
+            entries[key] = entry
+            self._dirty = True
+        if st.st_size > entry["indexed"]:
+            self._extend(path, entry)
+        return entry
+    
+    def start_offset(self, entry: Dict[str, Any], since: float) -> int:
+        """Desplazamiento desde el que puede haber registros de `since` en adelante"""
+        points = entry["points"]
+        # Último punto cuyo máximo anterior es menor que `since`
+        position = bisect.bisect_left([point[0] for point in points], since)
+        return points[position - 1][1] if position else 0
+    
+    def _extend(self, path: Path, entry: Dict[str, Any]):
+        latest = entry["max"]
+        last_point = entry["points"][-1][1] if entry["points"] else 0
+        indexed = entry["indexed"]
+        with open(path, "rb") as f:
+            for offset, raw in _scan(f, entry["indexed"]):
+                if not raw.endswith(b"\n"):
+                    # Línea a medio escribir: se indexa la próxima vez
+                    break
+                header = parse_header(raw.decode("utf-8", errors="replace"))
+                if header is not None:
+                    if latest is not None and offset - last_point >= self.stride:
+                        entry["points"].append([latest, offset])
+                        last_point = offset
+                    latest = header[0] if latest is None else max(latest, header[0])
+                indexed = offset + len(raw)
+        entry["max"] = latest
+        entry["indexed"] = indexed
+        self._dirty = True
+    
+    def save(self):
+        """Guardar el índice (escritura atómica), olvidando archivos que ya no existen"""
+        if not self._dirty:
+            return
+        
+        entries = {key: entry for key, entry in self._load().items() if os.path.exists(key)}
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.index_file.with_name(f"{self.index_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, "w") as f:
+                json.dump({"format": LOG_INDEX_FORMAT, "files": entries}, f)
+            os.replace(tmp_file, self.index_file)
+            self._dirty = False
+        except OSError:
+            # Sin índice, la próxima búsqueda vuelve a recorrer los archivos
+            pass
+    
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            try:
+                with open(self.index_file) as f:
+                    data = json.load(f)
+                self._entries = dict(data["files"]) if data.get("format") == LOG_INDEX_FORMAT else {}
+            except (OSError, ValueError, TypeError, KeyError, AttributeError):
+                self._entries = {}
+        return self._entries
+
+class EntryFilter:
+    """
+    Criterios de --since, --level y --grep sobre un registro
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def __init__(self, since: Optional[float] = None, level: Optional[str] = None,
+                 pattern: Optional[str] = None):
+        self.since = since
+        self.min_level = LEVELS[level.upper()] if level else None
+        self.pattern: Optional[Pattern[str]] = re.compile(pattern) if pattern else None
+    
+    @property
+    def active(self) -> bool:
+        return self.since is not None or self.min_level is not None or self.pattern is not None
+    
+    def matches(self, entry: LogEntry) -> bool:
+        if self.since is not None and (entry.timestamp is None or entry.timestamp < self.since):
+            return False
+        if self.min_level is not None and LEVELS.get(entry.level or "", 0) < self.min_level:
+            return False
+        if self.pattern is not None and not self.pattern.search(entry.text):
+            return False
+        return True
+
+def group_entries(lines: Iterator[str]) -> Iterator[LogEntry]:
+    """Agrupar líneas en registros (las líneas sin hora continúan el anterior)"""
+    entry: Optional[LogEntry] = None
+    for line in lines:
+        line = line.rstrip("\n")
+        header = parse_header(line)
+        if header is not None or entry is None:
+            if entry is not None:
+                yield entry
+            timestamp, level = header if header is not None else (None, None)
+            entry = LogEntry(timestamp, level, [line])
+        else:
+            entry.lines.append(line)
+    if entry is not None:
+        yield entry
+
+def _file_lines(path: Path, offset: int) -> Iterator[str]:
+    if path.name.endswith(".gz"):
+        with _open_text(path) as f:
+            yield from f
+        return
+    with open(path, "rb") as f:
+        for _, raw in _scan(f, offset):
+            yield raw.decode("utf-8", errors="replace")
+
+def search_logs(log_dir: Path, entry_filter: EntryFilter,
+                index: Optional[LogIndex] = None) -> Iterator[LogEntry]:
+    """
+    Registros de todos los archivos de log que cumplen `entry_filter`, en orden
+    
+    Con --since, los archivos cuyos registros son todos anteriores se saltan
+    y el archivo activo se empieza a leer desde el punto del índice.
+    """
+    index = index or LogIndex()
+    try:
+        for path in log_files(log_dir):
+            offset = 0
+            if entry_filter.since is not None:
+                try:
+                    indexed = index.lookup(path)
+                except OSError:
+                    indexed = None
+                if indexed is not None:
+                    if indexed["max"] is not None and indexed["max"] < entry_filter.since:
+                        continue
+                    offset = index.start_offset(indexed, entry_filter.since)
+            
+            try:
+                for log_entry in group_entries(_file_lines(path, offset)):
+                    if entry_filter.matches(log_entry):
+                        yield log_entry
+            except OSError:
+                # Rotado o borrado mientras se leía
+                continue
+    finally:
+        index.save()
+
+def _inotify_watch(directory: Path) -> Optional[int]:
+    """Descriptor inotify que avisa de escrituras y archivos nuevos en `directory`"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        import ctypes
+        import ctypes.util
+        
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        # IN_NONBLOCK e IN_CLOEXEC valen lo mismo que O_NONBLOCK y O_CLOEXEC
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return None
+        # IN_MODIFY | IN_MOVED_TO | IN_CREATE
+        if libc.inotify_add_watch(fd, os.fsencode(directory), 0x002 | 0x080 | 0x100) < 0:
+            os.close(fd)
+            return None
+        return fd
+    except (OSError, AttributeError):
+        return None
+
+class DirectoryWatcher:
+    """
+    Espera cambios en un directorio: inotify en Linux, si no, consultas periódicas
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def __init__(self, directory: Path, poll_interval: float = FOLLOW_POLL_INTERVAL,
+                 use_inotify: bool = True):
+        self.poll_interval = poll_interval
+        self._fd = _inotify_watch(directory) if use_inotify else None
+    
+    @property
+    def uses_inotify(self) -> bool:
+        return self._fd is not None
+    
+    def wait(self):
+        """Volver cuando algo cambió (o tras un intervalo)"""
+        if self._fd is None:
+            time.sleep(self.poll_interval)
+            return
+        ready, _, _ = select.select([self._fd], [], [], FOLLOW_WAKEUP_INTERVAL)
+        if ready:
+            try:
+                os.read(self._fd, 64 * 1024)
+            except OSError:
+                pass
+    
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+def follow_lines(path: Path, watcher: Optional[DirectoryWatcher] = None) -> Iterator[str]:
+    """
+    Líneas que se añaden a `path` desde ahora, como `tail -F`
+    
+    Si el archivo rota (otro inodo o tamaño menor), se termina de leer el
+    anterior y se sigue desde el principio del nuevo.
+    """
+    watcher = watcher or DirectoryWatcher(path.parent)
+    f: Optional[IO[bytes]] = None
+    partial = b""
+    try:
+        try:
+            f = open(path, "rb")
+            f.seek(0, os.SEEK_END)
+        except OSError:
+            f = None
+        
+        while True:
+            if f is not None:
+                data = f.read()
+                if data:
+                    lines = (partial + data).split(b"\n")
+                    partial = lines.pop()
+                    for line in lines:
+                        yield line.decode("utf-8", errors="replace")
+                    continue
+            
+            # Sin datos nuevos: ¿se rotó o se creó el archivo?
+            try:
+                st = os.stat(path)
+            except OSError:
+                st = None
+            if st is not None and (f is None or st.st_ino != os.fstat(f.fileno()).st_ino
+                                   or st.st_size < f.tell()):
+                if f is not None:
+                    f.close()
+                partial = b""
+                f = open(path, "rb")
+                continue
+            
+            watcher.wait()
+    finally:
+        if f is not None:
+            f.close()
+        watcher.close()
+
+def follow_matching(path: Path, entry_filter: EntryFilter,
+                    watcher: Optional[DirectoryWatcher] = None) -> Iterator[str]:
+    """
+    Líneas nuevas de `path` que cumplen `entry_filter`
+    
+    Se filtra por la primera línea de cada registro (las siguientes aún no
+    se han escrito); sus continuaciones se muestran o no con ella.
+    """
+    matched = not entry_filter.active
+    for line in follow_lines(path, watcher):
+        header = parse_header(line)
+        if header is not None:
+            matched = entry_filter.matches(LogEntry(header[0], header[1], [line]))
+        if matched:
+            yield line
@@ -1,6 +1,20 @@
 """
 Sistema de logging específico para Genesis CLI
 
+Los registros no se escriben en el hilo que los emite: GenesisCliLogger
+los deja en una cola acotada (QueueHandler) y un hilo en segundo plano
+(QueueListener) los formatea y los escribe en la consola y, en modo debug,
+en el archivo de log. Con la cola llena, DEBUG e INFO se descartan (y se
+cuentan) y WARNING o superior esperan un máximo de LOG_QUEUE_TIMEOUT. Al
+salir del proceso se vacía la cola (flush_logging / shutdown_logging).
+
+El archivo de log (~/.genesis-cli/logs/genesis-cli.log) se escribe como
+texto o, con log_format = "jsonl", como un objeto JSON por línea con el
+identificador de la ejecución, la hora y la duración. Al superar log_max_mb
+se renombra a un segmento genesis-cli.<fecha>-<pid>.log que un hilo en
+segundo plano comprime a .log.gz; después se borran los segmentos más
+antiguos hasta respetar log_retention_mb y log_retention_days.
+
 DOCTRINA DEL ECOSISTEMA:
 - NO implementa lógica de generación
 - NO coordina agentes directamente
@@ -9,19 +23,73 @@ DOCTRINA DEL ECOSISTEMA:
 - Enfocado en experiencia de usuario
 """
 
+import atexit
+import copy
+import gzip
+import json
 import logging
-import sys
+import os
+import queue
+import shutil
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, List
 from rich.console import Console
 from rich.logging import RichHandler
-from rich.text import Text
 
-from genesis_cli.config import get_config, is_debug_mode, get_log_level
+from genesis_cli import current_command
+from genesis_cli.config import (
+    get_log_format,
+    get_log_level,
+    get_log_max_mb,
+    get_log_retention_days,
+    get_log_retention_mb,
+    is_debug_mode,
+)
 
 # Console para logging
 console = Console(stderr=True)
 
+# Registros pendientes de escribir como máximo
+LOG_QUEUE_SIZE = 10_000
+
+# Espera máxima (segundos) para encolar un WARNING o superior con la cola llena
+LOG_QUEUE_TIMEOUT = 1.0
+
+# Icono y estilo por nivel
+LEVEL_STYLES = {
+    logging.DEBUG: ("🐛", "dim"),
+    logging.INFO: ("ℹ️", "cyan"),
+    logging.WARNING: ("⚠️", "yellow"),
+    logging.ERROR: ("❌", "red"),
+    logging.CRITICAL: ("🚨", "bold red")
+}
+DEFAULT_LEVEL_STYLE = ("•", "white")
+
+# Formato del archivo de log
+FILE_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+LOG_DIR = Path.home() / ".genesis-cli" / "logs"
+LOG_FILE_NAME = "genesis-cli.log"
+
+# Segmentos rotados: genesis-cli.<fecha>-<pid>.log y, ya comprimidos, .log.gz
+SEGMENT_PREFIX = "genesis-cli."
+SEGMENT_SUFFIXES = (".log", ".log.gz")
+
+# Espera máxima (segundos) al salir para terminar de comprimir segmentos;
+# lo que quede lo comprime la siguiente ejecución
+LOG_COMPRESS_TIMEOUT = 5.0
+
+# Todos los registros JSONL de esta ejecución llevan el mismo identificador
+COMMAND_ID = uuid.uuid4().hex[:12]
+
+# Para guardar como texto la traza de un registro encolado
+_exception_formatter = logging.Formatter()
+
 class GenesisCliFormatter(logging.Formatter):
     """
     Formatter personalizado para Genesis CLI
@@ -29,36 +97,239 @@ class GenesisCliFormatter(logging.Formatter):
     DOCTRINA: Enfocado en UX/UI elegante
     """
     
-    def __init__(self):
+    def __init__(self, show_time: Optional[bool] = None):
         super().__init__()
+        # La hora solo se muestra en modo debug (se decide una vez)
+        self.show_time = is_debug_mode() if show_time is None else show_time
         
+        # Markup de apertura y cierre por nivel, construido una vez
+        self._markup = {
+            level: (f"[{color}]{icon} ", f"[/{color}]")
+            for level, (icon, color) in LEVEL_STYLES.items()
+        }
+        icon, color = DEFAULT_LEVEL_STYLE
+        self._default_markup = (f"[{color}]{icon} ", f"[/{color}]")
+    
     def format(self, record: logging.LogRecord) -> str:
         """Formatear mensaje de log"""
+        opening, closing = self._markup.get(record.levelno, self._default_markup)
+        message = opening + record.getMessage() + closing
         
-        # Mapear niveles a iconos y colores
-        level_config = {
-            logging.DEBUG: ("🐛", "dim"),
-            logging.INFO: ("ℹ️", "cyan"),
-            logging.WARNING: ("⚠️", "yellow"),
-            logging.ERROR: ("❌", "red"),
-            logging.CRITICAL: ("🚨", "bold red")
+        # Los avisos y errores nunca llevan hora
+        if self.show_time and record.levelno < logging.WARNING:
+            return f"[dim]{self.formatTime(record, datefmt='%H:%M:%S')}[/dim] {message}"
+        return message
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Un objeto JSON por línea: hora, nivel, ejecución, mensaje y duración
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """Formatear registro como una línea JSON"""
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "command_id": COMMAND_ID,
+            "command": current_command["name"],
+            "pid": record.process,
+            "elapsed_ms": round((record.created - current_command["started"]) * 1000, 3),
+            "msg": record.getMessage(),
         }
         
-        icon, color = level_config.get(record.levelno, ("•", "white"))
+        # Duración de la operación que termina (LogContext, log_function_call)
+        duration = getattr(record, "duration", None)
+        if duration is not None:
+            entry["duration_ms"] = round(duration * 1000, 3)
         
-        # Formatear mensaje
-        message = record.getMessage()
-        timestamp = self.formatTime(record, datefmt="%H:%M:%S")
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
         
-        # Formato para diferentes niveles
-        if record.levelno >= logging.ERROR:
-            return f"[{color}]{icon} {message}[/{color}]"
-        elif record.levelno == logging.WARNING:
-            return f"[{color}]{icon} {message}[/{color}]"
-        elif is_debug_mode():
-            return f"[dim]{timestamp}[/dim] [{color}]{icon} {message}[/{color}]"
-        else:
-            return f"[{color}]{icon} {message}[/{color}]"
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+def is_log_segment(name: str) -> bool:
+    """Verificar si `name` es un segmento rotado (comprimido o no)"""
+    return name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIXES) and name != LOG_FILE_NAME
+
+def enforce_log_retention(log_dir: Path, max_bytes: int, max_age_days: float):
+    """
+    Borrar segmentos rotados por antigüedad y, empezando por el más antiguo,
+    hasta que el directorio (archivo activo incluido) ocupe como mucho `max_bytes`
+    
+    Un límite de 0 no se aplica. El archivo activo nunca se borra.
+    """
+    try:
+        entries = list(os.scandir(log_dir))
+    except OSError:
+        return
+    
+    segments = []
+    total = 0
+    for entry in entries:
+        try:
+            if entry.name == LOG_FILE_NAME:
+                total += entry.stat().st_size
+            elif is_log_segment(entry.name):
+                st = entry.stat()
+                segments.append((st.st_mtime, st.st_size, entry.path))
+                total += st.st_size
+        except OSError:
+            continue
+    
+    cutoff = time.time() - max_age_days * 86400 if max_age_days else None
+    for mtime, size, path in sorted(segments):
+        expired = cutoff is not None and mtime < cutoff
+        if not expired and (not max_bytes or total <= max_bytes):
+            break
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            continue
+        total -= size
+
+def compress_log_segment(segment: str) -> Optional[str]:
+    """Comprimir un segmento a .gz (conserva su mtime) y borrar el original"""
+    target = segment + ".gz"
+    tmp_file = f"{target}.{os.getpid()}.tmp"
+    try:
+        st = os.stat(segment)
+        with open(segment, "rb") as source, gzip.open(tmp_file, "wb", compresslevel=6) as compressed:
+            shutil.copyfileobj(source, compressed, 1024 * 1024)
+        os.utime(tmp_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(tmp_file, target)
+        os.unlink(segment)
+    except FileNotFoundError:
+        # Otro proceso ya lo comprimió
+        return None
+    except OSError:
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
+        return None
+    return target
+
+class LogSegmentCompressor:
+    """
+    Hilo en segundo plano que comprime segmentos rotados y aplica la retención
+    
+    El hilo se arranca al pedir trabajo y termina cuando no queda nada
+    pendiente. Cada pasada comprime todos los segmentos sin comprimir del
+    directorio, también los que dejaron ejecuciones anteriores.
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def __init__(self, log_dir: Path, max_bytes: int, max_age_days: float):
+        self.log_dir = Path(log_dir)
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+        self._reset()
+    
+    def _reset(self):
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._thread: Optional[threading.Thread] = None
+    
+    def submit(self):
+        """Pedir una pasada de compresión y retención"""
+        with self._lock:
+            self._pending += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="genesis-cli-log-compress", daemon=True)
+                self._thread.start()
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Esperar a que termine el trabajo pendiente; False si vence `timeout`"""
+        with self._lock:
+            return self._idle.wait_for(lambda: self._thread is None, timeout)
+    
+    def reset_after_fork(self):
+        """En un proceso hijo el hilo no existe: empezar sin trabajo pendiente"""
+        self._reset()
+    
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._thread = None
+                    self._idle.notify_all()
+                    return
+                self._pending = 0
+            try:
+                self.run_once()
+            except Exception:
+                # Comprimir es un extra: un error no debe afectar al comando
+                pass
+    
+    def run_once(self):
+        """Comprimir los segmentos pendientes y aplicar la retención"""
+        try:
+            names = sorted(name for name in os.listdir(self.log_dir) if is_log_segment(name) and name.endswith(".log"))
+        except OSError:
+            names = []
+        for name in names:
+            compress_log_segment(str(self.log_dir / name))
+        enforce_log_retention(self.log_dir, self.max_bytes, self.max_age_days)
+
+class RotatingLogFileHandler(RotatingFileHandler):
+    """
+    Archivo de log que rota por tamaño a segmentos con nombre único
+    
+    Los segmentos no se desplazan (.1 → .2), así que otro proceso puede
+    comprimirlos o borrarlos sin carreras. Si otro proceso rota el archivo,
+    este lo detecta por el inodo y vuelve a abrir el nuevo.
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def __init__(self, filename: Path, max_bytes: int, compressor: Optional[LogSegmentCompressor] = None):
+        super().__init__(filename, maxBytes=max_bytes, encoding="utf-8", delay=True)
+        self.compressor = compressor
+        self._inode: Optional[int] = None
+    
+    def _open(self):
+        stream = super()._open()
+        self._inode = os.fstat(stream.fileno()).st_ino
+        return stream
+    
+    def emit(self, record: logging.LogRecord):
+        """Emitir log record (reabriendo el archivo si otro proceso lo rotó)"""
+        if self.stream is not None:
+            try:
+                rotated = os.stat(self.baseFilename).st_ino != self._inode
+            except FileNotFoundError:
+                rotated = True
+            if rotated:
+                self.stream.close()
+                self.stream = None
+        super().emit(record)
+    
+    def doRollover(self):
+        """Renombrar el archivo a un segmento nuevo y pedir su compresión"""
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        
+        try:
+            # Otro proceso pudo rotarlo justo antes: solo se renombra si sigue lleno
+            if os.stat(self.baseFilename).st_size >= self.maxBytes:
+                stamp = datetime.now().strftime("%Y%m%dT%H%M%S%f")
+                log_dir = os.path.dirname(self.baseFilename)
+                os.replace(self.baseFilename, os.path.join(log_dir, f"{SEGMENT_PREFIX}{stamp}-{os.getpid()}.log"))
+        except OSError:
+            pass
+        
+        if self.compressor is not None:
+            self.compressor.submit()
 
 class GenesisCliHandler(RichHandler):
     """
@@ -67,36 +338,108 @@ class GenesisCliHandler(RichHandler):
     DOCTRINA: Enfocado en UX/UI elegante
     """
     
-    def __init__(self, console: Optional[Console] = None):
+    def __init__(self, console: Optional[Console] = None, debug: Optional[bool] = None):
+        debug = is_debug_mode() if debug is None else debug
         super().__init__(
             console=console or Console(stderr=True),
-            show_time=is_debug_mode(),
-            show_level=is_debug_mode(),
-            show_path=is_debug_mode(),
+            show_time=debug,
+            show_level=debug,
+            show_path=debug,
             markup=True,
             rich_tracebacks=True,
-            tracebacks_show_locals=is_debug_mode()
+            tracebacks_show_locals=debug
         )
-        
+        self.cli_formatter = GenesisCliFormatter(show_time=debug)
+    
     def emit(self, record: logging.LogRecord):
         """Emitir log record"""
         try:
             # Usar formatter personalizado solo para ciertos niveles
             if record.levelno >= logging.INFO:
-                # Formatear mensaje con Rich markup
-                formatter = GenesisCliFormatter()
-                message = formatter.format(record)
-                
-                # Mostrar con Rich
-                self.console.print(message, markup=True)
+                # Mostrar con Rich markup
+                self.console.print(self.cli_formatter.format(record), markup=True)
             else:
                 # Usar handler normal para DEBUG
                 super().emit(record)
-                
+        
         except Exception:
             # Fallback a handler normal en caso de error
             super().emit(record)
 
+class _BoundedQueueHandler(QueueHandler):
+    """Encola registros sin bloquear al hilo que los emite"""
+    
+    def __init__(self, pipeline: "LogPipeline"):
+        super().__init__(pipeline.queue)
+        self.pipeline = pipeline
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # El mensaje se resuelve aquí (los argumentos pueden cambiar después);
+        # la traza se guarda como texto para el archivo, no en el mensaje
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            if record.levelno >= logging.WARNING:
+                self.queue.put(record, timeout=LOG_QUEUE_TIMEOUT)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            self.pipeline.dropped += 1
+
+class LogPipeline:
+    """
+    Cola acotada y un hilo que escribe en `handlers`
+    
+    DOCTRINA: Enfocado en UX/UI elegante
+    """
+    
+    def __init__(self, handlers: List[logging.Handler], maxsize: int = LOG_QUEUE_SIZE):
+        self.handlers = list(handlers)
+        self.maxsize = maxsize
+        self.dropped = 0
+        self.queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize)
+        self.handler = _BoundedQueueHandler(self)
+        self._listener: Optional[QueueListener] = None
+    
+    @property
+    def running(self) -> bool:
+        return self._listener is not None
+    
+    def start(self):
+        """Arrancar el hilo de escritura"""
+        if self._listener is None:
+            self._listener = QueueListener(self.queue, *self.handlers, respect_handler_level=True)
+            self._listener.start()
+    
+    def flush(self):
+        """Esperar a que se escriban los registros encolados"""
+        if self._listener is not None:
+            self.queue.join()
+        for handler in self.handlers:
+            handler.flush()
+    
+    def stop(self):
+        """Escribir lo pendiente y detener el hilo"""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        for handler in self.handlers:
+            handler.flush()
+    
+    def restart_after_fork(self):
+        """En un proceso hijo: cola nueva (la heredada puede tener el lock tomado) y otro hilo"""
+        self.queue = queue.Queue(self.maxsize)
+        self.handler.queue = self.queue
+        self._listener = None
+        self.start()
+
 class GenesisCliLogger:
     """
     Logger principal para Genesis CLI
@@ -107,53 +450,68 @@ class GenesisCliLogger:
     def __init__(self, name: str = "genesis-cli"):
         self.name = name
         self.logger = logging.getLogger(name)
+        self.pipeline: Optional[LogPipeline] = None
+        self.compressor: Optional[LogSegmentCompressor] = None
         self._setup_logger()
-        
+    
     def _setup_logger(self):
         """Configurar logger"""
         # Limpiar handlers existentes
         self.logger.handlers.clear()
+        if self.pipeline is not None:
+            self.pipeline.stop()
         
         # Configurar nivel
         level = getattr(logging, get_log_level().upper(), logging.INFO)
         self.logger.setLevel(level)
         
-        # Handler para Rich
-        rich_handler = GenesisCliHandler(console)
-        self.logger.addHandler(rich_handler)
+        # Handler para Rich y, en modo debug, para archivo: ambos escriben
+        # desde el hilo de la cola
+        debug = is_debug_mode()
+        handlers: List[logging.Handler] = [GenesisCliHandler(console, debug=debug)]
+        if debug:
+            file_handler = self._setup_file_handler()
+            if file_handler is not None:
+                handlers.append(file_handler)
         
-        # Handler para archivo si está en modo debug
-        if is_debug_mode():
-            self._setup_file_handler()
+        self.pipeline = LogPipeline(handlers)
+        self.pipeline.start()
+        self.logger.addHandler(self.pipeline.handler)
         
         # Evitar propagación a root logger
         self.logger.propagate = False
     
-    def _setup_file_handler(self):
+    def _setup_file_handler(self) -> Optional[logging.Handler]:
         """Configurar handler para archivo"""
         try:
             # Crear directorio de logs
-            log_dir = Path.home() / ".genesis-cli" / "logs"
-            log_dir.mkdir(parents=True, exist_ok=True)
+            LOG_DIR.mkdir(parents=True, exist_ok=True)
             
-            # Archivo de log
-            log_file = log_dir / "genesis-cli.log"
+            # Compresión de segmentos y retención en segundo plano
+            self.compressor = LogSegmentCompressor(
+                LOG_DIR, get_log_retention_mb() * 1024 * 1024, get_log_retention_days()
+            )
             
-            # Handler para archivo
-            file_handler = logging.FileHandler(log_file)
+            # Handler para archivo (rota al alcanzar log_max_mb)
+            file_handler = RotatingLogFileHandler(
+                LOG_DIR / LOG_FILE_NAME, get_log_max_mb() * 1024 * 1024, self.compressor
+            )
             file_handler.setLevel(logging.DEBUG)
             
             # Formatter para archivo
-            file_formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            file_handler.setFormatter(file_formatter)
+            if get_log_format() == "jsonl":
+                file_handler.setFormatter(JsonLinesFormatter())
+            else:
+                file_handler.setFormatter(logging.Formatter(FILE_LOG_FORMAT))
             
-            self.logger.addHandler(file_handler)
+            # Segmentos que dejaron sin comprimir ejecuciones anteriores
+            self.compressor.submit()
             
+            return file_handler
+        
         except Exception:
             # Si no se puede configurar archivo, continuar sin él
-            pass
+            return None
     
     def debug(self, message: str, **kwargs):
         """Log debug message"""
@@ -190,6 +548,28 @@ class GenesisCliLogger:
 # Logger global para Genesis CLI
 cli_logger = GenesisCliLogger()
 
+def flush_logging():
+    """Esperar a que se escriban todos los registros emitidos hasta ahora"""
+    if cli_logger.pipeline is not None:
+        cli_logger.pipeline.flush()
+
+def shutdown_logging():
+    """Escribir lo pendiente y detener el hilo de logging (al salir del proceso)"""
+    if cli_logger.pipeline is not None:
+        cli_logger.pipeline.stop()
+    if cli_logger.compressor is not None:
+        cli_logger.compressor.wait(LOG_COMPRESS_TIMEOUT)
+
+def _restart_after_fork():
+    if cli_logger.compressor is not None:
+        cli_logger.compressor.reset_after_fork()
+    if cli_logger.pipeline is not None and cli_logger.pipeline.running:
+        cli_logger.pipeline.restart_after_fork()
+
+atexit.register(shutdown_logging)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_after_fork)
+
 # Funciones de conveniencia
 def debug(message: str, **kwargs):
     """Log debug message"""
@@ -245,10 +625,9 @@ def setup_external_logging():
     genesis_core_logger = logging.getLogger('genesis-core')
     genesis_core_logger.setLevel(logging.INFO)
     
-    # Handler para Genesis Core
-    if not genesis_core_logger.handlers:
-        handler = GenesisCliHandler(console)
-        genesis_core_logger.addHandler(handler)
+    # Genesis Core escribe por la misma cola
+    if not genesis_core_logger.handlers and cli_logger.pipeline is not None:
+        genesis_core_logger.addHandler(cli_logger.pipeline.handler)
         genesis_core_logger.propagate = False
 
 # Contexto para logging con indentación
@@ -263,18 +642,21 @@ class LogContext:
         self.message = message
         self.level = level
         self.logger = cli_logger
-        
+        self.started = None
+    
     def __enter__(self):
         """Entrar al contexto"""
         getattr(self.logger, self.level)(f"🔄 {self.message}...")
+        self.started = time.perf_counter()
         return self
-        
+    
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Salir del contexto"""
+        extra = {"duration": time.perf_counter() - self.started}
         if exc_type is None:
-            self.logger.success(f"✅ {self.message} completado")
+            self.logger.success(f"✅ {self.message} completado", extra=extra)
         else:
-            self.logger.error(f"❌ {self.message} falló: {exc_val}")
+            self.logger.error(f"❌ {self.message} falló: {exc_val}", extra=extra)
         
         return False  # No suprimir excepciones
 
@@ -292,18 +674,20 @@ def log_function_call(level: str = "debug"):
             if level == "debug":
                 debug(f"🔧 Llamando a {func_name}")
             
+            started = time.perf_counter()
             try:
                 result = func(*args, **kwargs)
                 
                 if level == "debug":
-                    debug(f"✅ {func_name} completado exitosamente")
+                    debug(f"✅ {func_name} completado exitosamente",
+                          extra={"duration": time.perf_counter() - started})
                 
                 return result
-                
+            
             except Exception as e:
-                error(f"❌ Error en {func_name}: {str(e)}")
+                error(f"❌ Error en {func_name}: {str(e)}", extra={"duration": time.perf_counter() - started})
                 raise
-                
+        
         return wrapper
     return decorator
 
@@ -323,19 +707,20 @@ def get_recent_logs(lines: int = 100) -> Optional[str]:
     """
     Obtener logs recientes del archivo
     
+    Lee bloques desde el final del archivo en lugar del archivo entero.
+    
     DOCTRINA: Utility para mejorar UX
     """
     try:
-        log_file = Path.home() / ".genesis-cli" / "logs" / "genesis-cli.log"
+        from genesis_cli.log_reader import tail_lines
+        
+        log_file = LOG_DIR / LOG_FILE_NAME
         
         if not log_file.exists():
             return None
         
-        with open(log_file, 'r') as f:
-            all_lines = f.readlines()
-            recent_lines = all_lines[-lines:] if len(all_lines) > lines else all_lines
-            return ''.join(recent_lines)
-            
+        return ''.join(f"{line}\n" for line in tail_lines(log_file, lines))
+    
     except Exception:
         return None
 
@@ -344,21 +729,14 @@ def cleanup_old_logs(days: int = 7):
     """
     Limpiar logs antiguos
     
+    Borra los segmentos rotados con más de `days` días y, si el directorio
+    supera log_retention_mb, los más antiguos hasta respetarlo.
+    
     DOCTRINA: Utility para mejorar UX
     """
     try:
-        log_dir = Path.home() / ".genesis-cli" / "logs"
-        
-        if not log_dir.exists():
-            return
-        
-        from datetime import datetime, timedelta
-        cutoff_date = datetime.now() - timedelta(days=days)
-        
-        for log_file in log_dir.glob("*.log"):
-            if log_file.stat().st_mtime < cutoff_date.timestamp():
-                log_file.unlink()
-                
+        enforce_log_retention(LOG_DIR, get_log_retention_mb() * 1024 * 1024, days)
+    
     except Exception:
         # Si no se puede limpiar, continuar silenciosamente
         pass
@@ -13,37 +13,132 @@ DOCTRINA DEL ECOSISTEMA:
 """
 
 import sys
-import asyncio
 import json
+import logging
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, TYPE_CHECKING
 import typer
 from typer.main import get_command
 from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Prompt, Confirm
-
-# DOCTRINA: Solo importamos genesis-core, nunca MCPturbo directamente
-try:
-    from genesis_core.orchestrator.core_orchestrator import CoreOrchestrator, ProjectGenerationRequest
-    from genesis_core.config import initialize_config
-    from genesis_core.logging import get_logger
-except ImportError as e:
-    print(f"ERROR: No se pudo importar genesis-core: {e}")
-    print("Instala genesis-core: pip install genesis-core")
-    sys.exit(1)
-
-from genesis_cli import __version__
-from genesis_cli.commands.utils import show_banner, check_dependencies
-from genesis_cli.utils import get_terminal_size, is_interactive_terminal, get_user_confirmation
-from genesis_cli.ui.console import genesis_console
+
+from genesis_cli import __version__, start_command
+from genesis_cli.tracing import (
+    PHASE_CORE_REQUEST,
+    PHASE_ORCHESTRATOR,
+    PHASE_PROMPTS,
+    PHASE_RENDER,
+    PHASE_VALIDATION,
+    span,
+    traced,
+)
+
+if TYPE_CHECKING:  # pragma: no cover - solo para anotaciones
+    from rich.progress import Progress
 
 # Configurar Rich Console
 console = Console()
-logger = get_logger("genesis.cli")
+logger = logging.getLogger("genesis.cli")
+
+# DOCTRINA: Solo importamos genesis-core, nunca MCPturbo directamente.
+# genesis-core (y los módulos pesados de Rich) se cargan solo cuando un comando
+# los necesita, para que --version, --help y help arranquen sin ese coste.
+_CORE_EXPORTS = ("CoreOrchestrator", "ProjectGenerationRequest", "initialize_config")
+_core_initialized = False
+
+def _load_core() -> None:
+    """Importar genesis-core bajo demanda y publicarlo en el módulo"""
+    global logger
+    module_globals = globals()
+    if all(name in module_globals for name in _CORE_EXPORTS):
+        return
+    
+    try:
+        from genesis_core.orchestrator.core_orchestrator import CoreOrchestrator, ProjectGenerationRequest
+        from genesis_core.config import initialize_config
+        from genesis_core.logging import get_logger
+    except ImportError as e:
+        console.print(f"[red]ERROR: No se pudo importar genesis-core: {e}[/red]")
+        console.print("[yellow]Instala genesis-core: pip install genesis-core[/yellow]")
+        raise typer.Exit(1)
+    
+    # setdefault respeta los objetos ya parcheados (tests, daemon)
+    module_globals.setdefault("CoreOrchestrator", CoreOrchestrator)
+    module_globals.setdefault("ProjectGenerationRequest", ProjectGenerationRequest)
+    module_globals.setdefault("initialize_config", initialize_config)
+    logger = get_logger("genesis.cli")
+
+@traced(PHASE_ORCHESTRATOR)
+def _ensure_core(ctx: Optional[typer.Context] = None) -> None:
+    """
+    Cargar e inicializar genesis-core una sola vez por proceso
+    
+    DOCTRINA: Solo inicializamos config de genesis-core
+    """
+    global _core_initialized
+    _load_core()
+    if _core_initialized:
+        return
+    
+    try:
+        initialize_config()
+        _core_initialized = True
+        if ctx is not None and ctx.obj and ctx.obj.get("verbose"):
+            logger.info("Configuración inicializada en modo verbose")
+    except Exception as e:
+        console.print(f"[red]❌ Error inicializando configuración: {e}[/red]")
+        raise typer.Exit(1)
+
+def _run_async(coroutine: Any) -> Any:
+    """Ejecutar una corrutina importando asyncio solo cuando hace falta"""
+    import asyncio
+    return asyncio.run(coroutine)
+
+def _forward_to_daemon(command: str, config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Ejecutar el comando en `genesis daemon` si está activo
+    
+    Returns:
+        Resultado del daemon, o None para ejecutar en este proceso
+    """
+    from genesis_cli.daemon import forward_request
+    
+    with span(PHASE_CORE_REQUEST, command=command, via="daemon") as current:
+        result = forward_request(command, config)
+        if result is None:
+            # Sin daemon: la solicitud se hace después en este proceso
+            current.discard()
+    return result
+
+def _project_root(ctx: Optional[typer.Context] = None, chdir: bool = False) -> Path:
+    """
+    Raíz del proyecto Genesis: el directorio con genesis.json más cercano
+    
+    Con --skip-project-check, fuera de un proyecto se usa el directorio
+    actual. Con `chdir=True` el comando continúa desde la raíz, como si se
+    hubiera ejecutado allí.
+    """
+    from genesis_cli.project_discovery import find_project_root
+    
+    root = find_project_root()
+    if root is None:
+        skip_check = ctx.obj.get("skip_project_check") if ctx is not None and ctx.obj else False
+        if not skip_check:
+            console.print("[red]❌ No estás en un proyecto Genesis[/red]")
+            console.print("[yellow]💡 Ejecuta 'genesis init <nombre>' para crear uno[/yellow]")
+            raise typer.Exit(1)
+        return Path.cwd()
+    
+    if chdir and root != Path.cwd():
+        import os
+        os.chdir(root)
+    return root
+
+def __getattr__(name: str) -> Any:
+    """Resolver bajo demanda los símbolos de genesis-core (PEP 562)"""
+    if name in _CORE_EXPORTS:
+        _load_core()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def version_callback(value: bool):
     """Callback para mostrar la versión y salir"""
@@ -53,28 +148,45 @@ def version_callback(value: bool):
         raise typer.Exit()
 
 def validate_project_name(name: str) -> bool:
-    """Validar nombre de proyecto según las reglas del ecosistema"""
-    import re
-    if not re.match(r'^[a-zA-Z][a-zA-Z0-9_-]*$', name):
-        console.print("[red]❌ Nombre de proyecto inválido. Use solo letras, números, _ y -[/red]")
-        return False
+    """
+    Validar nombre de proyecto según las reglas del ecosistema
     
-    if len(name) < 2 or len(name) > 50:
-        console.print("[red]❌ Nombre debe tener entre 2 y 50 caracteres[/red]")
-        return False
+    Solo caracteres y longitud: también valida nombres de componentes
+    (`generate model Cache`), así que no rechaza nombres reservados.
+    """
+    from genesis_cli.validators import NAME_TOO_LONG, NAME_TOO_SHORT, NO_RESERVED_NAMES, ProjectNameValidator
     
-    return True
+    check = ProjectNameValidator.check(name, reserved=NO_RESERVED_NAMES)
+    if check.is_valid:
+        return True
+    
+    if set(check.codes) - {NAME_TOO_SHORT, NAME_TOO_LONG}:
+        console.print("[red]❌ Nombre de proyecto inválido. Use solo letras, números, _ y -[/red]")
+    else:
+        console.print("[red]❌ Nombre debe tener entre 2 y 50 caracteres[/red]")
+    return False
+
+# Templates que se nombran al rechazar uno inválido (el resto, en `genesis templates`)
+MAX_LISTED_TEMPLATES = 12
 
 def validate_template_name(template: str) -> bool:
-    """Validar nombre de template"""
-    valid_templates = [
-        "saas-basic", "api-only", "frontend-only", "microservices", 
-        "e-commerce", "blog", "ai-ready", "minimal"
-    ]
-    
-    if template not in valid_templates:
-        console.print(f"[red]❌ Template inválido: {template}[/red]")
-        console.print(f"[yellow]Templates disponibles: {', '.join(valid_templates)}[/yellow]")
+    """Validar nombre de template contra el catálogo de genesis-core"""
+    from genesis_cli.template_catalog import get_template_catalog
+    
+    catalog = get_template_catalog()
+    if template not in catalog:
+        from rich.markup import escape
+        from genesis_cli.validators import TemplateValidator
+        
+        console.print(f"[red]❌ Template inválido: {escape(template)}[/red]")
+        similar = TemplateValidator.suggest(template, limit=1)
+        if similar:
+            console.print(f"[yellow]💡 ¿Quisiste decir '{similar[0]}'?[/yellow]")
+        names = catalog.names
+        listed = ", ".join(names[:MAX_LISTED_TEMPLATES])
+        if len(names) > MAX_LISTED_TEMPLATES:
+            listed += f" (y {len(names) - MAX_LISTED_TEMPLATES} más: genesis templates)"
+        console.print(f"[yellow]Templates disponibles: {listed}[/yellow]")
         return False
     
     return True
@@ -110,6 +222,40 @@ def main(
         help="Omitir verificación de genesis.json",
         envvar="GENESIS_SKIP_PROJECT_CHECK",
         hidden=True,
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Perfilar el comando y guardar un .prof en ~/.genesis-cli/profiles",
+        envvar="GENESIS_CLI_PROFILE",
+        hidden=True,
+    ),
+    profile_mode: Optional[str] = typer.Option(
+        None,
+        "--profile-mode",
+        help="cprofile (exacto, hilo principal) o sample (muestreo de bajo coste)",
+        envvar="GENESIS_CLI_PROFILE_MODE",
+        hidden=True,
+    ),
+    profile_top: int = typer.Option(
+        20,
+        "--profile-top",
+        min=1,
+        help="Funciones mostradas al terminar el perfil",
+        envvar="GENESIS_CLI_PROFILE_TOP",
+        hidden=True,
+    ),
+    timings: bool = typer.Option(
+        False,
+        "--timings",
+        help="Mostrar la duración de cada fase del comando al terminar",
+        envvar="GENESIS_CLI_TIMINGS",
+    ),
+    trace_file: Optional[Path] = typer.Option(
+        None,
+        "--trace-file",
+        help="Guardar las fases en formato Trace Event (chrome://tracing, Perfetto)",
+        envvar="GENESIS_CLI_TRACE_FILE",
     )
 ):
     """
@@ -118,25 +264,41 @@ def main(
     Genesis CLI te permite crear, gestionar y desplegar aplicaciones
     completas usando el ecosistema Genesis Engine.
     """
+    if ctx.invoked_subcommand is not None:
+        start_command(ctx.invoked_subcommand)
+    
+    if profile or profile_mode:
+        # Lo primero: el perfil cubre todo el comando y se cierra con el contexto
+        from genesis_cli.profiling import ProfileSession
+        try:
+            session = ProfileSession(ctx.invoked_subcommand, mode=profile_mode or "cprofile", top=profile_top)
+        except ValueError as e:
+            raise typer.BadParameter(str(e), param_hint="--profile-mode")
+        ctx.call_on_close(session.start().stop)
+    
+    if timings or trace_file is not None:
+        from genesis_cli.tracing import TraceSession
+        tracing = TraceSession(ctx.invoked_subcommand, timings=timings, trace_file=trace_file)
+        ctx.call_on_close(tracing.start().stop)
+    
     if ctx.invoked_subcommand is None:
+        from genesis_cli.commands.utils import show_banner
         show_banner()
         console.print("\n[bold yellow]💡 Usa 'genesis --help' para ver comandos disponibles[/bold yellow]")
         console.print("[bold yellow]💡 Usa 'genesis init <nombre>' para crear un proyecto[/bold yellow]")
-        
-    # DOCTRINA: Solo inicializamos config de genesis-core
-    try:
-        initialize_config()
-        if verbose:
-            logger.info("Configuración inicializada en modo verbose")
-    except Exception as e:
-        console.print(f"[red]❌ Error inicializando configuración: {e}[/red]")
-        raise typer.Exit(1)
 
+    if verbose:
+        from genesis_cli.config import set_cli_overrides
+        set_cli_overrides(verbose_output=True)
+
+    # genesis-core se inicializa en cada comando que lo usa (_ensure_core)
     ctx.obj = {"skip_project_check": skip_project_check, "verbose": verbose}
 
 @app.command("init")
 def init(
-    project_name: str = typer.Argument(
+    ctx: typer.Context,
+    project_name: Optional[str] = typer.Argument(
+        None,
         help="Nombre del proyecto a crear"
     ),
     template: str = typer.Option(
@@ -160,6 +322,29 @@ def init(
         False,
         "--force",
         help="Sobrescribir proyecto existente"
+    ),
+    manifest: Optional[Path] = typer.Option(
+        None,
+        "--manifest",
+        "-m",
+        help="Crear varios proyectos desde un manifiesto YAML/JSON"
+    ),
+    jobs: int = typer.Option(
+        4,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Proyectos generados en paralelo (con --manifest)"
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="No usar la caché de resultados"
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Regenerar y actualizar la caché de resultados"
     )
 ):
     """
@@ -167,28 +352,45 @@ def init(
     
     Crea un proyecto completo usando la plantilla seleccionada.
     Los agentes trabajarán en conjunto para generar código optimizado.
+    Con --manifest crea todos los proyectos del manifiesto en lote.
     """
+    if manifest is not None:
+        _init_batch(ctx, manifest, jobs, template, output_dir, force)
+        return
+    
+    if not project_name:
+        console.print("[red]❌ Indica el nombre del proyecto o un manifiesto con --manifest[/red]")
+        raise typer.Exit(1)
+    
+    from rich.prompt import Prompt, Confirm
+    from genesis_cli.ui.console import GenerationProgress
+    from genesis_cli.commands.utils import check_dependencies
+    from genesis_cli.config import should_skip_dependency_check
+    from genesis_cli.utils import get_user_confirmation
+    
     try:
         # DOCTRINA: Validamos entrada del usuario
-        if not validate_project_name(project_name):
-            raise typer.Exit(1)
-        
-        if not validate_template_name(template):
-            raise typer.Exit(1)
-        
-        # Validar directorio de salida
-        if output_dir:
-            output_path = Path(output_dir)
-            if not output_path.exists():
-                console.print(f"[red]❌ Directorio de salida no existe: {output_dir}[/red]")
+        with span(PHASE_VALIDATION):
+            if not validate_project_name(project_name):
                 raise typer.Exit(1)
-        else:
-            output_path = Path.cwd()
-        
-        project_path = output_path / project_name
+            
+            if not validate_template_name(template):
+                raise typer.Exit(1)
+            
+            # Validar directorio de salida
+            if output_dir:
+                output_path = Path(output_dir)
+                if not output_path.exists():
+                    console.print(f"[red]❌ Directorio de salida no existe: {output_dir}[/red]")
+                    raise typer.Exit(1)
+            else:
+                output_path = Path.cwd()
+            
+            project_path = output_path / project_name
+            project_exists = project_path.exists()
         
         # Verificar si el proyecto ya existe
-        if project_path.exists() and not force:
+        if project_exists and not force:
             if not no_interactive:
                 if not get_user_confirmation(f"⚠️ El directorio '{project_name}' ya existe. ¿Continuar?"):
                     console.print("[yellow]Operación cancelada[/yellow]")
@@ -198,7 +400,7 @@ def init(
                 raise typer.Exit(1)
         
         # DOCTRINA: Verificar dependencias como parte de UX
-        if not check_dependencies():
+        if not should_skip_dependency_check() and not check_dependencies():
             console.print("[red]❌ Algunas dependencias no están disponibles[/red]")
             if not no_interactive:
                 if not get_user_confirmation("¿Continuar de todos modos?"):
@@ -217,25 +419,26 @@ def init(
         
         # Modo interactivo para configuración adicional
         if not no_interactive:
-            config["description"] = Prompt.ask(
-                "[cyan]Descripción del proyecto[/cyan]", 
-                default="Aplicación generada con Genesis Engine"
-            )
-            
-            # Seleccionar características básicas
-            features = []
-            if Confirm.ask("¿Incluir autenticación?", default=True):
-                features.append("authentication")
-            if Confirm.ask("¿Incluir base de datos?", default=True):
-                features.append("database")
-            if Confirm.ask("¿Incluir API REST?", default=True):
-                features.append("api")
-            if Confirm.ask("¿Incluir frontend?", default=True):
-                features.append("frontend")
-            if Confirm.ask("¿Incluir Docker?", default=True):
-                features.append("docker")
-            if Confirm.ask("¿Incluir CI/CD?", default=True):
-                features.append("cicd")
+            with span(PHASE_PROMPTS):
+                config["description"] = Prompt.ask(
+                    "[cyan]Descripción del proyecto[/cyan]", 
+                    default="Aplicación generada con Genesis Engine"
+                )
+                
+                # Seleccionar características básicas
+                features = []
+                if Confirm.ask("¿Incluir autenticación?", default=True):
+                    features.append("authentication")
+                if Confirm.ask("¿Incluir base de datos?", default=True):
+                    features.append("database")
+                if Confirm.ask("¿Incluir API REST?", default=True):
+                    features.append("api")
+                if Confirm.ask("¿Incluir frontend?", default=True):
+                    features.append("frontend")
+                if Confirm.ask("¿Incluir Docker?", default=True):
+                    features.append("docker")
+                if Confirm.ask("¿Incluir CI/CD?", default=True):
+                    features.append("cicd")
             
             config["features"] = features
         else:
@@ -245,29 +448,47 @@ def init(
         # DOCTRINA: Mostramos progreso y estado elegante
         console.print(f"\n[bold green]🚀 Creando proyecto '{project_name}'...[/bold green]")
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True
-        ) as progress:
-            task = progress.add_task("Conectando con Genesis Core...", total=None)
+        with GenerationProgress(console=console) as progress:
+            task = progress.main_task
+            
+            def _create() -> Dict[str, Any]:
+                # DOCTRINA: Solo usamos genesis-core como interfaz
+                result = _forward_to_daemon("init", config)
+                if result is None:
+                    _ensure_core(ctx)
+                    result = _run_async(_create_project_async(
+                        config, progress, task, on_event=progress.handle_event
+                    ))
+                return result
             
-            # DOCTRINA: Solo usamos genesis-core como interfaz
-            result = asyncio.run(_create_project_async(config, progress, task))
+            result = _run_with_result_cache(
+                ctx,
+                request=(project_name, template, config["features"], config),
+                root=project_path,
+                files_key="generated_files",
+                produce=_create,
+                no_cache=no_cache,
+                refresh=refresh
+            )
+            if result.get("cached"):
+                result["project_path"] = str(project_path)
             
             if result.get("success"):
-                console.print(f"\n[bold green]✅ Proyecto '{project_name}' creado exitosamente![/bold green]")
-                console.print(f"[green]📁 Ubicación: {result.get('project_path', project_path)}[/green]")
+                _record_project(Path(result.get("project_path") or project_path), config,
+                                result.get("generated_files") or [])
                 
-                if result.get("generated_files"):
-                    console.print(f"[green]📄 Archivos generados: {len(result['generated_files'])}[/green]")
-                
-                # Mostrar siguientes pasos
-                console.print("\n[bold cyan]📋 Siguientes pasos:[/bold cyan]")
-                console.print(f"1. [cyan]cd {project_name}[/cyan]")
-                console.print("2. [cyan]genesis deploy --env local[/cyan]")
-                console.print("3. [cyan]genesis status[/cyan]")
+                with span(PHASE_RENDER):
+                    console.print(f"\n[bold green]✅ Proyecto '{project_name}' creado exitosamente![/bold green]")
+                    console.print(f"[green]📁 Ubicación: {result.get('project_path', project_path)}[/green]")
+                    
+                    if result.get("generated_files"):
+                        console.print(f"[green]📄 Archivos generados: {len(result['generated_files'])}[/green]")
+                    
+                    # Mostrar siguientes pasos
+                    console.print("\n[bold cyan]📋 Siguientes pasos:[/bold cyan]")
+                    console.print(f"1. [cyan]cd {project_name}[/cyan]")
+                    console.print("2. [cyan]genesis deploy --env local[/cyan]")
+                    console.print("3. [cyan]genesis status[/cyan]")
                 
             else:
                 console.print(f"\n[red]❌ Error creando proyecto: {result.get('error', 'Error desconocido')}[/red]")
@@ -281,25 +502,158 @@ def init(
         console.print(f"[red]❌ Error inesperado: {e}[/red]")
         raise typer.Exit(1)
 
-async def _create_project_async(config: Dict[str, Any], progress: Progress, task_id) -> Dict[str, Any]:
+def _init_batch(ctx: typer.Context, manifest: Path, jobs: int, template: str,
+                output_dir: Optional[str], force: bool):
+    """
+    Crear en lote los proyectos de un manifiesto
+    
+    DOCTRINA: Validamos todo el manifiesto antes de generar nada
+    """
+    import time
+    from genesis_cli.commands.batch import (
+        load_manifest, build_project_configs, validate_batch,
+        format_batch_errors, run_batch, show_batch_summary
+    )
+    from genesis_cli.commands.utils import check_dependencies
+    from genesis_cli.config import should_skip_dependency_check
+    from genesis_cli.exceptions import ConfigurationError
+    from genesis_cli.template_catalog import get_template_catalog
+    
+    try:
+        configs = build_project_configs(load_manifest(manifest), {
+            "template": template,
+            "output_path": output_dir or str(Path.cwd()),
+            "force": force,
+        })
+    except ConfigurationError as e:
+        console.print(f"[red]❌ {e.get_formatted_message()}[/red]")
+        raise typer.Exit(1)
+    
+    if not configs:
+        console.print("[yellow]⚠️ El manifiesto no contiene proyectos[/yellow]")
+        return
+    
+    get_template_catalog()
+    errors = validate_batch(configs)
+    if errors:
+        console.print(f"[red]❌ {format_batch_errors(errors).get_formatted_message()}[/red]")
+        raise typer.Exit(1)
+    
+    # DOCTRINA: Verificar dependencias una sola vez para todo el lote
+    if not should_skip_dependency_check() and not check_dependencies():
+        console.print("[red]❌ Algunas dependencias no están disponibles[/red]")
+        raise typer.Exit(1)
+    
+    console.print(f"\n[bold green]🚀 Creando {len(configs)} proyectos ({jobs} en paralelo)...[/bold green]")
+    
+    # DOCTRINA: Solo usamos genesis-core como interfaz
+    _ensure_core(ctx)
+    orchestrator = CoreOrchestrator()
+    
+    start = time.monotonic()
+    results = _run_async(run_batch(
+        configs,
+        lambda config: _create_project_async(config, orchestrator=orchestrator),
+        jobs=jobs
+    ))
+    
+    # Igual que `genesis init`: registrar hashes y huella para --incremental y verify
+    for config, result in zip(configs, results):
+        if result.success:
+            _record_project(Path(result.project_path or Path(config["output_path"]) / config["name"]),
+                            config, result.generated_files)
+    
+    show_batch_summary(results, time.monotonic() - start)
+    
+    if not all(result.success for result in results):
+        raise typer.Exit(1)
+
+def _run_with_result_cache(ctx: typer.Context, request: tuple, root: Path, files_key: str,
+                           produce: Callable[[], Dict[str, Any]],
+                           no_cache: bool = False, refresh: bool = False) -> Dict[str, Any]:
+    """
+    Ejecutar una generación consultando antes la caché de resultados
+    
+    Un acierto reproduce los archivos bajo `root` sin llamar a genesis-core.
+    
+    Args:
+        request: (name, template, features, options) del ProjectGenerationRequest
+        root: Directorio donde genesis-core escribe los archivos
+        files_key: Clave del resultado con la lista de archivos generados
+        produce: Ejecuta la generación real
+    """
+    if no_cache:
+        return produce()
+    
+    from genesis_cli.config import get_result_cache_max_mb
+    from genesis_cli.result_cache import ResultCache, make_cache_key, normalize_request
+    
+    cache = ResultCache(max_size_mb=get_result_cache_max_mb())
+    name, template, features, options = request
+    key = make_cache_key(normalize_request(name, template, features, options), template)
+    
+    result = None
+    entry = None if refresh else cache.lookup(key)
+    if entry is not None:
+        try:
+            result = {**entry.result, files_key: cache.replay(entry, root), "cached": True}
+        except OSError as e:
+            logger.warning(f"No se pudo reproducir el resultado en caché: {e}")
+    
+    if result is None:
+        result = produce()
+        if result.get("success"):
+            cache.store(key, result, result.get(files_key) or [], root)
+    
+    # Una sola escritura del índice por comando
+    cache.flush()
+    
+    if ctx is not None and ctx.obj and ctx.obj.get("verbose"):
+        from genesis_cli.utils import format_file_size
+        
+        stats = cache.stats()
+        outcome = "acierto" if result.get("cached") else "actualizada" if refresh else "fallo"
+        console.print(
+            f"[dim]💾 Caché de resultados: {outcome} · {stats['hits']} aciertos / "
+            f"{stats['misses']} fallos · {stats['entries']} entradas "
+            f"({format_file_size(stats['size'])})[/dim]"
+        )
+    
+    return result
+
+async def _create_project_async(config: Dict[str, Any], progress: Optional["Progress"] = None, task_id=None,
+                                orchestrator: Any = None, on_event: Optional[Callable[[Any], None]] = None) -> Dict[str, Any]:
     """
     Crear proyecto de forma asíncrona
     DOCTRINA: Solo usamos genesis-core, nunca MCPturbo directamente
+    
+    Si genesis-core emite eventos de progreso (fases, archivos, agentes),
+    se entregan a `on_event` a medida que ocurren.
     """
+    from genesis_cli.events import execute_with_progress
+    
+    def _update(description: str):
+        if progress is not None:
+            progress.update(task_id, description=description)
+    
     try:
-        progress.update(task_id, description="Inicializando Genesis Core...")
-        orchestrator = CoreOrchestrator()
+        _update("Inicializando Genesis Core...")
+        with span(PHASE_ORCHESTRATOR):
+            orchestrator = orchestrator or CoreOrchestrator()
+        
+        _update("Preparando solicitud de generación...")
+        from genesis_cli.validators import resolve_features
         
-        progress.update(task_id, description="Preparando solicitud de generación...")
         request = ProjectGenerationRequest(
             name=config.get("name", "project"),
             template=config.get("template", "saas-basic"),
-            features=config.get("features", []),
+            features=resolve_features(config.get("features", [])),
             options=config,
         )
         
-        progress.update(task_id, description="Ejecutando generación de proyecto...")
-        result = await orchestrator.execute_project_generation(request)
+        _update("Ejecutando generación de proyecto...")
+        with span(PHASE_CORE_REQUEST, command="init"):
+            result = await execute_with_progress(orchestrator, request, on_event)
         
         if result.success:
             return {
@@ -341,21 +695,19 @@ def deploy(
     
     Ejecuta el proceso de despliegue usando Genesis Core.
     """
+    from genesis_cli.utils import get_user_confirmation
+    
     try:
-        skip_check = ctx.obj.get("skip_project_check") if ctx.obj else False
-        
         # DOCTRINA: Validamos entrada del usuario
-        if not skip_check and not Path("genesis.json").exists():
-            console.print("[red]❌ No estás en un proyecto Genesis[/red]")
-            console.print("[yellow]💡 Ejecuta 'genesis init <nombre>' para crear uno[/yellow]")
-            raise typer.Exit(1)
-        
-        # Validar entorno
-        valid_envs = ["local", "staging", "production"]
-        if environment not in valid_envs:
-            console.print(f"[red]❌ Entorno inválido: {environment}[/red]")
-            console.print(f"[yellow]💡 Entornos válidos: {', '.join(valid_envs)}[/yellow]")
-            raise typer.Exit(1)
+        with span(PHASE_VALIDATION):
+            _project_root(ctx, chdir=True)
+            
+            # Validar entorno
+            valid_envs = ["local", "staging", "production"]
+            if environment not in valid_envs:
+                console.print(f"[red]❌ Entorno inválido: {environment}[/red]")
+                console.print(f"[yellow]💡 Entornos válidos: {', '.join(valid_envs)}[/yellow]")
+                raise typer.Exit(1)
         
         console.print(f"[bold blue]🚀 Desplegando en entorno: {environment}[/bold blue]")
         
@@ -371,12 +723,16 @@ def deploy(
             "force": force
         }
         
-        result = asyncio.run(_deploy_async(config))
+        result = _forward_to_daemon("deploy", config)
+        if result is None:
+            _ensure_core(ctx)
+            result = _run_async(_deploy_async(config))
         
         if result.get("success"):
-            console.print(f"[bold green]✅ Despliegue exitoso en {environment}[/bold green]")
-            if result.get("url"):
-                console.print(f"[green]🌐 URL: {result['url']}[/green]")
+            with span(PHASE_RENDER):
+                console.print(f"[bold green]✅ Despliegue exitoso en {environment}[/bold green]")
+                if result.get("url"):
+                    console.print(f"[green]🌐 URL: {result['url']}[/green]")
         else:
             console.print(f"[red]❌ Error en despliegue: {result.get('error', 'Error desconocido')}[/red]")
             raise typer.Exit(1)
@@ -386,13 +742,14 @@ def deploy(
         console.print(f"[red]❌ Error inesperado: {e}[/red]")
         raise typer.Exit(1)
 
-async def _deploy_async(config: Dict[str, Any]) -> Dict[str, Any]:
+async def _deploy_async(config: Dict[str, Any], orchestrator: Any = None) -> Dict[str, Any]:
     """
     Ejecutar despliegue de forma asíncrona
     DOCTRINA: Solo usamos genesis-core
     """
     try:
-        orchestrator = CoreOrchestrator()
+        with span(PHASE_ORCHESTRATOR):
+            orchestrator = orchestrator or CoreOrchestrator()
         
         request = ProjectGenerationRequest(
             name="deploy",
@@ -400,7 +757,8 @@ async def _deploy_async(config: Dict[str, Any]) -> Dict[str, Any]:
             options=config,
         )
         
-        result = await orchestrator.execute_deployment(request)
+        with span(PHASE_CORE_REQUEST, command="deploy"):
+            result = await orchestrator.execute_deployment(request)
         
         if result.success:
             return {
@@ -424,45 +782,72 @@ async def _deploy_async(config: Dict[str, Any]) -> Dict[str, Any]:
 @app.command("generate")
 def generate(
     ctx: typer.Context,
-    component: str = typer.Argument(
+    component: Optional[str] = typer.Argument(
+        None,
         help="Tipo de componente a generar (model, endpoint, page, component)"
     ),
-    name: str = typer.Argument(
+    name: Optional[str] = typer.Argument(
+        None,
         help="Nombre del componente"
     ),
     interactive: bool = typer.Option(
         True,
         "--interactive/--no-interactive",
         help="Modo interactivo para configuración"
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="No usar la caché de resultados"
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Regenerar y actualizar la caché de resultados"
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Regenerar solo los componentes cuyas entradas cambiaron"
     )
 ):
     """
     ⚡ Generar componentes específicos
     
     Genera componentes individuales usando Genesis Core.
+    Con --incremental y sin argumentos revisa todos los componentes registrados.
     """
     try:
-        skip_check = ctx.obj.get("skip_project_check") if ctx.obj else False
-        
         # DOCTRINA: Validamos entrada del usuario
-        if not skip_check and not Path("genesis.json").exists():
-            console.print("[red]❌ No estás en un proyecto Genesis[/red]")
-            console.print("[yellow]💡 Ejecuta 'genesis init <nombre>' para crear uno[/yellow]")
-            raise typer.Exit(1)
+        with span(PHASE_VALIDATION):
+            _project_root(ctx, chdir=True)
         
-        # Validar tipo de componente
-        valid_components = ["model", "endpoint", "page", "component", "test"]
-        if component not in valid_components:
-            console.print(f"[red]❌ Tipo de componente inválido: {component}[/red]")
-            console.print(f"[yellow]💡 Tipos válidos: {', '.join(valid_components)}[/yellow]")
-            raise typer.Exit(1)
-        
-        # Validar nombre
-        if not validate_project_name(name):
-            raise typer.Exit(1)
-        
-        console.print(f"[bold blue]⚡ Generando {component}: {name}[/bold blue]")
+        if incremental and component is None:
+            _generate_incremental(ctx, None, no_cache, refresh)
+            return
         
+        with span(PHASE_VALIDATION):
+            if not component or not name:
+                console.print("[red]❌ Indica el tipo y el nombre del componente[/red]")
+                console.print("[yellow]💡 O usa 'genesis generate --incremental' para regenerar lo que cambió[/yellow]")
+                raise typer.Exit(1)
+            
+            # Validar tipo de componente
+            valid_components = ["model", "endpoint", "page", "component", "test"]
+            if component not in valid_components:
+                from genesis_cli.suggestions import index_for
+                
+                console.print(f"[red]❌ Tipo de componente inválido: {component}[/red]")
+                similar = index_for(valid_components).best(component)
+                if similar:
+                    console.print(f"[yellow]💡 ¿Quisiste decir '{similar}'?[/yellow]")
+                console.print(f"[yellow]💡 Tipos válidos: {', '.join(valid_components)}[/yellow]")
+                raise typer.Exit(1)
+            
+            # Validar nombre
+            if not validate_project_name(name):
+                raise typer.Exit(1)
+            
         # Configurar generación
         config = {
             "component": component,
@@ -470,15 +855,22 @@ def generate(
             "interactive": interactive
         }
         
-        # Ejecutar generación
-        result = asyncio.run(_generate_async(config))
+        if incremental:
+            _generate_incremental(ctx, [config], no_cache, refresh)
+            return
+        
+        console.print(f"[bold blue]⚡ Generando {component}: {name}[/bold blue]")
+        
+        result = _run_generate(ctx, config, no_cache, refresh)
         
         if result.get("success"):
-            console.print(f"[bold green]✅ {component.capitalize()} '{name}' generado exitosamente[/bold green]")
-            if result.get("files"):
-                console.print(f"[green]📄 Archivos creados: {len(result['files'])}[/green]")
-                for file in result["files"]:
-                    console.print(f"  • {file}")
+            _record_generation(Path.cwd(), config, result.get("files") or [])
+            with span(PHASE_RENDER):
+                console.print(f"[bold green]✅ {component.capitalize()} '{name}' generado exitosamente[/bold green]")
+                if result.get("files"):
+                    console.print(f"[green]📄 Archivos creados: {len(result['files'])}[/green]")
+                    for file in result["files"]:
+                        console.print(f"  • {file}")
         else:
             console.print(f"[red]❌ Error generando {component}: {result.get('error', 'Error desconocido')}[/red]")
             raise typer.Exit(1)
@@ -488,13 +880,150 @@ def generate(
         console.print(f"[red]❌ Error inesperado: {e}[/red]")
         raise typer.Exit(1)
 
-async def _generate_async(config: Dict[str, Any]) -> Dict[str, Any]:
+def _run_generate(ctx: typer.Context, config: Dict[str, Any],
+                  no_cache: bool = False, refresh: bool = False) -> Dict[str, Any]:
+    """Generar un componente en el directorio actual (daemon, caché o en proceso)"""
+    from genesis_cli.project_manifest import generate_request, read_project_context
+    
+    def _generate() -> Dict[str, Any]:
+        result = _forward_to_daemon("generate", config)
+        if result is None:
+            _ensure_core(ctx)
+            result = _run_async(_generate_async(config))
+        return result
+    
+    # Ejecutar generación (o reproducirla desde la caché)
+    return _run_with_result_cache(
+        ctx,
+        request=generate_request(config, read_project_context(Path.cwd())),
+        root=Path.cwd(),
+        files_key="files",
+        produce=_generate,
+        no_cache=no_cache,
+        refresh=refresh
+    )
+
+def _record_generation(root: Path, config: Dict[str, Any], files: List[str]):
+    """Registrar en genesis.json la huella de entradas y el hash de cada archivo generado"""
+    from genesis_cli.project_manifest import ProjectManifest, component_id, generate_request
+    
+    manifest = ProjectManifest(root)
+    if not manifest.exists:
+        return
+    
+    try:
+        manifest.record(component_id(config), manifest.fingerprint(generate_request(config)), files, config)
+        manifest.save()
+    except OSError as e:
+        logger.warning(f"No se pudo actualizar genesis.json: {e}")
+
+def _record_project(project_path: Path, config: Dict[str, Any], files: List[str]):
+    """Registrar la generación inicial del proyecto en genesis.json"""
+    from datetime import datetime
+    from genesis_cli.project_manifest import ProjectManifest, PROJECT_COMPONENT
+    
+    manifest = ProjectManifest(project_path)
+    if not manifest.exists:
+        # genesis-core no dejó manifiesto: crear uno con los datos básicos
+        manifest.data.update({
+            "name": config.get("name"),
+            "template": config.get("template"),
+            "description": config.get("description", ""),
+            "features": config.get("features", []),
+            "created_at": datetime.now().isoformat(),
+            "generated_files": list(files),
+        })
+    
+    request = (config.get("name"), config.get("template"), config.get("features"), config)
+    try:
+        manifest.record(PROJECT_COMPONENT, manifest.fingerprint(request), files)
+        manifest.save()
+    except OSError as e:
+        logger.warning(f"No se pudo actualizar genesis.json: {e}")
+
+def _generate_incremental(ctx: typer.Context, configs: Optional[List[Dict[str, Any]]],
+                          no_cache: bool = False, refresh: bool = False):
+    """
+    Regenerar solo los componentes cuyas entradas cambiaron
+    
+    Cada componente se genera en un directorio temporal dentro del proyecto
+    y solo se mueven al proyecto los archivos cuyo contenido cambió.
+    """
+    import os
+    import shutil
+    import tempfile
+    from genesis_cli.project_manifest import (
+        ProjectManifest, MANIFEST_FILE, component_id, generate_request, sync_staged_files
+    )
+    
+    root = Path.cwd().resolve()
+    manifest = ProjectManifest(root)
+    configs = configs if configs is not None else manifest.component_configs()
+    
+    if not configs:
+        console.print("[yellow]⚠️ No hay componentes registrados en genesis.json[/yellow]")
+        return
+    
+    pending = []
+    for config in configs:
+        reason = manifest.stale_reason(component_id(config), manifest.fingerprint(generate_request(config)))
+        if reason:
+            pending.append((config, reason))
+    
+    if not pending:
+        console.print(f"[green]✅ {len(configs)} componentes al día, nada que regenerar[/green]")
+        return
+    
+    failed = 0
+    for config, reason in pending:
+        console.print(f"[bold blue]⚡ Generando {config['component']}: {config['name']}[/bold blue] [dim]({reason})[/dim]")
+        
+        staging = Path(tempfile.mkdtemp(prefix=".genesis-staging-", dir=root))
+        try:
+            if manifest.exists:
+                shutil.copy2(manifest.path, staging / MANIFEST_FILE)
+            os.chdir(staging)
+            try:
+                result = _run_generate(ctx, config, no_cache, refresh)
+            finally:
+                os.chdir(root)
+            
+            if not result.get("success"):
+                failed += 1
+                console.print(f"[red]❌ Error generando {config['component']}: {result.get('error', 'Error desconocido')}[/red]")
+                continue
+            
+            files = []
+            for file_path in result.get("files") or []:
+                path = Path(file_path)
+                if path.is_absolute():
+                    path = path.resolve().relative_to(staging.resolve())
+                files.append(path.as_posix())
+            
+            updated, unchanged = sync_staged_files(staging, root, files)
+            console.print(
+                f"[green]✅ {len(updated)} archivos actualizados, "
+                f"{len(unchanged)} sin cambios[/green]"
+            )
+            for file_path in updated:
+                console.print(f"  • {file_path}")
+            
+            manifest.record(component_id(config), manifest.fingerprint(generate_request(config)), files, config)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+    
+    manifest.save()
+    if failed:
+        raise typer.Exit(1)
+
+async def _generate_async(config: Dict[str, Any], orchestrator: Any = None) -> Dict[str, Any]:
     """
     Ejecutar generación de forma asíncrona
     DOCTRINA: Solo usamos genesis-core
     """
     try:
-        orchestrator = CoreOrchestrator()
+        with span(PHASE_ORCHESTRATOR):
+            orchestrator = orchestrator or CoreOrchestrator()
         
         request = ProjectGenerationRequest(
             name="generate_component",
@@ -502,7 +1031,8 @@ async def _generate_async(config: Dict[str, Any]) -> Dict[str, Any]:
             options=config,
         )
         
-        result = await orchestrator.execute_component_generation(request)
+        with span(PHASE_CORE_REQUEST, command="generate"):
+            result = await orchestrator.execute_component_generation(request)
         
         if result.success:
             return {
@@ -524,28 +1054,60 @@ async def _generate_async(config: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 @app.command("status")
-def status(ctx: typer.Context):
+def status(
+    ctx: typer.Context,
+    tree: bool = typer.Option(
+        False,
+        "--tree",
+        help="Mostrar el árbol de archivos generados"
+    ),
+    max_depth: int = typer.Option(
+        3,
+        "--max-depth",
+        min=1,
+        help="Niveles de directorios a desplegar en el árbol"
+    ),
+    path: Optional[str] = typer.Option(
+        None,
+        "--path",
+        help="Mostrar solo el subárbol de este directorio"
+    ),
+    top: Optional[int] = typer.Option(
+        None,
+        "--top",
+        min=1,
+        help="Mostrar los N directorios con más archivos"
+    ),
+    disk: bool = typer.Option(
+        False,
+        "--disk",
+        help="Mostrar el uso de disco por directorio de primer nivel"
+    ),
+    exclude: Optional[List[str]] = typer.Option(
+        None,
+        "--exclude",
+        help="Glob a ignorar en el uso de disco (repetible, ej: node_modules)"
+    )
+):
     """
     📊 Mostrar estado del proyecto actual
     
     Muestra información detallada sobre el proyecto Genesis.
     """
+    from rich.table import Table
+    
     try:
         console.print("[bold blue]📊 Estado del Proyecto Genesis[/bold blue]")
         
         # Verificar si estamos en un proyecto Genesis
-        project_file = Path("genesis.json")
-        skip_check = ctx.obj.get("skip_project_check") if ctx.obj else False
-        
-        if not skip_check and not project_file.exists():
-            console.print("[red]❌ No estás en un proyecto Genesis[/red]")
-            console.print("[yellow]💡 Ejecuta 'genesis init <nombre>' para crear uno[/yellow]")
-            raise typer.Exit(1)
+        root = _project_root(ctx)
+        project_file = root / "genesis.json"
         
-        # Leer metadata del proyecto
+        # Leer metadata del proyecto: solo la cabecera, sin cargar la lista de archivos
         try:
-            with open(project_file, 'r') as f:
-                metadata = json.load(f)
+            from genesis_cli.project_manifest import read_manifest_header
+            
+            metadata = read_manifest_header(project_file)
             
             console.print("[green]✅ Proyecto Genesis detectado[/green]")
             
@@ -558,7 +1120,7 @@ def status(ctx: typer.Context):
             table.add_row("Template", metadata.get("template", "N/A"))
             table.add_row("Versión", metadata.get("version", "N/A"))
             table.add_row("Generado", metadata.get("created_at", "N/A"))
-            table.add_row("Archivos", str(len(metadata.get("generated_files", []))))
+            table.add_row("Archivos", str(metadata["file_count"]))
             
             console.print(table)
             
@@ -569,6 +1131,17 @@ def status(ctx: typer.Context):
                 for feature in features:
                     console.print(f"  • {feature}")
             
+            # La lista completa solo se carga si se pide el árbol
+            if tree or path or top:
+                from genesis_cli.ui.console import GenesisUI
+                
+                with open(project_file, 'r') as f:
+                    generated_files = json.load(f).get("generated_files", [])
+                GenesisUI().show_file_tree(generated_files, max_depth=max_depth, path=path, top=top)
+            
+            if disk:
+                _show_disk_usage(root, exclude or [])
+            
         except Exception as e:
             console.print(f"[red]❌ Error leyendo metadata: {e}[/red]")
             raise typer.Exit(1)
@@ -578,24 +1151,244 @@ def status(ctx: typer.Context):
         console.print(f"[red]❌ Error inesperado: {e}[/red]")
         raise typer.Exit(1)
 
+def _show_disk_usage(root: Path, exclude: List[str]):
+    """
+    Mostrar el uso de disco del proyecto por directorio de primer nivel
+    
+    DOCTRINA: Mostrar estado de manera elegante
+    """
+    from rich.table import Table
+    from genesis_cli.disk_usage import DiskUsageCache, ROOT_FILES, scan_disk_usage
+    from genesis_cli.utils import format_file_size
+    
+    usage = scan_disk_usage(root, exclude=exclude, cache=DiskUsageCache())
+    
+    table = Table(title="💽 Uso de disco")
+    table.add_column("Directorio", style="cyan")
+    table.add_column("Tamaño", style="green", justify="right")
+    table.add_column("%", style="dim", justify="right")
+    
+    rows = sorted(usage.directories.items(), key=lambda item: item[1], reverse=True)
+    if usage.root_files:
+        rows.append((ROOT_FILES, usage.root_files))
+    for name, size in rows:
+        share = f"{size * 100 / usage.total:.1f}" if usage.total else "0.0"
+        table.add_row(f"{name}/" if name != ROOT_FILES else name, format_file_size(size), share)
+    table.add_row("[bold]Total[/bold]", f"[bold]{format_file_size(usage.total)}[/bold]", "")
+    
+    console.print(table)
+    console.print(
+        f"[dim]{usage.files} archivos · {usage.scanned_dirs} directorios leídos, "
+        f"{usage.cached_dirs} desde caché[/dim]"
+    )
+
+@app.command("verify")
+def verify(
+    exclude: Optional[List[str]] = typer.Option(
+        None,
+        "--exclude",
+        help="Glob que no cuenta como archivo no registrado (repetible)"
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs", "-j",
+        min=1,
+        help="Hilos para calcular hashes (por defecto según CPUs)"
+    ),
+    untracked: bool = typer.Option(
+        True,
+        "--untracked/--no-untracked",
+        help="Buscar archivos que no están en genesis.json"
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Volver a hashear todos los archivos"
+    )
+):
+    """
+    🔍 Verificar los archivos generados contra genesis.json
+    
+    Detecta archivos faltantes, modificados a mano y no registrados antes de
+    regenerar. Termina con código 1 si el proyecto difiere de genesis.json.
+    """
+    import time
+    from genesis_cli.commands.verify import HashCache, show_verify_report, verify_project
+    
+    root = _project_root()
+    
+    try:
+        start = time.monotonic()
+        report = verify_project(
+            root,
+            exclude=exclude or [],
+            jobs=jobs,
+            cache=None if no_cache else HashCache(),
+            untracked=untracked
+        )
+        show_verify_report(report, time.monotonic() - start)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]❌ Error leyendo genesis.json: {e}[/red]")
+        raise typer.Exit(1)
+    
+    if not report.clean:
+        raise typer.Exit(1)
+
+@app.command("logs")
+def logs(
+    lines: Optional[int] = typer.Option(
+        None,
+        "--lines", "-n",
+        min=1,
+        help="Mostrar las últimas N líneas (o N registros con filtros)"
+    ),
+    follow: bool = typer.Option(
+        False,
+        "--follow", "-f",
+        help="Seguir mostrando las líneas nuevas"
+    ),
+    since: Optional[str] = typer.Option(
+        None,
+        "--since",
+        help="Desde una fecha (2026-10-17 10:00) o una antigüedad (30m, 2h, 1d)"
+    ),
+    grep: Optional[str] = typer.Option(
+        None,
+        "--grep",
+        help="Solo registros que contienen esta expresión regular"
+    ),
+    level: Optional[str] = typer.Option(
+        None,
+        "--level",
+        help="Nivel mínimo: DEBUG, INFO, WARNING, ERROR o CRITICAL"
+    )
+):
+    """
+    📜 Mostrar los logs de Genesis CLI
+    
+    Sin filtros muestra las últimas líneas de genesis-cli.log. Con --since,
+    --grep o --level busca también en los logs rotados de ~/.genesis-cli/logs.
+    """
+    import re
+    from collections import deque
+    from genesis_cli.log_reader import (
+        LEVELS, EntryFilter, LogIndex, follow_matching, parse_since, read_last_lines, search_logs
+    )
+    from genesis_cli.logging import LOG_DIR, LOG_FILE_NAME
+    
+    if level is not None and level.upper() not in LEVELS:
+        raise typer.BadParameter(f"usa uno de: {', '.join(LEVELS)}", param_hint="--level")
+    try:
+        entry_filter = EntryFilter(
+            since=parse_since(since) if since else None,
+            level=level,
+            pattern=grep
+        )
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="--since")
+    except re.error as e:
+        raise typer.BadParameter(f"expresión regular no válida: {e}", param_hint="--grep")
+    
+    if entry_filter.active:
+        entries = search_logs(LOG_DIR, entry_filter, LogIndex())
+        if lines is not None:
+            entries = deque(entries, maxlen=lines)
+        for entry in entries:
+            print(entry.text)
+    else:
+        for line in read_last_lines(LOG_DIR, lines or 50):
+            print(line)
+    
+    if not follow:
+        return
+    
+    sys.stdout.flush()
+    try:
+        for line in follow_matching(LOG_DIR / LOG_FILE_NAME, entry_filter):
+            print(line, flush=True)
+    except KeyboardInterrupt:
+        pass
+
+@app.command("templates")
+def templates(
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Volver a pedir el catálogo a Genesis Core"
+    ),
+    as_json: bool = typer.Option(
+        False,
+        "--json",
+        help="Mostrar el catálogo en JSON"
+    )
+):
+    """
+    📋 Listar los templates disponibles
+    
+    El catálogo lo publica Genesis Core; se guarda en
+    ~/.genesis-cli/catalog.json y se vuelve a pedir cuando vence.
+    """
+    import time
+    from genesis_cli.config import get_template_catalog_ttl
+    from genesis_cli.template_catalog import CatalogStore, SOURCE_CORE, load_template_catalog
+    from genesis_cli.utils import format_duration
+    from genesis_cli.validators import TemplateValidator
+    
+    catalog = load_template_catalog(refresh=refresh, store=CatalogStore(ttl=get_template_catalog_ttl()))
+    
+    if as_json:
+        print(json.dumps({
+            "source": catalog.source,
+            "core_version": catalog.core_version,
+            "fetched_at": catalog.fetched_at,
+            "templates": catalog.templates,
+        }, indent=2, ensure_ascii=False))
+        return
+    
+    from genesis_cli.ui.console import GenesisUI
+    
+    GenesisUI().show_template_options(TemplateValidator.list_templates())
+    
+    if catalog.source == SOURCE_CORE:
+        age = format_duration(max(time.time() - catalog.fetched_at, 0))
+        version = f" {catalog.core_version}" if catalog.core_version != "unknown" else ""
+        origin = f"Genesis Core{version}, actualizado hace {age}"
+        if catalog.stale:
+            origin += " (vencido: Genesis Core no respondió)"
+    else:
+        origin = "templates incluidos en la CLI (Genesis Core no publica su catálogo)"
+    console.print(f"[dim]Catálogo: {origin}[/dim]")
+
 @app.command("doctor")
-def doctor():
+def doctor(
+    ctx: typer.Context,
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Ignorar la caché y volver a verificar las dependencias"
+    )
+):
     """
     🔍 Diagnosticar el entorno de desarrollo
     
     Ejecuta un diagnóstico completo del sistema.
     """
+    from genesis_cli.commands.utils import check_dependencies
+    
     try:
         console.print("[bold blue]🔍 Diagnóstico del Sistema Genesis[/bold blue]")
         
         # DOCTRINA: Verificar dependencias como parte de UX
-        deps_ok = check_dependencies()
+        deps_ok = check_dependencies(refresh=refresh)
         
         # Verificar conexión con genesis-core
         console.print("\n[bold cyan]⚙️ Verificando Genesis Core...[/bold cyan]")
         try:
+            _ensure_core(ctx)
             orchestrator = CoreOrchestrator()
             console.print("[green]✅ Genesis Core disponible[/green]")
+        except typer.Exit:
+            deps_ok = False
         except Exception as e:
             console.print(f"[red]❌ Error conectando con Genesis Core: {e}[/red]")
             deps_ok = False
@@ -614,9 +1407,104 @@ def doctor():
         console.print(f"[red]❌ Error inesperado: {e}[/red]")
         raise typer.Exit(1)
 
+# Subcomandos del daemon
+daemon_app = typer.Typer(
+    help="🔥 Gestionar el daemon que mantiene Genesis Core en memoria",
+    no_args_is_help=True
+)
+app.add_typer(daemon_app, name="daemon")
+
+@daemon_app.command("start")
+def daemon_start(
+    idle_timeout: Optional[int] = typer.Option(
+        None,
+        "--idle-timeout",
+        help="Segundos sin solicitudes antes de detenerse (por defecto: configuración)"
+    ),
+    foreground: bool = typer.Option(
+        False,
+        "--foreground",
+        help="Ejecutar en primer plano"
+    )
+):
+    """
+    🔥 Iniciar el daemon de Genesis CLI
+    
+    Mientras está activo, init, generate y deploy se ejecutan en un proceso
+    con Genesis Core ya cargado en lugar de inicializarlo en cada invocación.
+    """
+    from genesis_cli import daemon
+    from genesis_cli.config import get_daemon_idle_timeout
+    
+    if not daemon.is_supported():
+        console.print("[red]❌ El daemon requiere sockets Unix, no disponibles en esta plataforma[/red]")
+        raise typer.Exit(1)
+    
+    info = daemon.get_daemon_info()
+    if info is not None:
+        if info.get("version") == daemon.daemon_version():
+            console.print(f"[green]✅ El daemon ya está activo (PID {info.get('pid')})[/green]")
+            return
+        console.print("[yellow]⚠️ Reemplazando daemon de otra versión...[/yellow]")
+        daemon.stop_daemon()
+    
+    timeout = idle_timeout if idle_timeout is not None else get_daemon_idle_timeout()
+    if foreground:
+        console.print(f"[bold blue]🔥 Daemon escuchando en {daemon.SOCKET_PATH}[/bold blue]")
+        daemon.run_daemon(idle_timeout=timeout)
+        return
+    
+    if daemon.start_daemon(idle_timeout=timeout):
+        console.print("[bold green]✅ Daemon iniciado[/bold green]")
+        console.print(f"[green]🔌 Socket: {daemon.SOCKET_PATH}[/green]")
+    else:
+        console.print("[red]❌ El daemon no respondió a tiempo[/red]")
+        console.print(f"[yellow]💡 Revisa el log: {daemon.LOG_FILE}[/yellow]")
+        raise typer.Exit(1)
+
+@daemon_app.command("stop")
+def daemon_stop():
+    """🛑 Detener el daemon de Genesis CLI"""
+    from genesis_cli import daemon
+    
+    if daemon.stop_daemon():
+        console.print("[green]✅ Daemon detenido[/green]")
+    else:
+        console.print("[yellow]💡 El daemon no está activo[/yellow]")
+
+@daemon_app.command("status")
+def daemon_status():
+    """📊 Mostrar el estado del daemon"""
+    from rich.table import Table
+    from genesis_cli import daemon
+    from genesis_cli.utils import format_duration
+    
+    info = daemon.get_daemon_info()
+    if info is None:
+        console.print("[yellow]💡 El daemon no está activo[/yellow]")
+        console.print("[yellow]💡 Ejecuta 'genesis daemon start' para iniciarlo[/yellow]")
+        return
+    
+    import time
+    
+    table = Table(title="Daemon de Genesis CLI")
+    table.add_column("Propiedad", style="cyan")
+    table.add_column("Valor", style="green")
+    
+    version_ok = info.get("version") == daemon.daemon_version()
+    table.add_row("PID", str(info.get("pid", "N/A")))
+    table.add_row("Versión", f"{info.get('version')}" + ("" if version_ok else " [red](desactualizado)[/red]"))
+    table.add_row("Activo desde hace", format_duration(time.time() - info.get("started_at", time.time())))
+    table.add_row("Solicitudes atendidas", str(info.get("requests_served", 0)))
+    table.add_row("Cierre por inactividad", format_duration(info.get("idle_timeout", 0)))
+    table.add_row("Socket", str(daemon.SOCKET_PATH))
+    
+    console.print(table)
+
 @app.command("help")
 def help_cmd():
     """Mostrar la ayuda completa de la CLI"""
+    from genesis_cli.commands.utils import show_banner
     show_banner()
     command = get_command(app)
     ctx = typer.Context(command)
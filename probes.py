@@ -0,0 +1,265 @@
+"""
+Verificación concurrente de herramientas del sistema para Genesis CLI
+
+DOCTRINA DEL ECOSISTEMA:
+- NO implementa lógica de generación
+- NO coordina agentes directamente
+- SÍ valida el entorno del usuario
+- SÍ muestra estado de dependencias de manera rápida
+- Solo herramientas para interfaz de usuario
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Presupuesto global (segundos) para verificar todas las herramientas
+DEFAULT_PROBE_BUDGET = 5.0
+
+# Vigencia por defecto (segundos) de los resultados en caché
+DEFAULT_PROBE_CACHE_TTL = 24 * 60 * 60
+
+@dataclass(frozen=True)
+class ToolProbe:
+    """
+    Herramienta del sistema a verificar
+    
+    DOCTRINA: Validamos entorno del usuario
+    """
+    name: str
+    command: Tuple[str, ...]
+    required: bool = True
+    notes: str = ""
+
+@dataclass
+class ProbeResult:
+    """
+    Resultado de verificar una herramienta
+    
+    DOCTRINA: Validamos entorno del usuario
+    """
+    name: str
+    required: bool
+    installed: bool
+    version: Optional[str] = None
+    path: Optional[str] = None
+    error: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, object]:
+        """Convertir a diccionario (formato de GenesisUI.show_dependency_check)"""
+        return {
+            "installed": self.installed,
+            "required": self.required,
+            "version": self.version,
+            "path": self.path,
+            "notes": self.error or "",
+        }
+
+# Herramientas verificadas por check_dependencies
+DEFAULT_PROBES: Tuple[ToolProbe, ...] = (
+    ToolProbe("Node.js", ("node", "--version"), required=True),
+    ToolProbe("Git", ("git", "--version"), required=True),
+    ToolProbe("Docker", ("docker", "--version"), required=False, notes="recomendado para despliegue"),
+    ToolProbe("npm", ("npm", "--version"), required=False, notes="recomendado para proyectos frontend"),
+)
+
+class ProbeCache:
+    """
+    Caché persistente de resultados de verificación
+    
+    Una entrada solo es válida si $PATH, la ruta resuelta del binario y su
+    identidad en disco (inode, mtime, tamaño) no cambiaron y no superó el TTL.
+    Así, actualizar o reinstalar una herramienta invalida su entrada sin
+    necesidad de ejecutarla.
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def __init__(self, cache_file: Optional[Path] = None, ttl: float = DEFAULT_PROBE_CACHE_TTL):
+        self.cache_file = cache_file or Path.home() / ".genesis-cli" / "probe-cache.json"
+        self.ttl = ttl
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty = False
+    
+    @staticmethod
+    def _path_fingerprint() -> str:
+        """Huella de $PATH"""
+        return hashlib.sha256(os.environ.get("PATH", "").encode("utf-8")).hexdigest()[:16]
+    
+    @staticmethod
+    def _binary_identity(executable: str) -> Optional[List[Any]]:
+        """Identidad en disco del binario resuelto"""
+        try:
+            real_path = os.path.realpath(executable)
+            stat = os.stat(real_path)
+        except OSError:
+            return None
+        return [real_path, stat.st_ino, stat.st_mtime_ns, stat.st_size]
+    
+    @staticmethod
+    def _key(probe: ToolProbe) -> str:
+        return "\0".join(probe.command)
+    
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            try:
+                with open(self.cache_file, "r") as f:
+                    data = json.load(f)
+                self._entries = data if isinstance(data, dict) else {}
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+    
+    def get(self, probe: ToolProbe, executable: str) -> Optional[ProbeResult]:
+        """Obtener resultado vigente o None"""
+        if self.ttl <= 0:
+            return None
+        
+        entry = self._load().get(self._key(probe))
+        if not entry:
+            return None
+        
+        if (time.time() - entry.get("checked_at", 0) > self.ttl
+                or entry.get("path_env") != self._path_fingerprint()
+                or entry.get("executable") != executable
+                or entry.get("identity") != self._binary_identity(executable)):
+            return None
+        
+        try:
+            return ProbeResult(**{**entry["result"], "name": probe.name, "required": probe.required})
+        except (KeyError, TypeError):
+            return None
+    
+    def put(self, probe: ToolProbe, executable: str, result: ProbeResult):
+        """Guardar resultado de una verificación completada"""
+        identity = self._binary_identity(executable)
+        if identity is None:
+            return
+        
+        self._load()[self._key(probe)] = {
+            "checked_at": time.time(),
+            "path_env": self._path_fingerprint(),
+            "executable": executable,
+            "identity": identity,
+            "result": asdict(result),
+        }
+        self._dirty = True
+    
+    def save(self):
+        """Persistir la caché si hubo cambios"""
+        if not self._dirty:
+            return
+        
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, "w") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_file, self.cache_file)
+            self._dirty = False
+        except OSError:
+            # Si no se puede guardar, la próxima ejecución volverá a verificar
+            pass
+    
+    def clear(self):
+        """Eliminar todos los resultados en caché"""
+        self._entries = {}
+        self._dirty = False
+        try:
+            self.cache_file.unlink()
+        except OSError:
+            pass
+
+def _first_line(text: Optional[str]) -> Optional[str]:
+    """Primera línea no vacía de una salida de proceso"""
+    for line in (text or "").splitlines():
+        line = line.strip()
+        if line:
+            return line
+    return None
+
+def run_probes(probes: Sequence[ToolProbe] = DEFAULT_PROBES,
+               timeout: float = DEFAULT_PROBE_BUDGET,
+               cache: Optional[ProbeCache] = None,
+               refresh: bool = False) -> Dict[str, ProbeResult]:
+    """
+    Verificar herramientas de forma concurrente
+    
+    Cada binario se ejecuta como máximo una vez: el código de salida y la
+    versión se obtienen de la misma invocación. Todos los procesos se lanzan
+    antes de esperar a ninguno, y `timeout` es un presupuesto global para la
+    verificación completa, no por herramienta.
+    
+    Con `cache`, las herramientas con un resultado vigente no se ejecutan
+    (solo se guardan verificaciones exitosas); `refresh=True` ignora la
+    caché y la actualiza.
+    
+    Returns:
+        Dict[str, ProbeResult]: Resultados por nombre, en el orden de `probes`
+    """
+    deadline = time.monotonic() + timeout
+    results: Dict[str, ProbeResult] = {}
+    running: List[Tuple[ToolProbe, str, subprocess.Popen]] = []
+    
+    # Lanzar todos los procesos
+    for probe in probes:
+        executable = shutil.which(probe.command[0])
+        if executable is None:
+            results[probe.name] = ProbeResult(probe.name, probe.required, installed=False)
+            continue
+        
+        cached = cache.get(probe, executable) if cache is not None and not refresh else None
+        if cached is not None:
+            results[probe.name] = cached
+            continue
+        
+        try:
+            process = subprocess.Popen(
+                [executable, *probe.command[1:]],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+        except OSError as e:
+            results[probe.name] = ProbeResult(
+                probe.name, probe.required, installed=False, path=executable, error=str(e)
+            )
+            continue
+        
+        running.append((probe, executable, process))
+    
+    # Recoger resultados dentro del presupuesto global
+    for probe, executable, process in running:
+        try:
+            stdout, stderr = process.communicate(timeout=max(deadline - time.monotonic(), 0.0))
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            results[probe.name] = ProbeResult(
+                probe.name, probe.required, installed=False, path=executable,
+                error=f"Sin respuesta en {timeout:g}s"
+            )
+            continue
+        
+        installed = process.returncode == 0
+        results[probe.name] = ProbeResult(
+            probe.name,
+            probe.required,
+            installed=installed,
+            version=(_first_line(stdout) or _first_line(stderr)) if installed else None,
+            path=executable,
+        )
+        if cache is not None and installed:
+            cache.put(probe, executable, results[probe.name])
+    
+    if cache is not None:
+        cache.save()
+    
+    return {probe.name: results[probe.name] for probe in probes}
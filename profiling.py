@@ -0,0 +1,258 @@
+"""
+Perfilado de comandos para Genesis CLI
+
+`genesis --profile <comando>` (o GENESIS_CLI_PROFILE=1) perfila el comando
+completo, desde el callback principal hasta que termina, incluidas las
+importaciones diferidas, la verificación de dependencias, el renderizado de
+Rich y la llamada a genesis-core. Al terminar guarda un archivo .prof en
+~/.genesis-cli/profiles/ (formato pstats: snakeviz, `python -m pstats`...) y
+muestra las funciones con más tiempo acumulado.
+
+Dos modos:
+- "cprofile": cProfile, exacto pero solo para el hilo principal y con un
+  coste apreciable por llamada.
+- "sample": un hilo toma cada SAMPLE_INTERVAL la pila de todos los hilos
+  (sys._current_frames). Coste casi nulo, pensado para deploys largos; los
+  tiempos son estimaciones (muestras × intervalo).
+
+DOCTRINA DEL ECOSISTEMA:
+- NO implementa lógica de generación
+- NO coordina agentes directamente
+- SÍ ayuda a diagnosticar la experiencia de usuario
+- Solo herramientas para interfaz de usuario
+"""
+
+import cProfile
+import marshal
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from rich.console import Console
+from rich.table import Table
+
+PROFILE_DIR = Path.home() / ".genesis-cli" / "profiles"
+
+PROFILE_MODES = ("cprofile", "sample")
+
+# Funciones mostradas por defecto
+PROFILE_TOP = 20
+
+# Perfiles que se conservan (los más antiguos se borran)
+MAX_PROFILES = 50
+
+# Intervalo entre muestras del modo "sample" (segundos)
+SAMPLE_INTERVAL = 0.005
+
+# El informe va a stderr: no se mezcla con salidas como --json
+console = Console(stderr=True)
+
+# Función en el formato de pstats: (archivo, línea, nombre)
+FunctionKey = Tuple[str, int, str]
+
+def _function_key(frame: Any) -> FunctionKey:
+    code = frame.f_code
+    return (code.co_filename, code.co_firstlineno, code.co_name)
+
+class SamplingProfiler:
+    """
+    Perfilador por muestreo de todos los hilos
+    
+    Cada muestra pesa el tiempo real transcurrido desde la anterior (con el
+    GIL ocupado, el hilo de muestreo se despierta más tarde que `interval`).
+    La función de arriba de la pila suma tiempo propio y cada función
+    distinta de la pila suma tiempo acumulado (una vez aunque sea recursiva).
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self.samples = 0
+        self._counts: Counter = Counter()
+        self._own: Counter = Counter()
+        self._cumulative: Counter = Counter()
+        self._callers: Dict[FunctionKey, Counter] = defaultdict(Counter)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="genesis-cli-profiler", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+    
+    def _run(self):
+        own_thread = threading.get_ident()
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_thread:
+                    self._sample(frame, now - last)
+            last = now
+    
+    def _sample(self, frame: Any, weight: float):
+        self.samples += 1
+        callee = _function_key(frame)
+        self._own[callee] += weight
+        seen = {callee}
+        self._counts[callee] += 1
+        self._cumulative[callee] += weight
+        
+        frame = frame.f_back
+        while frame is not None:
+            caller = _function_key(frame)
+            self._callers[callee][caller] += weight
+            if caller not in seen:
+                seen.add(caller)
+                self._counts[caller] += 1
+                self._cumulative[caller] += weight
+            callee = caller
+            frame = frame.f_back
+    
+    def stats(self) -> Dict[FunctionKey, tuple]:
+        """
+        Muestras en el formato de pstats: {función: (cc, nc, tt, ct, callers)}
+        
+        Las "llamadas" son las muestras en las que la función estaba en la pila.
+        """
+        stats = {}
+        for function, count in self._counts.items():
+            callers = {
+                caller: (1, 1, 0.0, seconds)
+                for caller, seconds in self._callers.get(function, {}).items()
+            }
+            stats[function] = (count, count, self._own.get(function, 0.0), self._cumulative[function], callers)
+        return stats
+
+class ProfileSession:
+    """
+    Perfil de un comando: arrancar, detener, guardar el .prof y mostrar el resumen
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def __init__(self, command: Optional[str], mode: str = "cprofile", top: int = PROFILE_TOP,
+                 profile_dir: Optional[Path] = None, interval: float = SAMPLE_INTERVAL):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Modo de perfilado desconocido: {mode} (usa {' o '.join(PROFILE_MODES)})")
+        self.command = command or "genesis"
+        self.mode = mode
+        self.top = top
+        self.profile_dir = profile_dir or PROFILE_DIR
+        self.interval = interval
+        self.profile_file: Optional[Path] = None
+        self.elapsed = 0.0
+        self._profiler: Any = None
+        self._started = 0.0
+    
+    def start(self) -> "ProfileSession":
+        self._started = time.perf_counter()
+        if self.mode == "sample":
+            self._profiler = SamplingProfiler(self.interval)
+            self._profiler.start()
+        else:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        return self
+    
+    def stop(self, report: bool = True) -> Optional[Path]:
+        """Detener, guardar el .prof y (por defecto) mostrar las funciones más costosas"""
+        if self._profiler is None:
+            return self.profile_file
+        if self.mode == "sample":
+            self._profiler.stop()
+            stats = self._profiler.stats()
+        else:
+            self._profiler.disable()
+            self._profiler.create_stats()
+            stats = self._profiler.stats
+        self._profiler = None
+        self.elapsed = time.perf_counter() - self._started
+        
+        try:
+            self.profile_file = self._save(stats)
+        except OSError as e:
+            console.print(f"[yellow]⚠️ No se pudo guardar el perfil: {e}[/yellow]")
+            self.profile_file = None
+        
+        if report:
+            self.report(stats)
+        return self.profile_file
+    
+    def _save(self, stats: Dict[FunctionKey, tuple]) -> Path:
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        profile_file = self.profile_dir / f"{self.command}-{stamp}-{os.getpid()}.prof"
+        tmp_file = profile_file.with_name(profile_file.name + ".tmp")
+        with open(tmp_file, "wb") as f:
+            marshal.dump(stats, f)
+        os.replace(tmp_file, profile_file)
+        prune_profiles(self.profile_dir)
+        return profile_file
+    
+    def report(self, stats: Dict[FunctionKey, tuple]):
+        """Tabla con las `top` funciones de más tiempo acumulado"""
+        sampled = self.mode == "sample"
+        title = f"⏱️ Perfil de '{self.command}' ({self.mode}): {self.elapsed:.2f} s"
+        if sampled:
+            title += f", una muestra cada {self.interval * 1000:g} ms"
+        
+        table = Table(title=title, title_justify="left", show_lines=False)
+        table.add_column("Muestras" if sampled else "Llamadas", justify="right")
+        table.add_column("Propio (s)", justify="right")
+        table.add_column("Acumulado (s)", justify="right")
+        table.add_column("Función")
+        
+        for function, (cc, nc, tt, ct, _) in top_functions(stats, self.top):
+            calls = str(nc) if cc == nc else f"{nc}/{cc}"
+            table.add_row(calls, f"{tt:.3f}", f"{ct:.3f}", format_function(function))
+        
+        console.print(table)
+        if self.profile_file is not None:
+            console.print(f"[dim]💾 {self.profile_file} (python -m pstats {self.profile_file})[/dim]")
+
+def top_functions(stats: Dict[FunctionKey, tuple], top: int) -> List[Tuple[FunctionKey, tuple]]:
+    """Las `top` funciones con más tiempo acumulado"""
+    return sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:top]
+
+def format_function(function: FunctionKey) -> str:
+    """archivo:línea(nombre), con la ruta acortada como hace pstats"""
+    filename, line, name = function
+    if filename == "~":
+        # Funciones en C: ('~', 0, "<built-in method ...>")
+        return name
+    parts = Path(filename).parts
+    short = os.path.join(*parts[-2:]) if len(parts) > 2 else filename
+    return f"{short}:{line}({name})"
+
+def load_profile(profile_file: Path) -> pstats.Stats:
+    """Abrir un .prof guardado (de cualquiera de los dos modos)"""
+    return pstats.Stats(str(profile_file))
+
+def prune_profiles(profile_dir: Path, keep: int = MAX_PROFILES):
+    """Borrar los perfiles más antiguos y conservar los `keep` más recientes"""
+    try:
+        profiles = sorted(
+            (entry.stat().st_mtime, entry.path)
+            for entry in os.scandir(profile_dir)
+            if entry.name.endswith(".prof")
+        )
+    except OSError:
+        return
+    for _, path in profiles[:-keep] if keep else profiles:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
@@ -0,0 +1,187 @@
+"""
+Descubrimiento del proyecto para Genesis CLI
+
+Busca, subiendo desde el directorio actual, el .genesis-cli.toml más cercano
+(configuración del proyecto) y el directorio más cercano con genesis.json
+(raíz del proyecto Genesis), como hace git con .git.
+
+Para no repetir dos stat por cada directorio antepasado en cada ejecución,
+~/.genesis-cli/discovery.cache recuerda qué marcadores contiene cada
+directorio junto con su mtime. Crear, borrar o renombrar un archivo cambia
+el mtime del directorio que lo contiene, así que un stat del directorio
+basta para saber si la respuesta guardada sigue siendo válida. Dentro del
+proceso, el resultado de cada directorio de partida se calcula una vez.
+
+DOCTRINA DEL ECOSISTEMA:
+- NO implementa lógica de generación
+- NO coordina agentes directamente
+- SÍ localiza la configuración y el proyecto del usuario
+- Solo herramientas para interfaz de usuario
+"""
+
+import marshal
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+# Configuración del proyecto (mismas secciones que ~/.genesis-cli/config.json)
+PROJECT_CONFIG_FILE = ".genesis-cli.toml"
+
+# Marca la raíz de un proyecto Genesis (project_manifest.MANIFEST_FILE)
+PROJECT_MARKER = "genesis.json"
+
+DISCOVERY_CACHE_FILE = Path.home() / ".genesis-cli" / "discovery.cache"
+
+# Cambiar al modificar el formato del archivo
+DISCOVERY_CACHE_FORMAT = 1
+
+# Directorios recordados (los usados más recientemente)
+DISCOVERY_CACHE_ENTRIES = 512
+
+# Un directorio modificado hace menos de esto (segundos) puede volver a
+# cambiar sin que cambie su mtime (resolución del reloj): no se recuerda
+RACY_WINDOW = 2.0
+
+# Marcadores presentes en un directorio (máscara de bits)
+HAS_CONFIG = 1
+HAS_PROJECT = 2
+
+@dataclass(frozen=True)
+class ProjectLocation:
+    """
+    Configuración y proyecto más cercanos a un directorio
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    start: Path
+    config_file: Optional[Path] = None  # .genesis-cli.toml más cercano
+    project_root: Optional[Path] = None  # directorio con genesis.json más cercano
+    
+    @property
+    def manifest_file(self) -> Optional[Path]:
+        return self.project_root / PROJECT_MARKER if self.project_root is not None else None
+
+def _scan(directory: str) -> int:
+    markers = 0
+    if os.path.isfile(os.path.join(directory, PROJECT_CONFIG_FILE)):
+        markers |= HAS_CONFIG
+    if os.path.isfile(os.path.join(directory, PROJECT_MARKER)):
+        markers |= HAS_PROJECT
+    return markers
+
+class DiscoveryCache:
+    """
+    Marcadores de cada directorio, validados por su mtime
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def __init__(self, cache_file: Optional[Path] = None):
+        self.cache_file = cache_file or DISCOVERY_CACHE_FILE
+        self._entries: Optional[Dict[str, tuple]] = None
+        self._dirty = False
+    
+    def markers(self, directory: str) -> int:
+        """Marcadores de `directory`: un stat si no cambió desde la última vez"""
+        try:
+            st = os.stat(directory)
+        except OSError:
+            return 0
+        
+        entries = self._load()
+        cached = entries.get(directory)
+        if cached is not None and cached[0] == st.st_mtime_ns:
+            return cached[1]
+        
+        markers = _scan(directory)
+        if time.time() - st.st_mtime > RACY_WINDOW:
+            entries.pop(directory, None)
+            entries[directory] = (st.st_mtime_ns, markers)
+            self._dirty = True
+        elif entries.pop(directory, None) is not None:
+            self._dirty = True
+        return markers
+    
+    def save(self):
+        """Guardar los cambios (escritura atómica)"""
+        if not self._dirty:
+            return
+        
+        recent = dict(list(self._load().items())[-DISCOVERY_CACHE_ENTRIES:])
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, "wb") as f:
+                f.write(marshal.dumps({"format": DISCOVERY_CACHE_FORMAT, "entries": recent}))
+            os.replace(tmp_file, self.cache_file)
+            self._dirty = False
+        except OSError:
+            # Sin caché, la próxima ejecución vuelve a revisar cada directorio
+            pass
+    
+    def _load(self) -> Dict[str, tuple]:
+        if self._entries is None:
+            try:
+                with open(self.cache_file, "rb") as f:
+                    data = marshal.load(f)
+                self._entries = dict(data["entries"]) if data.get("format") == DISCOVERY_CACHE_FORMAT else {}
+            except (OSError, EOFError, ValueError, TypeError, KeyError, AttributeError):
+                self._entries = {}
+        return self._entries
+
+_discovered: Dict[str, ProjectLocation] = {}
+
+def discover_project(start: Optional[Union[str, Path]] = None,
+                     cache: Optional[DiscoveryCache] = None) -> ProjectLocation:
+    """
+    Buscar .genesis-cli.toml y genesis.json subiendo desde `start`
+    
+    La búsqueda termina cuando se encontraron los dos o al llegar a la raíz
+    del sistema de archivos. El resultado se recuerda por directorio de
+    partida durante el proceso.
+    
+    Args:
+        start: Directorio de partida (por defecto, el actual)
+        cache: Caché de marcadores (por defecto, ~/.genesis-cli/discovery.cache)
+    """
+    try:
+        key = os.path.abspath(os.fspath(start) if start is not None else os.getcwd())
+    except OSError:
+        # El directorio actual ya no existe
+        return ProjectLocation(Path(os.fspath(start or ".")))
+    
+    location = _discovered.get(key)
+    if location is not None:
+        return location
+    
+    cache = cache or DiscoveryCache()
+    config_file = project_root = None
+    directory = key
+    while True:
+        markers = cache.markers(directory)
+        if config_file is None and markers & HAS_CONFIG:
+            config_file = Path(directory) / PROJECT_CONFIG_FILE
+        if project_root is None and markers & HAS_PROJECT:
+            project_root = Path(directory)
+        if config_file is not None and project_root is not None:
+            break
+        
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            break
+        directory = parent
+    
+    cache.save()
+    location = ProjectLocation(Path(key), config_file, project_root)
+    _discovered[key] = location
+    return location
+
+def find_project_root(start: Optional[Union[str, Path]] = None) -> Optional[Path]:
+    """Directorio con genesis.json más cercano, o None fuera de un proyecto"""
+    return discover_project(start).project_root
+
+def clear_discovery_cache():
+    """Olvidar los resultados calculados en este proceso"""
+    _discovered.clear()
@@ -0,0 +1,377 @@
+"""
+Manifiesto de generación del proyecto (genesis.json) para Genesis CLI
+
+Registra, para cada componente generado, la huella de sus entradas y el hash
+del contenido de cada archivo producido. Con esa información
+`genesis generate --incremental` sabe qué componentes cambiaron desde la
+última ejecución y solo envía esos a genesis-core; los archivos cuyo
+contenido no cambió no se vuelven a escribir.
+
+DOCTRINA DEL ECOSISTEMA:
+- NO implementa lógica de generación
+- NO coordina agentes directamente
+- SÍ registra el estado del proyecto para la interfaz
+- Solo usa genesis-core como interfaz
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import re
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from genesis_cli.result_cache import make_cache_key, normalize_request
+
+MANIFEST_FILE = "genesis.json"
+
+# Sección de genesis.json propia de la CLI
+GENERATION_KEY = "generation"
+
+# Identificador del componente registrado por `genesis init`
+PROJECT_COMPONENT = "project"
+
+# A partir de este tamaño los archivos se hashean mapeados en memoria (bytes)
+MMAP_THRESHOLD = 1024 * 1024
+
+# Campos de cabecera que muestra `genesis status`
+HEADER_FIELDS = ("name", "template", "version", "description", "created_at", "features")
+
+# Campos del proyecto que cambian lo que `genesis generate` produce en él
+PROJECT_CONTEXT_FIELDS = ("template", "stack", "features")
+
+# Tokens estructurales de JSON (los literales numéricos y booleanos se leen por posición)
+_STRING_PATTERN = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+_TOKEN = re.compile(_STRING_PATTERN + rb'|[\[\]{}:,]')
+_ARRAY_ITEM = re.compile(_STRING_PATTERN + rb'|[\[\]{}]')
+
+def hash_file(path: Path) -> Optional[str]:
+    """
+    Hash SHA-256 del contenido de un archivo (None si no existe)
+    
+    Los archivos grandes se mapean en memoria y se hashean de una vez;
+    hashlib libera el GIL mientras tanto, así varios hilos avanzan en paralelo.
+    """
+    try:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < MMAP_THRESHOLD:
+                return hashlib.sha256(f.read()).hexdigest()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                return hashlib.sha256(buffer).hexdigest()
+    except (OSError, ValueError):
+        return None
+
+def component_id(config: Dict[str, Any]) -> str:
+    """Identificador estable de un componente generado con `genesis generate`"""
+    return f"{config.get('component')}:{config.get('name')}"
+
+def generate_request(config: Dict[str, Any],
+                     project: Optional[Dict[str, Any]] = None) -> Tuple[str, str, Optional[List[str]], Dict[str, Any]]:
+    """
+    (name, template, features, options) del ProjectGenerationRequest de `generate`
+    
+    `project` (ver `read_project_context`) distingue en la caché de resultados
+    el mismo componente generado en proyectos de distinto template o stack.
+    """
+    options = {**config, "project": project} if project else config
+    return ("generate_component", config.get("component", "component"), None, options)
+
+def read_project_context(root: Path) -> Dict[str, Any]:
+    """Template, stack y características del genesis.json de `root` ({} fuera de un proyecto)"""
+    try:
+        header = read_manifest_header(root / MANIFEST_FILE, fields=PROJECT_CONTEXT_FIELDS)
+    except (OSError, ValueError):
+        return {}
+    context = {field: header[field] for field in PROJECT_CONTEXT_FIELDS if header.get(field) is not None}
+    if isinstance(context.get("features"), list):
+        context["features"] = sorted(context["features"], key=str)
+    return context
+
+class ProjectManifest:
+    """
+    Lectura y actualización de genesis.json
+    
+    Conserva intactas las claves escritas por genesis-core y solo modifica
+    la sección `generation`.
+    
+    DOCTRINA: Solo usa genesis-core como interfaz
+    """
+    
+    def __init__(self, root: Path):
+        self.root = root
+        self.path = root / MANIFEST_FILE
+        self._data: Optional[Dict[str, Any]] = None
+    
+    @property
+    def exists(self) -> bool:
+        return self.path.exists()
+    
+    @property
+    def data(self) -> Dict[str, Any]:
+        if self._data is None:
+            try:
+                with open(self.path, "r") as f:
+                    data = json.load(f)
+                self._data = data if isinstance(data, dict) else {}
+            except (OSError, ValueError):
+                self._data = {}
+        return self._data
+    
+    @property
+    def generation(self) -> Dict[str, Any]:
+        section = self.data.setdefault(GENERATION_KEY, {})
+        section.setdefault("components", {})
+        section.setdefault("files", {})
+        return section
+    
+    def project_context(self) -> Dict[str, Any]:
+        """Entradas del proyecto que afectan a todos sus componentes"""
+        return {
+            "template": self.data.get("template"),
+            "features": sorted(self.data.get("features") or []),
+        }
+    
+    def fingerprint(self, request: Tuple[str, str, Optional[List[str]], Dict[str, Any]]) -> str:
+        """Huella de las entradas de un componente"""
+        name, template, features, options = request
+        key = make_cache_key(normalize_request(name, template, features, options), template)
+        payload = json.dumps({"request": key, "project": self.project_context()}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def component_configs(self) -> List[Dict[str, Any]]:
+        """Configuraciones de los componentes registrados por `generate`"""
+        return [
+            dict(entry["config"])
+            for component, entry in self.generation["components"].items()
+            if component != PROJECT_COMPONENT and entry.get("config")
+        ]
+    
+    def stale_reason(self, component: str, fingerprint: str) -> Optional[str]:
+        """
+        Motivo por el que un componente debe regenerarse
+        
+        Returns:
+            Optional[str]: None si sus entradas y archivos están al día
+        """
+        entry = self.generation["components"].get(component)
+        if entry is None:
+            return "nuevo"
+        if entry.get("fingerprint") != fingerprint:
+            return "entradas modificadas"
+        if any(not (self.root / file_path).exists() for file_path in entry.get("files", [])):
+            return "archivos faltantes"
+        return None
+    
+    def record(self, component: str, fingerprint: str, files: List[str],
+               config: Optional[Dict[str, Any]] = None):
+        """Registrar huella y hash de contenido de los archivos de un componente"""
+        generation = self.generation
+        previous = generation["components"].get(component, {})
+        for file_path in previous.get("files", []):
+            generation["files"].pop(file_path, None)
+        
+        relative_files = []
+        for file_path in files:
+            path = Path(file_path)
+            if path.is_absolute():
+                try:
+                    path = path.relative_to(self.root)
+                except ValueError:
+                    continue
+            relative_path = path.as_posix()
+            relative_files.append(relative_path)
+            generation["files"][relative_path] = {
+                "sha256": hash_file(self.root / relative_path),
+                "component": component,
+            }
+        
+        entry = {
+            "fingerprint": fingerprint,
+            "files": relative_files,
+            "generated_at": datetime.now().isoformat(),
+        }
+        if config is not None:
+            entry["config"] = config
+        generation["components"][component] = entry
+    
+    def save(self):
+        """Guardar genesis.json de forma atómica"""
+        tmp_file = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(self.data, f, indent=2)
+        os.replace(tmp_file, self.path)
+
+def sync_staged_files(staging: Path, root: Path, files: List[str]) -> Tuple[List[str], List[str]]:
+    """
+    Mover a `root` los archivos generados en `staging` cuyo contenido cambió
+    
+    Los archivos idénticos a los del proyecto no se tocan, así sus fechas de
+    modificación no cambian y no invalidan builds ni watchers.
+    
+    Returns:
+        Tuple[List[str], List[str]]: (actualizados, sin cambios)
+    """
+    updated, unchanged = [], []
+    for file_path in files:
+        source = staging / file_path
+        target = root / file_path
+        if not source.exists():
+            continue
+        
+        if hash_file(source) == hash_file(target):
+            unchanged.append(file_path)
+            continue
+        
+        target.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.replace(source, target)
+        except OSError:
+            shutil.copy2(source, target)
+        updated.append(file_path)
+    return updated, unchanged
+
+def read_manifest_header(path: Path, fields=HEADER_FIELDS,
+                         count_field: str = "generated_files") -> Dict[str, Any]:
+    """
+    Leer los campos de cabecera de genesis.json sin cargar la lista de archivos
+    
+    Recorre el archivo mapeado en memoria token a token: decodifica solo los
+    campos pedidos, cuenta los elementos de `count_field` sin construir la
+    lista y se detiene en cuanto tiene todo lo necesario.
+    
+    Returns:
+        Dict[str, Any]: Campos encontrados más `file_count`
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError("genesis.json está vacío")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return _scan_header(buffer, set(fields), count_field)
+
+def _count_string_array(buffer, start: int) -> Optional[Tuple[int, int]]:
+    """
+    Contar los elementos de una lista de strings que empieza en `start`
+    
+    Returns:
+        (elementos, posición tras el cierre) o None si no es una lista de strings
+    """
+    # El primer "]" precedido por un número par de comillas cierra la lista
+    # si no hay escapes ni anidamiento: se cuenta sin salir de C
+    close, quotes = start, 0
+    while True:
+        bracket = buffer.find(b"]", close)
+        if bracket == -1:
+            return None
+        quotes += _count_bytes(buffer, b'"', close, bracket)
+        close = bracket + 1
+        if quotes % 2 == 0:
+            break
+    
+    if all(buffer.find(char, start, bracket) == -1 for char in (b"\\", b"[", b"{")):
+        if quotes == 0 and buffer[start:bracket].strip():
+            return None
+        return quotes // 2, close
+    
+    # Con escapes o corchetes dentro de las rutas, recorrer elemento a elemento
+    count = 0
+    for match in _ARRAY_ITEM.finditer(buffer, start):
+        token = match.group()
+        if token[:1] == b'"':
+            count += 1
+        elif token == b"]":
+            if count == 0 and buffer[start:match.start()].strip():
+                return None
+            return count, match.end()
+        else:
+            return None
+    return None
+
+def _count_bytes(buffer, needle: bytes, start: int, end: int, block: int = 1024 * 1024) -> int:
+    """Contar un byte en un rango del mmap por bloques, sin copiar el rango completo"""
+    return sum(buffer[offset:min(offset + block, end)].count(needle) for offset in range(start, end, block))
+
+def _scan_header(buffer, fields, count_field: str) -> Dict[str, Any]:
+    header: Dict[str, Any] = {"file_count": 0}
+    pending = set(fields) | {count_field}
+    depth = 0
+    key = None
+    expecting_key = False
+    value_start = None      # inicio de un literal (número, true, false, null)
+    container_start = None  # inicio de un objeto o lista de primer nivel
+    items = 0
+    non_empty = False
+    position = 0
+    
+    while pending:
+        match = _TOKEN.search(buffer, position)
+        if match is None:
+            break
+        token = match.group()
+        char = token[:1]
+        position = match.end()
+        
+        if depth == 0:
+            if char != b"{":
+                raise ValueError("genesis.json no contiene un objeto")
+            depth, expecting_key = 1, True
+            continue
+        
+        if depth == 1:
+            if expecting_key:
+                if char == b"}":
+                    break
+                if char != b'"':
+                    raise ValueError("genesis.json mal formado")
+                key, expecting_key = json.loads(token), False
+            elif char == b":":
+                value_start = match.end()
+            elif char in (b",", b"}"):
+                if value_start is not None and key in pending:
+                    header[key] = json.loads(buffer[value_start:match.start()])
+                    pending.discard(key)
+                value_start, key, expecting_key = None, None, True
+                if char == b"}":
+                    break
+            elif char == b'"':
+                if key in pending:
+                    header[key] = json.loads(token)
+                    pending.discard(key)
+                value_start = None
+            elif char in (b"[", b"{"):
+                value_start = None
+                # Camino rápido: lista de rutas, contada sin decodificar ninguna
+                if char == b"[" and key == count_field:
+                    count = _count_string_array(buffer, match.end())
+                    if count is not None:
+                        header["file_count"], position = count
+                        pending.discard(key)
+                        continue
+                depth, container_start, items, non_empty = 2, match.start(), 0, False
+            continue
+        
+        # Dentro de un objeto o lista de primer nivel
+        if char in (b"[", b"{"):
+            if depth == 2:
+                non_empty = True
+            depth += 1
+        elif char in (b"]", b"}"):
+            depth -= 1
+            if depth == 1:
+                if key in fields and key in pending:
+                    header[key] = json.loads(buffer[container_start:match.end()])
+                if key == count_field:
+                    if not non_empty and not items:
+                        non_empty = bool(buffer[container_start + 1:match.start()].strip())
+                    header["file_count"] = items + 1 if non_empty or items else 0
+                pending.discard(key)
+        elif depth == 2:
+            if char == b",":
+                items += 1
+            elif char == b'"':
+                non_empty = True
+    
+    return header
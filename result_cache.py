@@ -0,0 +1,302 @@
+"""
+Caché local de resultados de generación para Genesis CLI
+
+Guarda los archivos producidos por `genesis init` y `genesis generate` en un
+almacén direccionado por contenido en ~/.genesis-cli/cache. La clave combina
+la solicitud normalizada, el template y la versión de genesis-core: repetir
+una generación con las mismas entradas reproduce los archivos sin llamar al
+orquestador.
+
+DOCTRINA DEL ECOSISTEMA:
+- NO implementa lógica de generación
+- NO coordina agentes directamente
+- SÍ reutiliza resultados ya producidos por genesis-core
+- Solo usa genesis-core como interfaz
+"""
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+CACHE_DIR = Path.home() / ".genesis-cli" / "cache"
+
+# Tamaño máximo por defecto del almacén (MB)
+DEFAULT_MAX_SIZE_MB = 512
+
+# Cambiar al modificar el formato de las entradas
+CACHE_FORMAT = 1
+
+# Opciones que solo indican dónde o cómo escribir, no qué se genera
+VOLATILE_OPTIONS = ("output_path", "force")
+
+def get_core_version() -> str:
+    """Versión instalada de genesis-core (sin importarlo)"""
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+        try:
+            return version("genesis-core")
+        except PackageNotFoundError:
+            return "unknown"
+    except ImportError:  # pragma: no cover - Python < 3.8
+        return "unknown"
+
+def normalize_request(name: str, template: str, features: Optional[List[str]] = None,
+                      options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Forma canónica de un ProjectGenerationRequest
+    
+    Las características se ordenan y se descartan las opciones que no
+    afectan al contenido generado.
+    """
+    options = {key: value for key, value in (options or {}).items() if key not in VOLATILE_OPTIONS}
+    if isinstance(options.get("features"), list):
+        options["features"] = sorted(set(options["features"]))
+    
+    return {
+        "name": name,
+        "template": template,
+        "features": sorted(set(features or [])),
+        "options": options,
+    }
+
+def make_cache_key(request: Dict[str, Any], template: str, core_version: Optional[str] = None) -> str:
+    """Clave de caché: hash de la solicitud normalizada, el template y genesis-core"""
+    payload = json.dumps({
+        "format": CACHE_FORMAT,
+        "request": request,
+        "template": template,
+        "core": core_version or get_core_version(),
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+@dataclass
+class CacheEntry:
+    """
+    Resultado almacenado
+    
+    DOCTRINA: Solo usa genesis-core como interfaz
+    """
+    key: str
+    result: Dict[str, Any]
+    files: List[List[Any]]  # [ruta relativa, hash del contenido, permisos]
+    size: int
+
+class ResultCache:
+    """
+    Almacén de resultados con expulsión LRU acotada por tamaño
+    
+    Los contenidos se guardan una sola vez en objects/ por su hash SHA-256;
+    index.json relaciona cada clave con sus archivos y registra el último
+    uso de cada entrada y los contadores de aciertos y fallos.
+    
+    Varias CLIs pueden usar la caché a la vez (lotes, CI): cada escritura
+    del índice vuelve a leerlo bajo index.lock y aplica encima solo los
+    cambios de este proceso. Las búsquedas no escriben el índice: sus
+    contadores y último uso se guardan con el siguiente `store` o `flush`.
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def __init__(self, cache_dir: Optional[Path] = None, max_size_mb: float = DEFAULT_MAX_SIZE_MB):
+        self.cache_dir = cache_dir or CACHE_DIR
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.index_file = self.cache_dir / "index.json"
+        self.lock_file = self.cache_dir / "index.lock"
+        self.objects_dir = self.cache_dir / "objects"
+        self.hits = 0
+        self.misses = 0
+        self._index: Optional[Dict[str, Any]] = None
+        # Cambios aún no guardados en index.json
+        self._pending_hits = 0
+        self._pending_misses = 0
+        self._touched: Dict[str, float] = {}
+        self._stored: Dict[str, Dict[str, Any]] = {}
+    
+    def _load(self) -> Dict[str, Any]:
+        if self._index is None:
+            try:
+                with open(self.index_file, "r") as f:
+                    data = json.load(f)
+                if not isinstance(data, dict) or data.get("format") != CACHE_FORMAT:
+                    raise ValueError("formato de caché desconocido")
+                self._index = data
+            except (OSError, ValueError):
+                self._index = {"format": CACHE_FORMAT, "entries": {}, "stats": {"hits": 0, "misses": 0}}
+        return self._index
+    
+    def _save(self):
+        """Aplicar los cambios pendientes sobre el index.json actual y reemplazarlo"""
+        from genesis_cli.config import _atomic_write, _locked
+        
+        try:
+            with _locked(self.lock_file):
+                # Releer: otra CLI pudo guardar entradas o contadores desde nuestra lectura
+                self._index = None
+                index = self._load()
+                entries = index["entries"]
+                entries.update(self._stored)
+                for key, last_used in self._touched.items():
+                    if key in entries:
+                        entries[key]["last_used"] = max(entries[key]["last_used"], last_used)
+                stats = index["stats"]
+                stats["hits"] = stats.get("hits", 0) + self._pending_hits
+                stats["misses"] = stats.get("misses", 0) + self._pending_misses
+                self._evict()
+                _atomic_write(self.index_file, json.dumps(index, default=str).encode("utf-8"))
+        except OSError:
+            # Una caché que no se puede guardar solo implica más fallos
+            return
+        
+        self._pending_hits = self._pending_misses = 0
+        self._touched.clear()
+        self._stored.clear()
+    
+    def flush(self):
+        """Guardar los aciertos, fallos y últimos usos aún pendientes"""
+        if self._pending_hits or self._pending_misses or self._touched:
+            self._save()
+    
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest
+    
+    def _count(self, hit: bool):
+        stats = self._load()["stats"]
+        if hit:
+            self.hits += 1
+            self._pending_hits += 1
+            stats["hits"] = stats.get("hits", 0) + 1
+        else:
+            self.misses += 1
+            self._pending_misses += 1
+            stats["misses"] = stats.get("misses", 0) + 1
+    
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """Buscar entrada completa; cuenta un acierto o un fallo (sin guardar aún)"""
+        entry = self._load()["entries"].get(key)
+        if entry and all(self._object_path(digest).exists() for _, digest, _ in entry["files"]):
+            entry["last_used"] = self._touched[key] = time.time()
+            self._count(hit=True)
+            return CacheEntry(key, entry["result"], entry["files"], entry["size"])
+        
+        self._count(hit=False)
+        return None
+    
+    def replay(self, entry: CacheEntry, root: Path) -> List[str]:
+        """
+        Escribir los archivos de la entrada bajo `root`
+        
+        Returns:
+            List[str]: Rutas escritas, relativas a `root`
+        """
+        written = []
+        for relative_path, digest, mode in entry.files:
+            target = root / relative_path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(self._object_path(digest).read_bytes())
+            os.chmod(target, mode)
+            written.append(relative_path)
+        return written
+    
+    def store(self, key: str, result: Dict[str, Any], files: List[str], root: Path) -> bool:
+        """
+        Guardar el resultado de una generación exitosa
+        
+        Solo se guarda si todos los archivos existen bajo `root`; de lo
+        contrario la generación no se podría reproducir completa.
+        """
+        root = root.resolve()
+        records = []
+        contents = []
+        size = 0
+        
+        for file_path in files:
+            path = Path(file_path)
+            if not path.is_absolute():
+                # genesis-core puede informar rutas relativas al proyecto o al cwd
+                path = root / path if (root / path).exists() else Path.cwd() / path
+            path = path.resolve()
+            try:
+                relative_path = path.relative_to(root).as_posix()
+                data = path.read_bytes()
+                mode = path.stat().st_mode & 0o777
+            except (ValueError, OSError):
+                return False
+            digest = hashlib.sha256(data).hexdigest()
+            records.append([relative_path, digest, mode])
+            contents.append((digest, data))
+            size += len(data)
+        
+        if not records or size > self.max_bytes:
+            return False
+        
+        try:
+            for digest, data in contents:
+                object_path = self._object_path(digest)
+                if object_path.exists():
+                    continue
+                object_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = object_path.with_name(f"{digest}.{os.getpid()}.tmp")
+                tmp_file.write_bytes(data)
+                os.replace(tmp_file, object_path)
+        except OSError:
+            return False
+        
+        now = time.time()
+        self._stored[key] = self._load()["entries"][key] = {
+            "result": result,
+            "files": records,
+            "size": size,
+            "created_at": now,
+            "last_used": now,
+        }
+        self._save()
+        return True
+    
+    def _evict(self):
+        """Expulsar las entradas menos usadas hasta respetar el tamaño máximo"""
+        entries = self._load()["entries"]
+        total = sum(entry["size"] for entry in entries.values())
+        if total <= self.max_bytes:
+            return
+        
+        evicted = set()
+        for key in sorted(entries, key=lambda k: entries[k]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            entry = entries.pop(key)
+            total -= entry["size"]
+            evicted.update(digest for _, digest, _ in entry["files"])
+        
+        # Eliminar solo contenidos de las entradas expulsadas que ya no usa
+        # ninguna otra: los demás archivos de objects/ pueden ser de otra CLI
+        # que aún no actualizó el índice
+        referenced = {digest for entry in entries.values() for _, digest, _ in entry["files"]}
+        for digest in evicted - referenced:
+            try:
+                self._object_path(digest).unlink()
+            except OSError:
+                pass
+    
+    def stats(self) -> Dict[str, Any]:
+        """Contadores acumulados y tamaño actual"""
+        index = self._load()
+        return {
+            "entries": len(index["entries"]),
+            "size": sum(entry["size"] for entry in index["entries"].values()),
+            "hits": index["stats"].get("hits", 0),
+            "misses": index["stats"].get("misses", 0),
+        }
+    
+    def clear(self):
+        """Eliminar todo el contenido de la caché"""
+        import shutil
+        
+        self._index = None
+        self._pending_hits = self._pending_misses = 0
+        self._touched.clear()
+        self._stored.clear()
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
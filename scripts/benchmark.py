@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Benchmarks de rendimiento para Genesis CLI
+
+Mide el throughput del validador de nombres de proyecto (el que usan
+`init`, `generate` y los manifiestos de `init --manifest`) expresado como
+tiempo por millón de nombres, la resolución de dependencias entre
+características sobre un catálogo de cientos de entradas y las sugerencias
+para nombres mal escritos sobre un catálogo de miles de templates, y los
+registros por segundo que acepta el logging de la CLI con escritura
+síncrona y con la cola en segundo plano.
+
+DOCTRINA DEL ECOSISTEMA:
+- NO implementa lógica de generación
+- NO coordina agentes directamente
+- SÍ proporciona herramientas de desarrollo para CLI
+- SÍ mejora la experiencia de desarrollo
+- Solo herramientas para interfaz de usuario
+"""
+
+import argparse
+import importlib
+import logging
+import os
+import random
+import string
+import tempfile
+import time
+from typing import Callable, List
+
+from rich.console import Console
+
+from genesis_cli.feature_graph import FeatureGraph
+from genesis_cli.suggestions import SuggestionIndex
+from genesis_cli.validators import ProjectNameValidator, _check_project_name
+
+# Consultas repetidas (dentro de SUGGESTION_CACHE_SIZE) para medir la caché
+SUGGESTION_SAMPLE = 500
+
+
+def make_names(count: int, distinct: int, seed: int = 42) -> List[str]:
+    """Nombres de prueba: mayoría válidos, algunos inválidos y reservados"""
+    rng = random.Random(seed)
+    alphabet = string.ascii_lowercase + string.digits + "-_"
+    pool = []
+    for index in range(distinct):
+        kind = index % 10
+        if kind == 0:
+            pool.append(rng.choice(sorted(ProjectNameValidator.RESERVED_NAMES)))
+        elif kind == 1:
+            pool.append("1" + "".join(rng.choices(alphabet, k=8)))
+        elif kind == 2:
+            pool.append("app " + "".join(rng.choices(string.ascii_lowercase, k=6)))
+        else:
+            pool.append(rng.choice(string.ascii_letters) + "".join(rng.choices(alphabet, k=rng.randint(4, 20))))
+    return [pool[rng.randrange(distinct)] for _ in range(count)]
+
+
+def run(label: str, names: List[str], func: Callable[[List[str]], object], clear_cache: bool = True):
+    """Ejecutar y mostrar el tiempo por millón de nombres"""
+    if clear_cache:
+        _check_project_name.cache_clear()
+    start = time.perf_counter()
+    func(names)
+    elapsed = time.perf_counter() - start
+    per_million = elapsed * 1_000_000 / len(names)
+    print(f"  {label:<38} {per_million:7.2f} s/millón  ({len(names) / elapsed:,.0f} nombres/s)")
+
+
+def bench_features(size: int = 500, resolutions: int = 100_000, seed: int = 42):
+    """Compilar un catálogo de `size` características y resolver conjuntos aleatorios"""
+    rng = random.Random(seed)
+    catalog = {
+        f"feature-{index}": {
+            "dependencies": [f"feature-{dep}" for dep in rng.sample(range(index), min(index, rng.randint(0, 4)))]
+        }
+        for index in range(size)
+    }
+    
+    start = time.perf_counter()
+    graph = FeatureGraph.compile(catalog)
+    compiled = time.perf_counter() - start
+    print(f"  compilar {size} características              {compiled * 1000:7.2f} ms")
+    
+    requests = [rng.sample(list(catalog), 6) for _ in range(resolutions)]
+    start = time.perf_counter()
+    for features in requests:
+        graph.resolve(features)
+    elapsed = time.perf_counter() - start
+    print(f"  resolver 6 características              {elapsed * 1_000_000 / resolutions:7.2f} µs/conjunto")
+
+
+def bench_suggestions(size: int = 5000, queries: int = 1000, seed: int = 42):
+    """Indexar `size` templates y sugerir para nombres con una errata"""
+    rng = random.Random(seed)
+    words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(size // 5)]
+    names = sorted({"-".join(rng.sample(words, rng.randint(1, 3))) for _ in range(size)})
+    
+    start = time.perf_counter()
+    index = SuggestionIndex(names)
+    built = time.perf_counter() - start
+    print(f"  indexar {len(names)} templates                 {built * 1000:7.2f} ms")
+    
+    typos = []
+    for name in rng.choices(names, k=queries):
+        position = rng.randrange(len(name))
+        typos.append(name[:position] + rng.choice(string.ascii_lowercase) + name[position + 1:])
+    
+    start = time.perf_counter()
+    for typo in typos:
+        index.suggest(typo)
+    elapsed = time.perf_counter() - start
+    print(f"  sugerir (sin caché)                     {elapsed * 1_000_000 / queries:7.2f} µs/consulta")
+    
+    repeated = typos[:SUGGESTION_SAMPLE]
+    for typo in repeated:
+        index.suggest(typo)
+    start = time.perf_counter()
+    for typo in repeated:
+        index.suggest(typo)
+    elapsed = time.perf_counter() - start
+    print(f"  sugerir (consulta repetida)             {elapsed * 1_000_000 / SUGGESTION_SAMPLE:7.2f} µs/consulta")
+
+
+def bench_logging(records: int = 20_000):
+    """Registros por segundo con los handlers en el hilo que emite y con la cola"""
+    cli_logging = importlib.import_module("genesis_cli.logging")
+    
+    with tempfile.TemporaryDirectory() as temp_dir, open(os.devnull, "w") as devnull:
+        def make_handlers() -> List[logging.Handler]:
+            file_handler = logging.FileHandler(os.path.join(temp_dir, "genesis-cli.log"))
+            file_handler.setFormatter(logging.Formatter(cli_logging.FILE_LOG_FORMAT))
+            return [cli_logging.GenesisCliHandler(Console(file=devnull), debug=True), file_handler]
+        
+        logger = logging.getLogger("genesis-cli.benchmark")
+        logger.propagate = False
+        logger.setLevel(logging.DEBUG)
+        
+        handlers = make_handlers()
+        logger.handlers = list(handlers)
+        start = time.perf_counter()
+        for index in range(records):
+            logger.info("Generando componente %d", index)
+        elapsed = time.perf_counter() - start
+        print(f"  síncrono (consola y archivo)            {records / elapsed:10,.0f} registros/s")
+        for handler in handlers:
+            handler.close()
+        
+        pipeline = cli_logging.LogPipeline(make_handlers(), maxsize=records)
+        logger.handlers = [pipeline.handler]
+        pipeline.start()
+        start = time.perf_counter()
+        for index in range(records):
+            logger.info("Generando componente %d", index)
+        emitted = time.perf_counter() - start
+        pipeline.stop()
+        drained = time.perf_counter() - start
+        print(f"  cola (hilo que emite)                   {records / emitted:10,.0f} registros/s")
+        print(f"  cola (hasta escribir todo)              {records / drained:10,.0f} registros/s")
+        for handler in pipeline.handlers:
+            handler.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de Genesis CLI")
+    parser.add_argument("--names", type=int, default=1_000_000, help="Nombres por ejecución")
+    args = parser.parse_args()
+    
+    print("⏱️  Validador de nombres de proyecto")
+    
+    unique = make_names(args.names, args.names)
+    repeated = make_names(args.names, 1000)
+    
+    run("nombres distintos (sin memoización)", unique,
+        lambda names: [ProjectNameValidator.validate(name) for name in names])
+    run("manifiesto con repetidos (validate)", repeated,
+        lambda names: [ProjectNameValidator.validate(name) for name in names])
+    run("manifiesto con repetidos (validate_many)", repeated, ProjectNameValidator.validate_many)
+    run("solo comprobar (check, caché caliente)", repeated,
+        lambda names: [ProjectNameValidator.check(name).is_valid for name in names], clear_cache=False)
+    
+    info = _check_project_name.cache_info()
+    print(f"  caché: {info.hits:,} aciertos, {info.misses:,} fallos, {info.currsize} entradas")
+    
+    print("⏱️  Resolución de dependencias entre características")
+    bench_features()
+    
+    print("⏱️  Sugerencias para nombres mal escritos")
+    bench_suggestions()
+    
+    print("⏱️  Logging")
+    bench_logging()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""
+Sugerencias aproximadas para Genesis CLI
+
+Índice de nombres conocidos (templates, características, tipos de
+componente) que propone alternativas para un nombre mal escrito:
+`sass-basic` → `saas-basic`, `ecomerce` → `e-commerce`. Los candidatos se
+obtienen de un índice de trigramas y solo esos se comparan con distancia de
+edición acotada, no el catálogo completo.
+
+DOCTRINA DEL ECOSISTEMA:
+- NO implementa lógica de generación
+- NO coordina agentes directamente
+- SÍ valida entrada del usuario
+- Enfocado en UX/UI para validación
+"""
+
+import re
+from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+# Separadores que no cuentan para comparar nombres ("e-commerce" == "ecommerce")
+_SEPARATORS = re.compile(r"[\s_\-./]+")
+
+# Consultas distintas que recuerda cada índice
+SUGGESTION_CACHE_SIZE = 1024
+
+# Trigramas que puede romper una sola edición (una transposición)
+_GRAMS_PER_EDIT = 4
+
+# Niveles de coincidencia (menor es mejor)
+_EXACT, _ALIAS, _TOKEN, _EDIT, _SUBSTRING, _PARTIAL = range(6)
+
+def normalize(name: str) -> str:
+    """Forma comparable de un nombre: minúsculas y sin separadores"""
+    return _SEPARATORS.sub("", name.lower())
+
+def _tokens(name: str) -> List[str]:
+    return [token for token in _SEPARATORS.split(name.lower()) if token]
+
+def _trigrams(key: str) -> List[str]:
+    padded = f"^{key}$"
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+def max_distance(key: str) -> int:
+    """Ediciones toleradas según la longitud: 1 hasta 5 caracteres, luego una cada 3"""
+    return min(3, max(1, len(key) // 3))
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Distancia de Damerau-Levenshtein (transposiciones adyacentes) acotada
+    
+    Solo calcula la banda diagonal de ancho `limit` y devuelve `limit + 1`
+    en cuanto la distancia supera `limit`.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    if a == b:
+        return 0
+    
+    over = limit + 1
+    width = len(b)
+    previous2 = None
+    previous = [j if j <= limit else over for j in range(width + 1)]
+    for i in range(1, len(a) + 1):
+        current = [over] * (width + 1)
+        if i <= limit:
+            current[0] = i
+        char_a = a[i - 1]
+        row_min = current[0]
+        for j in range(max(1, i - limit), min(width, i + limit) + 1):
+            value = previous[j - 1] if char_a == b[j - 1] else previous[j - 1] + 1
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if previous2 is not None and j > 1 and char_a == b[j - 2] and a[i - 2] == b[j - 1]:
+                if previous2[j - 2] + 1 < value:
+                    value = previous2[j - 2] + 1
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > limit:
+            return over
+        previous2, previous = previous, current
+    
+    return previous[-1] if previous[-1] <= limit else over
+
+class SuggestionIndex:
+    """
+    Índice de sugerencias sobre un conjunto de nombres
+    
+    Orden de las sugerencias: coincidencia exacta, alias, nombres que
+    contienen todas las palabras de la consulta (`saas` → `saas-basic`),
+    distancia de edición dentro del umbral (también contra los alias),
+    nombres que contienen la consulta y, por último, nombres o alias que
+    coinciden con una sola palabra de la consulta (`my-blog` → `blog`). Los
+    empates se resuelven por el orden del catálogo.
+    
+    DOCTRINA: Validamos entrada del usuario
+    """
+    
+    def __init__(self, names: Iterable[str], aliases: Optional[Mapping[str, str]] = None):
+        self.names: List[str] = list(dict.fromkeys(names))
+        self._exact: Dict[str, int] = {}
+        self._tokens: Dict[str, List[int]] = defaultdict(list)
+        for position, name in enumerate(self.names):
+            self._exact.setdefault(normalize(name), position)
+            for token in set(_tokens(name)):
+                self._tokens[token].append(position)
+        
+        self._aliases: Dict[str, int] = {}
+        for alias, target in (aliases or {}).items():
+            position = self._exact.get(normalize(target))
+            if position is not None:
+                self._aliases.setdefault(normalize(alias), position)
+        
+        # Entradas comparables: cada nombre y cada alias, con su nombre destino
+        self._keys: List[str] = [normalize(name) for name in self.names] + list(self._aliases)
+        self._targets: List[int] = list(range(len(self.names))) + list(self._aliases.values())
+        self._chars: List[FrozenSet[str]] = [frozenset(key) for key in self._keys]
+        self._grams: Dict[str, List[int]] = defaultdict(list)
+        for entry, key in enumerate(self._keys):
+            for gram in set(_trigrams(key)):
+                self._grams[gram].append(entry)
+        
+        self._cache: Dict[Tuple[str, int], List[str]] = {}
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def suggest(self, query: str, limit: int = 3) -> List[str]:
+        """Sugerencias ordenadas para `query` (vacío si ninguna supera el umbral)"""
+        cache_key = (query, limit)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+        
+        suggestions = self._rank(query, limit)
+        if len(self._cache) >= SUGGESTION_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[cache_key] = suggestions
+        return list(suggestions)
+    
+    def best(self, query: str) -> Optional[str]:
+        """Mejor sugerencia o None"""
+        suggestions = self.suggest(query, limit=1)
+        return suggestions[0] if suggestions else None
+    
+    def _rank(self, query: str, limit: int) -> List[str]:
+        key = normalize(query or "")
+        if not key:
+            return []
+        
+        keys = self._keys
+        targets = self._targets
+        scores: Dict[int, Tuple[int, int]] = {}
+        
+        def _add(position: int, tier: int, distance: int = 0):
+            score = (tier, distance)
+            if position not in scores or score < scores[position]:
+                scores[position] = score
+        
+        if key in self._exact:
+            _add(self._exact[key], _EXACT)
+        if key in self._aliases:
+            _add(self._aliases[key], _ALIAS)
+        
+        tokens = set(_tokens(query))
+        postings = sorted((self._tokens.get(token, ()) for token in tokens), key=len)
+        if postings and postings[0]:
+            for position in set(postings[0]).intersection(*postings[1:]):
+                _add(position, _TOKEN, len(keys[position]) - len(key))
+        
+        # Los niveles anteriores ya llenan el resultado
+        if len(scores) >= limit:
+            return self._ordered(scores, limit)
+        
+        # Candidatos por trigramas compartidos: con k ediciones se pierden
+        # como mucho 4k de los trigramas de la consulta (3 por inserción,
+        # borrado o sustitución; 4 por una transposición)
+        grams = set(_trigrams(key))
+        counts = Counter(chain.from_iterable(self._grams.get(gram, ()) for gram in grams))
+        
+        # Con consultas cortas el filtro no descarta nada: se exige al menos
+        # un trigrama en común (un nombre sin ninguno no es una buena sugerencia)
+        bound = max_distance(key)
+        required = max(1, len(grams) - _GRAMS_PER_EDIT * bound)
+        candidates = [item for item in counts.items() if item[1] >= required]
+        candidates.sort(key=itemgetter(1), reverse=True)
+        
+        # Como en un BK-tree, el radio se reduce a la peor distancia entre las
+        # `limit` mejores encontradas (los empates aún pueden ganar por orden)
+        # y con él el mínimo de trigramas compartidos: como los candidatos van
+        # ordenados por trigramas, al quedar por debajo se puede parar. Antes
+        # de calcular la distancia, cada carácter distinto que falta en uno de
+        # los dos lados cuesta al menos una edición.
+        chars = frozenset(key)
+        found: Dict[int, int] = {}
+        for entry, count in candidates:
+            if count < required:
+                break
+            candidate = keys[entry]
+            if abs(len(candidate) - len(key)) > bound:
+                continue
+            position = targets[entry]
+            if position in scores and scores[position][0] < _EDIT:
+                continue
+            if len(chars - self._chars[entry]) > bound or len(self._chars[entry] - chars) > bound:
+                continue
+            distance = edit_distance(key, candidate, bound)
+            if distance <= bound:
+                _add(position, _EDIT, distance)
+                found[position] = min(distance, found.get(position, distance))
+                if len(found) >= limit:
+                    bound = sorted(found.values())[limit - 1]
+                    required = max(1, len(grams) - _GRAMS_PER_EDIT * bound)
+        
+        inner = len(grams) - 2  # sin los trigramas de los extremos ^ y $
+        if len(key) >= 3:
+            for entry, count in counts.items():
+                if count >= inner and key in keys[entry]:
+                    _add(targets[entry], _SUBSTRING, len(keys[entry]) - len(key))
+        
+        for token in tokens:
+            if token in self._exact:
+                _add(self._exact[token], _PARTIAL, len(keys[self._exact[token]]))
+            if token in self._aliases:
+                _add(self._aliases[token], _PARTIAL)
+        
+        return self._ordered(scores, limit)
+    
+    def _ordered(self, scores: Mapping[int, Tuple[int, int]], limit: int) -> List[str]:
+        ranked = sorted(scores, key=lambda position: (scores[position], position))
+        return [self.names[position] for position in ranked[:limit]]
+
+@lru_cache(maxsize=32)
+def _cached_index(names: Tuple[str, ...], aliases: Tuple[Tuple[str, str], ...]) -> SuggestionIndex:
+    return SuggestionIndex(names, dict(aliases))
+
+def index_for(names: Iterable[str], aliases: Optional[Mapping[str, str]] = None) -> SuggestionIndex:
+    """Índice compartido para listas pequeñas de nombres (p. ej. tipos de componente)"""
+    return _cached_index(tuple(names), tuple(sorted((aliases or {}).items())))
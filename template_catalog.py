@@ -0,0 +1,234 @@
+"""
+Catálogo de templates para Genesis CLI
+
+genesis-core es quien conoce los templates disponibles. La CLI le pide el
+catálogo una vez, lo guarda en ~/.genesis-cli/catalog.json con la fecha de
+consulta y la versión de genesis-core, y mientras esté vigente lo lee de
+disco: validar un template, sugerir uno parecido o listarlos no requiere
+cargar genesis-core. Si genesis-core no está disponible o no publica su
+catálogo, se usan los templates incluidos en la CLI.
+
+DOCTRINA DEL ECOSISTEMA:
+- NO implementa lógica de generación
+- NO coordina agentes directamente
+- NO contiene templates: solo guarda el catálogo que publica genesis-core
+- SÍ valida entrada del usuario
+- Solo usa genesis-core como interfaz
+"""
+
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from genesis_cli.result_cache import get_core_version
+from genesis_cli.validators import TemplateValidator
+
+CATALOG_FILE = Path.home() / ".genesis-cli" / "catalog.json"
+
+# Cambiar al modificar el formato del archivo
+CATALOG_FORMAT = 1
+
+# Vigencia por defecto (segundos) del catálogo guardado
+DEFAULT_CATALOG_TTL = 24 * 60 * 60
+
+# Campos de cada template que la CLI conserva
+TEMPLATE_FIELDS = ("name", "description", "features", "complexity")
+
+# Origen del catálogo
+SOURCE_CORE = "core"
+SOURCE_BUILTIN = "builtin"
+
+@dataclass(frozen=True)
+class TemplateCatalog:
+    """
+    Templates disponibles y de dónde salieron
+    
+    DOCTRINA: Validamos entrada del usuario
+    """
+    templates: Dict[str, Dict[str, Any]]
+    source: str  # SOURCE_CORE o SOURCE_BUILTIN
+    core_version: str
+    fetched_at: float
+    from_cache: bool = False
+    stale: bool = False  # vencido, pero genesis-core no pudo dar uno nuevo
+    
+    @property
+    def names(self) -> List[str]:
+        return list(self.templates)
+    
+    def __contains__(self, template: object) -> bool:
+        return template in self.templates
+    
+    def __len__(self) -> int:
+        return len(self.templates)
+
+def normalize_catalog(raw: Any) -> Dict[str, Dict[str, Any]]:
+    """
+    Catálogo de genesis-core en la forma {id: {name, description, ...}}
+    
+    Acepta un diccionario por id, el mismo envuelto en {"templates": ...}
+    o una lista de diccionarios con "id". Las entradas que no tienen esa
+    forma se descartan.
+    """
+    if isinstance(raw, dict) and isinstance(raw.get("templates"), (dict, list)):
+        raw = raw["templates"]
+    
+    if isinstance(raw, dict):
+        items = list(raw.items())
+    elif isinstance(raw, list):
+        items = [(entry.get("id"), entry) for entry in raw if isinstance(entry, dict)]
+    else:
+        return {}
+    
+    templates: Dict[str, Dict[str, Any]] = {}
+    for template_id, info in items:
+        if not isinstance(template_id, str) or not template_id or not isinstance(info, dict):
+            continue
+        entry = {field: info[field] for field in TEMPLATE_FIELDS if field in info}
+        entry["features"] = [str(feature) for feature in entry.get("features") or []]
+        templates[template_id] = entry
+    return templates
+
+def fetch_core_catalog() -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Pedir el catálogo a genesis-core
+    
+    Returns:
+        Templates por id, o None si genesis-core no está instalado, no
+        publica su catálogo o falló al obtenerlo
+    """
+    try:
+        from genesis_core.templates import get_template_catalog
+    except ImportError:
+        return None
+    
+    try:
+        templates = normalize_catalog(get_template_catalog())
+    except Exception:
+        return None
+    return templates or None
+
+class CatalogStore:
+    """
+    Copia persistente del catálogo en ~/.genesis-cli/catalog.json
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def __init__(self, cache_file: Optional[Path] = None, ttl: float = DEFAULT_CATALOG_TTL):
+        self.cache_file = cache_file or CATALOG_FILE
+        self.ttl = ttl
+    
+    def read(self) -> Optional[TemplateCatalog]:
+        """Catálogo guardado (vigente o no) o None si falta o es de otro formato"""
+        try:
+            with open(self.cache_file, "r") as f:
+                data = json.load(f)
+            if data.get("format") != CATALOG_FORMAT:
+                return None
+            return TemplateCatalog(
+                templates=normalize_catalog(data["templates"]),
+                source=data["source"],
+                core_version=data["core_version"],
+                fetched_at=float(data["fetched_at"]),
+                from_cache=True,
+            )
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+    
+    def is_fresh(self, catalog: TemplateCatalog, core_version: str) -> bool:
+        """Vigente: dentro del TTL y de la misma versión de genesis-core"""
+        return (self.ttl > 0
+                and catalog.core_version == core_version
+                and 0 <= time.time() - catalog.fetched_at <= self.ttl)
+    
+    def write(self, catalog: TemplateCatalog):
+        """Guardar el catálogo (escritura atómica)"""
+        payload = {
+            "format": CATALOG_FORMAT,
+            "source": catalog.source,
+            "core_version": catalog.core_version,
+            "fetched_at": catalog.fetched_at,
+            "templates": catalog.templates,
+        }
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, "w") as f:
+                f.write(json.dumps(payload, ensure_ascii=False))
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            # Sin copia en disco, la próxima ejecución volverá a preguntar
+            pass
+    
+    def clear(self):
+        """Eliminar el catálogo guardado"""
+        try:
+            self.cache_file.unlink()
+        except OSError:
+            pass
+
+def load_template_catalog(
+    refresh: bool = False,
+    store: Optional[CatalogStore] = None,
+    fetch: Callable[[], Optional[Dict[str, Dict[str, Any]]]] = fetch_core_catalog,
+) -> TemplateCatalog:
+    """
+    Obtener el catálogo: copia vigente en disco, genesis-core o respaldo
+    
+    Con `refresh=True` se ignora la copia en disco. Si genesis-core no
+    responde se usa la copia vencida (marcada como `stale`) y, sin ella,
+    los templates incluidos en la CLI. El catálogo obtenido queda activo en
+    TemplateValidator para el resto del proceso.
+    """
+    store = store or CatalogStore()
+    core_version = get_core_version()
+    cached = store.read()
+    
+    if cached is not None and not refresh and store.is_fresh(cached, core_version):
+        if cached.source == SOURCE_BUILTIN:
+            cached = _builtin(core_version, cached.fetched_at, from_cache=True)
+        return _activate(cached)
+    
+    templates = fetch()
+    if templates:
+        catalog = TemplateCatalog(templates, SOURCE_CORE, core_version, time.time())
+        store.write(catalog)
+        return _activate(catalog)
+    
+    if cached is not None and cached.source == SOURCE_CORE:
+        return _activate(TemplateCatalog(
+            cached.templates, cached.source, cached.core_version, cached.fetched_at,
+            from_cache=True, stale=True,
+        ))
+    
+    # Sin catálogo de genesis-core: recordarlo para no volver a cargar
+    # genesis-core hasta que venza o cambie su versión. Los templates de
+    # respaldo no se guardan, se toman siempre de esta versión de la CLI.
+    catalog = _builtin(core_version, time.time())
+    store.write(TemplateCatalog({}, SOURCE_BUILTIN, core_version, catalog.fetched_at))
+    return _activate(catalog)
+
+def _builtin(core_version: str, fetched_at: float, from_cache: bool = False) -> TemplateCatalog:
+    return TemplateCatalog(
+        dict(TemplateValidator.OFFICIAL_TEMPLATES), SOURCE_BUILTIN, core_version, fetched_at, from_cache=from_cache
+    )
+
+_active_catalog: Optional[TemplateCatalog] = None
+
+def _activate(catalog: TemplateCatalog) -> TemplateCatalog:
+    global _active_catalog
+    _active_catalog = catalog
+    TemplateValidator.use_catalog(catalog.templates)
+    return catalog
+
+def get_template_catalog() -> TemplateCatalog:
+    """Catálogo del proceso: se carga en la primera llamada"""
+    if _active_catalog is not None:
+        return _active_catalog
+    
+    from genesis_cli.config import get_template_catalog_ttl
+    return load_template_catalog(store=CatalogStore(ttl=get_template_catalog_ttl()))
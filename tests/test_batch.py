@@ -0,0 +1,205 @@
+"""
+Tests para la creación de proyectos en lote de Genesis CLI
+
+DOCTRINA DEL ECOSISTEMA:
+- NO testea lógica de generación
+- NO testea agentes directamente
+- SÍ testea validación y progreso del lote
+- Solo testea funcionalidad de CLI
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from genesis_cli.commands.batch import (
+    build_project_configs, format_batch_errors, load_manifest, run_batch, validate_batch
+)
+from genesis_cli.exceptions import ConfigurationError, ValidationError
+
+
+class TestManifest:
+    """
+    Tests para load_manifest y build_project_configs
+    
+    DOCTRINA: Validamos entrada del usuario
+    """
+    
+    def test_load_json_list(self, tmp_path):
+        """Test manifiesto JSON con una lista de proyectos"""
+        manifest = tmp_path / "projects.json"
+        manifest.write_text(json.dumps([{"name": "alpha"}, "beta"]))
+        
+        assert load_manifest(manifest) == {"projects": [{"name": "alpha"}, "beta"]}
+    
+    def test_load_yaml_with_defaults(self, tmp_path):
+        """Test manifiesto YAML con defaults"""
+        pytest.importorskip("yaml")
+        manifest = tmp_path / "projects.yaml"
+        manifest.write_text("defaults:\n  template: api-only\nprojects:\n  - name: alpha\n")
+        
+        data = load_manifest(manifest)
+        
+        assert data["defaults"] == {"template": "api-only"}
+        assert data["projects"] == [{"name": "alpha"}]
+    
+    def test_missing_manifest(self, tmp_path):
+        """Test manifiesto inexistente"""
+        with pytest.raises(ConfigurationError):
+            load_manifest(tmp_path / "missing.json")
+    
+    def test_manifest_without_projects(self, tmp_path):
+        """Test manifiesto sin lista de proyectos"""
+        manifest = tmp_path / "projects.json"
+        manifest.write_text(json.dumps({"defaults": {}}))
+        
+        with pytest.raises(ConfigurationError):
+            load_manifest(manifest)
+    
+    def test_config_precedence(self, tmp_path):
+        """Test prioridad: entrada > defaults del manifiesto > CLI"""
+        manifest = {
+            "defaults": {"template": "api-only", "description": "Compartida"},
+            "projects": [
+                {"name": "alpha"},
+                {"name": "beta", "template": "microservices", "output": str(tmp_path)},
+            ],
+        }
+        
+        configs = build_project_configs(manifest, {"template": "saas-basic", "force": True})
+        
+        assert configs[0]["template"] == "api-only"
+        assert configs[0]["description"] == "Compartida"
+        assert configs[0]["force"] is True
+        assert configs[0]["interactive"] is False
+        assert configs[0]["features"]
+        assert configs[1]["template"] == "microservices"
+        assert configs[1]["output_path"] == str(tmp_path.resolve())
+
+
+class TestValidateBatch:
+    """
+    Tests para validate_batch
+    
+    DOCTRINA: Validamos todo antes de generar nada
+    """
+    
+    def test_valid_batch(self, tmp_path):
+        """Test lote válido"""
+        configs = build_project_configs(
+            {"projects": ["alpha-app", "beta-app"]},
+            {"template": "saas-basic", "output_path": str(tmp_path)}
+        )
+        
+        assert validate_batch(configs) == {}
+    
+    def test_invalid_entries_are_reported(self, tmp_path):
+        """Test se reportan todos los errores de todas las entradas"""
+        configs = build_project_configs(
+            {"projects": ["alpha-app", "alpha-app", "bad name!", {"template": "saas-basic"}]},
+            {"template": "saas-basic", "output_path": str(tmp_path)}
+        )
+        
+        errors = validate_batch(configs)
+        
+        assert "Proyecto duplicado en el manifiesto" in errors["alpha-app"]
+        assert "bad name!" in errors
+        assert "#4" in errors
+        
+        error = format_batch_errors(errors)
+        assert isinstance(error, ValidationError)
+        assert any(message.startswith("alpha-app:") for message in error.errors)
+
+
+class TestRunBatch:
+    """
+    Tests para run_batch
+    
+    DOCTRINA: Solo usa genesis-core como interfaz
+    """
+    
+    def test_concurrency_is_bounded(self):
+        """Test nunca hay más de `jobs` proyectos generándose a la vez"""
+        in_flight = 0
+        peak = 0
+        
+        async def _create(config):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return {"success": True, "generated_files": ["a.py"]}
+        
+        configs = [{"name": f"project-{i}"} for i in range(6)]
+        results = asyncio.run(run_batch(configs, _create, jobs=2))
+        
+        assert peak == 2
+        assert [result.name for result in results] == [c["name"] for c in configs]
+        assert all(result.success for result in results)
+    
+    def test_failures_do_not_stop_batch(self):
+        """Test un proyecto fallido no detiene el resto"""
+        async def _create(config):
+            if config["name"] == "broken":
+                raise RuntimeError("boom")
+            return {"success": config["name"] != "rejected", "error": "rechazado"}
+        
+        configs = [{"name": "ok"}, {"name": "broken"}, {"name": "rejected"}]
+        results = asyncio.run(run_batch(configs, _create, jobs=3))
+        
+        assert [result.success for result in results] == [True, False, False]
+        assert results[1].error == "boom"
+        assert results[2].error == "rechazado"
+    
+    def test_same_name_in_different_outputs(self, monkeypatch):
+        """Test cada entrada tiene su fila aunque se repita el nombre en otro directorio"""
+        import io
+        from rich.console import Console
+        from genesis_cli.commands import batch
+        
+        output = io.StringIO()
+        monkeypatch.setattr(batch, "console", Console(file=output, width=120))
+        
+        async def _create(config):
+            return {"success": config["output_path"] == "/a", "error": "rechazado"}
+        
+        configs = [{"name": "app", "output_path": "/a"}, {"name": "app", "output_path": "/b"}]
+        results = asyncio.run(run_batch(configs, _create, jobs=2))
+        
+        assert [result.success for result in results] == [True, False]
+        final = output.getvalue()
+        assert final.count("app") == 2
+        assert "listo" in final and "error" in final
+    
+    def test_batch_records_projects(self, tmp_path, monkeypatch):
+        """Test los proyectos creados en lote quedan registrados en genesis.json como con `init`"""
+        from genesis_cli import config as config_module, main, template_catalog
+        
+        async def _create(config, orchestrator=None):
+            project_path = tmp_path / config["name"]
+            (project_path / "src").mkdir(parents=True)
+            (project_path / "src" / "app.py").write_text(config["name"])
+            return {"success": True, "project_path": str(project_path), "generated_files": ["src/app.py"]}
+        
+        monkeypatch.setattr(main, "_ensure_core", lambda ctx=None: None)
+        monkeypatch.setitem(vars(main), "CoreOrchestrator", object)  # sin pasar por la carga diferida
+        monkeypatch.setattr(main, "_create_project_async", _create)
+        monkeypatch.setattr(config_module, "should_skip_dependency_check", lambda: True)
+        monkeypatch.setattr(template_catalog, "get_template_catalog", lambda: None)
+        manifest = tmp_path / "projects.json"
+        manifest.write_text(json.dumps(["alpha", "beta"]))
+        
+        main._init_batch(None, manifest, 2, "saas-basic", str(tmp_path), False)
+        
+        for name in ("alpha", "beta"):
+            data = json.loads((tmp_path / name / "genesis.json").read_text())
+            assert "project" in data["generation"]["components"]
+            assert "src/app.py" in data["generation"]["files"]
+
+
+# Marcadores para tests
+pytestmark = [
+    pytest.mark.unit
+]
@@ -10,6 +10,8 @@ DOCTRINA DEL ECOSISTEMA:
 """
 
 import pytest
+import copy
+import dataclasses
 import json
 import tempfile
 import os
@@ -20,6 +22,8 @@ from genesis_cli.config import (
     CLIConfig,
     CLIConfigManager,
     DEFAULT_CONFIG,
+    ENV_FLAGS,
+    ENV_VALUES,
     get_config,
     update_config,
     reset_config,
@@ -760,6 +764,221 @@ class TestConfigurationEdgeCases:
             assert config.interactive_mode == True
 
 
+
+class TestLayeredConfiguration:
+    """
+    Tests para la resolución por capas y la caché de archivos interpretados
+    
+    DOCTRINA: Solo configuración de interfaz de usuario
+    """
+    
+    @pytest.fixture
+    def manager(self, tmp_path, monkeypatch):
+        for variable in list(ENV_FLAGS) + list(ENV_VALUES):
+            monkeypatch.delenv(variable, raising=False)
+        manager = CLIConfigManager()
+        manager.config_dir = tmp_path / "home"
+        manager.config_file = manager.config_dir / "config.json"
+        manager.project_file = tmp_path / "project" / ".genesis-cli.toml"
+        manager.config_dir.mkdir()
+        manager.project_file.parent.mkdir()
+        return manager
+    
+    def test_layer_precedence(self, manager, monkeypatch):
+        """Test defaults < usuario < proyecto < entorno < línea de comandos"""
+        manager.config_file.write_text(json.dumps({
+            "ui": {"theme": "dark"},
+            "templates": {"default_template": "api-only"},
+            "behavior": {"verbose_output": False},
+        }))
+        manager.project_file.write_text(
+            '[templates]\ndefault_template = "minimal"\n\n[behavior]\nskip_dependency_check = true\n'
+        )
+        monkeypatch.setenv("GENESIS_CLI_SKIP_DEPS", "1")
+        monkeypatch.setenv("GENESIS_CLI_DEFAULT_TEMPLATE", "e-commerce")
+        manager.set_overrides(default_template="saas-basic", unknown="ignored")
+        
+        config = manager.load_config()
+        
+        assert config.theme == "dark"
+        assert config.default_template == "saas-basic"
+        assert config.skip_dependency_check == True
+        assert config.verbose_output == False
+        assert config.color_output == True
+    
+    def test_snapshot_is_immutable(self, manager):
+        """Test la configuración resuelta no se puede modificar"""
+        config = manager.load_config()
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.theme = "dark"
+        assert manager.load_config() is config
+        assert manager.get_config_value("to_dict", "default") == "default"
+    
+    def test_defaults_not_mutated(self, manager):
+        """Test guardar y resolver no modifican DEFAULT_CONFIG"""
+        original = copy.deepcopy(DEFAULT_CONFIG)
+        manager.config_file.write_text(json.dumps({"ui": {"theme": "dark"}}))
+        
+        manager.load_config()
+        manager.update_config(show_banner=False)
+        
+        assert DEFAULT_CONFIG == original
+    
+    def test_update_config_keeps_other_layers_out(self, manager, monkeypatch):
+        """Test update_config no guarda valores del proyecto ni del entorno"""
+        manager.project_file.write_text('[templates]\ndefault_template = "minimal"\n')
+        monkeypatch.setenv("GENESIS_CLI_VERBOSE", "1")
+        
+        manager.update_config(theme="dark")
+        saved = json.loads(manager.config_file.read_text())
+        
+        assert saved["ui"]["theme"] == "dark"
+        assert saved["templates"]["default_template"] == "saas-basic"
+        assert saved["behavior"]["verbose_output"] == False
+        assert manager.load_config().default_template == "minimal"
+        assert manager.load_config().verbose_output == True
+    
+    def test_parsed_files_cached_across_processes(self, manager, monkeypatch):
+        """Test un archivo sin cambios no se vuelve a interpretar"""
+        manager.config_file.write_text(json.dumps({"ui": {"theme": "dark"}}))
+        os.utime(manager.config_file, (0, 0))
+        manager.load_config()
+        assert manager.cache_file.exists()
+        
+        def fail(*args, **kwargs):
+            raise AssertionError("config.json no debería interpretarse de nuevo")
+        
+        fresh = CLIConfigManager()
+        fresh.config_dir, fresh.config_file, fresh.project_file = (
+            manager.config_dir, manager.config_file, manager.project_file
+        )
+        with patch("genesis_cli.config.json.load", fail):
+            assert fresh.load_config().theme == "dark"
+    
+    def test_changed_file_invalidates_cache(self, manager):
+        """Test un cambio de tamaño o mtime vuelve a interpretar el archivo"""
+        manager.config_file.write_text(json.dumps({"ui": {"theme": "dark"}}))
+        os.utime(manager.config_file, (0, 0))
+        assert manager.load_config().theme == "dark"
+        
+        manager.config_file.write_text(json.dumps({"ui": {"theme": "light"}}))
+        os.utime(manager.config_file, (1, 1))
+        
+        assert manager.load_config().theme == "dark"
+        assert manager.reload_config().theme == "light"
+    
+    def test_corrupt_cache_is_ignored(self, manager):
+        """Test una caché ilegible equivale a no tenerla"""
+        manager.config_file.write_text(json.dumps({"ui": {"theme": "dark"}}))
+        manager.cache_file.write_bytes(b"\x00garbage")
+        
+        assert manager.load_config().theme == "dark"
+    
+    def test_recently_written_file_not_cached(self, manager):
+        """Test un archivo recién escrito se vuelve a interpretar en la siguiente ejecución"""
+        manager.config_file.write_text(json.dumps({"ui": {"theme": "dark"}}))
+        manager.load_config()
+        
+        manager.config_file.write_text(json.dumps({"ui": {"theme": "blue"}}))
+        
+        assert manager.reload_config().theme == "blue"
+
+
+def _increment_cache_size(config_dir: str, project_file: str, rounds: int):
+    """Proceso escritor: incrementar result_cache_max_mb con compare_and_swap"""
+    manager = CLIConfigManager()
+    manager.config_dir = Path(config_dir)
+    manager.config_file = manager.config_dir / "config.json"
+    manager.project_file = Path(project_file)
+    for _ in range(rounds):
+        while True:
+            current = manager.read_saved_config().result_cache_max_mb
+            if manager.compare_and_swap({"result_cache_max_mb": current}, result_cache_max_mb=current + 1):
+                break
+
+
+class TestConcurrentWrites:
+    """
+    Tests para escrituras de configuración desde varios procesos
+    
+    DOCTRINA: Solo configuración de interfaz de usuario
+    """
+    
+    @pytest.fixture
+    def manager(self, tmp_path):
+        manager = CLIConfigManager()
+        manager.config_dir = tmp_path / "home"
+        manager.config_file = manager.config_dir / "config.json"
+        manager.project_file = tmp_path / "none.toml"
+        return manager
+    
+    def test_compare_and_swap(self, manager):
+        """Test el cambio solo se aplica si el valor guardado es el esperado"""
+        manager.update_config(theme="dark")
+        
+        assert manager.compare_and_swap({"theme": "light"}, theme="blue") == False
+        assert manager.read_saved_config().theme == "dark"
+        assert manager.compare_and_swap({"theme": "dark"}, theme="blue") == True
+        assert manager.read_saved_config().theme == "blue"
+        assert manager.load_config().theme == "blue"
+    
+    def test_update_preserves_unknown_keys(self, manager):
+        """Test una actualización conserva las claves que la CLI no conoce"""
+        manager.config_dir.mkdir()
+        manager.config_file.write_text(json.dumps({"ui": {"theme": "dark", "font": "mono"}, "plugins": {"a": 1}}))
+        
+        manager.update_config(show_banner=False)
+        saved = json.loads(manager.config_file.read_text())
+        
+        assert saved["ui"] == {**saved["ui"], "theme": "dark", "font": "mono", "show_banner": False}
+        assert saved["plugins"] == {"a": 1}
+    
+    def test_write_is_atomic(self, manager, monkeypatch):
+        """Test un fallo al escribir deja intacto el archivo anterior"""
+        manager.update_config(theme="dark")
+        before = manager.config_file.read_text()
+        
+        def fail(*args, **kwargs):
+            raise OSError("disco lleno")
+        
+        monkeypatch.setattr("genesis_cli.config.os.fsync", fail)
+        manager.update_config(theme="light")
+        
+        assert manager.config_file.read_text() == before
+        assert [path.name for path in manager.config_dir.iterdir() if path.suffix == ".tmp"] == []
+        assert manager.load_config().theme == "light"  # en memoria
+    
+    def test_concurrent_writers_lose_no_updates(self, manager):
+        """Test 64 procesos actualizando a la vez: sin cambios perdidos ni lecturas corruptas"""
+        import multiprocessing
+        
+        if "fork" not in multiprocessing.get_all_start_methods():
+            pytest.skip("requiere fork")
+        context = multiprocessing.get_context("fork")
+        writers, rounds = 64, 3
+        manager.update_config(result_cache_max_mb=0)
+        
+        processes = [
+            context.Process(target=_increment_cache_size,
+                            args=(str(manager.config_dir), str(manager.project_file), rounds))
+            for _ in range(writers)
+        ]
+        for process in processes:
+            process.start()
+        
+        reads = 0
+        while any(process.is_alive() for process in processes):
+            json.loads(manager.config_file.read_text())
+            reads += 1
+        for process in processes:
+            process.join()
+        
+        assert all(process.exitcode == 0 for process in processes)
+        assert reads > 0
+        assert manager.read_saved_config().result_cache_max_mb == writers * rounds
+
+
 # Marcadores para tests
 pytestmark = [
     pytest.mark.unit,
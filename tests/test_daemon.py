@@ -0,0 +1,258 @@
+"""
+Tests para el daemon de Genesis CLI
+
+DOCTRINA DEL ECOSISTEMA:
+- NO testea lógica de generación
+- NO testea agentes directamente
+- SÍ testea comunicación de la CLI con su daemon
+- Solo testea funcionalidad de CLI
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from genesis_cli import daemon
+from genesis_cli.daemon import GenesisDaemon, forward_request, get_daemon_info, stop_daemon
+
+requires_unix_sockets = pytest.mark.skipif(not daemon.is_supported(), reason="Requiere sockets Unix")
+
+
+class _FakeCli:
+    """Sustituto del módulo main: registra cada ejecución"""
+    
+    def __init__(self):
+        self.calls = []
+    
+    async def _create_project_async(self, config, orchestrator=None):
+        self.calls.append(("init", config, orchestrator, os.getcwd()))
+        return {"success": True, "project_path": config.get("name")}
+    
+    async def _generate_async(self, config, orchestrator=None):
+        self.calls.append(("generate", config, orchestrator, os.getcwd()))
+        return {"success": True, "files": ["a.py"]}
+    
+    async def _deploy_async(self, config, orchestrator=None):
+        self.calls.append(("deploy", config, orchestrator, os.getcwd()))
+        return {"success": True, "url": "http://localhost"}
+
+
+@pytest.fixture
+def running_daemon():
+    """Daemon real escuchando en un socket temporal, con genesis-core simulado"""
+    socket_dir = tempfile.mkdtemp(prefix="gd")
+    socket_path = Path(socket_dir) / "d.sock"
+    fake_cli = _FakeCli()
+    orchestrator = object()
+    
+    def _fake_load(self):
+        self._cli = fake_cli
+        self.orchestrator = orchestrator
+    
+    server = GenesisDaemon(socket_path, idle_timeout=60)
+    with patch.object(GenesisDaemon, "_load", _fake_load):
+        thread = threading.Thread(target=lambda: asyncio.run(server.serve()), daemon=True)
+        thread.start()
+        
+        deadline = time.monotonic() + 5
+        while get_daemon_info(socket_path) is None and time.monotonic() < deadline:
+            time.sleep(0.02)
+        
+        yield SimpleNamespace(server=server, socket_path=socket_path, cli=fake_cli,
+                              orchestrator=orchestrator, thread=thread)
+        
+        stop_daemon(socket_path)
+        thread.join(timeout=5)
+    shutil.rmtree(socket_dir, ignore_errors=True)
+
+
+@requires_unix_sockets
+class TestDaemon:
+    """
+    Tests del daemon
+    
+    DOCTRINA: Solo usa genesis-core como interfaz
+    """
+    
+    def test_hello_reports_version(self, running_daemon):
+        """Test handshake devuelve versión y PID"""
+        info = get_daemon_info(running_daemon.socket_path)
+        
+        assert info["ok"] is True
+        assert info["version"] == daemon.daemon_version()
+        assert info["pid"] == os.getpid()
+    
+    def test_forward_reuses_single_orchestrator(self, running_daemon, monkeypatch, tmp_path):
+        """Test las solicitudes comparten el mismo orquestador y el cwd del cliente"""
+        monkeypatch.delenv("GENESIS_CLI_NO_DAEMON", raising=False)
+        monkeypatch.chdir(tmp_path)
+        
+        first = forward_request("generate", {"component": "model", "name": "User"}, running_daemon.socket_path)
+        second = forward_request("deploy", {"environment": "local"}, running_daemon.socket_path)
+        
+        assert first == {"success": True, "files": ["a.py"]}
+        assert second["url"] == "http://localhost"
+        
+        calls = running_daemon.cli.calls
+        assert [c[0] for c in calls] == ["generate", "deploy"]
+        assert all(c[2] is running_daemon.orchestrator for c in calls)
+        assert calls[0][3] == str(tmp_path)
+        assert get_daemon_info(running_daemon.socket_path)["requests_served"] == 2
+    
+    def test_version_mismatch_falls_back_and_restarts(self, running_daemon, monkeypatch):
+        """Test un daemon desactualizado se reemplaza y la solicitud corre en proceso"""
+        monkeypatch.delenv("GENESIS_CLI_NO_DAEMON", raising=False)
+        running_daemon.server.version = "0.0.0+core.old"
+        
+        socket_freed = []
+        with patch("genesis_cli.daemon.start_daemon",
+                   side_effect=lambda **kwargs: socket_freed.append(not running_daemon.socket_path.exists())
+                   ) as mock_start:
+            result = forward_request("generate", {"name": "User"}, running_daemon.socket_path)
+        
+        assert result is None
+        mock_start.assert_called_once()
+        # El nuevo daemon solo se lanza cuando el anterior liberó el socket
+        assert socket_freed == [True]
+        assert running_daemon.cli.calls == []
+        running_daemon.thread.join(timeout=5)
+        assert not running_daemon.thread.is_alive()
+    
+    def test_busy_daemon_falls_back(self, running_daemon, monkeypatch):
+        """Test un daemon ocupado rechaza la solicitud sin encolarla"""
+        monkeypatch.delenv("GENESIS_CLI_NO_DAEMON", raising=False)
+        monkeypatch.setattr(running_daemon.server._lock, "locked", lambda: True)
+        
+        assert forward_request("generate", {"name": "User"}, running_daemon.socket_path) is None
+        assert running_daemon.cli.calls == []
+    
+    def test_no_daemon_env_disables_forwarding(self, running_daemon, monkeypatch):
+        """Test GENESIS_CLI_NO_DAEMON fuerza ejecución en proceso"""
+        monkeypatch.setenv("GENESIS_CLI_NO_DAEMON", "1")
+        
+        assert forward_request("generate", {"name": "User"}, running_daemon.socket_path) is None
+        assert running_daemon.cli.calls == []
+    
+    def test_status_is_not_forwarded(self, running_daemon, monkeypatch):
+        """Test comandos locales no se reenvían"""
+        monkeypatch.delenv("GENESIS_CLI_NO_DAEMON", raising=False)
+        
+        assert forward_request("status", {}, running_daemon.socket_path) is None
+    
+    def test_idle_shutdown(self):
+        """Test el daemon se detiene solo tras el tiempo de inactividad"""
+        socket_dir = tempfile.mkdtemp(prefix="gd")
+        socket_path = Path(socket_dir) / "d.sock"
+        
+        def _fake_load(self):
+            self._cli = _FakeCli()
+        
+        try:
+            with patch.object(GenesisDaemon, "_load", _fake_load):
+                start = time.monotonic()
+                asyncio.run(GenesisDaemon(socket_path, idle_timeout=1).serve())
+            
+            assert time.monotonic() - start < 10
+            assert not socket_path.exists()
+        finally:
+            shutil.rmtree(socket_dir, ignore_errors=True)
+    
+    def test_keeps_socket_of_replacement(self):
+        """Test al salir no se borra el socket de un daemon que ocupó la misma ruta"""
+        import socket
+        
+        socket_dir = tempfile.mkdtemp(prefix="gd")
+        socket_path = Path(socket_dir) / "d.sock"
+        
+        def _fake_load(self):
+            self._cli = _FakeCli()
+        
+        try:
+            with patch.object(GenesisDaemon, "_load", _fake_load):
+                server = GenesisDaemon(socket_path, idle_timeout=1)
+                thread = threading.Thread(target=lambda: asyncio.run(server.serve()), daemon=True)
+                thread.start()
+                deadline = time.monotonic() + 5
+                while get_daemon_info(socket_path) is None and time.monotonic() < deadline:
+                    time.sleep(0.02)
+                
+                # Un daemon nuevo reemplaza el socket mientras el anterior termina
+                socket_path.unlink()
+                replacement = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                replacement.bind(str(socket_path))
+                replacement.listen()
+                replacement_inode = os.stat(socket_path).st_ino
+                thread.join(timeout=10)
+            
+            assert not thread.is_alive()
+            assert os.stat(socket_path).st_ino == replacement_inode
+            replacement.close()
+        finally:
+            shutil.rmtree(socket_dir, ignore_errors=True)
+
+
+class TestDaemonClient:
+    """
+    Tests del cliente sin daemon activo
+    
+    DOCTRINA: Solo testea funcionalidad de CLI
+    """
+    
+    def test_forward_without_daemon(self, tmp_path, monkeypatch):
+        """Test sin daemon la solicitud se ejecuta en proceso"""
+        monkeypatch.delenv("GENESIS_CLI_NO_DAEMON", raising=False)
+        
+        assert forward_request("generate", {}, tmp_path / "missing.sock") is None
+    
+    @requires_unix_sockets
+    def test_unresponsive_daemon_times_out(self, monkeypatch):
+        """Test un daemon que recibió la solicitud y no responde da error sin repetirla en proceso"""
+        import socket
+        
+        monkeypatch.delenv("GENESIS_CLI_NO_DAEMON", raising=False)
+        socket_dir = tempfile.mkdtemp(prefix="gd")
+        socket_path = Path(socket_dir) / "d.sock"
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as wedged:
+                wedged.bind(str(socket_path))
+                wedged.listen()  # Acepta conexiones pero nunca responde
+                
+                start = time.monotonic()
+                result = forward_request("generate", {}, socket_path, timeout=0.2)
+                assert time.monotonic() - start < 5
+                assert result["success"] is False
+                assert "puede seguir en ejecución" in result["error"]
+        finally:
+            shutil.rmtree(socket_dir, ignore_errors=True)
+    
+    @requires_unix_sockets
+    def test_stale_socket_is_removed(self, monkeypatch):
+        """Test un socket huérfano se elimina"""
+        import socket
+        
+        monkeypatch.delenv("GENESIS_CLI_NO_DAEMON", raising=False)
+        socket_dir = tempfile.mkdtemp(prefix="gd")
+        socket_path = Path(socket_dir) / "d.sock"
+        try:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.bind(str(socket_path))
+            sock.close()  # Archivo de socket sin nadie escuchando
+            
+            assert forward_request("generate", {}, socket_path) is None
+            assert not socket_path.exists()
+        finally:
+            shutil.rmtree(socket_dir, ignore_errors=True)
+
+
+# Marcadores para tests
+pytestmark = [
+    pytest.mark.unit
+]
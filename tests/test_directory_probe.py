@@ -0,0 +1,176 @@
+"""
+Tests para el sondeo de directorios de Genesis CLI
+
+DOCTRINA DEL ECOSISTEMA:
+- NO testea lógica de generación
+- NO testea agentes directamente
+- SÍ testea validación de entrada del usuario
+- Solo testea funcionalidad de CLI
+"""
+
+import os
+
+import pytest
+
+from genesis_cli import directory_probe
+from genesis_cli.commands.batch import validate_batch
+from genesis_cli.directory_probe import directory_probe_scope, probe_directories, probe_directory
+from genesis_cli.utils import validate_project_directory
+from genesis_cli.validators import DirectoryValidator
+
+
+@pytest.fixture
+def output(tmp_path):
+    """Directorio de salida con un proyecto vacío, uno con contenido y un archivo"""
+    (tmp_path / "empty").mkdir()
+    (tmp_path / "full").mkdir()
+    for index in range(50):
+        (tmp_path / "full" / f"file{index}.txt").write_text("x")
+    (tmp_path / "notes.txt").write_text("notas")
+    return tmp_path
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Contar las llamadas al sistema de archivos que hace el sondeo"""
+    counts = {"stat": 0, "scandir": 0, "entries": 0}
+    real_stat, real_scandir = os.stat, os.scandir
+    
+    def counting_stat(path, *args, **kwargs):
+        counts["stat"] += 1
+        return real_stat(path, *args, **kwargs)
+    
+    class CountingScandir:
+        def __init__(self, path):
+            counts["scandir"] += 1
+            self._entries = real_scandir(path)
+        
+        def __enter__(self):
+            return self
+        
+        def __exit__(self, *exc):
+            self._entries.close()
+        
+        def __iter__(self):
+            return self
+        
+        def __next__(self):
+            entry = next(self._entries)
+            counts["entries"] += 1
+            return entry
+    
+    monkeypatch.setattr(directory_probe.os, "stat", counting_stat)
+    monkeypatch.setattr(directory_probe.os, "scandir", CountingScandir)
+    return counts
+
+
+class TestProbeDirectory:
+    """
+    Tests para los hechos que reúne un sondeo
+    
+    DOCTRINA: Validamos entrada del usuario
+    """
+    
+    def test_facts(self, output):
+        """Test existencia, tipo, escritura, vacío y espacio libre"""
+        missing = probe_directory(output / "missing")
+        assert not missing.exists and missing.error is None
+        
+        notes = probe_directory(output / "notes.txt", empty=True)
+        assert notes.exists and not notes.is_dir and notes.empty is None
+        
+        assert probe_directory(output / "empty", empty=True).empty is True
+        assert probe_directory(output / "full", empty=True).empty is False
+        
+        parent = probe_directory(output, free=True)
+        assert parent.is_dir and parent.writable
+        assert parent.free_bytes is not None and parent.empty is None
+    
+    def test_emptiness_stops_at_first_entry(self, output, calls):
+        """Test un stat y la primera entrada del directorio, no el listado completo"""
+        probe_directory(output / "full", empty=True)
+        
+        assert calls == {"stat": 1, "scandir": 1, "entries": 1}
+    
+    def test_no_files_are_written(self, output):
+        """Test comprobar permisos no crea archivos de prueba"""
+        before = sorted(os.listdir(output))
+        
+        validate_project_directory(str(output / "new-project"))
+        DirectoryValidator.validate_output_directory(str(output), "new-project")
+        
+        assert sorted(os.listdir(output)) == before
+
+
+class TestProbeScope:
+    """
+    Tests para la caché de sondeos durante un comando
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def test_scope_reuses_probes(self, output, calls):
+        """Test dentro del ámbito cada ruta se sondea una vez"""
+        with directory_probe_scope():
+            first = probe_directory(output / "empty", empty=True)
+            (output / "empty" / "new.txt").write_text("x")
+            assert probe_directory(output / "empty", empty=True) is first
+            
+            with directory_probe_scope():
+                assert probe_directory(output / "empty") is first
+        
+        assert calls["stat"] == 1
+        assert probe_directory(output / "empty", empty=True).empty is False
+    
+    def test_missing_facts_are_added(self, output):
+        """Test pedir un dato nuevo vuelve a sondear y conserva los anteriores"""
+        with directory_probe_scope():
+            probe_directory(output, free=True)
+            probe = probe_directory(output, empty=True)
+        
+        assert probe.empty is False
+        assert probe.free_bytes is not None
+    
+    def test_probe_directories_fills_scope(self, output, calls):
+        """Test el sondeo en paralelo deja los resultados en la caché"""
+        paths = [output / name for name in ("empty", "full", "missing", "notes.txt")]
+        
+        with directory_probe_scope():
+            probes = probe_directories(paths + [paths[0]], empty=True, workers=4)
+            for path in paths:
+                probe_directory(path, empty=True)
+        
+        assert list(probes) == [os.path.abspath(path) for path in paths]
+        assert probes[os.path.abspath(paths[1])].empty is False
+        assert calls["stat"] == len(paths)
+
+
+class TestBatchValidation:
+    """
+    Tests para la validación de manifiestos con sondeos compartidos
+    
+    DOCTRINA: Validamos entrada del usuario
+    """
+    
+    def test_shared_output_directory_probed_once(self, output, calls, monkeypatch):
+        """Test el espacio libre del directorio de salida se consulta una vez por lote"""
+        disk_usage_calls = []
+        real_disk_usage = directory_probe.shutil.disk_usage
+        monkeypatch.setattr(directory_probe.shutil, "disk_usage",
+                            lambda path: disk_usage_calls.append(path) or real_disk_usage(path))
+        configs = [
+            {"name": f"app-{index}", "template": "minimal", "features": [], "output_path": str(output)}
+            for index in range(20)
+        ] + [{"name": "full", "template": "minimal", "features": [], "output_path": str(output)}]
+        
+        errors = validate_batch(configs)
+        
+        assert list(errors) == ["full"]
+        assert disk_usage_calls == [str(output)]
+        assert calls["stat"] == 1 + len(configs)
+
+
+# Marcadores para tests
+pytestmark = [
+    pytest.mark.unit
+]
@@ -0,0 +1,160 @@
+"""
+Tests para el cálculo de uso de disco de Genesis CLI
+
+DOCTRINA DEL ECOSISTEMA:
+- NO testea lógica de generación
+- NO testea agentes directamente
+- SÍ testea utilities de UX/UI
+- Solo testea funcionalidad de CLI
+"""
+
+import os
+
+import pytest
+
+from genesis_cli import disk_usage
+from genesis_cli.disk_usage import DiskUsageCache, compile_excludes, scan_disk_usage
+from genesis_cli.utils import get_directory_size
+
+
+def _write(root, files):
+    for relative_path, content in files.items():
+        path = root / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "project"
+    _write(root, {
+        "README.md": "x" * 10,
+        "backend/app.py": "x" * 100,
+        "backend/api/routes.py": "x" * 200,
+        "frontend/src/index.ts": "x" * 300,
+        "node_modules/pkg/index.js": "x" * 5000,
+    })
+    return root
+
+
+@pytest.fixture
+def no_racy_window(monkeypatch):
+    """Permitir cachear directorios recién creados"""
+    monkeypatch.setattr(disk_usage, "RACY_WINDOW_NS", 0)
+
+
+class TestScanDiskUsage:
+    """
+    Tests para el recorrido con scandir
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def test_totals_per_top_level_directory(self, project):
+        """Test totales por directorio de primer nivel y archivos de la raíz"""
+        usage = scan_disk_usage(project, workers=4)
+        
+        assert usage.directories == {"backend": 300, "frontend": 300, "node_modules": 5000}
+        assert usage.root_files == 10
+        assert usage.total == 5610
+        assert usage.files == 5
+    
+    def test_matches_get_directory_size(self, project):
+        """Test get_directory_size usa el mismo motor"""
+        assert get_directory_size(project) == scan_disk_usage(project, workers=1).total == 5610
+    
+    def test_exclude_by_name_and_relative_path(self, project):
+        """Test los globs excluyen por nombre o por ruta relativa"""
+        usage = scan_disk_usage(project, exclude=["node_modules", "backend/api"])
+        
+        assert "node_modules" not in usage.directories
+        assert usage.directories["backend"] == 100
+        assert usage.total == 410
+        
+        assert scan_disk_usage(project, exclude=["*.md"]).root_files == 0
+    
+    def test_compile_excludes(self):
+        """Test sin patrones no hay filtro"""
+        assert compile_excludes([]) is None
+        
+        excluded = compile_excludes(["*.pyc", "build/"])
+        assert excluded("mod.pyc", "src/mod.pyc")
+        assert excluded("build", "build")
+        assert not excluded("mod.py", "src/mod.py")
+    
+    def test_directory_symlinks_not_followed(self, project):
+        """Test los enlaces a directorios no se recorren"""
+        try:
+            os.symlink(project / "node_modules", project / "linked")
+        except (OSError, NotImplementedError):
+            pytest.skip("El sistema no permite enlaces simbólicos")
+        
+        assert "linked" not in scan_disk_usage(project).directories
+    
+    def test_missing_root(self, tmp_path):
+        """Test un directorio inexistente mide 0"""
+        assert scan_disk_usage(tmp_path / "missing").total == 0
+
+
+class TestDiskUsageCache:
+    """
+    Tests para la caché por directorio
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def test_second_run_uses_cache(self, project, tmp_path, no_racy_window):
+        """Test la segunda ejecución no vuelve a listar directorios sin cambios"""
+        cache_file = tmp_path / "disk-cache.json"
+        first = scan_disk_usage(project, cache=DiskUsageCache(cache_file))
+        second = scan_disk_usage(project, cache=DiskUsageCache(cache_file))
+        
+        assert first.cached_dirs == 0
+        assert second.scanned_dirs == 0
+        assert second.cached_dirs == first.scanned_dirs
+        assert second.directories == first.directories
+        assert second.total == first.total
+    
+    def test_changed_directory_is_rescanned(self, project, tmp_path, no_racy_window):
+        """Test un directorio cuya mtime cambió se vuelve a listar"""
+        cache = DiskUsageCache(tmp_path / "disk-cache.json")
+        scan_disk_usage(project, cache=cache)
+        
+        new_file = project / "backend" / "api" / "models.py"
+        new_file.write_text("x" * 50)
+        api_dir = project / "backend" / "api"
+        stat = api_dir.stat()
+        os.utime(api_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        usage = scan_disk_usage(project, cache=cache)
+        assert usage.directories["backend"] == 350
+        assert usage.scanned_dirs == 1
+    
+    def test_recent_directories_not_cached(self, project, tmp_path):
+        """Test directorios modificados en la ventana de mtime no se cachean"""
+        cache = DiskUsageCache(tmp_path / "disk-cache.json")
+        scan_disk_usage(project, cache=cache)
+        
+        assert scan_disk_usage(project, cache=cache).cached_dirs == 0
+    
+    def test_excludes_have_separate_entries(self, project, tmp_path, no_racy_window):
+        """Test cambiar los globs no reutiliza tamaños filtrados de otra forma"""
+        cache = DiskUsageCache(tmp_path / "disk-cache.json")
+        scan_disk_usage(project, exclude=["*.py"], cache=cache)
+        
+        usage = scan_disk_usage(project, cache=cache)
+        assert usage.cached_dirs == 0
+        assert usage.total == 5610
+    
+    def test_corrupt_cache_is_ignored(self, project, tmp_path):
+        """Test una caché ilegible se descarta"""
+        cache_file = tmp_path / "disk-cache.json"
+        cache_file.write_text("{no es json")
+        
+        assert scan_disk_usage(project, cache=DiskUsageCache(cache_file)).total == 5610
+
+
+# Marcadores para tests
+pytestmark = [
+    pytest.mark.unit
+]
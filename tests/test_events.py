@@ -0,0 +1,154 @@
+"""
+Tests para los eventos de progreso de generación de Genesis CLI
+
+DOCTRINA DEL ECOSISTEMA:
+- NO testea lógica de generación
+- NO testea agentes directamente
+- SÍ testea progreso y estado visual
+- Solo testea funcionalidad de CLI
+"""
+
+import asyncio
+import io
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from rich.console import Console
+
+from genesis_cli.events import (
+    ProgressEvent, execute_with_progress, supports_event_stream, supports_progress_callback,
+    PHASE_STARTED, FILE_WRITTEN, AGENT_FINISHED
+)
+from genesis_cli.ui.console import GenerationProgress
+
+RESULT = SimpleNamespace(success=True, project_path="/tmp/app", generated_files=["a.py"], data={})
+
+
+class _StreamingOrchestrator:
+    """Orquestador que expone un iterador asíncrono de eventos"""
+    
+    async def stream_project_generation(self, request):
+        yield {"type": "phase_started", "name": "backend", "total": 2}
+        yield {"type": "file_written", "path": "backend/app.py"}
+        yield SimpleNamespace(type="agent_finished", agent="backend")
+        yield {"type": "completed", "result": RESULT}
+
+
+class _CallbackOrchestrator:
+    """Orquestador que acepta un callback de progreso"""
+    
+    async def execute_project_generation(self, request, progress_callback=None):
+        progress_callback({"event": "file-written", "file": "a.py", "total": 1})
+        return RESULT
+
+
+class _PlainOrchestrator:
+    """Orquestador sin soporte de eventos"""
+    
+    async def execute_project_generation(self, request):
+        return RESULT
+
+
+class TestExecuteWithProgress:
+    """
+    Tests para execute_with_progress
+    
+    DOCTRINA: Solo usa genesis-core como interfaz
+    """
+    
+    def _run(self, orchestrator):
+        events = []
+        result = asyncio.run(execute_with_progress(orchestrator, object(), events.append))
+        return result, events
+    
+    def test_event_stream(self):
+        """Test eventos desde un iterador asíncrono"""
+        result, events = self._run(_StreamingOrchestrator())
+        
+        assert result is RESULT
+        assert [event.type for event in events] == [PHASE_STARTED, FILE_WRITTEN, AGENT_FINISHED]
+        assert events[2].name == "backend"
+    
+    def test_progress_callback(self):
+        """Test eventos desde un callback, con claves alternativas normalizadas"""
+        result, events = self._run(_CallbackOrchestrator())
+        
+        assert result is RESULT
+        assert events == [ProgressEvent(type=FILE_WRITTEN, path="a.py", total=1)]
+    
+    def test_plain_orchestrator(self):
+        """Test orquestador sin eventos sigue funcionando"""
+        result, events = self._run(_PlainOrchestrator())
+        
+        assert result is RESULT
+        assert events == []
+    
+    def test_mock_orchestrator_uses_plain_call(self):
+        """Test los Mock no se confunden con orquestadores con eventos"""
+        orchestrator = Mock()
+        orchestrator.execute_project_generation = AsyncMock(return_value=RESULT)
+        
+        assert not supports_event_stream(orchestrator)
+        assert not supports_progress_callback(orchestrator)
+        
+        result, _ = self._run(orchestrator)
+        assert result is RESULT
+        orchestrator.execute_project_generation.assert_called_once()
+        assert orchestrator.execute_project_generation.call_args.kwargs == {}
+
+
+class TestGenerationProgress:
+    """
+    Tests para GenerationProgress
+    
+    DOCTRINA: Mostramos progreso y estado elegante
+    """
+    
+    def _progress(self):
+        return GenerationProgress(console=Console(file=io.StringIO()), auto_refresh=False)
+    
+    def test_events_are_coalesced(self):
+        """Test miles de eventos producen una sola actualización al dibujar"""
+        progress = self._progress()
+        
+        with patch.object(progress, "update", wraps=progress.update) as mock_update:
+            for i in range(5000):
+                progress.handle_event({"type": "file_written", "path": f"f{i}.py", "total": 5000})
+            assert mock_update.call_count == 0
+            
+            list(progress.get_renderables())
+            list(progress.get_renderables())
+        
+        assert mock_update.call_count == 1
+        task = progress.tasks[0]
+        assert task.completed == 5000
+        assert task.total == 5000
+        assert "f4999.py" in task.fields["detail"]
+    
+    def test_phase_progress(self):
+        """Test sin total de archivos la barra avanza por fases"""
+        progress = self._progress()
+        progress.handle_event(ProgressEvent(PHASE_STARTED, name="backend", total=4))
+        progress.handle_event(ProgressEvent(PHASE_STARTED, name="frontend", total=4))
+        progress.handle_event(ProgressEvent(AGENT_FINISHED, name="backend"))
+        list(progress.get_renderables())
+        
+        task = progress.tasks[0]
+        assert task.description == "frontend (2/4)"
+        assert task.completed == 1
+        assert task.total == 4
+        assert progress.agents_finished == ["backend"]
+    
+    def test_unknown_events_are_ignored(self):
+        """Test eventos desconocidos no fuerzan redibujado"""
+        progress = self._progress()
+        progress.handle_event({"type": "heartbeat"})
+        
+        assert progress._pending is False
+
+
+# Marcadores para tests
+pytestmark = [
+    pytest.mark.unit
+]
@@ -0,0 +1,116 @@
+"""
+Tests para el grafo de dependencias entre características de Genesis CLI
+
+DOCTRINA DEL ECOSISTEMA:
+- NO testea lógica de generación
+- NO testea agentes directamente
+- SÍ testea validación de entrada del usuario
+- Solo testea funcionalidad de CLI
+"""
+
+import pytest
+
+from genesis_cli.feature_graph import FeatureGraph
+from genesis_cli.validators import FeatureValidator, resolve_features
+
+
+def _catalog(edges):
+    return {feature: {"dependencies": dependencies} for feature, dependencies in edges.items()}
+
+
+class TestFeatureGraph:
+    """
+    Tests para la compilación y resolución del grafo
+    
+    DOCTRINA: Validamos entrada del usuario
+    """
+    
+    def test_transitive_closure_in_dependency_order(self):
+        """Test payments -> authentication -> database sin listar database"""
+        graph = FeatureGraph.compile(_catalog({
+            "payments": ["authentication"],
+            "authentication": ["database"],
+            "database": [],
+            "api": [],
+        }))
+        
+        assert graph.resolve(["payments"]) == ["database", "authentication", "payments"]
+        assert graph.resolve(["api", "payments", "api"]) == ["database", "authentication", "payments", "api"]
+    
+    def test_order_respects_every_edge(self):
+        """Test cada característica aparece después de sus dependencias"""
+        catalog = _catalog({
+            "e": ["d", "b"],
+            "d": ["c"],
+            "c": ["a"],
+            "b": ["a"],
+            "a": [],
+        })
+        graph = FeatureGraph.compile(catalog)
+        position = {feature: index for index, feature in enumerate(graph.features)}
+        
+        for feature, info in catalog.items():
+            for dependency in info["dependencies"]:
+                assert position[dependency] < position[feature]
+    
+    def test_cycles_are_reported(self):
+        """Test los ciclos se detectan y se resuelven como un bloque"""
+        graph = FeatureGraph.compile(_catalog({
+            "a": ["b"],
+            "b": ["c"],
+            "c": ["a"],
+            "d": ["a"],
+            "self": ["self"],
+            "free": [],
+        }))
+        
+        assert set(graph.resolve(["d"])) == {"a", "b", "c", "d"}
+        assert [set(cycle) for cycle in graph.cycles_in(["d"])] == [{"a", "b", "c"}]
+        assert graph.cycles_in(["self"]) == [("self",)]
+        assert graph.cycles_in(["free"]) == []
+    
+    def test_unknown_features_and_dependencies(self):
+        """Test las dependencias fuera del catálogo se registran y las características desconocidas se conservan"""
+        graph = FeatureGraph.compile(_catalog({"a": ["ghost"], "b": []}))
+        
+        assert graph.missing == {"a": ("ghost",)}
+        assert graph.resolve(["other", "a"]) == ["a", "other"]
+    
+    def test_large_catalog(self):
+        """Test un catálogo de cientos de características en cadena"""
+        size = 600
+        graph = FeatureGraph.compile(_catalog({
+            f"f{index}": [f"f{index - 1}"] if index else [] for index in range(size)
+        }))
+        
+        resolved = graph.resolve([f"f{size - 1}"])
+        assert resolved == [f"f{index}" for index in range(size)]
+        assert graph.cycles == ()
+
+
+class TestFeatureValidatorGraph:
+    """
+    Tests para la integración con FeatureValidator
+    
+    DOCTRINA: Validamos entrada del usuario
+    """
+    
+    def test_resolve_features_includes_transitive_dependencies(self):
+        """Test el orden que recibe genesis-core pone las dependencias primero"""
+        resolved = resolve_features(["payments"])
+        
+        assert resolved.index("database") < resolved.index("authentication") < resolved.index("payments")
+    
+    def test_graph_recompiles_when_catalog_changes(self, monkeypatch):
+        """Test reemplazar VALID_FEATURES recompila el grafo"""
+        monkeypatch.setattr(FeatureValidator, "VALID_FEATURES", _catalog({"a": ["b"], "b": ["a"]}))
+        
+        result = FeatureValidator.validate(["a"])
+        assert not result.is_valid
+        assert "circulares" in str(result.errors)
+
+
+# Marcadores para tests
+pytestmark = [
+    pytest.mark.unit
+]
@@ -0,0 +1,143 @@
+"""
+Tests para el árbol de archivos generados de Genesis CLI
+
+DOCTRINA DEL ECOSISTEMA:
+- NO testea lógica de generación
+- NO testea agentes directamente
+- SÍ testea UI elegante y funcional
+- Solo testea funcionalidad de CLI
+"""
+
+import io
+
+import pytest
+from rich.console import Console
+
+from genesis_cli.ui.console import GenesisUI
+from genesis_cli.ui.file_tree import FileTrie
+
+FILES = [
+    "README.md",
+    "backend/app/main.py",
+    "backend/app/models/user.py",
+    "backend/app/models/order.py",
+    "backend/tests/test_user.py",
+    "frontend/src/pages/[id].tsx",
+    "frontend\\src\\index.tsx",
+    "frontend/src/app.tsx",
+]
+
+
+def _render(renderable) -> str:
+    console = Console(file=io.StringIO(), width=120, color_system=None)
+    console.print(renderable)
+    return console.file.getvalue()
+
+
+class TestFileTrie:
+    """
+    Tests para FileTrie
+    
+    DOCTRINA: Enfocado en UX/UI excelente
+    """
+    
+    def test_counts_per_directory(self):
+        """Test conteo de archivos por subárbol"""
+        trie = FileTrie.from_paths(FILES)
+        
+        assert trie.root.count == 8
+        assert trie.root.files == ["README.md"]
+        assert trie.find("backend").count == 4
+        assert trie.find("backend/app").count == 3
+        assert trie.find("backend/app/models").files == ["user.py", "order.py"]
+        assert trie.find("frontend/src").count == 3
+        assert trie.find("missing") is None
+    
+    def test_largest_directories(self):
+        """Test directorios con más archivos propios"""
+        trie = FileTrie.from_paths(FILES)
+        
+        largest = trie.largest(2)
+        
+        assert [path for path, _ in largest] == ["frontend/src", "backend/app/models"]
+    
+    def test_largest_under_path(self):
+        """Test ranking restringido a un subárbol con rutas completas"""
+        trie = FileTrie.from_paths(FILES)
+        
+        largest = trie.largest(1, trie.find("backend"), "backend")
+        
+        assert largest[0][0] == "backend/app/models"
+    
+    def test_depth_limit(self):
+        """Test los niveles más profundos se muestran contraídos"""
+        trie = FileTrie.from_paths(FILES)
+        
+        output = _render(trie.render(max_depth=1))
+        
+        assert "backend (4 archivos)" in output
+        assert "app" not in output
+        assert "README.md" in output
+    
+    def test_limits_and_markup(self):
+        """Test límites por nivel y nombres con corchetes"""
+        trie = FileTrie.from_paths([f"src/file_{i}.py" for i in range(50)] + ["pages/[id].tsx"])
+        
+        output = _render(trie.render(max_depth=3, max_files=5))
+        
+        assert "... y 45 archivos más" in output
+        assert "[id].tsx" in output
+    
+    def test_render_cost_follows_output(self):
+        """Test el renderizado solo visita lo que se muestra"""
+        trie = FileTrie.from_paths(f"pkg{i}/mod{j}/file.py" for i in range(100) for j in range(100))
+        
+        tree = trie.render(max_depth=1, max_dirs=10)
+        
+        assert len(tree.children) == 11  # 10 directorios + "... y 90 directorios más"
+        assert all(not child.children for child in tree.children)
+
+
+class TestShowFileTree:
+    """
+    Tests para GenesisUI.show_file_tree
+    
+    DOCTRINA: Enfocado en UX/UI excelente
+    """
+    
+    def _ui(self):
+        ui = GenesisUI()
+        ui.console = Console(file=io.StringIO(), width=120, color_system=None)
+        return ui
+    
+    def test_path_filter(self):
+        """Test filtro por directorio"""
+        ui = self._ui()
+        ui.show_file_tree(FILES, path="backend/app")
+        output = ui.console.file.getvalue()
+        
+        assert "Archivos generados en backend/app (3)" in output
+        assert "models (2 archivos)" in output
+        assert "frontend" not in output
+    
+    def test_top_view(self):
+        """Test vista de directorios más grandes"""
+        ui = self._ui()
+        ui.show_file_tree(FILES, top=1)
+        output = ui.console.file.getvalue()
+        
+        assert "frontend/src" in output
+        assert "backend/app/models" not in output
+    
+    def test_unknown_path(self):
+        """Test directorio sin archivos generados"""
+        ui = self._ui()
+        ui.show_file_tree(FILES, path="docs")
+        
+        assert "No hay archivos generados en 'docs'" in ui.console.file.getvalue()
+
+
+# Marcadores para tests
+pytestmark = [
+    pytest.mark.unit
+]
@@ -0,0 +1,299 @@
+"""
+Tests para la lectura de logs de Genesis CLI
+
+DOCTRINA DEL ECOSISTEMA:
+- NO testea lógica de generación
+- NO testea agentes directamente
+- SÍ testea funcionalidad de CLI
+- Solo testea funcionalidad de CLI
+"""
+
+import gzip
+import importlib
+import io
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+from typer.testing import CliRunner
+
+from genesis_cli import log_reader
+from genesis_cli.log_reader import (
+    DirectoryWatcher,
+    EntryFilter,
+    LogIndex,
+    follow_lines,
+    parse_header,
+    parse_since,
+    read_last_lines,
+    search_logs,
+    tail_lines,
+)
+
+cli_logging = importlib.import_module("genesis_cli.logging")
+
+BASE = datetime(2026, 10, 17, 10, 0, 0).timestamp()
+
+
+def text_line(timestamp, level, message):
+    stamp = datetime.fromtimestamp(timestamp)
+    return f"{stamp:%Y-%m-%d %H:%M:%S},{stamp.microsecond // 1000:03d} - genesis-cli - {level} - {message}"
+
+
+def json_line(timestamp, level, message):
+    ts = datetime.fromtimestamp(timestamp, timezone.utc).isoformat(timespec="milliseconds")
+    return json.dumps({"ts": ts, "level": level, "msg": message})
+
+
+@pytest.fixture
+def logs(tmp_path):
+    """Dos segmentos comprimidos (horas 0 y 1) y el archivo activo (hora 2)"""
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    for hour in range(2):
+        lines = [text_line(BASE + hour * 3600 + minute * 60, "INFO", f"h{hour} m{minute}") for minute in range(60)]
+        with gzip.open(log_dir / f"genesis-cli.2026101{hour}T000000000000-1.log.gz", "wt") as f:
+            f.write("\n".join(lines) + "\n")
+    active = [text_line(BASE + 7200 + minute * 60, "WARNING" if minute % 10 == 0 else "INFO", f"h2 m{minute}")
+              for minute in range(60)]
+    (log_dir / "genesis-cli.log").write_text("\n".join(active) + "\n")
+    return log_dir
+
+
+class TestParsing:
+    """
+    Tests para reconocer registros y fechas
+    
+    DOCTRINA: Validamos entrada del usuario
+    """
+    
+    def test_both_formats(self):
+        """Test hora y nivel en texto y en JSONL; las trazas no empiezan registro"""
+        assert parse_header(text_line(BASE, "ERROR", "x")) == (BASE, "ERROR")
+        assert parse_header(json_line(BASE, "INFO", "x")) == (BASE, "INFO")
+        assert parse_header("Traceback (most recent call last):") is None
+        assert parse_header("{no es json") is None
+    
+    def test_since(self):
+        """Test antigüedades y fechas ISO"""
+        assert parse_since("30m", now=BASE) == BASE - 1800
+        assert parse_since("2h", now=BASE) == BASE - 7200
+        assert parse_since("2026-10-17 10:00") == BASE
+        with pytest.raises(ValueError):
+            parse_since("ayer")
+
+
+class TestTail:
+    """
+    Tests para leer las últimas líneas desde el final
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def test_reads_only_the_end(self, tmp_path, monkeypatch):
+        """Test se leen bloques desde el final, no el archivo entero"""
+        log_file = tmp_path / "genesis-cli.log"
+        log_file.write_text("".join(f"línea {index}\n" for index in range(100_000)))
+        
+        assert tail_lines(log_file, 3, block_size=64) == ["línea 99997", "línea 99998", "línea 99999"]
+        
+        read = []
+        
+        class CountingFile(io.FileIO):
+            def read(self, size=-1):
+                read.append(size)
+                return super().read(size)
+        
+        monkeypatch.setattr(log_reader, "open", lambda path, mode: CountingFile(path), raising=False)
+        assert len(tail_lines(log_file, 10, block_size=4096)) == 10
+        assert sum(read) == 4096
+    
+    def test_short_file_and_missing_newline(self, tmp_path):
+        """Test archivo con menos líneas que las pedidas y sin salto final"""
+        log_file = tmp_path / "genesis-cli.log"
+        log_file.write_text("uno\ndos")
+        
+        assert tail_lines(log_file, 10) == ["uno", "dos"]
+    
+    def test_continues_into_rotated_segments(self, logs):
+        """Test si el archivo activo no basta se siguen los segmentos anteriores"""
+        lines = read_last_lines(logs, 62)
+        
+        assert lines[0].endswith("h1 m58")
+        assert lines[-1].endswith("h2 m59")
+    
+    def test_recent_logs_uses_tail(self, logs, monkeypatch):
+        """Test get_recent_logs devuelve las últimas líneas con su salto"""
+        monkeypatch.setattr(cli_logging, "LOG_DIR", logs)
+        
+        assert cli_logging.get_recent_logs(2).splitlines()[-1].endswith("h2 m59")
+        assert cli_logging.get_recent_logs(2).count("\n") == 2
+
+
+class TestSearch:
+    """
+    Tests para las búsquedas con --since, --level y --grep
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def test_level_and_grep(self, logs, tmp_path):
+        """Test nivel mínimo y expresión regular en todos los archivos"""
+        entries = list(search_logs(logs, EntryFilter(level="warning", pattern=r"m[12]0$"), LogIndex(tmp_path / "index.json")))
+        
+        assert [entry.text.split(" - ")[-1] for entry in entries] == ["h2 m10", "h2 m20"]
+    
+    def test_traceback_belongs_to_record(self, tmp_path):
+        """Test las líneas de una traza se filtran con su registro"""
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+        (log_dir / "genesis-cli.log").write_text("\n".join([
+            text_line(BASE, "INFO", "bien"),
+            text_line(BASE + 1, "ERROR", "falló"),
+            "Traceback (most recent call last):",
+            "ValueError: roto",
+            json_line(BASE + 2, "INFO", "sigue"),
+        ]) + "\n")
+        
+        entries = list(search_logs(log_dir, EntryFilter(pattern="ValueError"), LogIndex(tmp_path / "index.json")))
+        
+        assert len(entries) == 1
+        assert entries[0].level == "ERROR"
+        assert entries[0].lines[-1] == "ValueError: roto"
+    
+    def test_since_skips_old_segments(self, logs, tmp_path, monkeypatch):
+        """Test los segmentos anteriores a --since no se vuelven a leer"""
+        index = LogIndex(tmp_path / "index.json")
+        list(search_logs(logs, EntryFilter(since=BASE + 7200), index))
+        
+        opened = []
+        real_file_lines = log_reader._file_lines
+        monkeypatch.setattr(log_reader, "_file_lines",
+                            lambda path, offset: opened.append(path.name) or real_file_lines(path, offset))
+        entries = list(search_logs(logs, EntryFilter(since=BASE + 7200 + 30 * 60), LogIndex(tmp_path / "index.json")))
+        
+        assert opened == ["genesis-cli.log"]
+        assert entries[0].text.endswith("h2 m30") and len(entries) == 30
+    
+    def test_index_jumps_inside_active_file(self, tmp_path):
+        """Test --since empieza a leer cerca del punto del índice"""
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+        log_file = log_dir / "genesis-cli.log"
+        log_file.write_text("".join(text_line(BASE + second, "INFO", f"s{second}") + "\n" for second in range(10_000)))
+        index = LogIndex(tmp_path / "index.json", stride=4096)
+        
+        entry = index.lookup(log_file)
+        offset = index.start_offset(entry, BASE + 9_000)
+        
+        with open(log_file, "rb") as f:
+            f.seek(offset)
+            first = parse_header(f.readline().decode())[0]
+        assert BASE + 9_000 - 100 < first <= BASE + 9_000
+        assert [e.text for e in search_logs(log_dir, EntryFilter(since=BASE + 9_998), index)][0].endswith("s9998")
+    
+    def test_index_extended_incrementally(self, tmp_path):
+        """Test el archivo activo solo se indexa desde donde se quedó"""
+        log_file = tmp_path / "genesis-cli.log"
+        log_file.write_text(text_line(BASE, "INFO", "uno") + "\n")
+        index = LogIndex(tmp_path / "index.json")
+        index.lookup(log_file)
+        index.save()
+        
+        with open(log_file, "a") as f:
+            f.write(text_line(BASE + 60, "INFO", "dos") + "\n" + "a medio")
+        reloaded = LogIndex(tmp_path / "index.json")
+        entry = reloaded.lookup(log_file)
+        
+        assert entry["max"] == BASE + 60
+        assert entry["indexed"] == os.path.getsize(log_file) - len("a medio")
+    
+    def test_disordered_writers(self, tmp_path):
+        """Test con horas desordenadas no se pierde ningún registro posterior a --since"""
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+        seconds = [second + (5 if second % 7 == 0 else 0) for second in range(2_000)]
+        (log_dir / "genesis-cli.log").write_text("".join(text_line(BASE + s, "INFO", f"s{s}") + "\n" for s in seconds))
+        
+        entries = list(search_logs(log_dir, EntryFilter(since=BASE + 1_500), LogIndex(tmp_path / "i.json", stride=512)))
+        
+        assert len(entries) == sum(1 for s in seconds if s >= 1_500)
+
+
+class TestFollow:
+    """
+    Tests para seguir el archivo de log
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    @pytest.mark.parametrize("use_inotify", [False, True])
+    def test_streams_new_lines_across_rotation(self, tmp_path, use_inotify):
+        """Test las líneas nuevas llegan, también tras rotar el archivo"""
+        log_file = tmp_path / "genesis-cli.log"
+        log_file.write_text("antigua\n")
+        watcher = DirectoryWatcher(tmp_path, poll_interval=0.01, use_inotify=use_inotify)
+        
+        def writer():
+            time.sleep(0.1)
+            with open(log_file, "a") as f:
+                f.write("uno\ndo")
+                f.flush()
+                time.sleep(0.05)
+                f.write("s\n")
+            os.replace(log_file, tmp_path / "genesis-cli.rotado-1.log")
+            log_file.write_text("tres\n")
+        
+        thread = threading.Thread(target=writer)
+        thread.start()
+        received = []
+        for line in follow_lines(log_file, watcher):
+            received.append(line)
+            if len(received) == 3:
+                break
+        thread.join()
+        
+        assert received == ["uno", "dos", "tres"]
+
+
+class TestLogsCommand:
+    """
+    Tests para `genesis logs`
+    
+    DOCTRINA: Validamos entrada del usuario
+    """
+    
+    def test_tail_and_filters(self, logs, tmp_path, monkeypatch):
+        """Test -n y --level sobre el directorio de logs"""
+        from genesis_cli.main import app
+        
+        monkeypatch.setattr(cli_logging, "LOG_DIR", logs)
+        monkeypatch.setattr(log_reader, "LOG_INDEX_FILE", tmp_path / "index.json")
+        runner = CliRunner()
+        
+        result = runner.invoke(app, ["logs", "-n", "2"])
+        assert result.exit_code == 0
+        assert result.output.splitlines()[-1].endswith("h2 m59")
+        
+        result = runner.invoke(app, ["logs", "--level", "WARNING", "-n", "1"])
+        assert result.output.strip().endswith("h2 m50")
+    
+    def test_invalid_options(self, logs, monkeypatch):
+        """Test nivel, fecha y expresión no válidos"""
+        from genesis_cli.main import app
+        
+        monkeypatch.setattr(cli_logging, "LOG_DIR", logs)
+        runner = CliRunner()
+        
+        assert runner.invoke(app, ["logs", "--level", "LOUD"]).exit_code == 2
+        assert runner.invoke(app, ["logs", "--since", "ayer"]).exit_code == 2
+        assert runner.invoke(app, ["logs", "--grep", "("]).exit_code == 2
+
+
+# Marcadores para tests
+pytestmark = [
+    pytest.mark.unit
+]
@@ -0,0 +1,376 @@
+"""
+Tests para el logging de Genesis CLI
+
+DOCTRINA DEL ECOSISTEMA:
+- NO testea lógica de generación
+- NO testea agentes directamente
+- SÍ testea funcionalidad de CLI
+- Solo testea funcionalidad de CLI
+"""
+
+import gzip
+import importlib
+import json
+import logging
+import os
+import threading
+import time
+
+import pytest
+
+from genesis_cli.logging import (
+    GenesisCliFormatter,
+    GenesisCliLogger,
+    JsonLinesFormatter,
+    LogPipeline,
+    LogSegmentCompressor,
+    RotatingLogFileHandler,
+    enforce_log_retention,
+)
+
+# El paquete expone como `logging` el módulo estándar: se toma el de la CLI
+cli_logging = importlib.import_module("genesis_cli.logging")
+
+
+class RecordingHandler(logging.Handler):
+    """Guarda los registros y el hilo que los escribió"""
+    
+    def __init__(self, formatter=None):
+        super().__init__()
+        self.records = []
+        self.lines = []
+        self.threads = set()
+        if formatter is not None:
+            self.setFormatter(formatter)
+    
+    def emit(self, record):
+        self.records.append(record)
+        self.lines.append(self.format(record))
+        self.threads.add(threading.current_thread().name)
+
+
+def make_record(level=logging.INFO, msg="mensaje", args=None, exc_info=None):
+    return logging.LogRecord("genesis-cli", level, __file__, 1, msg, args, exc_info)
+
+
+def read_segment(path):
+    opener = gzip.open if path.name.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        return f.read().splitlines()
+
+
+@pytest.fixture
+def pipeline():
+    handler = RecordingHandler(logging.Formatter(cli_logging.FILE_LOG_FORMAT))
+    pipeline = LogPipeline([handler])
+    yield pipeline, handler
+    pipeline.stop()
+
+
+class TestGenesisCliFormatter:
+    """
+    Tests para el formato de la consola
+    
+    DOCTRINA: Enfocado en UX/UI elegante
+    """
+    
+    def test_markup_per_level(self):
+        """Test icono y color según el nivel"""
+        formatter = GenesisCliFormatter(show_time=False)
+        
+        assert formatter.format(make_record(logging.ERROR, "falló")) == "[red]❌ falló[/red]"
+        assert formatter.format(make_record(logging.INFO, "hola")) == "[cyan]ℹ️ hola[/cyan]"
+        assert formatter.format(make_record(25, "otro")) == "[white]• otro[/white]"
+    
+    def test_time_only_below_warning_in_debug(self):
+        """Test la hora se muestra en modo debug salvo en avisos y errores"""
+        formatter = GenesisCliFormatter(show_time=True)
+        
+        assert formatter.format(make_record(logging.INFO)).startswith("[dim]")
+        assert formatter.format(make_record(logging.WARNING)).startswith("[yellow]")
+
+
+class TestLogPipeline:
+    """
+    Tests para la cola de logging
+    
+    DOCTRINA: Enfocado en UX/UI elegante
+    """
+    
+    def test_records_written_off_caller_thread(self, pipeline):
+        """Test los handlers escriben desde el hilo de la cola"""
+        pipeline, handler = pipeline
+        logger = logging.getLogger("genesis-cli.test.pipeline")
+        logger.propagate = False
+        logger.addHandler(pipeline.handler)
+        pipeline.start()
+        
+        for index in range(100):
+            logger.warning("registro %d", index)
+        pipeline.flush()
+        
+        assert len(handler.records) == 100
+        assert threading.current_thread().name not in handler.threads
+        logger.removeHandler(pipeline.handler)
+    
+    def test_message_resolved_when_emitted(self, pipeline):
+        """Test los argumentos se resuelven al emitir, no al escribir"""
+        pipeline, handler = pipeline
+        values = ["antes"]
+        
+        pipeline.handler.handle(make_record(msg="valor %s", args=(values,)))
+        values[0] = "después"
+        pipeline.start()
+        pipeline.flush()
+        
+        assert handler.records[0].getMessage() == "valor ['antes']"
+    
+    def test_traceback_kept_for_file(self, pipeline):
+        """Test la traza llega al archivo sin mezclarse en el mensaje"""
+        pipeline, handler = pipeline
+        try:
+            raise ValueError("roto")
+        except ValueError:
+            import sys
+            pipeline.handler.handle(make_record(logging.ERROR, "falló", exc_info=sys.exc_info()))
+        pipeline.start()
+        pipeline.flush()
+        
+        assert handler.records[0].getMessage() == "falló"
+        assert "ValueError: roto" in handler.lines[0]
+    
+    def test_full_queue_drops_low_levels(self, monkeypatch):
+        """Test con la cola llena se descartan DEBUG e INFO y se cuentan"""
+        monkeypatch.setattr(cli_logging, "LOG_QUEUE_TIMEOUT", 0.01)
+        handler = RecordingHandler()
+        pipeline = LogPipeline([handler], maxsize=2)
+        
+        for level in (logging.INFO, logging.INFO, logging.DEBUG, logging.INFO, logging.ERROR):
+            pipeline.handler.handle(make_record(level))
+        pipeline.start()
+        pipeline.stop()
+        
+        assert len(handler.records) == 2
+        assert pipeline.dropped == 3
+    
+    def test_stop_drains_queue(self, pipeline):
+        """Test detener escribe todo lo encolado"""
+        pipeline, handler = pipeline
+        pipeline.start()
+        for _ in range(500):
+            pipeline.handler.handle(make_record())
+        pipeline.stop()
+        
+        assert len(handler.records) == 500
+        assert not pipeline.running
+
+
+class TestGenesisCliLogger:
+    """
+    Tests para el logger principal
+    
+    DOCTRINA: Enfocado en UX/UI elegante
+    """
+    
+    def test_debug_mode_writes_file_through_queue(self, tmp_path, monkeypatch):
+        """Test en modo debug el archivo se escribe desde la cola"""
+        monkeypatch.setattr(cli_logging, "LOG_DIR", tmp_path / "logs")
+        monkeypatch.setattr(cli_logging, "is_debug_mode", lambda: True)
+        logger = GenesisCliLogger("genesis-cli.test.debug")
+        
+        logger.error("algo falló")
+        logger.pipeline.stop()
+        
+        log_file = tmp_path / "logs" / "genesis-cli.log"
+        assert "ERROR - algo falló" in log_file.read_text()
+        assert logger.logger.handlers == [logger.pipeline.handler]
+    
+    def test_setup_replaces_previous_pipeline(self, monkeypatch):
+        """Test reconfigurar detiene la cola anterior"""
+        monkeypatch.setattr(cli_logging, "is_debug_mode", lambda: False)
+        logger = GenesisCliLogger("genesis-cli.test.reset")
+        previous = logger.pipeline
+        
+        logger._setup_logger()
+        
+        assert not previous.running
+        assert logger.pipeline.running
+        logger.pipeline.stop()
+    
+    def test_jsonl_format(self, tmp_path, monkeypatch):
+        """Test con log_format = "jsonl" el archivo tiene un objeto por línea"""
+        monkeypatch.setattr(cli_logging, "LOG_DIR", tmp_path / "logs")
+        monkeypatch.setattr(cli_logging, "is_debug_mode", lambda: True)
+        monkeypatch.setattr(cli_logging, "get_log_format", lambda: "jsonl")
+        logger = GenesisCliLogger("genesis-cli.test.jsonl")
+        
+        logger.info("uno")
+        logger.warning("dos")
+        logger.pipeline.stop()
+        logger.compressor.wait(5)
+        
+        entries = [json.loads(line) for line in read_segment(tmp_path / "logs" / "genesis-cli.log")]
+        assert [entry["msg"] for entry in entries] == ["uno", "dos"]
+        assert {entry["command_id"] for entry in entries} == {cli_logging.COMMAND_ID}
+
+
+class TestJsonLinesFormatter:
+    """
+    Tests para el formato JSONL del archivo de log
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def test_fields(self):
+        """Test hora, nivel, ejecución y mensaje"""
+        entry = json.loads(JsonLinesFormatter().format(make_record(logging.WARNING, "hola %s", ("mundo",))))
+        
+        assert entry["level"] == "WARNING"
+        assert entry["msg"] == "hola mundo"
+        assert entry["command_id"] == cli_logging.COMMAND_ID
+        assert entry["ts"].endswith("+00:00")
+        assert entry["elapsed_ms"] >= 0
+        assert "duration_ms" not in entry
+    
+    def test_command_from_cli_callback(self, monkeypatch):
+        """Test el callback principal registra el comando y el origen de elapsed_ms"""
+        from typer.testing import CliRunner
+        from genesis_cli import current_command
+        from genesis_cli.main import app
+        
+        monkeypatch.setitem(current_command, "name", None)
+        monkeypatch.setitem(current_command, "started", 0.0)
+        
+        assert CliRunner().invoke(app, ["help"]).exit_code == 0
+        entry = json.loads(JsonLinesFormatter().format(make_record(logging.INFO, "hecho")))
+        
+        assert entry["command"] == "help"
+        assert 0 <= entry["elapsed_ms"] < 60_000
+    
+    def test_duration_and_traceback(self):
+        """Test la duración y la traza se guardan en sus propios campos"""
+        try:
+            raise ValueError("roto")
+        except ValueError:
+            import sys
+            record = make_record(logging.ERROR, "falló", exc_info=sys.exc_info())
+        record.duration = 0.25
+        
+        entry = json.loads(JsonLinesFormatter().format(record))
+        
+        assert entry["duration_ms"] == 250.0
+        assert "ValueError: roto" in entry["exc"]
+        assert "\n" not in JsonLinesFormatter().format(record)
+    
+    def test_log_context_records_duration(self, pipeline, monkeypatch):
+        """Test LogContext añade la duración al registro de cierre"""
+        pipeline, handler = pipeline
+        logger = GenesisCliLogger("genesis-cli.test.context")
+        logger.pipeline.stop()
+        logger.logger.handlers = [pipeline.handler]
+        monkeypatch.setattr(cli_logging, "cli_logger", logger)
+        pipeline.start()
+        
+        with cli_logging.LogContext("Instalando"):
+            pass
+        pipeline.flush()
+        
+        assert handler.records[-1].duration >= 0
+
+
+class TestLogRotation:
+    """
+    Tests para la rotación, compresión y retención del archivo de log
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def make_handler(self, log_dir, max_bytes=500, retention_bytes=0, retention_days=0):
+        compressor = LogSegmentCompressor(log_dir, retention_bytes, retention_days)
+        handler = RotatingLogFileHandler(log_dir / "genesis-cli.log", max_bytes, compressor)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        return handler, compressor
+    
+    def test_rotates_and_compresses_without_losing_records(self, tmp_path):
+        """Test los segmentos rotados se comprimen y conservan todas las líneas"""
+        handler, compressor = self.make_handler(tmp_path)
+        
+        for index in range(200):
+            handler.emit(make_record(msg=f"registro {index:04d}"))
+        handler.close()
+        assert compressor.wait(10)
+        
+        segments = sorted(path for path in tmp_path.iterdir() if path.name != "genesis-cli.log")
+        assert segments and all(path.name.endswith(".log.gz") for path in segments)
+        lines = [line for path in segments for line in read_segment(path)]
+        lines += read_segment(tmp_path / "genesis-cli.log")
+        assert lines == [f"registro {index:04d}" for index in range(200)]
+        assert os.path.getsize(tmp_path / "genesis-cli.log") <= 500
+    
+    def test_leftover_segments_compressed_by_next_run(self, tmp_path):
+        """Test un segmento sin comprimir de otra ejecución se comprime"""
+        (tmp_path / "genesis-cli.20260101T000000000000-1.log").write_text("viejo\n")
+        
+        compressor = LogSegmentCompressor(tmp_path, 0, 0)
+        compressor.submit()
+        assert compressor.wait(10)
+        
+        assert read_segment(tmp_path / "genesis-cli.20260101T000000000000-1.log.gz") == ["viejo"]
+        assert not (tmp_path / "genesis-cli.20260101T000000000000-1.log").exists()
+    
+    def test_reopens_file_rotated_by_other_process(self, tmp_path):
+        """Test si otro proceso rota el archivo se escribe en el nuevo"""
+        handler, _ = self.make_handler(tmp_path, max_bytes=10_000)
+        handler.emit(make_record(msg="antes"))
+        os.replace(tmp_path / "genesis-cli.log", tmp_path / "genesis-cli.otro-1.log")
+        
+        handler.emit(make_record(msg="después"))
+        handler.close()
+        
+        assert read_segment(tmp_path / "genesis-cli.log") == ["después"]
+        assert read_segment(tmp_path / "genesis-cli.otro-1.log") == ["antes"]
+    
+    def test_retention_by_total_bytes(self, tmp_path):
+        """Test se borran los segmentos más antiguos hasta respetar el tamaño total"""
+        (tmp_path / "genesis-cli.log").write_bytes(b"x" * 100)
+        now = time.time()
+        for index in range(5):
+            segment = tmp_path / f"genesis-cli.{index}.log.gz"
+            segment.write_bytes(b"x" * 100)
+            os.utime(segment, (now - 100 + index, now - 100 + index))
+        (tmp_path / "other.txt").write_bytes(b"x" * 1000)
+        
+        enforce_log_retention(tmp_path, 350, 0)
+        
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "genesis-cli.3.log.gz", "genesis-cli.4.log.gz", "genesis-cli.log", "other.txt"
+        ]
+    
+    def test_retention_by_age(self, tmp_path):
+        """Test se borran los segmentos más antiguos que la retención en días"""
+        old = tmp_path / "genesis-cli.old.log.gz"
+        new = tmp_path / "genesis-cli.new.log.gz"
+        old.write_bytes(b"x")
+        new.write_bytes(b"x")
+        os.utime(old, (time.time() - 10 * 86400,) * 2)
+        
+        enforce_log_retention(tmp_path, 0, 7)
+        
+        assert not old.exists() and new.exists()
+    
+    def test_cleanup_old_logs_never_removes_active_file(self, tmp_path, monkeypatch):
+        """Test cleanup_old_logs aplica la retención sin tocar el archivo activo"""
+        monkeypatch.setattr(cli_logging, "LOG_DIR", tmp_path)
+        active = tmp_path / "genesis-cli.log"
+        active.write_text("activo")
+        os.utime(active, (time.time() - 30 * 86400,) * 2)
+        
+        cli_logging.cleanup_old_logs(days=7)
+        
+        assert active.exists()
+
+
+# Marcadores para tests
+pytestmark = [
+    pytest.mark.unit
+]
@@ -0,0 +1,216 @@
+"""
+Tests para la verificación de herramientas de Genesis CLI
+
+DOCTRINA DEL ECOSISTEMA:
+- NO testea lógica de generación
+- NO testea agentes directamente
+- SÍ testea validación del entorno
+- Solo testea funcionalidad de CLI
+"""
+
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+from genesis_cli.probes import ToolProbe, ProbeResult, ProbeCache, run_probes
+
+
+def _python_probe(name: str, code: str, required: bool = True) -> ToolProbe:
+    """Crear probe que ejecuta código Python"""
+    return ToolProbe(name, (sys.executable, "-c", code), required=required)
+
+
+class TestRunProbes:
+    """
+    Tests para run_probes
+    
+    DOCTRINA: Validamos entorno del usuario
+    """
+    
+    def test_probe_installed_with_version(self):
+        """Test herramienta instalada devuelve versión de la misma ejecución"""
+        probe = _python_probe("Tool", "print('tool 1.2.3')")
+        results = run_probes([probe], timeout=10)
+        
+        assert results["Tool"].installed is True
+        assert results["Tool"].version == "tool 1.2.3"
+        assert results["Tool"].path is not None
+    
+    def test_probe_version_from_stderr(self):
+        """Test versión escrita en stderr (p.ej. java -version)"""
+        probe = _python_probe("Tool", "import sys; sys.stderr.write('v9\\n')")
+        results = run_probes([probe], timeout=10)
+        
+        assert results["Tool"].version == "v9"
+    
+    def test_probe_nonzero_exit(self):
+        """Test herramienta con código de salida distinto de cero"""
+        probe = _python_probe("Tool", "import sys; sys.exit(3)")
+        results = run_probes([probe], timeout=10)
+        
+        assert results["Tool"].installed is False
+        assert results["Tool"].version is None
+    
+    def test_probe_missing_binary_is_not_spawned(self):
+        """Test binario inexistente no lanza proceso"""
+        probe = ToolProbe("Missing", ("genesis-binario-inexistente", "--version"))
+        
+        with patch("genesis_cli.probes.subprocess.Popen") as mock_popen:
+            results = run_probes([probe], timeout=10)
+        
+        mock_popen.assert_not_called()
+        assert results["Missing"].installed is False
+        assert results["Missing"].required is True
+    
+    def test_probe_spawns_each_binary_once(self):
+        """Test cada binario se ejecuta una sola vez"""
+        probes = [_python_probe("A", "print(1)"), _python_probe("B", "print(2)")]
+        
+        with patch("genesis_cli.probes.subprocess.Popen", wraps=__import__("subprocess").Popen) as mock_popen:
+            run_probes(probes, timeout=10)
+        
+        assert mock_popen.call_count == 2
+    
+    def test_probes_run_concurrently(self):
+        """Test las herramientas se verifican en paralelo"""
+        probes = [_python_probe(f"Slow{i}", "import time; time.sleep(0.5)") for i in range(4)]
+        
+        start = time.monotonic()
+        results = run_probes(probes, timeout=10)
+        elapsed = time.monotonic() - start
+        
+        assert all(result.installed for result in results.values())
+        assert elapsed < 1.5  # En serie serían al menos 2 segundos
+    
+    def test_global_budget(self):
+        """Test presupuesto global para toda la verificación"""
+        probes = [
+            _python_probe("Hang1", "import time; time.sleep(30)"),
+            _python_probe("Hang2", "import time; time.sleep(30)"),
+            _python_probe("Fast", "print('ok')"),
+        ]
+        
+        start = time.monotonic()
+        results = run_probes(probes, timeout=1.0)
+        elapsed = time.monotonic() - start
+        
+        assert elapsed < 5
+        assert results["Hang1"].installed is False
+        assert "Sin respuesta" in results["Hang1"].error
+        assert results["Hang2"].installed is False
+    
+    def test_results_keep_probe_order(self):
+        """Test resultados en el orden de las herramientas"""
+        probes = [
+            ToolProbe("Missing", ("genesis-binario-inexistente",)),
+            _python_probe("Present", "print(1)"),
+        ]
+        results = run_probes(probes, timeout=10)
+        
+        assert list(results) == ["Missing", "Present"]
+    
+    def test_probe_result_to_dict(self):
+        """Test formato compatible con GenesisUI.show_dependency_check"""
+        result = ProbeResult("Git", required=True, installed=True, version="git 2.0")
+        data = result.to_dict()
+        
+        assert data["installed"] is True
+        assert data["required"] is True
+        assert data["version"] == "git 2.0"
+
+
+
+class TestProbeCache:
+    """
+    Tests para ProbeCache
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def _run(self, cache, probe, refresh=False):
+        with patch("genesis_cli.probes.subprocess.Popen", wraps=__import__("subprocess").Popen) as mock_popen:
+            results = run_probes([probe], timeout=10, cache=cache, refresh=refresh)
+        return results[probe.name], mock_popen.call_count
+    
+    def test_cache_hit_skips_subprocess(self, tmp_path):
+        """Test un resultado en caché no ejecuta el binario"""
+        probe = _python_probe("Tool", "print('1.0')")
+        
+        first, spawned = self._run(ProbeCache(tmp_path / "cache.json"), probe)
+        assert spawned == 1
+        
+        second, spawned = self._run(ProbeCache(tmp_path / "cache.json"), probe)
+        assert spawned == 0
+        assert second.installed is True
+        assert second.version == "1.0"
+    
+    def test_refresh_forces_probe(self, tmp_path):
+        """Test refresh ignora la caché"""
+        probe = _python_probe("Tool", "print('1.0')")
+        self._run(ProbeCache(tmp_path / "cache.json"), probe)
+        
+        _, spawned = self._run(ProbeCache(tmp_path / "cache.json"), probe, refresh=True)
+        assert spawned == 1
+    
+    def test_path_change_invalidates(self, tmp_path, monkeypatch):
+        """Test cambiar $PATH invalida la caché"""
+        probe = _python_probe("Tool", "print('1.0')")
+        self._run(ProbeCache(tmp_path / "cache.json"), probe)
+        
+        monkeypatch.setenv("PATH", str(tmp_path) + ":" + __import__("os").environ.get("PATH", ""))
+        _, spawned = self._run(ProbeCache(tmp_path / "cache.json"), probe)
+        assert spawned == 1
+    
+    def test_binary_change_invalidates(self, tmp_path):
+        """Test cambiar el binario (mtime/tamaño) invalida la caché"""
+        import os
+        import stat
+        
+        tool = tmp_path / "fake-tool"
+        tool.write_text(f"#!{sys.executable}\nprint('v1')\n")
+        tool.chmod(tool.stat().st_mode | stat.S_IEXEC)
+        probe = ToolProbe("Fake", (str(tool), "--version"))
+        
+        self._run(ProbeCache(tmp_path / "cache.json"), probe)
+        _, spawned = self._run(ProbeCache(tmp_path / "cache.json"), probe)
+        assert spawned == 0
+        
+        tool.write_text(f"#!{sys.executable}\nprint('v2.0')\n")
+        os.utime(tool, ns=(0, 10 ** 9))
+        result, spawned = self._run(ProbeCache(tmp_path / "cache.json"), probe)
+        assert spawned == 1
+        assert result.version == "v2.0"
+    
+    def test_expired_entry(self, tmp_path):
+        """Test entradas vencidas se vuelven a verificar"""
+        probe = _python_probe("Tool", "print('1.0')")
+        self._run(ProbeCache(tmp_path / "cache.json"), probe)
+        
+        _, spawned = self._run(ProbeCache(tmp_path / "cache.json", ttl=0), probe)
+        assert spawned == 1
+    
+    def test_failures_are_not_cached(self, tmp_path):
+        """Test verificaciones fallidas no se guardan"""
+        probe = _python_probe("Tool", "import sys; sys.exit(1)")
+        self._run(ProbeCache(tmp_path / "cache.json"), probe)
+        
+        _, spawned = self._run(ProbeCache(tmp_path / "cache.json"), probe)
+        assert spawned == 1
+    
+    def test_corrupt_cache_file(self, tmp_path):
+        """Test caché corrupta se ignora"""
+        cache_file = tmp_path / "cache.json"
+        cache_file.write_text("{ no es json")
+        probe = _python_probe("Tool", "print('1.0')")
+        
+        result, spawned = self._run(ProbeCache(cache_file), probe)
+        assert spawned == 1
+        assert result.installed is True
+
+
+# Marcadores para tests
+pytestmark = [
+    pytest.mark.unit
+]
@@ -0,0 +1,166 @@
+"""
+Tests para el perfilado de comandos de Genesis CLI
+
+DOCTRINA DEL ECOSISTEMA:
+- NO testea lógica de generación
+- NO testea agentes directamente
+- SÍ testea funcionalidad de CLI
+- Solo testea funcionalidad de CLI
+"""
+
+import io
+import os
+import sys
+import threading
+import time
+
+import pytest
+from rich.console import Console
+from typer.testing import CliRunner
+
+from genesis_cli import profiling
+from genesis_cli.profiling import ProfileSession, SamplingProfiler, load_profile, prune_profiles
+
+
+def busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def names(stats):
+    return {function[2] for function in stats.stats}
+
+
+@pytest.fixture
+def report(monkeypatch):
+    """Capturar el informe que se muestra en stderr"""
+    output = io.StringIO()
+    monkeypatch.setattr(profiling, "console", Console(file=output, width=200))
+    return output
+
+
+class TestProfileSession:
+    """
+    Tests para perfilar un comando
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def test_cprofile_writes_pstats_file(self, tmp_path, report):
+        """Test el .prof se abre con pstats y el resumen muestra las funciones"""
+        session = ProfileSession("init", top=5, profile_dir=tmp_path).start()
+        busy(0.05)
+        profile_file = session.stop()
+        
+        assert profile_file.parent == tmp_path and profile_file.name.startswith("init-")
+        assert "busy" in names(load_profile(profile_file))
+        assert "Perfil de 'init' (cprofile)" in report.getvalue()
+        assert "busy" in report.getvalue()
+    
+    def test_sampling_sees_other_threads(self, tmp_path, report):
+        """Test el muestreo incluye los hilos de trabajo"""
+        session = ProfileSession("deploy", mode="sample", profile_dir=tmp_path, interval=0.001).start()
+        worker = threading.Thread(target=busy, args=(0.2,))
+        worker.start()
+        worker.join()
+        profile_file = session.stop()
+        
+        stats = load_profile(profile_file)
+        busy_stats = next(value for function, value in stats.stats.items() if function[2] == "busy")
+        assert busy_stats[3] > 0.05
+        assert "(sample)" in report.getvalue()
+    
+    def test_stop_is_idempotent(self, tmp_path, report):
+        """Test detener dos veces no escribe dos perfiles"""
+        session = ProfileSession("status", profile_dir=tmp_path).start()
+        first = session.stop()
+        
+        assert session.stop(report=False) == first
+        assert len(os.listdir(tmp_path)) == 1
+    
+    def test_unknown_mode(self):
+        """Test un modo desconocido se rechaza"""
+        with pytest.raises(ValueError):
+            ProfileSession("init", mode="perf")
+
+
+class TestSamplingProfiler:
+    """
+    Tests para el perfilador por muestreo
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def test_recursion_counted_once(self):
+        """Test una función recursiva suma una vez por muestra a su acumulado"""
+        profiler = SamplingProfiler()
+        
+        def recurse(depth):
+            if depth:
+                return recurse(depth - 1)
+            profiler._sample(sys._getframe(), 0.5)
+        
+        recurse(10)
+        stats = profiler.stats()
+        
+        recurse_stats = next(value for function, value in stats.items() if function[2] == "recurse")
+        assert recurse_stats[:2] == (1, 1)
+        assert recurse_stats[3] == 0.5
+
+
+class TestProfileRetention:
+    """
+    Tests para la limpieza de perfiles antiguos
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def test_keeps_most_recent(self, tmp_path):
+        """Test se conservan los perfiles más recientes"""
+        for index in range(5):
+            profile_file = tmp_path / f"init-{index}.prof"
+            profile_file.write_bytes(b"")
+            os.utime(profile_file, (1000 + index, 1000 + index))
+        
+        prune_profiles(tmp_path, keep=2)
+        
+        assert sorted(os.listdir(tmp_path)) == ["init-3.prof", "init-4.prof"]
+
+
+class TestProfileOption:
+    """
+    Tests para la opción global --profile
+    
+    DOCTRINA: Validamos entrada del usuario
+    """
+    
+    def test_flag_and_env_var(self, tmp_path, monkeypatch, report):
+        """Test --profile y GENESIS_CLI_PROFILE_MODE perfilan el subcomando"""
+        from genesis_cli.main import app
+        
+        monkeypatch.setattr(profiling, "PROFILE_DIR", tmp_path / "profiles")
+        runner = CliRunner()
+        
+        assert runner.invoke(app, ["--profile", "--version"]).exit_code == 0
+        assert runner.invoke(app, ["--profile", "help"]).exit_code == 0
+        assert runner.invoke(app, ["help"], env={"GENESIS_CLI_PROFILE_MODE": "sample"}).exit_code == 0
+        
+        profiles = sorted(os.listdir(tmp_path / "profiles"))
+        assert len(profiles) == 2 and all(name.startswith("help-") for name in profiles)
+        assert "(sample)" in report.getvalue()
+    
+    def test_hidden_and_validated(self):
+        """Test la opción no aparece en la ayuda y el modo se valida"""
+        from genesis_cli.main import app
+        
+        runner = CliRunner()
+        
+        assert "--profile" not in runner.invoke(app, ["--help"]).output
+        assert runner.invoke(app, ["--profile-mode", "perf", "help"]).exit_code == 2
+
+
+# Marcadores para tests
+pytestmark = [
+    pytest.mark.unit
+]
@@ -0,0 +1,194 @@
+"""
+Tests para el descubrimiento del proyecto de Genesis CLI
+
+DOCTRINA DEL ECOSISTEMA:
+- NO testea lógica de generación
+- NO testea agentes directamente
+- SÍ testea validación de entrada del usuario
+- Solo testea funcionalidad de CLI
+"""
+
+import os
+import sys
+import time
+
+import pytest
+import typer
+
+from genesis_cli import project_discovery
+from genesis_cli.config import CLIConfigManager
+from genesis_cli.project_discovery import (
+    DiscoveryCache,
+    clear_discovery_cache,
+    discover_project,
+    find_project_root,
+)
+
+OLD = time.time() - 3600
+
+
+@pytest.fixture(autouse=True)
+def isolated(tmp_path, monkeypatch):
+    """Caché de descubrimiento aislada y sin resultados del proceso"""
+    monkeypatch.setattr(project_discovery, "DISCOVERY_CACHE_FILE", tmp_path / "discovery.cache")
+    clear_discovery_cache()
+    yield
+    clear_discovery_cache()
+
+
+@pytest.fixture
+def monorepo(tmp_path):
+    """repo/.genesis-cli.toml, repo/services/api/genesis.json y un directorio profundo"""
+    repo = tmp_path / "repo"
+    deep = repo / "services" / "api" / "src" / "handlers" / "v1"
+    deep.mkdir(parents=True)
+    (repo / ".genesis-cli.toml").write_text('[templates]\ndefault_template = "api-only"\n')
+    (repo / "services" / "api" / "genesis.json").write_text('{"name": "api"}')
+    return repo, deep
+
+
+def age(*directories):
+    """Fechar los directorios en el pasado (fuera de la ventana de carrera)"""
+    for directory in directories:
+        os.utime(directory, (OLD, OLD))
+
+
+class TestDiscoverProject:
+    """
+    Tests para la búsqueda subiendo desde un directorio
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def test_finds_nearest_markers(self, monorepo):
+        """Test configuración y raíz del proyecto más cercanas"""
+        repo, deep = monorepo
+        
+        location = discover_project(deep)
+        
+        assert location.config_file == repo / ".genesis-cli.toml"
+        assert location.project_root == repo / "services" / "api"
+        assert location.manifest_file == repo / "services" / "api" / "genesis.json"
+    
+    def test_nearest_config_wins(self, monorepo):
+        """Test un .genesis-cli.toml más cercano tapa al del repositorio"""
+        repo, deep = monorepo
+        nested = repo / "services" / "api" / ".genesis-cli.toml"
+        nested.write_text("")
+        
+        assert discover_project(deep).config_file == nested
+    
+    def test_outside_project(self, tmp_path):
+        """Test fuera de un proyecto no hay raíz"""
+        (tmp_path / "empty").mkdir()
+        
+        assert find_project_root(tmp_path / "empty") is None
+    
+    def test_result_memoized_per_directory(self, monorepo, monkeypatch):
+        """Test dentro del proceso cada directorio se resuelve una vez"""
+        _, deep = monorepo
+        first = discover_project(deep)
+        monkeypatch.setattr(DiscoveryCache, "markers", None)
+        
+        assert discover_project(deep) is first
+
+
+class TestDiscoveryCache:
+    """
+    Tests para la caché de marcadores entre ejecuciones
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def directories(self, repo, deep):
+        return [deep] + list(deep.parents)[:len(deep.relative_to(repo).parts) + 1]
+    
+    def test_unchanged_directories_not_rescanned(self, monorepo, monkeypatch):
+        """Test otra ejecución solo hace un stat por directorio"""
+        repo, deep = monorepo
+        age(*self.directories(repo, deep))
+        discover_project(deep)
+        clear_discovery_cache()
+        
+        scanned = []
+        real_scan = project_discovery._scan
+        monkeypatch.setattr(project_discovery, "_scan", lambda directory: scanned.append(directory) or real_scan(directory))
+        location = discover_project(deep)
+        
+        assert location.project_root == repo / "services" / "api"
+        assert all(not directory.startswith(str(repo)) for directory in scanned)
+    
+    def test_new_marker_detected(self, monorepo):
+        """Test crear un archivo cambia el mtime del directorio y se vuelve a revisar"""
+        repo, deep = monorepo
+        age(*self.directories(repo, deep))
+        discover_project(deep)
+        clear_discovery_cache()
+        
+        (deep / ".genesis-cli.toml").write_text("")
+        
+        assert discover_project(deep).config_file == deep / ".genesis-cli.toml"
+    
+    def test_recent_directories_not_stored(self, tmp_path):
+        """Test un directorio recién modificado no se recuerda"""
+        (tmp_path / "fresh").mkdir()
+        cache = DiscoveryCache(tmp_path / "cache")
+        
+        cache.markers(str(tmp_path / "fresh"))
+        cache.save()
+        
+        assert str(tmp_path / "fresh") not in DiscoveryCache(tmp_path / "cache")._load()
+    
+    def test_corrupt_cache_is_ignored(self, monorepo):
+        """Test una caché ilegible equivale a no tenerla"""
+        repo, deep = monorepo
+        project_discovery.DISCOVERY_CACHE_FILE.write_bytes(b"\x00garbage")
+        
+        assert discover_project(deep).project_root == repo / "services" / "api"
+
+
+class TestDiscoveryIntegration:
+    """
+    Tests para el uso del descubrimiento en configuración y comandos
+    
+    DOCTRINA: Validamos entrada del usuario
+    """
+    
+    def test_config_uses_nearest_project_file(self, monorepo, tmp_path, monkeypatch):
+        """Test la capa del proyecto es el .genesis-cli.toml más cercano"""
+        pytest.importorskip("tomllib" if sys.version_info >= (3, 11) else "tomli")
+        _, deep = monorepo
+        monkeypatch.chdir(deep)
+        monkeypatch.delenv("GENESIS_CLI_DEFAULT_TEMPLATE", raising=False)
+        manager = CLIConfigManager()
+        manager.config_dir = tmp_path / "home"
+        manager.config_file = manager.config_dir / "config.json"
+        
+        assert manager.load_config().default_template == "api-only"
+    
+    def test_commands_run_from_project_root(self, monorepo, monkeypatch):
+        """Test los comandos de proyecto funcionan desde un subdirectorio"""
+        from genesis_cli.main import _project_root
+        
+        repo, deep = monorepo
+        monkeypatch.chdir(deep)
+        
+        assert _project_root() == repo / "services" / "api"
+        assert _project_root(chdir=True) == repo / "services" / "api"
+        assert os.getcwd() == str(repo / "services" / "api")
+    
+    def test_outside_project_exits(self, tmp_path, monkeypatch):
+        """Test fuera de un proyecto el comando termina con error"""
+        from genesis_cli.main import _project_root
+        
+        (tmp_path / "empty").mkdir()
+        monkeypatch.chdir(tmp_path / "empty")
+        
+        with pytest.raises(typer.Exit):
+            _project_root()
+
+
+# Marcadores para tests
+pytestmark = [
+    pytest.mark.unit
+]
@@ -0,0 +1,181 @@
+"""
+Tests para el manifiesto de generación (genesis.json) de Genesis CLI
+
+DOCTRINA DEL ECOSISTEMA:
+- NO testea lógica de generación
+- NO testea agentes directamente
+- SÍ testea el registro del estado del proyecto
+- Solo testea funcionalidad de CLI
+"""
+
+import json
+import os
+
+import pytest
+
+from genesis_cli.project_manifest import (
+    ProjectManifest, component_id, generate_request, hash_file, read_manifest_header, sync_staged_files
+)
+
+CONFIG = {"component": "model", "name": "User", "interactive": False}
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Proyecto con genesis.json escrito por genesis-core"""
+    (tmp_path / "genesis.json").write_text(json.dumps({
+        "name": "app",
+        "template": "saas-basic",
+        "features": ["api"],
+        "generated_files": ["README.md"],
+    }))
+    (tmp_path / "models").mkdir()
+    (tmp_path / "models" / "user.py").write_text("class User: ...")
+    return tmp_path
+
+
+def _record(root, config=CONFIG):
+    manifest = ProjectManifest(root)
+    manifest.record(component_id(config), manifest.fingerprint(generate_request(config)),
+                    ["models/user.py"], config)
+    manifest.save()
+    return manifest
+
+
+class TestProjectManifest:
+    """
+    Tests para ProjectManifest
+    
+    DOCTRINA: Solo usa genesis-core como interfaz
+    """
+    
+    def test_record_keeps_core_fields(self, project):
+        """Test registrar no altera las claves de genesis-core"""
+        _record(project)
+        data = json.loads((project / "genesis.json").read_text())
+        
+        assert data["generated_files"] == ["README.md"]
+        assert data["generation"]["files"]["models/user.py"]["sha256"] == hash_file(project / "models" / "user.py")
+        assert data["generation"]["components"]["model:User"]["config"] == CONFIG
+    
+    def test_unchanged_component_is_up_to_date(self, project):
+        """Test un componente sin cambios no se regenera"""
+        _record(project)
+        manifest = ProjectManifest(project)
+        
+        assert manifest.stale_reason("model:User", manifest.fingerprint(generate_request(CONFIG))) is None
+        assert manifest.component_configs() == [CONFIG]
+    
+    def test_changed_inputs_are_detected(self, project):
+        """Test cambiar el componente o el proyecto invalida la huella"""
+        _record(project)
+        manifest = ProjectManifest(project)
+        
+        other = {**CONFIG, "name": "Order"}
+        assert manifest.stale_reason(component_id(other), manifest.fingerprint(generate_request(other))) == "nuevo"
+        
+        manifest.data["features"].append("payments")
+        reason = manifest.stale_reason("model:User", manifest.fingerprint(generate_request(CONFIG)))
+        assert reason == "entradas modificadas"
+    
+    def test_missing_files_are_detected(self, project):
+        """Test archivos borrados fuerzan la regeneración"""
+        _record(project)
+        (project / "models" / "user.py").unlink()
+        manifest = ProjectManifest(project)
+        
+        reason = manifest.stale_reason("model:User", manifest.fingerprint(generate_request(CONFIG)))
+        assert reason == "archivos faltantes"
+
+
+class TestSyncStagedFiles:
+    """
+    Tests para sync_staged_files
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def test_identical_files_are_not_touched(self, project, tmp_path_factory):
+        """Test solo se escriben los archivos cuyo contenido cambió"""
+        staging = tmp_path_factory.mktemp("staging")
+        (staging / "models").mkdir()
+        (staging / "models" / "user.py").write_text("class User: ...")
+        (staging / "models" / "order.py").write_text("class Order: ...")
+        
+        target = project / "models" / "user.py"
+        os.utime(target, ns=(0, 10 ** 9))
+        
+        updated, unchanged = sync_staged_files(staging, project, ["models/user.py", "models/order.py"])
+        
+        assert updated == ["models/order.py"]
+        assert unchanged == ["models/user.py"]
+        assert target.stat().st_mtime_ns == 10 ** 9
+        assert (project / "models" / "order.py").read_text() == "class Order: ..."
+
+
+class TestReadManifestHeader:
+    """
+    Tests para read_manifest_header
+    
+    DOCTRINA: Mostramos estado de manera elegante
+    """
+    
+    def _read(self, tmp_path, data, indent=2):
+        path = tmp_path / "genesis.json"
+        path.write_text(json.dumps(data, indent=indent))
+        return read_manifest_header(path)
+    
+    def test_header_and_count(self, tmp_path):
+        """Test campos de cabecera y número de archivos"""
+        header = self._read(tmp_path, {
+            "name": "app",
+            "version": 2,
+            "nested": {"skip": ["}", {"a": "]"}]},
+            "description": "con \"comillas\" y } llaves",
+            "generated_files": [f"src/file_{i}.py" for i in range(1000)],
+            "features": ["api", "auth"],
+            "generation": {"files": {"src/file_0.py": {"sha256": "x"}}},
+        })
+        
+        assert header == {
+            "name": "app",
+            "version": 2,
+            "description": "con \"comillas\" y } llaves",
+            "features": ["api", "auth"],
+            "file_count": 1000,
+        }
+    
+    @pytest.mark.parametrize("files", [
+        [],
+        ["pages/[id].tsx", "a]b.py", "c.py"],
+        ["dir\\file.py", "quote\"d.py"],
+        [{"path": "a.py"}, {"path": "b.py"}],
+    ])
+    def test_count_matches_json_load(self, tmp_path, files):
+        """Test el conteo coincide con cargar la lista completa"""
+        header = self._read(tmp_path, {"name": "app", "generated_files": files}, indent=None)
+        
+        assert header["file_count"] == len(files)
+    
+    def test_stops_after_header(self, tmp_path):
+        """Test no se lee más allá de lo necesario"""
+        path = tmp_path / "genesis.json"
+        path.write_text('{"name": "app", "generated_files": ["a.py"], ' + ' ' * 100 + '"broken": [')
+        
+        header = read_manifest_header(path, fields=("name",))
+        
+        assert header == {"name": "app", "file_count": 1}
+    
+    def test_invalid_manifest(self, tmp_path):
+        """Test archivo que no es un objeto JSON"""
+        path = tmp_path / "genesis.json"
+        path.write_text("[1, 2]")
+        
+        with pytest.raises(ValueError):
+            read_manifest_header(path)
+
+
+# Marcadores para tests
+pytestmark = [
+    pytest.mark.unit
+]
@@ -0,0 +1,239 @@
+"""
+Tests para la caché de resultados de generación de Genesis CLI
+
+DOCTRINA DEL ECOSISTEMA:
+- NO testea lógica de generación
+- NO testea agentes directamente
+- SÍ testea reutilización de resultados de genesis-core
+- Solo testea funcionalidad de CLI
+"""
+
+import hashlib
+import json
+
+import pytest
+
+from genesis_cli import result_cache
+from genesis_cli.result_cache import ResultCache, make_cache_key, normalize_request
+
+
+def _generate(root, files):
+    """Simular los archivos escritos por genesis-core"""
+    for relative_path, content in files.items():
+        path = root / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return {"success": True, "files": list(files)}
+
+
+class TestCacheKey:
+    """
+    Tests para la clave de caché
+    
+    DOCTRINA: Solo usa genesis-core como interfaz
+    """
+    
+    def test_key_ignores_order_and_output_location(self):
+        """Test la clave no depende del orden de características ni del destino"""
+        first = normalize_request("app", "saas-basic", ["api", "auth"], {"output_path": "/a", "force": True})
+        second = normalize_request("app", "saas-basic", ["auth", "api"], {"output_path": "/b"})
+        
+        assert make_cache_key(first, "saas-basic", "1.0") == make_cache_key(second, "saas-basic", "1.0")
+    
+    def test_key_depends_on_inputs_and_core_version(self):
+        """Test cambiar entradas, template o genesis-core cambia la clave"""
+        request = normalize_request("User", "model", None, {"component": "model"})
+        other = normalize_request("Order", "model", None, {"component": "model"})
+        
+        key = make_cache_key(request, "model", "1.0")
+        assert key != make_cache_key(other, "model", "1.0")
+        assert key != make_cache_key(request, "endpoint", "1.0")
+        assert key != make_cache_key(request, "model", "1.1")
+
+
+class TestResultCache:
+    """
+    Tests para ResultCache
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def test_hit_replays_files(self, tmp_path):
+        """Test un acierto reproduce los archivos en otro directorio"""
+        source = tmp_path / "source"
+        result = _generate(source, {"models/user.py": "class User: ...", "README.md": "# User"})
+        
+        cache = ResultCache(tmp_path / "cache")
+        assert cache.lookup("k") is None
+        assert cache.store("k", result, result["files"], source)
+        
+        entry = ResultCache(tmp_path / "cache").lookup("k")
+        assert entry is not None
+        assert entry.result == result
+        
+        target = tmp_path / "target"
+        written = ResultCache(tmp_path / "cache").replay(entry, target)
+        
+        assert sorted(written) == ["README.md", "models/user.py"]
+        assert (target / "models" / "user.py").read_text() == "class User: ..."
+    
+    def test_counters(self, tmp_path):
+        """Test contadores de aciertos y fallos persistentes"""
+        source = tmp_path / "source"
+        result = _generate(source, {"a.py": "a"})
+        
+        cache = ResultCache(tmp_path / "cache")
+        cache.lookup("k")
+        cache.store("k", result, result["files"], source)
+        cache.lookup("k")
+        cache.flush()
+        
+        assert (cache.hits, cache.misses) == (1, 1)
+        stats = ResultCache(tmp_path / "cache").stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+        assert stats["size"] == 1
+    
+    def test_identical_contents_are_stored_once(self, tmp_path):
+        """Test almacenamiento direccionado por contenido"""
+        source = tmp_path / "source"
+        result = _generate(source, {"a.py": "same", "b.py": "same"})
+        
+        cache = ResultCache(tmp_path / "cache")
+        cache.store("k", result, result["files"], source)
+        
+        assert len(list((tmp_path / "cache" / "objects").glob("*/*"))) == 1
+    
+    def test_lru_eviction(self, tmp_path):
+        """Test se expulsan las entradas menos usadas al superar el tamaño"""
+        cache = ResultCache(tmp_path / "cache", max_size_mb=2500 / (1024 * 1024))
+        for key in ("old", "used", "new"):
+            source = tmp_path / key
+            result = _generate(source, {"f.txt": key[0] * 1000})
+            cache.store(key, result, result["files"], source)
+            if key == "used":
+                cache.lookup("old")  # "old" pasa a ser la más reciente
+        
+        assert cache.lookup("used") is None
+        assert cache.lookup("old") is not None
+        assert cache.lookup("new") is not None
+        assert len(list((tmp_path / "cache" / "objects").glob("*/*"))) == 2
+    
+    def test_eviction_keeps_other_writers_objects(self, tmp_path):
+        """Test la expulsión no borra temporales ni contenidos aún sin indexar de otra CLI"""
+        cache = ResultCache(tmp_path / "cache", max_size_mb=1500 / (1024 * 1024))
+        pending = tmp_path / "cache" / "objects" / "ab" / ("ab" * 32)
+        pending.parent.mkdir(parents=True)
+        pending.write_text("sin indexar")
+        in_flight = pending.with_name(f"{'ab' * 32}.4242.tmp")
+        in_flight.write_text("a medio escribir")
+        
+        for key in ("old", "new"):
+            source = tmp_path / key
+            result = _generate(source, {"f.txt": key[0] * 1000})
+            cache.store(key, result, result["files"], source)
+        
+        assert cache.lookup("old") is None
+        assert pending.exists() and in_flight.exists()
+        objects = {path.name for path in (tmp_path / "cache" / "objects").glob("*/*")}
+        assert objects == {pending.name, in_flight.name, hashlib.sha256(b"n" * 1000).hexdigest()}
+    
+    def test_lookup_defers_index_write(self, tmp_path):
+        """Test las búsquedas no reescriben index.json hasta flush"""
+        source = tmp_path / "source"
+        result = _generate(source, {"a.py": "a"})
+        cache = ResultCache(tmp_path / "cache")
+        cache.store("k", result, result["files"], source)
+        index_file = tmp_path / "cache" / "index.json"
+        before = index_file.read_bytes()
+        
+        assert cache.lookup("k") is not None
+        assert cache.lookup("missing") is None
+        assert index_file.read_bytes() == before
+        
+        cache.flush()
+        assert (ResultCache(tmp_path / "cache").stats()["hits"],
+                ResultCache(tmp_path / "cache").stats()["misses"]) == (1, 1)
+    
+    def test_files_outside_root_are_not_cached(self, tmp_path):
+        """Test resultados que no se pueden reproducir no se guardan"""
+        outside = tmp_path / "outside.txt"
+        outside.write_text("x")
+        
+        cache = ResultCache(tmp_path / "cache")
+        
+        assert not cache.store("k", {"success": True}, [str(outside)], tmp_path / "project")
+        assert not cache.store("k", {"success": True}, ["missing.py"], tmp_path)
+        assert cache.lookup("k") is None
+    
+    def test_missing_object_is_a_miss(self, tmp_path):
+        """Test una entrada con contenidos borrados cuenta como fallo"""
+        source = tmp_path / "source"
+        result = _generate(source, {"a.py": "a"})
+        cache = ResultCache(tmp_path / "cache")
+        cache.store("k", result, result["files"], source)
+        
+        for object_path in (tmp_path / "cache" / "objects").glob("*/*"):
+            object_path.unlink()
+        
+        assert cache.lookup("k") is None
+    
+    def test_concurrent_writers_keep_entries_and_counters(self, tmp_path):
+        """Test dos CLIs que leyeron el mismo índice no se pisan entradas ni contadores"""
+        first, second = ResultCache(tmp_path / "cache"), ResultCache(tmp_path / "cache")
+        assert first.lookup("a") is None
+        assert second.lookup("b") is None
+        
+        for cache, key in ((first, "a"), (second, "b")):
+            source = tmp_path / key
+            result = _generate(source, {"f.txt": key})
+            cache.store(key, result, result["files"], source)
+        reader = ResultCache(tmp_path / "cache")
+        assert reader.lookup("b") is not None
+        reader.flush()
+        
+        stats = ResultCache(tmp_path / "cache").stats()
+        assert stats["entries"] == 2
+        assert (stats["hits"], stats["misses"]) == (1, 2)
+
+
+class TestGenerateCache:
+    """
+    Tests para la caché de `genesis generate`
+    
+    DOCTRINA: Solo usa genesis-core como interfaz
+    """
+    
+    def test_key_includes_project_template(self, tmp_path, monkeypatch):
+        """Test un componente en caché no se reproduce en un proyecto de otro template"""
+        from genesis_cli import main
+        
+        monkeypatch.setattr(result_cache, "CACHE_DIR", tmp_path / "cache")
+        generated = []
+        
+        def _fake_forward(command, config):
+            template = json.loads((main.Path.cwd() / "genesis.json").read_text())["template"]
+            generated.append(template)
+            return _generate(main.Path.cwd(), {"models/user.py": f"# {template}"})
+        
+        monkeypatch.setattr(main, "_forward_to_daemon", _fake_forward)
+        
+        results = {}
+        for project, template in (("saas", "saas-basic"), ("api", "api-only"), ("saas2", "saas-basic")):
+            root = tmp_path / project
+            root.mkdir()
+            (root / "genesis.json").write_text(json.dumps({"name": project, "template": template}))
+            monkeypatch.chdir(root)
+            results[project] = main._run_generate(None, {"component": "model", "name": "User"})
+        
+        assert generated == ["saas-basic", "api-only"]
+        assert results["saas2"].get("cached") is True
+        assert (tmp_path / "api" / "models" / "user.py").read_text() == "# api-only"
+        assert (tmp_path / "saas2" / "models" / "user.py").read_text() == "# saas-basic"
+
+
+# Marcadores para tests
+pytestmark = [
+    pytest.mark.unit
+]
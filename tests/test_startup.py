@@ -0,0 +1,102 @@
+"""
+Tests de arranque en frío para Genesis CLI
+
+DOCTRINA DEL ECOSISTEMA:
+- NO testea lógica de generación
+- NO testea agentes directamente
+- SÍ testea interfaz de usuario
+- SÍ testea tiempo de respuesta de la CLI
+- Solo testea funcionalidad de CLI
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Presupuesto de importación propio de genesis_cli (sin contar typer/rich.console)
+IMPORT_BUDGET_MS = float(os.getenv("GENESIS_CLI_IMPORT_BUDGET_MS", "50"))
+
+# Módulos que solo deben cargarse cuando un comando los necesita
+HEAVY_MODULES = [
+    "genesis_core",
+    "asyncio",
+    "rich.progress",
+    "rich.prompt",
+    "rich.syntax",
+    "genesis_cli.ui.console",
+    "genesis_cli.commands.utils",
+]
+
+
+def _run_python(code: str, tmp_path) -> str:
+    """Ejecutar código en un intérprete limpio y devolver stdout"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in sys.path if p)
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+        env=env,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip().splitlines()[-1]
+
+
+class TestColdStart:
+    """
+    Tests de tiempo de arranque
+    
+    DOCTRINA: Solo testea interfaz de usuario
+    """
+    
+    def test_main_import_does_not_load_heavy_modules(self, tmp_path):
+        """Test que importar main no carga genesis-core ni Rich pesado"""
+        code = (
+            "import sys, json\n"
+            "import genesis_cli.main\n"
+            f"heavy = {HEAVY_MODULES!r}\n"
+            "print(json.dumps([m for m in heavy if m in sys.modules]))\n"
+        )
+        loaded = json.loads(_run_python(code, tmp_path))
+        assert loaded == []
+    
+    def test_version_skips_core_initialization(self, tmp_path):
+        """Test que --version sale sin inicializar genesis-core"""
+        code = (
+            "import sys, json\n"
+            "from typer.testing import CliRunner\n"
+            "from genesis_cli.main import app\n"
+            "result = CliRunner().invoke(app, ['--version'])\n"
+            "print(json.dumps([result.exit_code, 'genesis_core' in sys.modules]))\n"
+        )
+        exit_code, core_loaded = json.loads(_run_python(code, tmp_path))
+        assert exit_code == 0
+        assert core_loaded is False
+    
+    def test_main_import_within_budget(self, tmp_path):
+        """Test que el coste de importación propio de la CLI no regresa"""
+        code = (
+            "import time\n"
+            "import typer, rich.console\n"
+            "start = time.perf_counter()\n"
+            "import genesis_cli.main\n"
+            "print((time.perf_counter() - start) * 1000)\n"
+        )
+        # Mejor de varias ejecuciones para filtrar ruido del sistema
+        elapsed = min(float(_run_python(code, tmp_path)) for _ in range(3))
+        assert elapsed < IMPORT_BUDGET_MS, (
+            f"Importar genesis_cli.main tomó {elapsed:.1f} ms "
+            f"(presupuesto: {IMPORT_BUDGET_MS:.0f} ms)"
+        )
+
+
+# Marcadores para tests
+pytestmark = [
+    pytest.mark.cli,
+    pytest.mark.slow
+]
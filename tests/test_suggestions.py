@@ -0,0 +1,130 @@
+"""
+Tests para las sugerencias aproximadas de Genesis CLI
+
+DOCTRINA DEL ECOSISTEMA:
+- NO testea lógica de generación
+- NO testea agentes directamente
+- SÍ testea validación de entrada del usuario
+- Solo testea funcionalidad de CLI
+"""
+
+import pytest
+
+from genesis_cli.suggestions import SuggestionIndex, edit_distance, index_for
+from genesis_cli.validators import FeatureValidator, TemplateValidator
+
+
+class TestEditDistance:
+    """
+    Tests para la distancia de edición acotada
+    
+    DOCTRINA: Validamos entrada del usuario
+    """
+    
+    def test_distances(self):
+        """Test sustitución, inserción, borrado y transposición cuentan una edición"""
+        assert edit_distance("blog", "blog", 2) == 0
+        assert edit_distance("blog", "blag", 2) == 1
+        assert edit_distance("blog", "blogs", 2) == 1
+        assert edit_distance("blog", "bog", 2) == 1
+        assert edit_distance("blog", "blgo", 2) == 1
+        assert edit_distance("minimal", "mimimla", 2) == 2
+    
+    def test_limit(self):
+        """Test al superar el límite devuelve límite + 1"""
+        assert edit_distance("microservices", "minimal", 2) == 3
+        assert edit_distance("abcdef", "uvwxyz", 1) == 2
+
+
+class TestSuggestionIndex:
+    """
+    Tests para el índice de sugerencias
+    
+    DOCTRINA: Validamos entrada del usuario
+    """
+    
+    @pytest.mark.parametrize("query, expected", [
+        ("sass-basic", "saas-basic"),
+        ("ecomerce", "e-commerce"),
+        ("ecommerce", "e-commerce"),
+        ("micro-services", "microservices"),
+        ("mimimal", "minimal"),
+        ("blgo", "blog"),
+        ("frontnd", "frontend-only"),
+        ("sotre", "e-commerce"),
+    ])
+    def test_template_typos(self, query, expected):
+        """Test nombres mal escritos de templates y alias"""
+        assert TemplateValidator.suggest(query)[0] == expected
+    
+    def test_ranking(self):
+        """Test exacto, alias, palabras, edición y subcadena en ese orden"""
+        index = SuggestionIndex(["saas-basic", "minimal", "saas-pro", "blog"], {"basic": "minimal"})
+        
+        assert index.suggest("minimal") == ["minimal"]
+        assert index.suggest("basic") == ["minimal", "saas-basic"]
+        assert index.suggest("saas", limit=2) == ["saas-pro", "saas-basic"]
+        assert index.suggest("sass-basic") == ["saas-basic", "minimal"]
+        assert index.suggest("my-blog") == ["blog"]
+    
+    def test_threshold(self):
+        """Test nombres sin parecido no producen sugerencias"""
+        index = TemplateValidator.suggestion_index()
+        
+        assert index.suggest("completely-unknown") == []
+        assert index.suggest("xyz") == []
+        assert index.suggest("") == []
+        assert index.best("zzzz") is None
+    
+    def test_large_catalog(self):
+        """Test con miles de nombres la sugerencia sigue siendo la correcta"""
+        names = [f"template-{index:04d}-{word}" for index in range(3000) for word in ("api", "web")]
+        index = SuggestionIndex(names)
+        
+        assert index.best("tempalte-1234-web") == "template-1234-web"
+        assert index.best("template1234api") == "template-1234-api"
+        assert index.suggest("nothing-like-it") == []
+    
+    def test_results_are_cached(self):
+        """Test la misma consulta devuelve copias de la respuesta memorizada"""
+        index = SuggestionIndex(["blog", "minimal"])
+        first = index.suggest("blgo")
+        first.append("otro")
+        
+        assert index.suggest("blgo") == ["blog"]
+        assert len(index._cache) == 1
+    
+    def test_shared_index_for_small_lists(self):
+        """Test index_for reutiliza el índice para la misma lista"""
+        components = ["model", "endpoint", "page", "component", "test"]
+        
+        assert index_for(components) is index_for(list(components))
+        assert index_for(components).best("endpiont") == "endpoint"
+
+
+class TestValidatorSuggestions:
+    """
+    Tests para la integración con los validadores
+    
+    DOCTRINA: Validamos entrada del usuario
+    """
+    
+    def test_feature_typos(self):
+        """Test las características mal escritas sugieren la válida"""
+        result = FeatureValidator.validate(["authentcation", "databse"])
+        
+        assert not result.is_valid
+        assert "¿Quisiste decir 'authentication' en lugar de 'authentcation'?" in result.suggestions
+        assert "¿Quisiste decir 'database' en lugar de 'databse'?" in result.suggestions
+    
+    def test_index_rebuilds_when_templates_change(self, monkeypatch):
+        """Test reemplazar OFFICIAL_TEMPLATES reconstruye el índice"""
+        monkeypatch.setattr(TemplateValidator, "OFFICIAL_TEMPLATES", {"community-crm": {}})
+        
+        assert TemplateValidator.suggest("comunity-crm") == ["community-crm"]
+
+
+# Marcadores para tests
+pytestmark = [
+    pytest.mark.unit
+]
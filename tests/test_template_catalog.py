@@ -0,0 +1,187 @@
+"""
+Tests para el catálogo de templates de Genesis CLI
+
+DOCTRINA DEL ECOSISTEMA:
+- NO testea lógica de generación
+- NO testea agentes directamente
+- SÍ testea validación de entrada del usuario
+- Solo testea funcionalidad de CLI
+"""
+
+import json
+import time
+
+import pytest
+
+from genesis_cli import template_catalog
+from genesis_cli.template_catalog import (
+    CATALOG_FORMAT,
+    SOURCE_BUILTIN,
+    SOURCE_CORE,
+    CatalogStore,
+    load_template_catalog,
+    normalize_catalog,
+)
+from genesis_cli.utils import validate_template_name
+from genesis_cli.validators import TemplateValidator
+
+
+CORE_TEMPLATES = {
+    "saas-basic": {"name": "SaaS", "description": "SaaS", "features": ["api"], "complexity": "Media"},
+    "django-htmx": {"name": "Django + HTMX", "description": "HTML desde el servidor", "features": ["database"]},
+}
+
+
+class FakeCore:
+    """Sustituto de genesis-core que cuenta las consultas"""
+    
+    def __init__(self, templates=CORE_TEMPLATES):
+        self.templates = templates
+        self.calls = 0
+    
+    def __call__(self):
+        self.calls += 1
+        return normalize_catalog(self.templates) or None
+
+
+@pytest.fixture(autouse=True)
+def isolated_catalog(monkeypatch):
+    """Cada test empieza sin catálogo activo y con una versión fija de genesis-core"""
+    monkeypatch.setattr(TemplateValidator, "_catalog", None)
+    monkeypatch.setattr(template_catalog, "_active_catalog", None)
+    monkeypatch.setattr(template_catalog, "get_core_version", lambda: "1.0.0")
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CatalogStore(tmp_path / "catalog.json")
+
+
+class TestNormalizeCatalog:
+    """
+    Tests para las formas de catálogo que publica genesis-core
+    
+    DOCTRINA: Validamos entrada del usuario
+    """
+    
+    def test_accepted_shapes(self):
+        """Test diccionario por id, envuelto en 'templates' o lista con 'id'"""
+        as_list = [{"id": template_id, **info} for template_id, info in CORE_TEMPLATES.items()]
+        
+        assert list(normalize_catalog(CORE_TEMPLATES)) == ["saas-basic", "django-htmx"]
+        assert normalize_catalog({"version": "2", "templates": as_list}) == normalize_catalog(CORE_TEMPLATES)
+    
+    def test_invalid_entries_are_dropped(self):
+        """Test entradas sin id o que no son diccionarios se descartan"""
+        catalog = normalize_catalog([{"name": "sin id"}, "blog", {"id": "blog", "extra": 1, "features": None}])
+        
+        assert catalog == {"blog": {"features": []}}
+        assert normalize_catalog(None) == {}
+
+
+class TestLoadTemplateCatalog:
+    """
+    Tests para la caché del catálogo con TTL y versión
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def test_fetch_once_then_read_from_disk(self, store):
+        """Test la segunda carga no consulta genesis-core"""
+        core = FakeCore()
+        
+        first = load_template_catalog(store=store, fetch=core)
+        second = load_template_catalog(store=store, fetch=core)
+        
+        assert core.calls == 1
+        assert first.source == SOURCE_CORE and not first.from_cache
+        assert second.from_cache
+        assert second.templates == first.templates
+        assert json.loads(store.cache_file.read_text())["format"] == CATALOG_FORMAT
+    
+    def test_expired_or_other_core_version_refetches(self, store, monkeypatch):
+        """Test el TTL y la versión de genesis-core invalidan la copia"""
+        core = FakeCore()
+        load_template_catalog(store=store, fetch=core)
+        
+        data = json.loads(store.cache_file.read_text())
+        data["fetched_at"] = time.time() - store.ttl - 1
+        store.cache_file.write_text(json.dumps(data))
+        load_template_catalog(store=store, fetch=core)
+        assert core.calls == 2
+        
+        monkeypatch.setattr(template_catalog, "get_core_version", lambda: "2.0.0")
+        load_template_catalog(store=store, fetch=core)
+        assert core.calls == 3
+    
+    def test_refresh_and_zero_ttl(self, tmp_path):
+        """Test --refresh y TTL 0 siempre consultan genesis-core"""
+        core = FakeCore()
+        store = CatalogStore(tmp_path / "catalog.json", ttl=0)
+        
+        load_template_catalog(store=store, fetch=core)
+        load_template_catalog(store=store, fetch=core)
+        load_template_catalog(refresh=True, store=CatalogStore(store.cache_file), fetch=core)
+        assert core.calls == 3
+    
+    def test_stale_copy_when_core_fails(self, store):
+        """Test sin respuesta de genesis-core se usa la copia vencida"""
+        load_template_catalog(store=store, fetch=FakeCore())
+        
+        catalog = load_template_catalog(refresh=True, store=store, fetch=lambda: None)
+        
+        assert catalog.stale
+        assert "django-htmx" in catalog
+    
+    def test_builtin_when_core_has_no_catalog(self, store, monkeypatch):
+        """Test sin catálogo de genesis-core se usan los templates de la CLI"""
+        core = FakeCore(templates={})
+        catalog = load_template_catalog(store=store, fetch=core)
+        assert catalog.source == SOURCE_BUILTIN
+        assert catalog.names == list(TemplateValidator.OFFICIAL_TEMPLATES)
+        
+        # La copia solo recuerda el origen: los templates salen de esta versión de la CLI
+        monkeypatch.setattr(TemplateValidator, "OFFICIAL_TEMPLATES", {"nuevo": {}})
+        cached = load_template_catalog(store=store, fetch=core)
+        assert core.calls == 1
+        assert cached.names == ["nuevo"]
+    
+    def test_corrupted_file_is_ignored(self, store):
+        """Test un archivo dañado se reemplaza"""
+        store.cache_file.write_text("{no es json")
+        
+        assert load_template_catalog(store=store, fetch=FakeCore()).source == SOURCE_CORE
+        assert store.read() is not None
+
+
+class TestActiveCatalog:
+    """
+    Tests para la validación con el catálogo de genesis-core
+    
+    DOCTRINA: Validamos entrada del usuario
+    """
+    
+    def test_validators_use_core_catalog(self, store):
+        """Test templates nuevos de genesis-core son válidos sin actualizar la CLI"""
+        assert not TemplateValidator.validate("django-htmx").is_valid
+        
+        load_template_catalog(store=store, fetch=FakeCore())
+        
+        assert TemplateValidator.validate("django-htmx").is_valid
+        assert validate_template_name("django-htmx")["valid"]
+        assert not TemplateValidator.validate("blog").is_valid
+        assert TemplateValidator.suggest("djagno-htmx") == ["django-htmx"]
+        assert [template["id"] for template in TemplateValidator.list_templates()] == ["saas-basic", "django-htmx"]
+    
+    def test_reset_to_official_templates(self, store):
+        """Test use_catalog(None) vuelve a OFFICIAL_TEMPLATES"""
+        load_template_catalog(store=store, fetch=FakeCore())
+        TemplateValidator.use_catalog(None)
+        
+        assert TemplateValidator.validate("blog").is_valid
+
+
+# Marcadores para tests
+pytestmark = [
+    pytest.mark.unit
+]
@@ -0,0 +1,196 @@
+"""
+Tests para la medición de fases de Genesis CLI
+
+DOCTRINA DEL ECOSISTEMA:
+- NO testea lógica de generación
+- NO testea agentes directamente
+- SÍ testea funcionalidad de CLI
+- Solo testea funcionalidad de CLI
+"""
+
+import io
+import json
+import threading
+
+import pytest
+from rich.console import Console
+from typer.testing import CliRunner
+
+from genesis_cli import tracing
+from genesis_cli.tracing import (
+    PHASE_COMMAND,
+    PHASE_RENDER,
+    PHASE_VALIDATION,
+    TraceSession,
+    span,
+    start_tracing,
+    stop_tracing,
+    timings_table,
+    traced,
+)
+
+
+@pytest.fixture
+def recorder():
+    """Registrar fases durante el test"""
+    recorder = start_tracing()
+    yield recorder
+    stop_tracing()
+
+
+@pytest.fixture
+def report(monkeypatch):
+    """Capturar lo que se muestra en stderr"""
+    output = io.StringIO()
+    monkeypatch.setattr(tracing, "console", Console(file=output, width=200))
+    return output
+
+
+class TestSpans:
+    """
+    Tests para span() y traced
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def test_disabled_by_default(self):
+        """Test sin medición activa no se registra nada"""
+        calls = []
+        
+        @traced(PHASE_RENDER)
+        def render(value):
+            calls.append(value)
+            return value * 2
+        
+        assert not tracing.is_tracing()
+        assert span(PHASE_VALIDATION) is tracing._NULL_SPAN
+        with span(PHASE_VALIDATION) as current:
+            current.set(ignored=True)
+        assert render(21) == 42
+        assert calls == [21]
+        assert render.__name__ == "render"
+    
+    def test_nested_spans(self, recorder):
+        """Test las fases anidadas guardan su profundidad y se agrupan por nombre"""
+        @traced(PHASE_RENDER)
+        def render():
+            pass
+        
+        with span(PHASE_VALIDATION, field="name") as current:
+            current.set(valid=True)
+            render()
+            render()
+        
+        phases = {name: (depth, count) for name, depth, count, _ in recorder.phases()}
+        assert phases == {PHASE_VALIDATION: (0, 1), PHASE_RENDER: (1, 2)}
+        assert recorder.events[-1][5] == {"field": "name", "valid": True}
+    
+    def test_error_and_discard(self, recorder):
+        """Test una excepción queda en los datos y discard() no registra la fase"""
+        with pytest.raises(ValueError):
+            with span(PHASE_VALIDATION):
+                raise ValueError("nombre inválido")
+        with span(PHASE_RENDER) as current:
+            current.discard()
+        
+        assert [event[0] for event in recorder.events] == [PHASE_VALIDATION]
+        assert recorder.events[0][5] == {"error": "ValueError"}
+        # La profundidad vuelve a cero aunque la fase fallara
+        with span(PHASE_RENDER):
+            pass
+        assert recorder.events[-1][3] == 0
+    
+    def test_threads(self, recorder):
+        """Test las fases de otro hilo llevan su identificador y su propia profundidad"""
+        def worker():
+            with span(PHASE_RENDER):
+                pass
+        
+        with span(PHASE_VALIDATION):
+            thread = threading.Thread(target=worker, name="worker")
+            thread.start()
+            thread.join()
+        
+        events = {event[0]: event for event in recorder.events}
+        assert events[PHASE_RENDER][4] == thread.ident
+        assert events[PHASE_RENDER][4] != events[PHASE_VALIDATION][4]
+        assert events[PHASE_RENDER][3] == 0
+
+
+class TestTraceExport:
+    """
+    Tests para la exportación en formato Trace Event
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def test_write_trace(self, recorder, tmp_path):
+        """Test la traza tiene metadatos y un evento completo por fase, en microsegundos"""
+        recorder.record(PHASE_VALIDATION, recorder.origin + 1_000, recorder.origin + 3_500, 0, {"ok": True})
+        trace_file = tmp_path / "traces" / "init.json"
+        
+        recorder.write_trace(trace_file, {"command": "init"})
+        
+        data = json.loads(trace_file.read_text())
+        assert data["otherData"]["command"] == "init"
+        metadata = [event for event in data["traceEvents"] if event["ph"] == "M"]
+        assert {event["name"] for event in metadata} == {"process_name", "thread_name"}
+        (event,) = [event for event in data["traceEvents"] if event["ph"] == "X"]
+        assert event["name"] == PHASE_VALIDATION
+        assert event["ts"] == 1.0 and event["dur"] == 2.5
+        assert event["args"] == {"ok": True}
+        assert [path.name for path in trace_file.parent.iterdir()] == ["init.json"]
+
+
+class TestTraceSession:
+    """
+    Tests para --timings y --trace-file
+    
+    DOCTRINA: Validamos entrada del usuario
+    """
+    
+    def test_timings_table(self, report):
+        """Test la tabla muestra las fases, lo que queda fuera y el total"""
+        session = TraceSession("init", timings=True).start()
+        with span(PHASE_VALIDATION):
+            pass
+        session.stop()
+        
+        output = report.getvalue()
+        assert not tracing.is_tracing()
+        assert "Fases de 'init'" in output
+        assert "Validación de entrada" in output
+        assert "Fuera de las fases" in output
+        assert "Comando completo" in output
+        assert {name for name, _, _, _ in session.recorder.phases()} == {PHASE_COMMAND, PHASE_VALIDATION}
+    
+    def test_table_without_total(self):
+        """Test la tabla se construye aunque falte la fase del comando"""
+        recorder = tracing.SpanRecorder()
+        recorder.record(PHASE_RENDER, 0, 1_000_000, 0, {})
+        
+        table = timings_table(recorder, "status")
+        
+        assert table.row_count == 1
+    
+    def test_cli_options(self, tmp_path, report):
+        """Test --timings y GENESIS_CLI_TRACE_FILE miden el subcomando"""
+        from genesis_cli.main import app
+        
+        runner = CliRunner()
+        trace_file = tmp_path / "help.json"
+        
+        assert runner.invoke(app, ["--timings", "help"]).exit_code == 0
+        assert runner.invoke(app, ["help"], env={"GENESIS_CLI_TRACE_FILE": str(trace_file)}).exit_code == 0
+        
+        assert "Fases de 'help'" in report.getvalue()
+        events = json.loads(trace_file.read_text())["traceEvents"]
+        assert any(event["name"] == PHASE_COMMAND and event["args"]["command"] == "help" for event in events)
+        assert not tracing.is_tracing()
+        assert "--timings" in runner.invoke(app, ["--help"]).output
+
+
+# Marcadores para tests
+pytestmark = [
+    pytest.mark.unit
+]
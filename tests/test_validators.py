@@ -21,11 +21,13 @@ from genesis_cli.validators import (
     FeatureValidator,
     ValidationResult,
     validate_project_name,
+    validate_project_names,
     validate_template,
     validate_directory,
     validate_features,
     validate_project_config
 )
+from genesis_cli.validators import NAME_BAD_CHARS, NAME_BAD_START, NAME_PROBLEMATIC
 from genesis_cli.exceptions import ValidationError, ProjectNameError, TemplateError
 
 
@@ -243,6 +245,51 @@ class TestProjectNameValidator:
         result = ProjectNameValidator.validate("a" * 40)
         assert result.is_valid
         assert "más cortos" in str(result.suggestions)
+    
+    def test_validate_many_keeps_order(self):
+        """Test validación en lote en el mismo orden que la entrada"""
+        results = validate_project_names(["mi-app", "123", "mi-app", "con"])
+        
+        assert [result.is_valid for result in results] == [True, False, True, False]
+        assert "reservado" in str(results[3].errors)
+    
+    def test_results_are_independent(self):
+        """Test los resultados memoizados no comparten listas entre llamadas"""
+        first = ProjectNameValidator.validate("123-project")
+        first.add_error("error añadido por el llamador")
+        
+        second = ProjectNameValidator.validate("123-project")
+        assert "error añadido por el llamador" not in second.errors
+    
+    def test_check_exposes_codes(self):
+        """Test el motor expone códigos para que cada comando use sus mensajes"""
+        check = ProjectNameValidator.check("1 app")
+        
+        assert not check.is_valid
+        assert check.codes == (NAME_BAD_START, NAME_BAD_CHARS, NAME_PROBLEMATIC)
+        assert ProjectNameValidator.check("mi-proyecto").codes == ()
+    
+    def test_trailing_newline_is_invalid(self):
+        """Test un salto de línea final no se acepta como carácter válido"""
+        result = ProjectNameValidator.validate("proyecto\n")
+        assert not result.is_valid
+        assert "solo puede contener" in str(result.errors)
+    
+    def test_wrappers_keep_their_reserved_names(self):
+        """Test los envoltorios de main y utils solo rechazan sus propios nombres reservados"""
+        from genesis_cli import main, utils
+        
+        for name in ("demo", "build", "Cache"):
+            assert not ProjectNameValidator.check(name).is_valid
+            assert main.validate_project_name(name)
+            assert utils.validate_project_name(name)["valid"]
+        
+        # main solo valida caracteres y longitud; utils también rechaza dispositivos y ejemplos
+        assert main.validate_project_name("con")
+        assert not utils.validate_project_name("con")["valid"]
+        assert not utils.validate_project_name("Example")["valid"]
+        assert not main.validate_project_name("1app")
+        assert not main.validate_project_name("a")
 
 
 class TestTemplateValidator:
@@ -0,0 +1,155 @@
+"""
+Tests para la verificación de archivos generados de Genesis CLI
+
+DOCTRINA DEL ECOSISTEMA:
+- NO testea lógica de generación
+- NO testea agentes directamente
+- SÍ testea validación del estado del proyecto
+- Solo testea funcionalidad de CLI
+"""
+
+import json
+import os
+
+import pytest
+
+from genesis_cli.commands import verify as verify_module
+from genesis_cli.commands.verify import HashCache, verify_project
+from genesis_cli.project_manifest import MMAP_THRESHOLD, ProjectManifest, hash_file
+
+
+FILES = {
+    "backend/app.py": "print('app')\n",
+    "backend/models.py": "class User: pass\n",
+    "frontend/index.ts": "export {}\n",
+    "README.md": "# Proyecto\n",
+}
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Proyecto con genesis.json y hashes registrados como en `genesis init`"""
+    root = tmp_path / "project"
+    for relative_path, content in FILES.items():
+        path = root / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    
+    (root / "genesis.json").write_text(json.dumps({"name": "app", "generated_files": list(FILES)}))
+    manifest = ProjectManifest(root)
+    manifest.record("project", "huella", list(FILES))
+    manifest.save()
+    return root
+
+
+@pytest.fixture
+def no_racy_window(monkeypatch):
+    """Permitir cachear archivos recién escritos"""
+    monkeypatch.setattr(verify_module, "RACY_WINDOW_NS", 0)
+
+
+class TestVerifyProject:
+    """
+    Tests para la detección de cambios
+    
+    DOCTRINA: Validamos el estado del proyecto
+    """
+    
+    def test_clean_project(self, project):
+        """Test un proyecto sin cambios no tiene diferencias"""
+        report = verify_project(project, jobs=4)
+        
+        assert report.clean
+        assert report.tracked == len(FILES)
+        assert report.hashed == len(FILES)
+    
+    def test_detects_missing_modified_and_untracked(self, project):
+        """Test faltantes, modificados y no registrados"""
+        (project / "README.md").unlink()
+        (project / "backend" / "app.py").write_text("print('editado')\n")
+        (project / "backend" / "extra.py").write_text("x = 1\n")
+        (project / "node_modules" / "pkg").mkdir(parents=True)
+        (project / "node_modules" / "pkg" / "index.js").write_text("")
+        
+        report = verify_project(project)
+        
+        assert not report.clean
+        assert report.missing == ["README.md"]
+        assert report.modified == ["backend/app.py"]
+        assert report.untracked == ["backend/extra.py"]
+    
+    def test_exclude_and_no_untracked(self, project):
+        """Test los globs y --no-untracked omiten archivos no registrados"""
+        (project / "notes.txt").write_text("notas")
+        
+        assert verify_project(project, exclude=["*.txt"]).clean
+        assert verify_project(project, untracked=False).clean
+    
+    def test_files_without_recorded_hash(self, project):
+        """Test archivos sin hash registrado se informan aparte"""
+        data = json.loads((project / "genesis.json").read_text())
+        data["generated_files"].append("docs/guide.md")
+        (project / "genesis.json").write_text(json.dumps(data))
+        (project / "docs").mkdir()
+        (project / "docs" / "guide.md").write_text("guía")
+        
+        report = verify_project(project)
+        assert report.clean
+        assert report.unverified == ["docs/guide.md"]
+
+
+class TestHashCache:
+    """
+    Tests para la caché de hashes por tamaño y mtime
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def test_warm_run_skips_hashing(self, project, tmp_path, no_racy_window):
+        """Test la segunda ejecución no vuelve a hashear archivos sin cambios"""
+        cache_file = tmp_path / "hash-cache.json"
+        verify_project(project, cache=HashCache(cache_file))
+        report = verify_project(project, cache=HashCache(cache_file))
+        
+        assert report.hashed == 0
+        assert report.cached == len(FILES)
+        assert report.clean
+    
+    def test_changed_file_is_rehashed(self, project, tmp_path, no_racy_window):
+        """Test un archivo con otra mtime se vuelve a hashear"""
+        cache = HashCache(tmp_path / "hash-cache.json")
+        verify_project(project, cache=cache)
+        
+        target = project / "backend" / "models.py"
+        target.write_text("class Admin: pass\n")
+        stat = target.stat()
+        os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        report = verify_project(project, cache=cache)
+        assert report.hashed == 1
+        assert report.modified == ["backend/models.py"]
+    
+    def test_recent_files_not_cached(self, project, tmp_path):
+        """Test archivos escritos en la ventana de mtime no se cachean"""
+        cache = HashCache(tmp_path / "hash-cache.json")
+        verify_project(project, cache=cache)
+        
+        assert verify_project(project, cache=cache).cached == 0
+
+
+def test_hash_file_large_files_use_same_digest(tmp_path):
+    """Test el hash mapeado en memoria coincide con el hash por bloques"""
+    import hashlib
+    
+    data = os.urandom(MMAP_THRESHOLD + 123)
+    path = tmp_path / "large.bin"
+    path.write_bytes(data)
+    
+    assert hash_file(path) == hashlib.sha256(data).hexdigest()
+    assert hash_file(tmp_path / "missing.bin") is None
+
+
+# Marcadores para tests
+pytestmark = [
+    pytest.mark.unit
+]
@@ -0,0 +1,308 @@
+"""
+Medición de fases para Genesis CLI
+
+Los comandos marcan sus fases con `span(nombre)` (o el decorador `traced`):
+configuración, validación, dependencias, preguntas al usuario, construcción
+del orquestador, solicitud a genesis-core y presentación del resultado.
+Con `genesis --timings <comando>` se muestra al terminar una tabla con la
+duración de cada fase; con `--trace-file out.json` se guardan en formato
+Trace Event (chrome://tracing, Perfetto, speedscope) para comparar
+ejecuciones.
+
+Sin --timings ni --trace-file no hay nada registrando: `span()` devuelve un
+contexto vacío compartido y `traced` llama directamente a la función, de
+modo que las fases marcadas cuestan una comprobación.
+
+DOCTRINA DEL ECOSISTEMA:
+- NO implementa lógica de generación
+- NO coordina agentes directamente
+- SÍ ayuda a diagnosticar la experiencia de usuario
+- Solo herramientas para interfaz de usuario
+"""
+
+import json
+import os
+import threading
+import time
+from functools import wraps
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from rich.console import Console
+
+if TYPE_CHECKING:  # pragma: no cover - solo para anotaciones
+    from rich.table import Table
+
+# Fases del ciclo de vida de un comando
+PHASE_COMMAND = "command"
+PHASE_CONFIG = "config"
+PHASE_VALIDATION = "validation"
+PHASE_DEPENDENCIES = "dependencies"
+PHASE_PROMPTS = "prompts"
+PHASE_ORCHESTRATOR = "orchestrator"
+PHASE_CORE_REQUEST = "core_request"
+PHASE_RENDER = "render"
+
+# Nombre de cada fase en la tabla de --timings
+PHASE_LABELS = {
+    PHASE_COMMAND: "Comando completo",
+    PHASE_CONFIG: "Inicialización de configuración",
+    PHASE_VALIDATION: "Validación de entrada",
+    PHASE_DEPENDENCIES: "Verificación de dependencias",
+    PHASE_PROMPTS: "Preguntas al usuario",
+    PHASE_ORCHESTRATOR: "Construcción del orquestador",
+    PHASE_CORE_REQUEST: "Solicitud a Genesis Core",
+    PHASE_RENDER: "Presentación del resultado",
+}
+
+# Categoría de los eventos en la traza
+TRACE_CATEGORY = "genesis-cli"
+
+# La tabla va a stderr: no se mezcla con salidas como --json
+console = Console(stderr=True)
+
+class _NullSpan:
+    """Contexto vacío: lo que devuelve `span()` cuando no se está midiendo"""
+    
+    __slots__ = ()
+    
+    def __enter__(self) -> "_NullSpan":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        return False
+    
+    def set(self, **args: Any):
+        pass
+    
+    def discard(self):
+        pass
+
+_NULL_SPAN = _NullSpan()
+
+class Span:
+    """
+    Una fase en curso: se registra al salir del bloque `with`
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    __slots__ = ("recorder", "name", "args", "start", "depth", "discarded")
+    
+    def __init__(self, recorder: "SpanRecorder", name: str, args: Dict[str, Any]):
+        self.recorder = recorder
+        self.name = name
+        self.args = args
+        self.start = 0
+        self.depth = 0
+        self.discarded = False
+    
+    def __enter__(self) -> "Span":
+        self.depth = self.recorder._push()
+        self.start = time.perf_counter_ns()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        end = time.perf_counter_ns()
+        self.recorder._pop()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        if not self.discarded:
+            self.recorder.record(self.name, self.start, end, self.depth, self.args)
+        return False
+    
+    def set(self, **args: Any):
+        """Añadir datos a la fase (aparecen en la traza)"""
+        self.args.update(args)
+    
+    def discard(self):
+        """No registrar la fase (por ejemplo, si al final no ocurrió)"""
+        self.discarded = True
+
+# (nombre, inicio_ns, fin_ns, profundidad, hilo, datos)
+SpanEvent = Tuple[str, int, int, int, int, Dict[str, Any]]
+
+class SpanRecorder:
+    """
+    Fases registradas durante un comando
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def __init__(self):
+        self.origin = time.perf_counter_ns()
+        self.started_at = time.time()
+        self.pid = os.getpid()
+        self.events: List[SpanEvent] = []
+        self._threads: Dict[int, str] = {}
+        self._local = threading.local()
+    
+    def _push(self) -> int:
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        return depth
+    
+    def _pop(self):
+        self._local.depth -= 1
+    
+    def record(self, name: str, start: int, end: int, depth: int, args: Dict[str, Any]):
+        thread = threading.current_thread()
+        self._threads.setdefault(thread.ident, thread.name)
+        # list.append es atómico: las fases de otros hilos no necesitan lock
+        self.events.append((name, start, end, depth, thread.ident, args))
+    
+    def phases(self) -> List[Tuple[str, int, int, float]]:
+        """(fase, profundidad, veces, segundos) agrupadas por fase, en orden de inicio"""
+        totals: Dict[str, List[Any]] = {}
+        for name, start, end, depth, _, _ in sorted(self.events, key=lambda event: event[1]):
+            total = totals.setdefault(name, [depth, 0, 0])
+            total[0] = min(total[0], depth)
+            total[1] += 1
+            total[2] += end - start
+        return [(name, depth, count, nanoseconds / 1e9) for name, (depth, count, nanoseconds) in totals.items()]
+    
+    def trace_events(self) -> List[Dict[str, Any]]:
+        """Eventos en formato Trace Event: metadatos y un evento completo ("X") por fase"""
+        events: List[Dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": self.pid, "tid": 0, "args": {"name": "genesis-cli"}}
+        ]
+        events.extend(
+            {"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid, "args": {"name": name}}
+            for tid, name in self._threads.items()
+        )
+        for name, start, end, _, tid, args in self.events:
+            events.append({
+                "name": name,
+                "cat": TRACE_CATEGORY,
+                "ph": "X",
+                "ts": (start - self.origin) / 1000,
+                "dur": (end - start) / 1000,
+                "pid": self.pid,
+                "tid": tid,
+                "args": args,
+            })
+        return events
+    
+    def write_trace(self, trace_file: Path, metadata: Optional[Dict[str, Any]] = None):
+        """Guardar la traza (JSON Object Format) de forma atómica"""
+        trace_file = Path(trace_file)
+        trace_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = trace_file.with_name(f"{trace_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "w") as f:
+            json.dump({
+                "traceEvents": self.trace_events(),
+                "displayTimeUnit": "ms",
+                "otherData": {"started_at": self.started_at, **(metadata or {})},
+            }, f, ensure_ascii=False, default=str)
+        os.replace(tmp_file, trace_file)
+
+_recorder: Optional[SpanRecorder] = None
+
+def span(name: str, **args: Any) -> Any:
+    """
+    Marcar una fase: `with span(PHASE_VALIDATION): ...`
+    
+    Sin medición activa devuelve un contexto vacío compartido.
+    """
+    recorder = _recorder
+    if recorder is None:
+        return _NULL_SPAN
+    return Span(recorder, name, args)
+
+def traced(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorador: toda la llamada a la función es la fase `name`"""
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            recorder = _recorder
+            if recorder is None:
+                return func(*args, **kwargs)
+            with Span(recorder, name, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def start_tracing() -> SpanRecorder:
+    """Empezar a registrar fases (en todos los hilos)"""
+    global _recorder
+    _recorder = SpanRecorder()
+    return _recorder
+
+def stop_tracing() -> Optional[SpanRecorder]:
+    """Dejar de registrar fases y devolver lo registrado"""
+    global _recorder
+    recorder, _recorder = _recorder, None
+    return recorder
+
+def is_tracing() -> bool:
+    return _recorder is not None
+
+class TraceSession:
+    """
+    Medición de un comando: --timings y --trace-file
+    
+    DOCTRINA: Utility para mejorar UX
+    """
+    
+    def __init__(self, command: Optional[str], timings: bool = False, trace_file: Optional[Path] = None):
+        self.command = command or "genesis"
+        self.timings = timings
+        self.trace_file = trace_file
+        self.recorder: Optional[SpanRecorder] = None
+        self._root: Optional[Span] = None
+    
+    def start(self) -> "TraceSession":
+        self.recorder = start_tracing()
+        self._root = Span(self.recorder, PHASE_COMMAND, {"command": self.command})
+        self._root.__enter__()
+        return self
+    
+    def stop(self):
+        """Cerrar la fase del comando, mostrar la tabla y guardar la traza"""
+        if self._root is None:
+            return
+        self._root.__exit__(None, None, None)
+        self._root = None
+        stop_tracing()
+        
+        if self.timings:
+            console.print(timings_table(self.recorder, self.command))
+        if self.trace_file is not None:
+            try:
+                self.recorder.write_trace(self.trace_file, {"command": self.command})
+                console.print(f"[dim]🧭 Traza guardada en {self.trace_file} (chrome://tracing o ui.perfetto.dev)[/dim]")
+            except OSError as e:
+                console.print(f"[yellow]⚠️ No se pudo guardar la traza: {e}[/yellow]")
+
+def timings_table(recorder: SpanRecorder, command: str) -> "Table":
+    """Tabla de Rich con la duración de cada fase y su parte del comando"""
+    # rich.table solo se importa si se pide la tabla: no retrasa el arranque
+    from rich.table import Table
+    
+    phases = recorder.phases()
+    total = next((seconds for name, _, _, seconds in phases if name == PHASE_COMMAND), 0.0)
+    
+    table = Table(title=f"⏱️ Fases de '{command}'", title_justify="left")
+    table.add_column("Fase", style="cyan")
+    table.add_column("Veces", justify="right")
+    table.add_column("Duración", justify="right")
+    table.add_column("%", justify="right", style="dim")
+    
+    measured = 0.0
+    for name, depth, count, seconds in phases:
+        if name == PHASE_COMMAND:
+            continue
+        if depth <= 1:
+            measured += seconds
+        label = "  " * max(depth - 1, 0) + PHASE_LABELS.get(name, name)
+        share = f"{seconds / total * 100:.0f}%" if total else ""
+        table.add_row(label, str(count), f"{seconds * 1000:.1f} ms", share)
+    
+    if total:
+        # Importaciones, Typer y todo lo que no está dentro de una fase
+        other = max(total - measured, 0.0)
+        table.add_row("[dim]Fuera de las fases[/dim]", "", f"[dim]{other * 1000:.1f} ms[/dim]",
+                      f"{other / total * 100:.0f}%")
+        table.add_section()
+        table.add_row(f"[bold]{PHASE_LABELS[PHASE_COMMAND]}[/bold]", "", f"[bold]{total * 1000:.1f} ms[/bold]", "100%")
+    return table
@@ -25,10 +25,106 @@ from rich.json import JSON
 from contextlib import contextmanager
 from pathlib import Path
 import json
+import threading
+
+from genesis_cli.events import ProgressEvent, PHASE_STARTED, FILE_WRITTEN, AGENT_FINISHED
+from genesis_cli.ui.file_tree import FileTrie, DEFAULT_MAX_DEPTH
 
 # Console principal para Genesis CLI
 genesis_console = Console()
 
+class GenerationProgress(Progress):
+    """
+    Barra de progreso alimentada por los eventos de generación de genesis-core
+    
+    Cada evento solo actualiza contadores; el estado se vuelca a la barra al
+    dibujar. Así el terminal se redibuja como máximo `refresh_per_second`
+    veces por segundo, sin importar cuántos eventos lleguen.
+    
+    DOCTRINA: Mostramos progreso y estado elegante
+    """
+    
+    def __init__(self, console: Optional[Console] = None, refresh_per_second: float = 10,
+                 transient: bool = True, **kwargs):
+        # Estado acumulado: Progress puede dibujar ya durante su __init__
+        self._events_lock = threading.Lock()
+        self._pending = False
+        self.events_received = 0
+        self.phase: Optional[str] = None
+        self.phases_started = 0
+        self.total_phases: Optional[int] = None
+        self.files_written = 0
+        self.total_files: Optional[int] = None
+        self.last_file: Optional[str] = None
+        self.agents_finished: List[str] = []
+        
+        super().__init__(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            TextColumn("[dim]{task.fields[detail]}[/dim]"),
+            console=console or genesis_console,
+            refresh_per_second=refresh_per_second,
+            transient=transient,
+            **kwargs
+        )
+        self.main_task = self.add_task("Conectando con Genesis Core...", total=None, detail="")
+    
+    def handle_event(self, event: Any):
+        """Registrar un evento de progreso (seguro desde cualquier hilo)"""
+        event = ProgressEvent.from_raw(event)
+        with self._events_lock:
+            self.events_received += 1
+            if event.type == PHASE_STARTED:
+                self.phase = event.message or event.name
+                self.phases_started += 1
+                if event.total:
+                    self.total_phases = event.total
+            elif event.type == FILE_WRITTEN:
+                self.files_written += 1
+                self.last_file = event.path
+                if event.total:
+                    self.total_files = event.total
+            elif event.type == AGENT_FINISHED:
+                self.agents_finished.append(event.name or "agente")
+            else:
+                return
+            self._pending = True
+    
+    def _apply_pending(self):
+        """Volcar los eventos acumulados a la barra"""
+        with self._events_lock:
+            if not self._pending:
+                return
+            self._pending = False
+            phase, phases_started, total_phases = self.phase, self.phases_started, self.total_phases
+            files_written, total_files, last_file = self.files_written, self.total_files, self.last_file
+            agents = len(self.agents_finished)
+        
+        if total_files:
+            completed, total = files_written, total_files
+        elif total_phases:
+            completed, total = max(phases_started - 1, 0), total_phases
+        else:
+            completed, total = 0, None
+        
+        description = phase or "Generando proyecto..."
+        if total_phases:
+            description = f"{description} ({phases_started}/{total_phases})"
+        
+        detail = f"{files_written} archivos · {agents} agentes"
+        if last_file:
+            detail = f"{detail} · {last_file}"
+        
+        self.update(self.main_task, description=description, completed=completed,
+                    total=total, detail=detail)
+    
+    def get_renderables(self):
+        self._apply_pending()
+        yield from super().get_renderables()
+
+
 class GenesisUI:
     """
     Interfaz de usuario elegante para Genesis CLI
@@ -84,7 +180,8 @@ class GenesisUI:
         
         self.console.print(tree)
     
-    def show_project_status(self, project_data: Dict[str, Any]):
+    def show_project_status(self, project_data: Dict[str, Any], max_depth: int = DEFAULT_MAX_DEPTH,
+                            path: Optional[str] = None, top: Optional[int] = None):
         """Mostrar estado del proyecto de manera elegante"""
         # Información básica
         basic_table = Table(title="📋 Información del Proyecto", show_header=True)
@@ -115,32 +212,47 @@ class GenesisUI:
                     self.console.print(f"  {feature}")
         
         # Archivos generados
-        generated_files = project_data.get("generated_files", [])
-        if generated_files:
-            self.console.print(f"\n[bold]📁 Archivos generados ({len(generated_files)}):[/bold]")
-            
-            # Agrupar por tipo
-            file_tree = Tree("📁 Estructura del proyecto")
-            directories = {}
-            
-            for file_path in generated_files:
-                parts = Path(file_path).parts
-                if len(parts) > 1:
-                    dir_name = parts[0]
-                    if dir_name not in directories:
-                        directories[dir_name] = []
-                    directories[dir_name].append(str(Path(*parts[1:])))
-                else:
-                    file_tree.add(f"📄 {file_path}")
+        self.show_file_tree(project_data.get("generated_files", []), max_depth=max_depth, path=path, top=top)
+    
+    def show_file_tree(self, generated_files: List[str], max_depth: int = DEFAULT_MAX_DEPTH,
+                       path: Optional[str] = None, top: Optional[int] = None):
+        """
+        Mostrar árbol de archivos generados
+        
+        Args:
+            max_depth: Niveles de directorios a desplegar
+            path: Mostrar solo el subárbol de este directorio
+            top: Mostrar los N directorios con más archivos en lugar del árbol
+        """
+        if not generated_files:
+            return
+        
+        trie = FileTrie.from_paths(generated_files)
+        node = trie.root
+        if path:
+            node = trie.find(path)
+            if node is None:
+                self.console.print(f"[yellow]⚠️ No hay archivos generados en '{path}'[/yellow]")
+                return
+        
+        location = f" en {path}" if path else ""
+        self.console.print(f"\n[bold]📁 Archivos generados{location} ({node.count}):[/bold]")
+        
+        if top:
+            table = Table(title=f"📊 Directorios con más archivos{location}")
+            table.add_column("Directorio", style="cyan")
+            table.add_column("Archivos", style="green", justify="right")
+            table.add_column("Total (subárbol)", style="yellow", justify="right")
             
-            for dir_name, files in directories.items():
-                dir_branch = file_tree.add(f"📁 {dir_name}")
-                for file in files[:5]:  # Mostrar solo los primeros 5
-                    dir_branch.add(f"📄 {file}")
-                if len(files) > 5:
-                    dir_branch.add(f"[dim]... y {len(files) - 5} archivos más[/dim]")
+            prefix = path.strip("/") if path else ""
+            for directory, directory_node in trie.largest(top, node, prefix):
+                table.add_row(directory, str(len(directory_node.files)), str(directory_node.count))
             
-            self.console.print(file_tree)
+            self.console.print(table)
+            return
+        
+        label = f"📁 {path}" if path else "📁 Estructura del proyecto"
+        self.console.print(trie.render(node, label=label, max_depth=max_depth))
     
     def show_deployment_status(self, environment: str, status: str, details: Dict[str, Any]):
         """Mostrar estado del despliegue"""
@@ -197,6 +309,7 @@ class GenesisUI:
         """Mostrar opciones de templates disponibles"""
         table = Table(title="📋 Templates Disponibles")
         table.add_column("Template", style="cyan")
+        table.add_column("Nombre", style="bold")
         table.add_column("Descripción", style="green")
         table.add_column("Características", style="yellow")
         table.add_column("Complejidad", style="magenta")
@@ -206,6 +319,7 @@ class GenesisUI:
             complexity = template.get("complexity", "Media")
             
             table.add_row(
+                template.get("id", "N/A"),
                 template.get("name", "N/A"),
                 template.get("description", "N/A"),
                 features,
@@ -296,6 +410,10 @@ class GenesisUI:
             task = progress.add_task(description, total=None)
             yield progress, task
     
+    def generation_progress(self, refresh_per_second: float = 10) -> GenerationProgress:
+        """Crear barra de progreso para eventos de generación"""
+        return GenerationProgress(console=self.console, refresh_per_second=refresh_per_second)
+    
     def ask_user(self, question: str, default: Optional[str] = None, choices: Optional[List[str]] = None) -> str:
         """Solicitar entrada del usuario"""
         if choices:
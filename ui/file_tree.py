@@ -0,0 +1,136 @@
+"""
+Árbol de archivos generados para Genesis CLI
+
+Agrega las rutas de `generated_files` en un trie de directorios con el
+número de archivos de cada subárbol, en una sola pasada sobre los strings.
+El renderizado solo recorre los nodos que se muestran, así el coste crece
+con la salida y no con el tamaño del proyecto.
+
+DOCTRINA DEL ECOSISTEMA:
+- NO implementa lógica de generación
+- NO coordina agentes directamente
+- SÍ proporciona UI elegante y funcional
+- Enfocado en UX/UI excelente
+"""
+
+import heapq
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from rich.markup import escape
+from rich.tree import Tree
+
+# Límites por defecto del árbol
+DEFAULT_MAX_DEPTH = 3
+DEFAULT_MAX_FILES = 5
+DEFAULT_MAX_DIRS = 20
+
+class TrieNode:
+    """
+    Directorio del árbol de archivos
+    
+    DOCTRINA: Enfocado en UX/UI excelente
+    """
+    __slots__ = ("name", "children", "files", "count")
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.children = {}
+        self.files: List[str] = []
+        self.count = 0  # archivos en todo el subárbol
+
+class FileTrie:
+    """
+    Trie de directorios con conteo de archivos por subárbol
+    
+    DOCTRINA: Enfocado en UX/UI excelente
+    """
+    
+    def __init__(self):
+        self.root = TrieNode("")
+    
+    @classmethod
+    def from_paths(cls, paths: Iterable[str]) -> "FileTrie":
+        """Construir el trie en una sola pasada sobre las rutas"""
+        trie = cls()
+        root = trie.root
+        for path in paths:
+            if "\\" in path:
+                path = path.replace("\\", "/")
+            parts = path.strip("/").split("/")
+            
+            node = root
+            node.count += 1
+            for part in parts[:-1]:
+                if not part or part == ".":
+                    continue
+                child = node.children.get(part)
+                if child is None:
+                    child = node.children[part] = TrieNode(part)
+                node = child
+                node.count += 1
+            node.files.append(parts[-1])
+        return trie
+    
+    def find(self, path: str) -> Optional[TrieNode]:
+        """Buscar el directorio `path` (None si no existe)"""
+        node = self.root
+        for part in path.replace("\\", "/").strip("/").split("/"):
+            if not part or part == ".":
+                continue
+            node = node.children.get(part)
+            if node is None:
+                return None
+        return node
+    
+    def directories(self, node: Optional[TrieNode] = None, prefix: str = "") -> Iterator[Tuple[str, TrieNode]]:
+        """Recorrer todos los directorios bajo `node` con su ruta"""
+        stack = [(prefix, child) for child in (node or self.root).children.values()]
+        while stack:
+            path, current = stack.pop()
+            path = f"{path}/{current.name}" if path else current.name
+            yield path, current
+            stack.extend((path, child) for child in current.children.values())
+    
+    def largest(self, limit: int, node: Optional[TrieNode] = None,
+                prefix: str = "") -> List[Tuple[str, TrieNode]]:
+        """Directorios con más archivos propios (sin contar subdirectorios)"""
+        return heapq.nlargest(
+            limit,
+            self.directories(node, prefix),
+            key=lambda item: (len(item[1].files), item[1].count)
+        )
+    
+    def render(self, node: Optional[TrieNode] = None, label: str = "📁 Estructura del proyecto",
+               max_depth: int = DEFAULT_MAX_DEPTH, max_files: int = DEFAULT_MAX_FILES,
+               max_dirs: int = DEFAULT_MAX_DIRS) -> Tree:
+        """
+        Construir el árbol de Rich hasta `max_depth` niveles
+        
+        Los directorios más profundos se muestran contraídos con su conteo;
+        cada nivel muestra como máximo `max_dirs` directorios y `max_files`
+        archivos.
+        """
+        node = node or self.root
+        tree = Tree(label)
+        self._render_level(tree, node, max_depth, max_files, max_dirs)
+        return tree
+    
+    def _render_level(self, branch: Tree, node: TrieNode, depth: int, max_files: int, max_dirs: int):
+        children = node.children
+        names = heapq.nsmallest(max_dirs, children) if len(children) > max_dirs else sorted(children)
+        
+        for name in names:
+            child = children[name]
+            label = f"📁 {escape(name)} [dim]({child.count} archivos)[/dim]"
+            if depth <= 1 or not (child.children or child.files):
+                branch.add(label)
+            else:
+                self._render_level(branch.add(label), child, depth - 1, max_files, max_dirs)
+        
+        if len(children) > max_dirs:
+            branch.add(f"[dim]... y {len(children) - max_dirs} directorios más[/dim]")
+        
+        for file_name in node.files[:max_files]:
+            branch.add(f"📄 {escape(file_name)}")
+        if len(node.files) > max_files:
+            branch.add(f"[dim]... y {len(node.files) - max_files} archivos más[/dim]")
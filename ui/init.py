@@ -9,10 +9,11 @@ DOCTRINA DEL ECOSISTEMA:
 - Enfocado en UX/UI excelente
 """
 
-from .console import genesis_console, GenesisUI, ui
+from .console import genesis_console, GenesisUI, GenerationProgress, ui
 
 __all__ = [
     "genesis_console",
     "GenesisUI", 
+    "GenerationProgress",
     "ui"
 ]
\ No newline at end of file
@@ -17,6 +17,8 @@ from typing import Dict, List, Optional, Any
 from rich.console import Console
 from rich.prompt import Confirm, Prompt
 
+from genesis_cli.tracing import PHASE_PROMPTS, traced
+
 console = Console()
 
 def get_terminal_size() -> tuple[int, int]:
@@ -38,6 +40,7 @@ def is_interactive_terminal() -> bool:
     """
     return sys.stdin.isatty() and sys.stdout.isatty()
 
+@traced(PHASE_PROMPTS)
 def get_user_confirmation(message: str, default: bool = False) -> bool:
     """
     Solicitar confirmación al usuario
@@ -49,6 +52,7 @@ def get_user_confirmation(message: str, default: bool = False) -> bool:
     
     return Confirm.ask(f"[yellow]{message}[/yellow]", default=default)
 
+@traced(PHASE_PROMPTS)
 def get_user_input(prompt: str, default: str = None, choices: List[str] = None) -> str:
     """
     Obtener entrada del usuario con validación
@@ -79,34 +83,23 @@ def validate_project_name(name: str) -> Dict[str, Any]:
     Returns:
         Dict con 'valid' (bool) y 'errors' (list)
     """
-    errors = []
-    
-    if not name:
-        errors.append("El nombre del proyecto es requerido")
-        return {"valid": False, "errors": errors}
-    
-    if len(name) < 2:
-        errors.append("El nombre debe tener al menos 2 caracteres")
-    
-    if len(name) > 50:
-        errors.append("El nombre no puede tener más de 50 caracteres")
-    
-    # Validar caracteres permitidos
-    import re
-    if not re.match(r'^[a-zA-Z][a-zA-Z0-9_-]*$', name):
-        errors.append("El nombre debe comenzar con letra y solo contener letras, números, _ y -")
-    
-    # Validar nombres reservados
-    reserved_names = [
-        "con", "prn", "aux", "nul", "com1", "com2", "com3", "com4", "com5",
-        "com6", "com7", "com8", "com9", "lpt1", "lpt2", "lpt3", "lpt4",
-        "lpt5", "lpt6", "lpt7", "lpt8", "lpt9", "test", "example", "sample"
-    ]
-    
-    if name.lower() in reserved_names:
-        errors.append(f"'{name}' es un nombre reservado")
+    from genesis_cli.validators import (
+        BASIC_RESERVED_NAMES, NAME_BAD_CHARS, NAME_BAD_START, NAME_PROBLEMATIC, NAME_RESERVED,
+        ProjectNameValidator
+    )
     
-    return {"valid": len(errors) == 0, "errors": errors}
+    # Solo dispositivos de Windows y nombres de ejemplo, no toda la lista del validador
+    check = ProjectNameValidator.check(name, reserved=BASIC_RESERVED_NAMES)
+    errors = []
+    for code, message in zip(check.codes, check.errors):
+        if code in (NAME_BAD_START, NAME_BAD_CHARS, NAME_PROBLEMATIC):
+            message = "El nombre debe comenzar con letra y solo contener letras, números, _ y -"
+        elif code == NAME_RESERVED:
+            message = f"'{name}' es un nombre reservado"
+        if message not in errors:
+            errors.append(message)
+    
+    return {"valid": check.is_valid, "errors": errors}
 
 def validate_template_name(template: str) -> Dict[str, Any]:
     """
@@ -114,16 +107,9 @@ def validate_template_name(template: str) -> Dict[str, Any]:
     
     DOCTRINA: Validamos entrada del usuario
     """
-    valid_templates = [
-        "saas-basic",
-        "api-only", 
-        "frontend-only",
-        "microservices",
-        "e-commerce",
-        "blog",
-        "ai-ready",
-        "minimal"
-    ]
+    from genesis_cli.validators import TemplateValidator
+    
+    valid_templates = list(TemplateValidator.templates())
     
     if template in valid_templates:
         return {"valid": True, "errors": []}
@@ -139,31 +125,26 @@ def validate_project_directory(path: str, force: bool = False) -> Dict[str, Any]
     
     DOCTRINA: Validamos entrada del usuario
     """
+    from genesis_cli.directory_probe import probe_directory
+    
     errors = []
     project_path = Path(path)
+    parent = probe_directory(project_path.parent)
     
     # Verificar si el directorio padre existe
-    if not project_path.parent.exists():
+    if not parent.exists:
         errors.append(f"El directorio padre no existe: {project_path.parent}")
         return {"valid": False, "errors": errors}
     
-    # Verificar si el directorio del proyecto ya existe
-    if project_path.exists():
-        if not force:
-            # Verificar si está vacío
-            if any(project_path.iterdir()):
-                errors.append(f"El directorio '{path}' no está vacío. Use --force para sobrescribir")
-            else:
-                # Directorio existe pero está vacío, está ok
-                pass
-        # Si force=True, está ok sobrescribir
-    
-    # Verificar permisos de escritura
-    try:
-        test_file = project_path.parent / ".test_write_permission"
-        test_file.touch()
-        test_file.unlink()
-    except PermissionError:
+    # Verificar si el directorio del proyecto ya existe y no está vacío
+    # (con force=True está ok sobrescribir)
+    if not force:
+        project = probe_directory(project_path, empty=True)
+        if project.exists and not project.empty:
+            errors.append(f"El directorio '{path}' no está vacío. Use --force para sobrescribir")
+    
+    # Verificar permisos de escritura sin crear archivos de prueba
+    if not parent.writable:
         errors.append(f"Sin permisos de escritura en: {project_path.parent}")
     
     return {"valid": len(errors) == 0, "errors": errors}
@@ -266,20 +247,9 @@ def get_directory_size(path: Path) -> int:
     
     DOCTRINA: Utility para mejorar UX
     """
-    total_size = 0
-    try:
-        for dirpath, dirnames, filenames in os.walk(path):
-            for filename in filenames:
-                filepath = Path(dirpath) / filename
-                try:
-                    total_size += filepath.stat().st_size
-                except (OSError, IOError):
-                    # Skip files that can't be read
-                    continue
-    except (OSError, IOError):
-        pass
+    from genesis_cli.disk_usage import scan_disk_usage
     
-    return total_size
+    return scan_disk_usage(path).total
 
 def clean_ansi_codes(text: str) -> str:
     """
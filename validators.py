@@ -11,10 +11,13 @@ DOCTRINA DEL ECOSISTEMA:
 
 import re
 import os
-from pathlib import Path
-from typing import List, Dict, Any, Optional, Union, Tuple
+from functools import lru_cache
+from typing import List, Dict, Any, FrozenSet, Iterable, Optional, Union, Tuple
 from dataclasses import dataclass
 
+from genesis_cli.directory_probe import probe_directory
+from genesis_cli.feature_graph import FeatureGraph
+from genesis_cli.suggestions import SuggestionIndex, index_for
 from genesis_cli.exceptions import (
     ValidationError,
     ProjectNameError,
@@ -77,6 +80,50 @@ class ValidationResult:
         """Agregar sugerencia"""
         self.suggestions.append(suggestion)
 
+# Códigos del validador de nombres de proyecto
+NAME_REQUIRED = "required"
+NAME_NOT_STRING = "not_string"
+NAME_TOO_SHORT = "too_short"
+NAME_TOO_LONG = "too_long"
+NAME_BAD_START = "bad_start"
+NAME_BAD_CHARS = "bad_chars"
+NAME_PROBLEMATIC = "problematic"
+NAME_RESERVED = "reserved"
+NAME_TRAILING_DASH = "trailing_dash"
+NAME_LEADING_UNDERSCORE = "leading_underscore"
+NAME_DOUBLE_DASH = "double_dash"
+NAME_DOUBLE_UNDERSCORE = "double_underscore"
+NAME_UPPERCASE = "uppercase"
+NAME_LONG = "long"
+
+# Nombres distintos que recuerda el validador
+NAME_CACHE_SIZE = 4096
+
+@dataclass(frozen=True)
+class NameCheck:
+    """
+    Resultado inmutable del validador de nombres
+    
+    `codes` y `warning_codes` permiten a cada comando presentar los problemas
+    con sus propios mensajes; `errors`, `warnings` y `suggestions` son los
+    mensajes de ProjectNameValidator ya formateados.
+    
+    DOCTRINA: Validamos entrada del usuario
+    """
+    codes: Tuple[str, ...]
+    warning_codes: Tuple[str, ...]
+    errors: Tuple[str, ...]
+    warnings: Tuple[str, ...]
+    suggestions: Tuple[str, ...]
+    
+    @property
+    def is_valid(self) -> bool:
+        return not self.codes
+    
+    def to_result(self) -> ValidationResult:
+        """ValidationResult nuevo (los llamadores pueden modificarlo)"""
+        return ValidationResult(not self.codes, list(self.errors), list(self.warnings), list(self.suggestions))
+
 class ProjectNameValidator:
     """
     Validador para nombres de proyecto
@@ -84,6 +131,13 @@ class ProjectNameValidator:
     DOCTRINA: Validamos entrada del usuario
     """
     
+    # Dispositivos de Windows: no se pueden usar como nombre de directorio
+    DEVICE_NAMES = frozenset({
+        'con', 'prn', 'aux', 'nul', 'com1', 'com2', 'com3', 'com4', 'com5',
+        'com6', 'com7', 'com8', 'com9', 'lpt1', 'lpt2', 'lpt3', 'lpt4',
+        'lpt5', 'lpt6', 'lpt7', 'lpt8', 'lpt9',
+    })
+    
     # Nombres reservados del sistema
     RESERVED_NAMES = {
         # Nombres de Windows
@@ -109,78 +163,142 @@ class ProjectNameValidator:
         r'.*[<>:"/\\|?*].*',  # Caracteres especiales problemáticos
     ]
     
+    # Mensajes por código: (mensaje, sugerencia)
+    ERROR_MESSAGES = {
+        NAME_TOO_SHORT: ("El nombre debe tener al menos 2 caracteres", "Ejemplo: 'my-app', 'proyecto-web'"),
+        NAME_TOO_LONG: ("El nombre no puede tener más de 50 caracteres", "Usa un nombre más corto y descriptivo"),
+        NAME_BAD_START: ("El nombre debe comenzar con una letra", "Ejemplo: 'mi-proyecto', 'app-web'"),
+        NAME_BAD_CHARS: (
+            "El nombre solo puede contener letras, números, guiones (-) y guiones bajos (_)",
+            "Caracteres permitidos: a-z, A-Z, 0-9, -, _"
+        ),
+        NAME_PROBLEMATIC: ("El nombre '{name}' contiene un patrón problemático", None),
+        NAME_RESERVED: (
+            "'{name}' es un nombre reservado del sistema",
+            "Usa un nombre diferente como 'mi-proyecto' o 'app-principal'"
+        ),
+    }
+    
+    WARNING_MESSAGES = {
+        NAME_TRAILING_DASH: ("El nombre termina con guión, esto puede causar problemas", "Remueve el guión final"),
+        NAME_LEADING_UNDERSCORE: (
+            "El nombre comienza con guión bajo, esto puede causar problemas",
+            "Comienza con una letra en su lugar"
+        ),
+        NAME_DOUBLE_DASH: ("El nombre contiene guiones dobles", "Usa guiones simples: 'mi-proyecto'"),
+        NAME_DOUBLE_UNDERSCORE: ("El nombre contiene guiones bajos dobles", "Usa guiones bajos simples: 'mi_proyecto'"),
+        NAME_UPPERCASE: (None, "Considera usar minúsculas para mejor legibilidad"),
+        NAME_LONG: (None, "Nombres más cortos son más fáciles de recordar"),
+    }
+    
     @classmethod
-    def validate(cls, name: str) -> ValidationResult:
+    def check(cls, name: Any, reserved: Optional[FrozenSet[str]] = None) -> NameCheck:
         """
-        Validar nombre de proyecto
+        Resultado inmutable de validar un nombre (memoizado por nombre)
+        
+        Args:
+            name: Nombre a validar
+            reserved: Nombres rechazados por reservados, en minúsculas
+                (por defecto, RESERVED_NAMES completo)
         
         DOCTRINA: Validamos entrada del usuario
         """
-        result = ValidationResult.success()
-        
-        # Validación básica
         if not name:
-            result.add_error("El nombre del proyecto es requerido")
-            return result
-        
+            return _REQUIRED_CHECK
         if not isinstance(name, str):
-            result.add_error("El nombre del proyecto debe ser una cadena de texto")
-            return result
-        
-        # Validar longitud
-        if len(name) < 2:
-            result.add_error("El nombre debe tener al menos 2 caracteres")
-            result.add_suggestion("Ejemplo: 'my-app', 'proyecto-web'")
-        
-        if len(name) > 50:
-            result.add_error("El nombre no puede tener más de 50 caracteres")
-            result.add_suggestion("Usa un nombre más corto y descriptivo")
-        
-        # Validar formato
-        if not re.match(r'^[a-zA-Z]', name):
-            result.add_error("El nombre debe comenzar con una letra")
-            result.add_suggestion("Ejemplo: 'mi-proyecto', 'app-web'")
-        
-        if not re.match(r'^[a-zA-Z][a-zA-Z0-9_-]*$', name):
-            result.add_error("El nombre solo puede contener letras, números, guiones (-) y guiones bajos (_)")
-            result.add_suggestion("Caracteres permitidos: a-z, A-Z, 0-9, -, _")
-        
-        # Validar patrones problemáticos
-        for pattern in cls.PROBLEMATIC_PATTERNS:
-            if re.match(pattern, name):
-                result.add_error(f"El nombre '{name}' contiene un patrón problemático")
-                break
-        
-        # Validar nombres reservados
-        if name.lower() in cls.RESERVED_NAMES:
-            result.add_error(f"'{name}' es un nombre reservado del sistema")
-            result.add_suggestion("Usa un nombre diferente como 'mi-proyecto' o 'app-principal'")
-        
-        # Validar convenciones
-        if name.endswith('-'):
-            result.add_warning("El nombre termina con guión, esto puede causar problemas")
-            result.add_suggestion("Remueve el guión final")
-        
-        if name.startswith('_'):
-            result.add_warning("El nombre comienza con guión bajo, esto puede causar problemas")
-            result.add_suggestion("Comienza con una letra en su lugar")
-        
-        if '--' in name:
-            result.add_warning("El nombre contiene guiones dobles")
-            result.add_suggestion("Usa guiones simples: 'mi-proyecto'")
-        
-        if '__' in name:
-            result.add_warning("El nombre contiene guiones bajos dobles")
-            result.add_suggestion("Usa guiones bajos simples: 'mi_proyecto'")
-        
-        # Sugerencias adicionales
-        if name.isupper():
-            result.add_suggestion("Considera usar minúsculas para mejor legibilidad")
+            return _NOT_STRING_CHECK
+        return _check_project_name(name, ALL_RESERVED_NAMES if reserved is None else reserved)
+    
+    @classmethod
+    def validate(cls, name: str) -> ValidationResult:
+        """
+        Validar nombre de proyecto
         
-        if len(name) > 30:
-            result.add_suggestion("Nombres más cortos son más fáciles de recordar")
+        DOCTRINA: Validamos entrada del usuario
+        """
+        return cls.check(name).to_result()
+    
+    @classmethod
+    def validate_many(cls, names: Iterable[str]) -> List[ValidationResult]:
+        """
+        Validar muchos nombres (p. ej. los de un manifiesto) en el mismo orden
         
-        return result
+        Los nombres repetidos se analizan una sola vez.
+        """
+        check = cls.check
+        return [check(name).to_result() for name in names]
+
+# Conjuntos para `ProjectNameValidator.check(name, reserved=...)`
+ALL_RESERVED_NAMES = frozenset(ProjectNameValidator.RESERVED_NAMES)
+BASIC_RESERVED_NAMES = ProjectNameValidator.DEVICE_NAMES | {'test', 'example', 'sample'}
+NO_RESERVED_NAMES: FrozenSet[str] = frozenset()
+
+# Una sola pasada por los caracteres: letra inicial opcional y después la clase permitida
+_NAME_SCAN = re.compile(r'(?P<start>[a-zA-Z]?)[a-zA-Z0-9_-]*')
+_VALID_NAME = re.compile(r'[a-zA-Z][a-zA-Z0-9_-]*')
+_NAME_PROBLEMATIC = re.compile("|".join(f"(?:{pattern})" for pattern in ProjectNameValidator.PROBLEMATIC_PATTERNS))
+
+def _name_check(name: Any, codes: Tuple[str, ...], warning_codes: Tuple[str, ...] = ()) -> NameCheck:
+    errors, warnings, suggestions = [], [], []
+    for code in codes:
+        message, suggestion = ProjectNameValidator.ERROR_MESSAGES[code]
+        errors.append(message.format(name=name))
+        if suggestion:
+            suggestions.append(suggestion)
+    for code in warning_codes:
+        message, suggestion = ProjectNameValidator.WARNING_MESSAGES[code]
+        if message:
+            warnings.append(message)
+        suggestions.append(suggestion)
+    return NameCheck(codes, warning_codes, tuple(errors), tuple(warnings), tuple(suggestions))
+
+_VALID_CHECK = NameCheck((), (), (), (), ())
+_REQUIRED_CHECK = NameCheck((NAME_REQUIRED,), (), ("El nombre del proyecto es requerido",), (), ())
+_NOT_STRING_CHECK = NameCheck((NAME_NOT_STRING,), (), ("El nombre del proyecto debe ser una cadena de texto",), (), ())
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def _check_project_name(name: str, reserved: FrozenSet[str]) -> NameCheck:
+    length = len(name)
+    
+    # Camino rápido: nombre válido sin advertencias, decidido con un solo fullmatch
+    if (2 <= length <= 30 and _VALID_NAME.fullmatch(name) is not None and name[-1] != '-'
+            and '--' not in name and '__' not in name and not name.isupper()
+            and name.lower() not in reserved):
+        return _VALID_CHECK
+    
+    codes = []
+    if length < 2:
+        codes.append(NAME_TOO_SHORT)
+    if length > 50:
+        codes.append(NAME_TOO_LONG)
+    
+    scan = _NAME_SCAN.match(name)
+    if not scan.group("start"):
+        codes.append(NAME_BAD_START)
+    if not scan.group("start") or scan.end() != length:
+        codes.append(NAME_BAD_CHARS)
+        # Los patrones problemáticos solo pueden aparecer con caracteres no permitidos
+        if _NAME_PROBLEMATIC.match(name):
+            codes.append(NAME_PROBLEMATIC)
+    
+    if name.lower() in reserved:
+        codes.append(NAME_RESERVED)
+    
+    warning_codes = []
+    if name.endswith('-'):
+        warning_codes.append(NAME_TRAILING_DASH)
+    if name.startswith('_'):
+        warning_codes.append(NAME_LEADING_UNDERSCORE)
+    if '--' in name:
+        warning_codes.append(NAME_DOUBLE_DASH)
+    if '__' in name:
+        warning_codes.append(NAME_DOUBLE_UNDERSCORE)
+    if name.isupper():
+        warning_codes.append(NAME_UPPERCASE)
+    if length > 30:
+        warning_codes.append(NAME_LONG)
+    
+    return _name_check(name, tuple(codes), tuple(warning_codes))
 
 class TemplateValidator:
     """
@@ -189,7 +307,7 @@ class TemplateValidator:
     DOCTRINA: Validamos entrada del usuario
     """
     
-    # Templates oficiales disponibles
+    # Templates incluidos en la CLI, de respaldo si genesis-core no publica su catálogo
     OFFICIAL_TEMPLATES = {
         'saas-basic': {
             'name': 'SaaS Básico',
@@ -241,6 +359,36 @@ class TemplateValidator:
         }
     }
     
+    # Palabras que no son parte del nombre pero identifican un template
+    TEMPLATE_ALIASES = {
+        'api': 'api-only',
+        'frontend': 'frontend-only',
+        'ui': 'frontend-only',
+        'saas': 'saas-basic',
+        'shop': 'e-commerce',
+        'store': 'e-commerce',
+        'tienda': 'e-commerce',
+        'ai': 'ai-ready',
+        'simple': 'minimal',
+        'basic': 'minimal',
+    }
+    
+    # Catálogo activo (el de genesis-core, ver template_catalog); None usa OFFICIAL_TEMPLATES
+    _catalog: Optional[Dict[str, Dict[str, Any]]] = None
+    
+    _index: Optional[SuggestionIndex] = None
+    _index_source: Optional[Dict[str, Any]] = None
+    
+    @classmethod
+    def templates(cls) -> Dict[str, Dict[str, Any]]:
+        """Templates disponibles: el catálogo activo u OFFICIAL_TEMPLATES"""
+        return cls._catalog if cls._catalog is not None else cls.OFFICIAL_TEMPLATES
+    
+    @classmethod
+    def use_catalog(cls, templates: Optional[Dict[str, Dict[str, Any]]]):
+        """Activar un catálogo de templates (None vuelve a OFFICIAL_TEMPLATES)"""
+        cls._catalog = templates
+    
     @classmethod
     def validate(cls, template: str) -> ValidationResult:
         """
@@ -261,9 +409,10 @@ class TemplateValidator:
             return result
         
         # Validar que existe
-        if template not in cls.OFFICIAL_TEMPLATES:
+        templates = cls.templates()
+        if template not in templates:
             result.add_error(f"Template '{template}' no encontrado")
-            result.add_suggestion(f"Templates disponibles: {', '.join(cls.OFFICIAL_TEMPLATES.keys())}")
+            result.add_suggestion(f"Templates disponibles: {', '.join(templates.keys())}")
             
             # Sugerir template similar
             similar = cls._find_similar_template(template)
@@ -272,45 +421,41 @@ class TemplateValidator:
         
         return result
     
+    @classmethod
+    def suggestion_index(cls) -> SuggestionIndex:
+        """
+        Índice de sugerencias sobre los templates disponibles
+        
+        Se reconstruye si cambia el catálogo activo o se reemplaza
+        OFFICIAL_TEMPLATES.
+        """
+        catalog = cls.templates()
+        if cls._index_source is not catalog:
+            cls._index = SuggestionIndex(catalog, cls.TEMPLATE_ALIASES)
+            cls._index_source = catalog
+        return cls._index
+    
+    @classmethod
+    def suggest(cls, template: str, limit: int = 3) -> List[str]:
+        """Templates parecidos a `template`, del más al menos probable"""
+        return cls.suggestion_index().suggest(template, limit)
+    
     @classmethod
     def _find_similar_template(cls, template: str) -> Optional[str]:
         """Encontrar template similar"""
-        template_lower = template.lower()
-        
-        # Buscar coincidencias parciales
-        for official_template in cls.OFFICIAL_TEMPLATES:
-            if template_lower in official_template or official_template in template_lower:
-                return official_template
-        
-        # Buscar por características
-        if 'api' in template_lower:
-            return 'api-only'
-        elif 'frontend' in template_lower or 'ui' in template_lower:
-            return 'frontend-only'
-        elif 'saas' in template_lower:
-            return 'saas-basic'
-        elif 'shop' in template_lower or 'store' in template_lower:
-            return 'e-commerce'
-        elif 'blog' in template_lower:
-            return 'blog'
-        elif 'ai' in template_lower:
-            return 'ai-ready'
-        elif 'simple' in template_lower or 'basic' in template_lower:
-            return 'minimal'
-        
-        return None
+        return cls.suggestion_index().best(template)
     
     @classmethod
     def get_template_info(cls, template: str) -> Optional[Dict[str, Any]]:
         """Obtener información del template"""
-        return cls.OFFICIAL_TEMPLATES.get(template)
+        return cls.templates().get(template)
     
     @classmethod
     def list_templates(cls) -> List[Dict[str, Any]]:
         """Listar todos los templates"""
         return [
             {**info, 'id': template_id}
-            for template_id, info in cls.OFFICIAL_TEMPLATES.items()
+            for template_id, info in cls.templates().items()
         ]
 
 class DirectoryValidator:
@@ -320,59 +465,63 @@ class DirectoryValidator:
     DOCTRINA: Validamos entrada del usuario
     """
     
+    # Espacio libre por debajo del cual se advierte
+    MIN_FREE_SPACE = 100 * 1024 * 1024  # 100MB
+    
     @classmethod
     def validate_output_directory(cls, path: str, project_name: str, force: bool = False) -> ValidationResult:
         """
         Validar directorio de salida
         
+        Los datos salen de directory_probe: un sondeo por ruta (reutilizado
+        dentro de directory_probe_scope) sin escribir en el disco.
+        
         DOCTRINA: Validamos entrada del usuario
         """
         result = ValidationResult.success()
         
-        try:
-            path_obj = Path(path)
-            project_path = path_obj / project_name
-            
-            # Validar que el directorio padre existe
-            if not path_obj.exists():
-                result.add_error(f"El directorio padre no existe: {path}")
-                result.add_suggestion("Crea el directorio o usa un directorio existente")
-                return result
-            
-            # Validar que es un directorio
-            if not path_obj.is_dir():
-                result.add_error(f"'{path}' no es un directorio")
-                return result
-            
-            # Validar permisos de escritura
-            if not os.access(path_obj, os.W_OK):
-                result.add_error(f"Sin permisos de escritura en: {path}")
-                result.add_suggestion("Cambia los permisos o usa un directorio diferente")
-                return result
-            
-            # Validar proyecto existente
-            if project_path.exists():
-                if not force:
-                    if any(project_path.iterdir()):
-                        result.add_error(f"El directorio '{project_name}' ya existe y no está vacío")
-                        result.add_suggestion("Usa --force para sobrescribir o elige otro nombre")
-                    else:
-                        result.add_warning(f"El directorio '{project_name}' existe pero está vacío")
-                else:
-                    result.add_warning(f"El directorio '{project_name}' será sobrescrito")
-            
-            # Validar espacio disponible
-            try:
-                import shutil
-                free_space = shutil.disk_usage(path_obj).free
-                if free_space < 100 * 1024 * 1024:  # 100MB
-                    result.add_warning("Poco espacio disponible en disco")
-                    result.add_suggestion("Asegúrate de tener suficiente espacio para el proyecto")
-            except Exception:
-                pass
-            
-        except Exception as e:
-            result.add_error(f"Error validando directorio: {str(e)}")
+        parent = probe_directory(path, free=True)
+        if parent.error:
+            result.add_error(f"Error validando directorio: {parent.error}")
+            return result
+        
+        # Validar que el directorio padre existe
+        if not parent.exists:
+            result.add_error(f"El directorio padre no existe: {path}")
+            result.add_suggestion("Crea el directorio o usa un directorio existente")
+            return result
+        
+        # Validar que es un directorio
+        if not parent.is_dir:
+            result.add_error(f"'{path}' no es un directorio")
+            return result
+        
+        # Validar permisos de escritura
+        if not parent.writable:
+            result.add_error(f"Sin permisos de escritura en: {path}")
+            result.add_suggestion("Cambia los permisos o usa un directorio diferente")
+            return result
+        
+        # Validar proyecto existente (el contenido solo importa sin --force)
+        project = probe_directory(os.path.join(path, project_name), empty=not force)
+        if project.error:
+            result.add_error(f"Error validando directorio: {project.error}")
+        elif project.exists:
+            if force:
+                result.add_warning(f"El directorio '{project_name}' será sobrescrito")
+            elif not project.is_dir:
+                result.add_error(f"'{project_name}' ya existe y no es un directorio")
+                result.add_suggestion("Elige otro nombre para el proyecto")
+            elif project.empty:
+                result.add_warning(f"El directorio '{project_name}' existe pero está vacío")
+            else:
+                result.add_error(f"El directorio '{project_name}' ya existe y no está vacío")
+                result.add_suggestion("Usa --force para sobrescribir o elige otro nombre")
+        
+        # Validar espacio disponible
+        if parent.free_bytes is not None and parent.free_bytes < cls.MIN_FREE_SPACE:
+            result.add_warning("Poco espacio disponible en disco")
+            result.add_suggestion("Asegúrate de tener suficiente espacio para el proyecto")
         
         return result
 
@@ -462,6 +611,9 @@ class FeatureValidator:
         }
     }
     
+    _graph: Optional[FeatureGraph] = None
+    _graph_source: Optional[Dict[str, Any]] = None
+    
     @classmethod
     def validate(cls, features: List[str]) -> ValidationResult:
         """
@@ -483,15 +635,25 @@ class FeatureValidator:
         
         if invalid_features:
             result.add_error(f"Características inválidas: {', '.join(invalid_features)}")
+            index = index_for(cls.VALID_FEATURES)
+            for feature in invalid_features:
+                similar = index.best(feature)
+                if similar:
+                    result.add_suggestion(f"¿Quisiste decir '{similar}' en lugar de '{feature}'?")
             result.add_suggestion(f"Características válidas: {', '.join(cls.VALID_FEATURES.keys())}")
         
         # Validar dependencias
-        resolved_features = cls._resolve_dependencies(features)
-        missing_deps = set(resolved_features) - set(features)
+        graph = cls.graph()
+        resolved_features = graph.resolve(features)
+        requested = set(features)
+        missing_deps = [feature for feature in resolved_features if feature not in requested]
         
         if missing_deps:
             result.add_warning(f"Dependencias automáticas agregadas: {', '.join(missing_deps)}")
         
+        for cycle in graph.cycles_in(features):
+            result.add_error(f"Dependencias circulares: {' -> '.join(cycle + cycle[:1])}")
+        
         # Validar combinaciones
         if 'ai' in features and 'database' not in resolved_features:
             result.add_error("La característica 'ai' requiere 'database'")
@@ -502,16 +664,23 @@ class FeatureValidator:
         return result
     
     @classmethod
-    def _resolve_dependencies(cls, features: List[str]) -> List[str]:
-        """Resolver dependencias de características"""
-        resolved = set(features)
-        
-        for feature in features:
-            if feature in cls.VALID_FEATURES:
-                deps = cls.VALID_FEATURES[feature]['dependencies']
-                resolved.update(deps)
+    def graph(cls) -> FeatureGraph:
+        """
+        Grafo compilado de VALID_FEATURES
         
-        return list(resolved)
+        Se compila al importar el módulo y se recompila si VALID_FEATURES se
+        reemplaza (por ejemplo, con el catálogo que informe genesis-core).
+        """
+        catalog = cls.VALID_FEATURES
+        if cls._graph_source is not catalog:
+            cls._graph = FeatureGraph.compile(catalog)
+            cls._graph_source = catalog
+        return cls._graph
+    
+    @classmethod
+    def _resolve_dependencies(cls, features: List[str]) -> List[str]:
+        """Resolver dependencias transitivas, dependencias primero"""
+        return cls.graph().resolve(features)
     
     @classmethod
     def get_feature_info(cls, feature: str) -> Optional[Dict[str, Any]]:
@@ -526,11 +695,18 @@ class FeatureValidator:
             for feature_id, info in cls.VALID_FEATURES.items()
         ]
 
+# Compilar el grafo de características al importar
+FeatureValidator.graph()
+
 # Funciones de conveniencia
 def validate_project_name(name: str) -> ValidationResult:
     """Validar nombre de proyecto"""
     return ProjectNameValidator.validate(name)
 
+def validate_project_names(names: Iterable[str]) -> List[ValidationResult]:
+    """Validar muchos nombres de proyecto en el mismo orden"""
+    return ProjectNameValidator.validate_many(names)
+
 def validate_template(template: str) -> ValidationResult:
     """Validar template"""
     return TemplateValidator.validate(template)
@@ -543,6 +719,10 @@ def validate_features(features: List[str]) -> ValidationResult:
     """Validar características"""
     return FeatureValidator.validate(features)
 
+def resolve_features(features: List[str]) -> List[str]:
+    """Características con sus dependencias transitivas, en el orden que necesita genesis-core"""
+    return FeatureValidator.graph().resolve(features)
+
 def validate_project_config(config: Dict[str, Any]) -> ValidationResult:
     """
     Validar configuración completa del proyecto